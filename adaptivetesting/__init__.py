@@ -1,55 +1,231 @@
-from . import data
-from . import implementations
-from . import math
-from . import models
-from . import services
-from . import simulation
-from . import tests
-
-from .data.__csv_context import CSVContext
-from .data.__pickle_context import PickleContext
-
-from .implementations.__default_implementation import DefaultImplementation
-from .implementations.__pre_test import PreTest
-from .implementations.__semi_implementation import SemiAdaptiveImplementation
-from .implementations.__test_assembler import TestAssembler, ContentBalancingArgs, ExposureControlArgs
-
-from .math.__gen_response_pattern import generate_response_pattern
-from .math.estimators.__ml_estimation import MLEstimator
-from .math.estimators.__bayes_modal_estimation import BayesModal
-from .math.estimators.__expect_a_posteriori import ExpectedAPosteriori
-from .math.estimators.__prior import Prior, NormalPrior, CustomPrior, CustomPriorException, SkewNormalPrior, EmpiricalPrior
-from .math.estimators.__functions.__estimators import probability_y0, probability_y1, maximize_likelihood_function, likelihood
-from .math.estimators.__functions.__bayes import maximize_posterior
-from .math.estimators.__test_information import test_information_function, item_information_function, prior_information_function
-from .math.item_selection.__maximum_information_criterion import maximum_information_criterion
-from .math.item_selection.__urrys_rule import urrys_rule
-from .math.content_balancing.__weighted_penalty_model import WeightedPenaltyModel
-from .math.content_balancing.__constraint import *
-from .math.content_balancing.__functions import *
-
-from .models.__adaptive_test import AdaptiveTest
-from .models.__algorithm_exception import AlgorithmException
-from .models.__item_pool import ItemPool 
-from .models.__item_selection_exception import ItemSelectionException
-from .models.__test_item import TestItem
-from .models.__test_result import TestResult
-from .models.__misc import ResultOutputFormat, StoppingCriterion
-
-from .services.__estimator_interface import IEstimator
-from .services.__test_results_interface import ITestResults
-from .services.__item_selection_protocol import ItemSelectionStrategy
-
-from .simulation.__simulation import Simulation, SimulationPool, setup_simulation_and_start
-
-from .utils.__descriptives import bias, average_absolute_deviation, rmse
-from .utils.__funcs import load_final_test_results, load_test_results_single_participant
-from .utils.__plots import (
-    plot_exposure_rate,
-    plot_final_ability_estimates,
-    plot_icc,
-    plot_iif,
-    plot_exposure_rate,
-    plot_test_information,
-    plot_theta_estimation_trace
-)
\ No newline at end of file
+"""adaptivetesting: simulation and delivery of computerized adaptive tests.
+
+The public names are imported on first access (PEP 562),
+so that `import adaptivetesting` only loads the modules that are actually used.
+Heavy optional dependencies (matplotlib for the plots, pandas for data frames
+and numdifftools for polytomous models) are only imported when a feature needs them.
+"""
+from typing import TYPE_CHECKING
+import importlib
+
+# modules of the public names
+_LAZY_IMPORTS: dict[str, tuple[str, ...]] = {
+    ".data.__csv_context": ("CSVContext",),
+    ".data.__pickle_context": ("PickleContext",),
+    ".data.__columnar_context": (
+        "ColumnarContext", "flush_columnar_results", "read_columnar_results", "read_columnar_test_results"
+    ),
+    ".data.__sqlite_context": ("SQLiteContext", "read_sqlite_final_test_results", "read_sqlite_exposure_counts"),
+    ".data.__sqlite_exposure_counter": ("SQLiteExposureCounter",),
+    ".data.__shared_exposure_counter": ("SharedExposureCounter",),
+    ".data.__session_store": ("SQLiteSessionStore", "FileSessionStore"),
+    ".implementations.__default_implementation": ("DefaultImplementation",),
+    ".implementations.__pre_test": ("PreTest",),
+    ".implementations.__semi_implementation": ("SemiAdaptiveImplementation",),
+    ".implementations.__test_assembler": ("TestAssembler", "ContentBalancingArgs", "ExposureControlArgs"),
+    ".implementations.__selection_pipeline": ("SelectionPipeline",),
+    ".implementations.__decision_trie": ("DecisionTrie",),
+    ".implementations.__session_snapshot": ("SessionSnapshot",),
+    ".implementations.__cat_session": ("CATSession",),
+    ".implementations.__session_manager": ("SessionManager",),
+    ".math.__gen_response_pattern": ("generate_response_pattern", "generate_response_matrix"),
+    ".math.__kernels": ("set_backend", "get_backend"),
+    ".math.estimators.__ml_estimation": ("MLEstimator",),
+    ".math.estimators.__bayes_modal_estimation": ("BayesModal",),
+    ".math.estimators.__expect_a_posteriori": ("ExpectedAPosteriori",),
+    ".math.estimators.__prior": (
+        "Prior", "NormalPrior", "CustomPrior", "CustomPriorException", "SkewNormalPrior", "EmpiricalPrior"
+    ),
+    ".math.estimators.__functions.__estimators": (
+        "probability_y0", "probability_y1", "maximize_likelihood_function", "likelihood"
+    ),
+    ".math.estimators.__functions.__bayes": ("maximize_posterior",),
+    ".math.estimators.__functions.__diagnostics": ("EstimationDiagnostics",),
+    ".math.estimators.__functions.__log_probabilities": ("log_probabilities", "LogLikelihoodWorkspace"),
+    ".math.estimators.__test_information": (
+        "test_information_function", "item_information_function", "prior_information_function"
+    ),
+    ".math.estimators.__batch_estimation": ("BatchEstimator",),
+    ".math.item_selection.__maximum_information_criterion": (
+        "maximum_information_criterion", "tabulated_maximum_information_criterion"
+    ),
+    ".math.item_selection.__urrys_rule": ("urrys_rule",),
+    ".math.item_selection.__a_stratified_selection": ("AStratifiedSelector", "AStratifiedSelectorState"),
+    ".math.item_selection.__selection_scheduler": ("SelectionScheduler",),
+    ".math.content_balancing.__weighted_penalty_model": ("WeightedPenaltyModel",),
+    ".math.content_balancing.__weighted_penalty_model_state": ("WeightedPenaltyModelState",),
+    ".math.content_balancing.__maximum_priority_index": ("MaximumPriorityIndex",),
+    ".math.content_balancing.__budgeted_selection": ("BudgetedSelection", "BudgetStatistics", "CandidateRanking"),
+    ".math.content_balancing.__constraint": ("Constraint",),
+    ".math.content_balancing.__functions": (
+        "compute_priority_index", "constraint_membership_matrix", "compute_priority_indices", "compute_quota_left",
+        "compute_prop", "compute_expected_difference", "compute_penalty_value",
+        "compute_total_content_penalty_value_for_item", "standardize_total_content_constraint_penalty_value",
+        "standardize_item_information", "compute_information_penalty_value", "compute_weighted_penalty_value"
+    ),
+    ".math.exposure_control.__sympson_hetter": ("SympsonHetter", "SympsonHetterParameters"),
+    ".models.__adaptive_test": ("AdaptiveTest",),
+    ".models.__algorithm_exception": ("AlgorithmException",),
+    ".models.__item_pool": ("ItemPool",),
+    ".models.__item_bank": ("ItemBank",),
+    ".models.__item_exclusions": ("ItemExclusions",),
+    ".models.__shared_item_bank": ("SharedItemBank",),
+    ".models.__item_selection_exception": ("ItemSelectionException",),
+    ".models.__test_item": ("TestItem",),
+    ".models.__test_result": ("TestResult",),
+    ".models.__misc": ("ResultOutputFormat", "StoppingCriterion"),
+    ".models.__instrumentation": ("Instrumentation", "Histogram", "active_instrumentation"),
+    ".services.__estimator_interface": ("IEstimator",),
+    ".services.__test_results_interface": ("ITestResults",),
+    ".services.__item_selection_protocol": ("ItemSelectionStrategy",),
+    ".services.__exposure_counter_interface": ("IExposureCounter",),
+    ".services.__session_store_interface": ("ISessionStore",),
+    ".simulation.__simulation": ("Simulation", "SimulationPool", "setup_simulation_and_start"),
+    ".simulation.__batch_simulation": ("BatchSimulation",),
+    ".simulation.__spec_simulation_pool": ("SimulationSpec", "SpecSimulationPool"),
+    ".simulation.__sympson_hetter_calibration": ("calibrate_sympson_hetter",),
+    ".utils.__descriptives": ("bias", "average_absolute_deviation", "rmse"),
+    ".utils.__funcs": ("load_final_test_results", "load_test_results_single_participant"),
+    ".utils.__plots": (
+        "plot_exposure_rate", "plot_final_ability_estimates", "plot_icc", "plot_iif", "plot_test_information",
+        "plot_theta_estimation_trace"
+    ),
+}
+_SUBPACKAGES = ("data", "implementations", "math", "models", "services", "simulation", "tests", "utils")
+_ATTRIBUTES: dict[str, str] = {name: module for module, names in _LAZY_IMPORTS.items() for name in names}
+
+__all__ = [name for names in _LAZY_IMPORTS.values() for name in names]
+
+
+def __getattr__(name: str):
+    module = _ATTRIBUTES.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(module, __name__), name)
+    elif name in _SUBPACKAGES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # later accesses do not call __getattr__ again
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | set(_SUBPACKAGES))
+
+
+if TYPE_CHECKING:
+    from . import data, implementations, math, models, services, simulation, tests, utils
+
+    from .data.__csv_context import CSVContext
+    from .data.__pickle_context import PickleContext
+    from .data.__columnar_context import (
+        ColumnarContext,
+        flush_columnar_results,
+        read_columnar_results,
+        read_columnar_test_results
+    )
+    from .data.__sqlite_context import SQLiteContext, read_sqlite_final_test_results, read_sqlite_exposure_counts
+    from .data.__sqlite_exposure_counter import SQLiteExposureCounter
+    from .data.__shared_exposure_counter import SharedExposureCounter
+    from .data.__session_store import SQLiteSessionStore, FileSessionStore
+
+    from .implementations.__default_implementation import DefaultImplementation
+    from .implementations.__pre_test import PreTest
+    from .implementations.__semi_implementation import SemiAdaptiveImplementation
+    from .implementations.__test_assembler import TestAssembler, ContentBalancingArgs, ExposureControlArgs
+    from .implementations.__selection_pipeline import SelectionPipeline
+    from .implementations.__decision_trie import DecisionTrie
+    from .implementations.__session_snapshot import SessionSnapshot
+    from .implementations.__cat_session import CATSession
+    from .implementations.__session_manager import SessionManager
+
+    from .math.__gen_response_pattern import generate_response_pattern, generate_response_matrix
+    from .math.__kernels import set_backend, get_backend
+    from .math.estimators.__ml_estimation import MLEstimator
+    from .math.estimators.__bayes_modal_estimation import BayesModal
+    from .math.estimators.__expect_a_posteriori import ExpectedAPosteriori
+    from .math.estimators.__prior import (
+        Prior,
+        NormalPrior,
+        CustomPrior,
+        CustomPriorException,
+        SkewNormalPrior,
+        EmpiricalPrior
+    )
+    from .math.estimators.__functions.__estimators import (
+        probability_y0,
+        probability_y1,
+        maximize_likelihood_function,
+        likelihood
+    )
+    from .math.estimators.__functions.__bayes import maximize_posterior
+    from .math.estimators.__functions.__diagnostics import EstimationDiagnostics
+    from .math.estimators.__functions.__log_probabilities import log_probabilities, LogLikelihoodWorkspace
+    from .math.estimators.__test_information import (
+        test_information_function,
+        item_information_function,
+        prior_information_function
+    )
+    from .math.estimators.__batch_estimation import BatchEstimator
+    from .math.item_selection.__maximum_information_criterion import (
+        maximum_information_criterion,
+        tabulated_maximum_information_criterion
+    )
+    from .math.item_selection.__urrys_rule import urrys_rule
+    from .math.item_selection.__a_stratified_selection import AStratifiedSelector, AStratifiedSelectorState
+    from .math.item_selection.__selection_scheduler import SelectionScheduler
+    from .math.content_balancing.__weighted_penalty_model import WeightedPenaltyModel
+    from .math.content_balancing.__weighted_penalty_model_state import WeightedPenaltyModelState
+    from .math.content_balancing.__maximum_priority_index import MaximumPriorityIndex
+    from .math.content_balancing.__budgeted_selection import BudgetedSelection, BudgetStatistics, CandidateRanking
+    from .math.content_balancing.__constraint import Constraint
+    from .math.content_balancing.__functions import (
+        compute_priority_index,
+        constraint_membership_matrix,
+        compute_priority_indices,
+        compute_quota_left,
+        compute_prop,
+        compute_expected_difference,
+        compute_penalty_value,
+        compute_total_content_penalty_value_for_item,
+        standardize_total_content_constraint_penalty_value,
+        standardize_item_information,
+        compute_information_penalty_value,
+        compute_weighted_penalty_value
+    )
+    from .math.exposure_control.__sympson_hetter import SympsonHetter, SympsonHetterParameters
+
+    from .models.__adaptive_test import AdaptiveTest
+    from .models.__algorithm_exception import AlgorithmException
+    from .models.__item_pool import ItemPool
+    from .models.__item_bank import ItemBank
+    from .models.__item_exclusions import ItemExclusions
+    from .models.__shared_item_bank import SharedItemBank
+    from .models.__item_selection_exception import ItemSelectionException
+    from .models.__test_item import TestItem
+    from .models.__test_result import TestResult
+    from .models.__misc import ResultOutputFormat, StoppingCriterion
+    from .models.__instrumentation import Instrumentation, Histogram, active_instrumentation
+
+    from .services.__estimator_interface import IEstimator
+    from .services.__test_results_interface import ITestResults
+    from .services.__item_selection_protocol import ItemSelectionStrategy
+    from .services.__exposure_counter_interface import IExposureCounter
+    from .services.__session_store_interface import ISessionStore
+
+    from .simulation.__simulation import Simulation, SimulationPool, setup_simulation_and_start
+    from .simulation.__batch_simulation import BatchSimulation
+    from .simulation.__spec_simulation_pool import SimulationSpec, SpecSimulationPool
+    from .simulation.__sympson_hetter_calibration import calibrate_sympson_hetter
+
+    from .utils.__descriptives import bias, average_absolute_deviation, rmse
+    from .utils.__funcs import load_final_test_results, load_test_results_single_participant
+    from .utils.__plots import (
+        plot_exposure_rate,
+        plot_final_ability_estimates,
+        plot_icc,
+        plot_iif,
+        plot_test_information,
+        plot_theta_estimation_trace
+    )
@@ -0,0 +1,312 @@
+from typing import TYPE_CHECKING, Any, List
+import json
+import multiprocessing
+import multiprocessing.util
+import os
+import pathlib
+import threading
+import zipfile
+import numpy as np
+from ..models.__test_result import TestResult
+from ..services.__test_results_interface import ITestResults
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# columns stored for every administered item
+STEP_COLUMNS = ["ability_estimation", "standard_error", "response", "true_ability_level", "item_id", "item_index"]
+# columns stored for every participant
+PARTICIPANT_COLUMNS = ["participant_id", "test_id", "length"]
+
+
+class _ColumnarWriter:
+    def __init__(self, path: pathlib.Path, chunk_size: int, compress: bool):
+        """Buffers the results of several participants of one process
+        and appends them as a chunk to a columnar results file.
+
+        Args:
+            path (pathlib.Path): path of the results file
+            chunk_size (int): number of participants per chunk
+            compress (bool): compress the chunks
+        """
+        self.path = path
+        self.chunk_size = chunk_size
+        self.compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+        self.pid = os.getpid()
+        self.lock = threading.Lock()
+        self.buffer: list[tuple[str, List[TestResult]]] = []
+        self.n_chunks = len(list_chunks(path)) if path.exists() else 0
+
+    def append(self, participant_id: str, test_results: List[TestResult]):
+        with self.lock:
+            self.buffer.append((participant_id, test_results))
+            if len(self.buffer) >= self.chunk_size:
+                self.__write_chunk()
+
+    def flush(self):
+        with self.lock:
+            if len(self.buffer) > 0:
+                self.__write_chunk()
+
+    def __write_chunk(self):
+        item_indices: dict[str, int] = {}
+        items: list[dict] = []
+        steps: dict[str, list] = {column: [] for column in STEP_COLUMNS}
+        participants: dict[str, list] = {column: [] for column in PARTICIPANT_COLUMNS}
+
+        for participant_id, test_results in self.buffer:
+            participants["participant_id"].append(str(participant_id))
+            participants["test_id"].append(str(test_results[0].test_id) if len(test_results) > 0 else "")
+            participants["length"].append(len(test_results))
+            for result in test_results:
+                # every distinct item is only stored once per chunk
+                key = json.dumps(result.showed_item, sort_keys=True, default=str)
+                if key not in item_indices:
+                    item_indices[key] = len(items)
+                    items.append(result.showed_item)
+                item_id = result.showed_item.get("id")
+                steps["ability_estimation"].append(result.ability_estimation)
+                steps["standard_error"].append(result.standard_error)
+                steps["response"].append(result.response)
+                steps["true_ability_level"].append(result.true_ability_level)
+                steps["item_id"].append(-1 if item_id is None else item_id)
+                steps["item_index"].append(item_indices[key])
+
+        columns: dict[str, np.ndarray] = {
+            "participant_id": np.array(participants["participant_id"], dtype=np.str_),
+            "test_id": np.array(participants["test_id"], dtype=np.str_),
+            "length": np.array(participants["length"], dtype=np.int64),
+            "ability_estimation": np.array(steps["ability_estimation"], dtype=np.float64),
+            "standard_error": np.array(steps["standard_error"], dtype=np.float64),
+            "response": np.array(steps["response"], dtype=np.int64),
+            "true_ability_level": np.array(steps["true_ability_level"], dtype=np.float64),
+            "item_id": np.array(steps["item_id"], dtype=np.int64),
+            "item_index": np.array(steps["item_index"], dtype=np.int64)
+        }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.path.exists():
+            self.n_chunks = 0
+        prefix = f"chunk{self.n_chunks:06d}"
+        with zipfile.ZipFile(self.path, mode="a" if self.path.exists() else "w", compression=self.compression) as file:
+            for name, values in columns.items():
+                with file.open(f"{prefix}/{name}.npy", "w", force_zip64=True) as member:
+                    np.lib.format.write_array(member, values, allow_pickle=False)
+            file.writestr(f"{prefix}/items.json", json.dumps(items, default=str))
+
+        self.n_chunks += 1
+        self.buffer = []
+
+
+# writers of the current process (key: path of the results file)
+_writers: dict[str, _ColumnarWriter] = {}
+_writers_lock = threading.Lock()
+_finalizer_pid: int | None = None
+
+
+def flush_columnar_results():
+    """Writes all buffered results of the current process to the columnar results files.
+    This function is called automatically when the process exits
+    and before results are read in the same process.
+    """
+    with _writers_lock:
+        writers = [writer for writer in _writers.values() if writer.pid == os.getpid()]
+    for writer in writers:
+        writer.flush()
+
+
+def list_chunks(path: pathlib.Path) -> list[str]:
+    """Lists the chunks of a columnar results file.
+
+    Args:
+        path (pathlib.Path): path of the results file
+
+    Returns:
+        list[str]: chunk names in the order of writing
+    """
+    with zipfile.ZipFile(path, mode="r") as file:
+        return _chunk_names(file)
+
+
+def _chunk_names(file: zipfile.ZipFile) -> list[str]:
+    return sorted({name.split("/")[0] for name in file.namelist()})
+
+
+def columnar_result_files(simulation_id: str) -> list[pathlib.Path]:
+    """Finds the columnar results file and the shards of a simulation.
+
+    Args:
+        simulation_id (str): simulation id
+
+    Returns:
+        list[pathlib.Path]: paths of the results files
+    """
+    path = pathlib.Path("data")
+    files = [path / f"{simulation_id}.npz"] + sorted(path.glob(f"{simulation_id}.*.npz"))
+    return [file for file in files if file.exists()]
+
+
+def read_columnar_results(simulation_id: str, as_dataframe: bool = False) -> "dict[str, np.ndarray] | pd.DataFrame":
+    """Reads all results of a simulation saved with the `ColumnarContext`.
+    Every row represents one administered item.
+    The returned columns are `participant_id`, `test_id`, `step`, `ability_estimation`,
+    `standard_error`, `response`, `true_ability_level` and `item_id`.
+    Missing item ids are stored as -1.
+
+    Args:
+        simulation_id (str): simulation id
+        as_dataframe (bool): return a pandas DataFrame instead of a dictionary of arrays. Defaults to False.
+
+    Returns:
+        dict[str, np.ndarray] | pd.DataFrame: results
+    """
+    flush_columnar_results()
+
+    parts: dict[str, list[np.ndarray]] = {
+        column: [] for column in ["participant_id", "test_id", "step"] + STEP_COLUMNS[:-1]
+    }
+    for path in columnar_result_files(simulation_id):
+        with zipfile.ZipFile(path, mode="r") as file:
+            for chunk in _chunk_names(file):
+                lengths = _read_array(file, chunk, "length")
+                parts["participant_id"].append(np.repeat(_read_array(file, chunk, "participant_id"), lengths))
+                parts["test_id"].append(np.repeat(_read_array(file, chunk, "test_id"), lengths))
+                parts["step"].append(np.arange(int(lengths.sum())) - np.repeat(np.cumsum(lengths) - lengths, lengths))
+                for column in STEP_COLUMNS[:-1]:
+                    parts[column].append(_read_array(file, chunk, column))
+
+    results: dict[str, np.ndarray] = {
+        column: np.concatenate(values) if len(values) > 0 else np.array([])
+        for column, values in parts.items()
+    }
+    if as_dataframe:
+        import pandas as pd
+        return pd.DataFrame(results)
+    return results
+
+
+def read_columnar_test_results(simulation_id: str) -> dict[str, List[TestResult]]:
+    """Reads the test results of all participants of a simulation saved with the `ColumnarContext`.
+    If a participant was saved several times, the latest results are returned.
+
+    Args:
+        simulation_id (str): simulation id
+
+    Returns:
+        dict[str, List[TestResult]]: test results of every participant (key: participant id)
+    """
+    flush_columnar_results()
+
+    test_results: dict[str, List[TestResult]] = {}
+    for path in columnar_result_files(simulation_id):
+        with zipfile.ZipFile(path, mode="r") as file:
+            for chunk in _chunk_names(file):
+                participant_ids = _read_array(file, chunk, "participant_id").tolist()
+                chunk_results = _read_test_results(file, chunk, list(range(len(participant_ids))))
+                test_results.update(zip(participant_ids, chunk_results))
+    return test_results
+
+
+def _read_array(file: zipfile.ZipFile, chunk: str, column: str) -> np.ndarray:
+    with file.open(f"{chunk}/{column}.npy", "r") as member:
+        return np.lib.format.read_array(member, allow_pickle=False)
+
+
+def _read_test_results(file: zipfile.ZipFile, chunk: str, positions: list[int]) -> list[List[TestResult]]:
+    # converts the columns of the participants at the given positions of a chunk to test results
+    lengths = _read_array(file, chunk, "length")
+    starts = np.cumsum(lengths) - lengths
+    test_ids = _read_array(file, chunk, "test_id").tolist()
+    items: list[dict[str, Any]] = json.loads(file.read(f"{chunk}/items.json"))
+    columns = {column: _read_array(file, chunk, column).tolist() for column in STEP_COLUMNS}
+
+    return [
+        [
+            TestResult(
+                test_id=test_ids[position],
+                ability_estimation=columns["ability_estimation"][row],
+                standard_error=columns["standard_error"][row],
+                showed_item=items[columns["item_index"][row]],
+                response=columns["response"][row],
+                true_ability_level=columns["true_ability_level"][row]
+            )
+            for row in range(int(starts[position]), int(starts[position] + lengths[position]))
+        ]
+        for position in positions
+    ]
+
+
+class ColumnarContext(ITestResults):
+    def __init__(self,
+                 simulation_id: str,
+                 participant_id: str,
+                 chunk_size: int = 256,
+                 compress: bool = False,
+                 shard: str | None = None):
+        """Implementation of the ITestResults interface for
+        saving the test results of all participants in one columnar file.
+        The results are buffered and appended in chunks to the zip archive
+        `data/<simulation_id>.npz` (or `data/<simulation_id>.<shard>.npz`).
+        Every chunk contains typed NumPy columns and a table of the administered items,
+        so that the items are referenced by their position and id instead of a dictionary.
+
+        In worker processes, the process id is used as shard,
+        so that several processes never write to the same file.
+        Existing files are appended to.
+
+        Args:
+            simulation_id (str): simulation id (file name)
+            participant_id (str): participant id
+            chunk_size (int): number of participants that are written at once. Defaults to 256.
+            compress (bool): compress the chunks. Defaults to False.
+            shard (str | None): suffix of the results file. Defaults to the process id in worker processes.
+        """
+        super().__init__(simulation_id, participant_id)
+        if shard is None and multiprocessing.parent_process() is not None:
+            shard = str(os.getpid())
+        self.filename = f"data/{simulation_id}.npz" if shard is None else f"data/{simulation_id}.{shard}.npz"
+        self.chunk_size = chunk_size
+        self.compress = compress
+
+    def save(self, test_results: List[TestResult]) -> None:
+        """Buffers the test results of the participant.
+        The buffer is written to the results file as soon as
+        it contains `chunk_size` participants or the process exits.
+
+        Args:
+            test_results (List[TestResult]): list of test results
+        """
+        global _finalizer_pid
+        with _writers_lock:
+            writer = _writers.get(self.filename)
+            if writer is None or writer.pid != os.getpid():
+                writer = _ColumnarWriter(pathlib.Path(self.filename), self.chunk_size, self.compress)
+                _writers[self.filename] = writer
+            writer.chunk_size = self.chunk_size
+            writer.compression = zipfile.ZIP_DEFLATED if self.compress else zipfile.ZIP_STORED
+            if _finalizer_pid != os.getpid():
+                # flush the buffers when the process exits
+                multiprocessing.util.Finalize(None, flush_columnar_results, exitpriority=10)
+                _finalizer_pid = os.getpid()
+        writer.append(self.participant_id, test_results)
+
+    def load(self) -> List[TestResult]:
+        """Loads the test results of the participant from all results files of the simulation.
+        If the participant was saved several times, the latest results are returned.
+        If the participant was not found, an empty list is returned.
+
+        Returns:
+            List[TestResult]: list of test results
+        """
+        flush_columnar_results()
+
+        test_results: List[TestResult] = []
+        for path in columnar_result_files(self.simulation_id):
+            with zipfile.ZipFile(path, mode="r") as file:
+                for chunk in _chunk_names(file):
+                    participant_ids = _read_array(file, chunk, "participant_id")
+                    positions = np.flatnonzero(participant_ids == str(self.participant_id))
+                    if len(positions) > 0:
+                        test_results = _read_test_results(file, chunk, [int(positions[-1])])[0]
+        return test_results
@@ -1,2 +1,17 @@
 from .__pickle_context import PickleContext
 from .__csv_context import CSVContext
+from .__columnar_context import (
+    ColumnarContext,
+    flush_columnar_results,
+    read_columnar_results,
+    read_columnar_test_results
+)
+from .__sqlite_context import (
+    SQLiteContext,
+    connect_results_database,
+    read_sqlite_final_test_results,
+    read_sqlite_exposure_counts
+)
+from .__sqlite_exposure_counter import SQLiteExposureCounter
+from .__shared_exposure_counter import SharedExposureCounter
+from .__session_store import SQLiteSessionStore, FileSessionStore
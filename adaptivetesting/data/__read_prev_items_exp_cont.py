@@ -4,16 +4,19 @@ from ..models.__test_item import TestItem
 from ..models.__test_result import TestResult
 from .__csv_context import CSVContext
 from .__pickle_context import PickleContext
+from .__columnar_context import ColumnarContext
+from .__sqlite_context import SQLiteContext
 
 
-def read_prev_items(format: Literal["CSV", "PICKLE"],
+def read_prev_items(format: Literal["CSV", "PICKLE", "COLUMNAR", "SQLITE"],
                     test_id: str,
                     participant_ids: list[str]) -> list[TestItem]:
     """Read previously administered items.
     This function is internally used to perform exposure control.
 
     Args:
-        format (Literal["CSV", "PICKLE"]): The format of the results: CSV or PICKLE.
+        format (Literal["CSV", "PICKLE", "COLUMNAR", "SQLITE"]): The format of the results:
+            CSV, PICKLE, COLUMNAR or SQLITE.
         test_id (str): The test ID / simulation ID.
         participant_ids (list[str]): The participant IDs.
 
@@ -32,13 +35,16 @@ def read_prev_items(format: Literal["CSV", "PICKLE"],
 
 
 @deprecated("This function will be removed in future releases.")
-def read_single_participant(test_id: str, participant_id: str, format: Literal["CSV", "PICKLE"]) -> list[TestResult]:
+def read_single_participant(test_id: str,
+                            participant_id: str,
+                            format: Literal["CSV", "PICKLE", "COLUMNAR", "SQLITE"]) -> list[TestResult]:
     """
     Reads the test results of a particular participant.
     Args:
         test_id (str): The test ID / simulation ID.
         participant_id (str): The participant ID.
-        format (Literal["CSV", "PICKLE"]): The format of the results: CSV or PICKLE.
+        format (Literal["CSV", "PICKLE", "COLUMNAR", "SQLITE"]): The format of the results:
+            CSV, PICKLE, COLUMNAR or SQLITE.
 
     Returns:
         list[TestResult]: A list of TestResult objects.
@@ -46,11 +52,17 @@ def read_single_participant(test_id: str, participant_id: str, format: Literal["
     Raises:
         ValueError: If the format is not supported.
     """
-    context: CSVContext | PickleContext
+    context: CSVContext | PickleContext | ColumnarContext | SQLiteContext
     if format == "CSV":
         context = CSVContext(test_id, participant_id)
         return context.load()
     if format == "PICKLE":
         context = PickleContext(test_id, participant_id)
         return context.load()
+    if format == "COLUMNAR":
+        context = ColumnarContext(test_id, participant_id)
+        return context.load()
+    if format == "SQLITE":
+        context = SQLiteContext(test_id, participant_id)
+        return context.load()
     raise ValueError(f"Unknown format: {format}")
@@ -0,0 +1,84 @@
+import pathlib
+import sqlite3
+import threading
+from urllib.parse import quote
+from ..services.__session_store_interface import ISessionStore
+
+
+class SQLiteSessionStore(ISessionStore):
+    def __init__(self, filename: str = "data/sessions.db", timeout: float = 30.0):
+        """Stores session snapshots in the table `sessions` of a SQLite database.
+        The connection is kept open and shared by all threads of the process.
+        The database uses the WAL journal mode, so that several processes can use the same file.
+
+        Args:
+            filename (str): path of the database file. Defaults to `data/sessions.db`.
+            timeout (float): seconds to wait for a lock of another process. Defaults to 30.
+        """
+        self.filename = filename
+        pathlib.Path(filename).parent.mkdir(parents=True, exist_ok=True)
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(filename, timeout=timeout, check_same_thread=False)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute(f"PRAGMA busy_timeout={int(timeout * 1000)}")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        self.__connection.execute(
+            "CREATE TABLE IF NOT EXISTS sessions (session_id TEXT PRIMARY KEY, snapshot BLOB NOT NULL) WITHOUT ROWID"
+        )
+
+    def save(self, session_id: str, snapshot: bytes) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.execute("INSERT OR REPLACE INTO sessions VALUES (?, ?)", (session_id, snapshot))
+
+    def load(self, session_id: str) -> bytes | None:
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT snapshot FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return None if row is None else bytes(row[0])
+
+    def delete(self, session_id: str) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return self.__connection.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    def close(self):
+        """Closes the database connection."""
+        self.__connection.close()
+
+
+class FileSessionStore(ISessionStore):
+    def __init__(self, directory: str = "data/sessions"):
+        """Stores every session snapshot in a file `<directory>/<session_id>.snapshot`.
+        Snapshots are written to a temporary file first and then renamed,
+        so that a snapshot is never read partially.
+
+        Args:
+            directory (str): directory of the snapshot files. Defaults to `data/sessions`.
+        """
+        self.directory = pathlib.Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def __path(self, session_id: str) -> pathlib.Path:
+        return self.directory / f"{quote(session_id, safe='')}.snapshot"
+
+    def save(self, session_id: str, snapshot: bytes) -> None:
+        path = self.__path(session_id)
+        temporary = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        temporary.write_bytes(snapshot)
+        temporary.replace(path)
+
+    def load(self, session_id: str) -> bytes | None:
+        try:
+            return self.__path(session_id).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def delete(self, session_id: str) -> None:
+        self.__path(session_id).unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(list(self.directory.glob("*.snapshot")))
@@ -0,0 +1,245 @@
+from multiprocessing.context import get_spawning_popen
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Sequence
+import multiprocessing
+import sys
+import numpy as np
+from ..models.__test_item import TestItem
+from ..services.__exposure_counter_interface import IExposureCounter
+
+# locks of the counters known to this process (key: name of the shared memory block),
+# so that counters can be passed to a worker without their locks once the worker has been created
+_process_locks: dict[str, list[Any]] = {}
+
+
+class SharedExposureCounter(IExposureCounter):
+    def __init__(self,
+                 shared_memory: SharedMemory,
+                 item_ids: list[int | None],
+                 constraint_names: list[str],
+                 item_constraints: list[list[int]],
+                 locks: list[Any],
+                 owner: bool = False):
+        """Exposure counts of all items and constraints stored in a
+        `multiprocessing.shared_memory` block.
+        The counts are increased directly after every administration,
+        so that all worker processes of a parallel simulation see the live counts
+        without reading any files.
+
+        The counts are indexed by the position of the items.
+        Every count is protected by one of several locks (lock striping),
+        so that workers administering different items rarely wait for each other.
+
+        Instances are created with `SharedExposureCounter.create`.
+        The locks have to be passed to the workers on process creation,
+        e.g. within the test factory of a `SpecSimulationPool`
+        or by the initializer of a `SimulationPool` (see `install`).
+        Afterwards, tests holding the counter can be sent to the workers.
+        The process that created the counter has to release the block
+        by calling `unlink` (or by using the counter as a context manager).
+
+        Args:
+            shared_memory (SharedMemory): shared memory block
+            item_ids (list[int | None]): item ids
+            constraint_names (list[str]): constraint names
+            item_constraints (list[list[int]]): positions of the constraints of every item
+            locks (list[Any]): locks protecting the counts
+            owner (bool): whether this instance created the shared memory block
+        """
+        self.item_ids = item_ids
+        self.constraint_names = constraint_names
+        self.item_constraints = item_constraints
+        self.owner = owner
+        self.__locks = locks
+        self.__shared_memory = shared_memory
+        self.__item_positions = {item_id: position for position, item_id in enumerate(item_ids)}
+        self.__constraint_positions = {name: position for position, name in enumerate(constraint_names)}
+        self.__counts = np.ndarray((len(item_ids) + len(constraint_names),),
+                                   dtype=np.int64,
+                                   buffer=shared_memory.buf)
+
+    @staticmethod
+    def create(items: Sequence[TestItem], n_locks: int = 16) -> "SharedExposureCounter":
+        """Creates a new shared exposure counter for the items of an item pool.
+        The constraints are determined by the `category` property of the items.
+
+        Args:
+            items (Sequence[TestItem]): items of the item pool
+            n_locks (int): number of locks protecting the counts. Defaults to 16.
+
+        Returns:
+            SharedExposureCounter: counter that owns the shared memory block
+
+        Raises:
+            ValueError: Raised if the item ids are not unique or n_locks is smaller than 1.
+        """
+        item_ids = [item.id for item in items]
+        if len(set(item_ids)) != len(item_ids):
+            raise ValueError("The items of a shared exposure counter need unique ids.")
+        if n_locks < 1:
+            raise ValueError("n_locks has to be at least 1.")
+
+        constraint_names = sorted({
+            name for item in items for name in item.additional_properties.get("category", [])
+        })
+        constraint_positions = {name: position for position, name in enumerate(constraint_names)}
+        item_constraints = [
+            [constraint_positions[name] for name in item.additional_properties.get("category", [])]
+            for item in items
+        ]
+
+        size = (len(item_ids) + len(constraint_names)) * np.dtype(np.int64).itemsize
+        shared_memory = SharedMemory(create=True, size=max(size, 1))
+        np.ndarray((len(item_ids) + len(constraint_names),), dtype=np.int64, buffer=shared_memory.buf)[:] = 0
+
+        locks = [multiprocessing.Lock() for _ in range(n_locks)]
+        _process_locks[shared_memory.name] = locks
+        return SharedExposureCounter(shared_memory, item_ids, constraint_names, item_constraints, locks, owner=True)
+
+    @staticmethod
+    def attach(name: str,
+               item_ids: list[int | None],
+               constraint_names: list[str],
+               item_constraints: list[list[int]],
+               locks: list[Any] | None = None) -> "SharedExposureCounter":
+        """Attaches to an existing shared exposure counter.
+
+        Args:
+            name (str): name of the shared memory block
+            item_ids (list[int | None]): item ids
+            constraint_names (list[str]): constraint names
+            item_constraints (list[list[int]]): positions of the constraints of every item
+            locks (list[Any] | None): locks protecting the counts.
+                If None, the locks that have been passed to this process are used (see `install`).
+
+        Returns:
+            SharedExposureCounter: counter that does not own the shared memory block
+
+        Raises:
+            RuntimeError: Raised if the locks have not been passed to this process.
+        """
+        if locks is None:
+            locks = _process_locks.get(name)
+            if locks is None:
+                raise RuntimeError("The locks of the shared exposure counter have not been passed to this process. "
+                                   "Pass the counter to the workers on process creation (see install).")
+        else:
+            _process_locks[name] = locks
+        if sys.version_info >= (3, 13):
+            # the block is released by the creating process
+            shared_memory = SharedMemory(name=name, create=False, track=False)
+        else:
+            shared_memory = SharedMemory(name=name, create=False)
+        return SharedExposureCounter(shared_memory, item_ids, constraint_names, item_constraints, locks)
+
+    @staticmethod
+    def install(counters: Sequence["SharedExposureCounter"]):
+        """Makes the locks of counters available in a worker process,
+        so that tests holding the counters can be sent to the worker afterwards.
+        Used as initializer of the worker processes (the counters are passed as initializer arguments).
+
+        Args:
+            counters (Sequence[SharedExposureCounter]): counters used by the worker
+        """
+        for counter in counters:
+            _process_locks[counter.name] = counter.__locks
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block"""
+        return self.__shared_memory.name
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Read-only view of the exposure counts of the items (indexed by item position)"""
+        view = self.__counts[:len(self.item_ids)]
+        view.flags.writeable = False
+        return view
+
+    def __reduce__(self):
+        # locks can only be pickled while a process is created,
+        # otherwise the worker uses the locks that have been passed to it on creation
+        locks = self.__locks if get_spawning_popen() is not None else None
+        return (SharedExposureCounter.attach,
+                (self.name, self.item_ids, self.constraint_names, self.item_constraints, locks))
+
+    def __enter__(self) -> "SharedExposureCounter":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+        if self.owner:
+            self.unlink()
+
+    def __del__(self):
+        if "_SharedExposureCounter__shared_memory" in self.__dict__:
+            self.close()
+
+    def close(self):
+        """Closes the access to the shared memory block."""
+        self.__dict__.pop("_SharedExposureCounter__counts", None)
+        self.__shared_memory.close()
+
+    def unlink(self):
+        """Releases the shared memory block.
+        Only the process that created the counter should call this method.
+        """
+        _process_locks.pop(self.name, None)
+        self.__shared_memory.unlink()
+
+    def __increment(self, position: int):
+        with self.__locks[position % len(self.__locks)]:
+            self.__counts[position] += 1
+
+    def on_item_administered(self, item: TestItem) -> None:
+        """Increases the counts of the item and its constraints.
+
+        Args:
+            item (TestItem): administered item
+
+        Raises:
+            ValueError: Raised if the item is not part of the counter.
+        """
+        position = self.__item_positions.get(item.id)
+        if position is None:
+            raise ValueError(f"Item with id {item.id} is not part of the shared exposure counter.")
+        self.__increment(position)
+        for constraint_position in self.item_constraints[position]:
+            self.__increment(len(self.item_ids) + constraint_position)
+
+    def record(self, participant_id: str, items: list[dict]) -> None:
+        """The counts are already increased after every administration.
+        Therefore, nothing is done when the test results are saved.
+
+        Args:
+            participant_id (str): participant id
+            items (list[dict]): administered items (`TestItem.as_dict`)
+        """
+        pass
+
+    def constraint_counts(self, constraint_names: list[str]) -> dict[str, int]:
+        """Number of administered items for every constraint.
+
+        Args:
+            constraint_names (list[str]): constraint names
+
+        Returns:
+            dict[str, int]: number of administered items (key: constraint name)
+        """
+        counts: dict[str, int] = {}
+        for name in constraint_names:
+            position = self.__constraint_positions.get(name)
+            counts[name] = 0 if position is None else int(self.__counts[len(self.item_ids) + position])
+        return counts
+
+    def item_counts(self) -> dict[int, int]:
+        """Number of administrations of every item.
+
+        Returns:
+            dict[int, int]: number of administrations (key: item id)
+        """
+        return {
+            item_id: int(count)
+            for item_id, count in zip(self.item_ids, self.__counts[:len(self.item_ids)].tolist())
+            if item_id is not None
+        }
@@ -0,0 +1,228 @@
+from typing import List
+import json
+import pathlib
+import sqlite3
+from ..models.__test_result import TestResult
+from ..services.__test_results_interface import ITestResults
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    a REAL NOT NULL,
+    b TEXT NOT NULL,
+    c REAL NOT NULL,
+    d REAL NOT NULL,
+    additional_properties TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    participant_id TEXT NOT NULL,
+    step INTEGER NOT NULL,
+    test_id TEXT NOT NULL,
+    ability_estimation REAL,
+    standard_error REAL,
+    item_id INTEGER NOT NULL REFERENCES items(id),
+    response INTEGER NOT NULL,
+    true_ability_level REAL,
+    PRIMARY KEY (participant_id, step)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS results_item_id ON results(item_id);
+"""
+
+RESULT_QUERY = """
+SELECT r.participant_id, r.test_id, r.ability_estimation, r.standard_error, r.response, r.true_ability_level,
+       i.id, i.a, i.b, i.c, i.d, i.additional_properties
+FROM results r JOIN items i ON i.id = r.item_id
+"""
+
+FINAL_STEP_JOIN = """
+JOIN (SELECT participant_id, MAX(step) AS step FROM results GROUP BY participant_id) f
+ON f.participant_id = r.participant_id AND f.step = r.step
+"""
+
+
+def connect_results_database(filename: str, timeout: float = 30.0) -> sqlite3.Connection:
+    """Opens the SQLite results database and creates the tables if they do not exist.
+    The database uses the WAL journal mode, so that several processes
+    can append results while others are reading.
+
+    Args:
+        filename (str): path of the database file
+        timeout (float): seconds to wait for a lock of another process. Defaults to 30.
+
+    Returns:
+        sqlite3.Connection: database connection
+    """
+    pathlib.Path(filename).parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(filename, timeout=timeout)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute(f"PRAGMA busy_timeout={int(timeout * 1000)}")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def _item_id(item_id):
+    # NumPy integers cannot be bound as parameters
+    return item_id.item() if hasattr(item_id, "item") else item_id
+
+
+def _to_test_result(row: tuple) -> TestResult:
+    # converts a row of the RESULT_QUERY to a test result
+    # (SQLite stores NaN, e.g., the estimates of pretest steps, as NULL)
+    return TestResult(
+        test_id=row[1],
+        ability_estimation=float("nan") if row[2] is None else row[2],
+        standard_error=float("nan") if row[3] is None else row[3],
+        showed_item={
+            "id": row[6],
+            "a": row[7],
+            "b": json.loads(row[8]),
+            "c": row[9],
+            "d": row[10],
+            "additional_properties": json.loads(row[11])
+        },
+        response=row[4],
+        true_ability_level=row[5]
+    )
+
+
+class SQLiteContext(ITestResults):
+    def __init__(self,
+                 simulation_id: str,
+                 participant_id: str,
+                 timeout: float = 30.0):
+        """Implementation of the ITestResults interface for
+        saving test results to the SQLite database `data/<simulation_id>.db`.
+        The administered items are stored once in the table `items` (key: item id)
+        and the steps of all participants in the table `results` (key: participant id and step).
+        The results of a participant are written in a single transaction.
+        The database uses the WAL journal mode, so that several worker processes
+        can save their results concurrently.
+
+        The items need an id to be saved.
+
+        Args:
+            simulation_id (str): simulation id (file name)
+            participant_id (str): participant id
+            timeout (float): seconds to wait for a lock of another process. Defaults to 30.
+        """
+        super().__init__(simulation_id, participant_id)
+        self.timeout = timeout
+
+    def save(self, test_results: List[TestResult]) -> None:
+        """Saves a list of test results to the database.
+        Previously saved results of the participant are replaced.
+
+        Args:
+            test_results (List[TestResult]): list of test results
+
+        Raises:
+            ValueError: Raised if an administered item has no id.
+        """
+        if any([result.showed_item.get("id") is None for result in test_results]):
+            raise ValueError("Items need an id to be saved in a SQLite database.")
+
+        items = {
+            _item_id(result.showed_item["id"]): (
+                _item_id(result.showed_item["id"]),
+                float(result.showed_item["a"]),
+                json.dumps(result.showed_item["b"], default=float),
+                float(result.showed_item["c"]),
+                float(result.showed_item["d"]),
+                json.dumps(result.showed_item.get("additional_properties", {}), default=str)
+            )
+            for result in test_results
+        }
+        rows = [
+            (
+                str(self.participant_id),
+                step,
+                str(result.test_id),
+                float(result.ability_estimation),
+                float(result.standard_error),
+                _item_id(result.showed_item["id"]),
+                int(result.response),
+                None if result.true_ability_level is None else float(result.true_ability_level)
+            )
+            for step, result in enumerate(test_results)
+        ]
+
+        connection = connect_results_database(self.filename, self.timeout)
+        try:
+            with connection:
+                connection.executemany("INSERT OR IGNORE INTO items VALUES (?, ?, ?, ?, ?, ?)", items.values())
+                connection.execute("DELETE FROM results WHERE participant_id = ?", (str(self.participant_id),))
+                connection.executemany("INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        finally:
+            connection.close()
+
+    def load(self) -> List[TestResult]:
+        """Loads the test results of the participant from the database.
+
+        Returns:
+            List[TestResult]: list of test results
+        """
+        connection = connect_results_database(self.filename, self.timeout)
+        try:
+            rows = connection.execute(
+                RESULT_QUERY + " WHERE r.participant_id = ? ORDER BY r.step",
+                (str(self.participant_id),)
+            ).fetchall()
+        finally:
+            connection.close()
+        return [_to_test_result(row) for row in rows]
+
+
+def read_sqlite_final_test_results(simulation_id: str, participant_ids: list[str]) -> list[TestResult]:
+    """Reads the final test result of every participant from the SQLite database
+    with a single query.
+
+    Args:
+        simulation_id (str): simulation id
+        participant_ids (list[str]): participant ids
+
+    Returns:
+        list[TestResult]: final test result of every participant (in the order of `participant_ids`)
+
+    Raises:
+        KeyError: Raised if no results are available for a participant.
+    """
+    connection = connect_results_database(f"data/{simulation_id}.db")
+    try:
+        rows = connection.execute(
+            RESULT_QUERY + FINAL_STEP_JOIN
+        ).fetchall()
+    finally:
+        connection.close()
+    final_results = {row[0]: _to_test_result(row) for row in rows}
+    return [final_results[str(participant_id)] for participant_id in participant_ids]
+
+
+def read_sqlite_exposure_counts(simulation_id: str, participant_ids: list[str] | None = None) -> dict[int, int]:
+    """Counts how often every item has been administered.
+
+    Args:
+        simulation_id (str): simulation id
+        participant_ids (list[str] | None): only count the items of these participants.
+            Defaults to all participants.
+
+    Returns:
+        dict[int, int]: number of administrations (key: item id)
+    """
+    connection = connect_results_database(f"data/{simulation_id}.db")
+    try:
+        if participant_ids is None:
+            rows = connection.execute("SELECT item_id, COUNT(*) FROM results GROUP BY item_id").fetchall()
+        else:
+            connection.execute("CREATE TEMP TABLE selected_participants (participant_id TEXT PRIMARY KEY)")
+            connection.executemany("INSERT OR IGNORE INTO selected_participants VALUES (?)",
+                                   [(str(participant_id),) for participant_id in participant_ids])
+            rows = connection.execute(
+                "SELECT item_id, COUNT(*) FROM results"
+                " WHERE participant_id IN (SELECT participant_id FROM selected_participants)"
+                " GROUP BY item_id"
+            ).fetchall()
+    finally:
+        connection.close()
+    return {item_id: count for item_id, count in rows}
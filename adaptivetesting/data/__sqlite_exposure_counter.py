@@ -0,0 +1,123 @@
+import os
+import sqlite3
+from ..services.__exposure_counter_interface import IExposureCounter
+from .__sqlite_context import connect_results_database
+
+
+EXPOSURE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS exposed_participants (
+    participant_id TEXT PRIMARY KEY
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS item_exposure (
+    item_id INTEGER PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS constraint_exposure (
+    constraint_name TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class SQLiteExposureCounter(IExposureCounter):
+    def __init__(self, simulation_id: str, timeout: float = 30.0):
+        """Persistent exposure counts stored in the SQLite database `data/<simulation_id>.db`.
+        The counts of the items (key: item id) and constraints (key: constraint name)
+        are updated in a single transaction when the results of a test are saved.
+        Every participant is only counted once.
+        Reading the counts of the constraints requires one indexed lookup per constraint.
+
+        Args:
+            simulation_id (str): simulation id (file name)
+            timeout (float): seconds to wait for a lock of another process. Defaults to 30.
+        """
+        self.simulation_id = simulation_id
+        self.filename = f"data/{simulation_id}.db"
+        self.timeout = timeout
+        self.__connection: sqlite3.Connection | None = None
+        self.__connection_pid: int | None = None
+
+    def __getstate__(self):
+        # connections cannot be shared between processes
+        state = self.__dict__.copy()
+        state["_SQLiteExposureCounter__connection"] = None
+        return state
+
+    def connection(self) -> sqlite3.Connection:
+        """Connection to the database. The connection is opened on first use.
+
+        Returns:
+            sqlite3.Connection: database connection
+        """
+        # connections cannot be used in forked processes
+        if self.__connection is None or self.__connection_pid != os.getpid():
+            self.__connection = connect_results_database(self.filename, self.timeout)
+            self.__connection.executescript(EXPOSURE_SCHEMA)
+            self.__connection_pid = os.getpid()
+        return self.__connection
+
+    def close(self):
+        """Closes the connection to the database."""
+        if self.__connection is not None and self.__connection_pid == os.getpid():
+            self.__connection.close()
+        self.__connection = None
+
+    def record(self, participant_id: str, items: list[dict]) -> None:
+        """Adds the administered items of a test to the counts.
+        If the participant has already been recorded, the counts are not changed.
+
+        Args:
+            participant_id (str): participant id
+            items (list[dict]): administered items (`TestItem.as_dict`)
+        """
+        item_counts: dict[int, int] = {}
+        constraint_counts: dict[str, int] = {}
+        for item in items:
+            if item.get("id") is not None:
+                item_id = item["id"].item() if hasattr(item["id"], "item") else item["id"]
+                item_counts[item_id] = item_counts.get(item_id, 0) + 1
+            for constraint_name in item.get("additional_properties", {}).get("category", []):
+                constraint_counts[constraint_name] = constraint_counts.get(constraint_name, 0) + 1
+
+        connection = self.connection()
+        with connection:
+            inserted = connection.execute("INSERT OR IGNORE INTO exposed_participants VALUES (?)",
+                                          (str(participant_id),)).rowcount
+            if inserted == 0:
+                return
+            connection.executemany(
+                "INSERT INTO item_exposure VALUES (?, ?) "
+                "ON CONFLICT(item_id) DO UPDATE SET count = count + excluded.count",
+                item_counts.items()
+            )
+            connection.executemany(
+                "INSERT INTO constraint_exposure VALUES (?, ?) "
+                "ON CONFLICT(constraint_name) DO UPDATE SET count = count + excluded.count",
+                constraint_counts.items()
+            )
+
+    def constraint_counts(self, constraint_names: list[str]) -> dict[str, int]:
+        """Number of administered items for every constraint.
+
+        Args:
+            constraint_names (list[str]): constraint names
+
+        Returns:
+            dict[str, int]: number of administered items (key: constraint name)
+        """
+        connection = self.connection()
+        counts: dict[str, int] = {}
+        for constraint_name in constraint_names:
+            row = connection.execute("SELECT count FROM constraint_exposure WHERE constraint_name = ?",
+                                     (constraint_name,)).fetchone()
+            counts[constraint_name] = 0 if row is None else row[0]
+        return counts
+
+    def item_counts(self) -> dict[int, int]:
+        """Number of administrations of every item.
+
+        Returns:
+            dict[int, int]: number of administrations (key: item id)
+        """
+        rows = self.connection().execute("SELECT item_id, count FROM item_exposure").fetchall()
+        return {item_id: count for item_id, count in rows}
@@ -0,0 +1,278 @@
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable
+import asyncio
+import os
+import threading
+import numpy as np
+from ..models.__adaptive_test import AdaptiveTest
+from ..models.__item_bank import ItemBank
+from ..models.__item_pool import ItemPool
+from ..models.__test_item import TestItem
+from ..models.__test_result import TestResult
+from ..models.__misc import StoppingCriterion
+from ..math.exposure_control.__randomesque import Randomesque
+from ..math.exposure_control.__sympson_hetter import SympsonHetter
+from .__test_assembler import TestAssembler
+from .__session_snapshot import SessionSnapshot
+
+
+class CATSession:
+    __default_executor: ThreadPoolExecutor | None = None
+    __default_executor_lock = threading.Lock()
+
+    def __init__(self,
+                 adaptive_test: AdaptiveTest,
+                 criterion: StoppingCriterion | list[StoppingCriterion] = StoppingCriterion.SE,
+                 value: float | list[float | int] = 0.4,
+                 executor: Executor | None = None):
+        """Step-wise delivery of an adaptive test, e.g., for a web application.
+        Instead of letting the test request responses (`AdaptiveTest.get_response`),
+        the application drives the test:
+        `start` returns the first item and `submit` takes the response to the current item
+        and returns the next item or, if the test is finished, the final result.
+
+        The async variants `astart` and `asubmit` run the item selection and ability estimation
+        in an executor, so that many sessions can be served by one event loop.
+        By default, a thread pool shared by all sessions with one worker per CPU is used.
+        The steps of one session are run one after another.
+
+        Pretests of the `TestAssembler` are not supported.
+
+        The state of a session can be moved between workers
+        with `snapshot` and `restore`.
+
+        Args:
+            adaptive_test (AdaptiveTest): instance of an adaptive test implementation
+            criterion (StoppingCriterion | list[StoppingCriterion]): stopping criterion or list of criteria.
+                Defaults to StoppingCriterion.SE.
+            value (float | list[float | int]): threshold value(s) for the stopping criteria. Defaults to 0.4.
+            executor (Executor | None): executor running the item selection and ability estimation
+                of the async variants. Defaults to None (shared thread pool).
+        """
+        self.adaptive_test = adaptive_test
+        self.criterion = criterion
+        self.value = value
+        self.executor = executor
+        self.current_item: TestItem | None = None
+        """Item waiting for a response"""
+        self.finished = False
+        """Whether the test is finished"""
+        self.__lock = threading.Lock()
+        self.__async_lock: asyncio.Lock | None = None
+
+    @staticmethod
+    def default_executor() -> ThreadPoolExecutor:
+        """Thread pool shared by all sessions that do not have their own executor.
+        The pool is created on first use with one worker per CPU.
+
+        Returns:
+            ThreadPoolExecutor: shared thread pool
+        """
+        with CATSession.__default_executor_lock:
+            if CATSession.__default_executor is None:
+                CATSession.__default_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                                                   thread_name_prefix="cat-session")
+            return CATSession.__default_executor
+
+    @property
+    def result(self) -> TestResult | None:
+        """Result of the last step (None if no item has been answered yet)"""
+        results = self.adaptive_test.test_results
+        return results[-1] if len(results) > 0 else None
+
+    def start(self) -> TestItem:
+        """Starts the test.
+        If the test has already been started, the current item is returned again.
+
+        Returns:
+            TestItem: first item
+
+        Raises:
+            ValueError: Raised if the test is already finished.
+        """
+        with self.__lock:
+            if self.finished:
+                raise ValueError("The test is already finished.")
+            if self.current_item is None:
+                self.current_item = self.adaptive_test.get_next_item()
+            return self.current_item
+
+    def submit(self, response: int) -> TestItem | TestResult:
+        """Submits the response to the current item.
+
+        Args:
+            response (int): response to the current item
+
+        Returns:
+            TestItem | TestResult: next item or, if the test is finished, the result of the last step
+
+        Raises:
+            ValueError: Raised if the test has not been started or is already finished.
+        """
+        with self.__lock:
+            if self.finished:
+                raise ValueError("The test is already finished.")
+            if self.current_item is None:
+                raise ValueError("The test has not been started.")
+            result = self.adaptive_test.administer_item(self.current_item, response)
+            self.current_item = None
+            if self.adaptive_test.check_stopping_criteria(self.criterion, self.value):
+                self.finished = True
+                return result
+            self.current_item = self.adaptive_test.get_next_item()
+            return self.current_item
+
+    async def __run_in_executor(self, function, *args):
+        # the steps of a session are run one after another
+        if self.__async_lock is None:
+            self.__async_lock = asyncio.Lock()
+        async with self.__async_lock:
+            executor = self.executor if self.executor is not None else CATSession.default_executor()
+            return await asyncio.get_running_loop().run_in_executor(executor, function, *args)
+
+    async def astart(self) -> TestItem:
+        """Async variant of `start`.
+        The item selection is run in the executor.
+
+        Returns:
+            TestItem: first item
+        """
+        return await self.__run_in_executor(self.start)
+
+    async def asubmit(self, response: int) -> TestItem | TestResult:
+        """Async variant of `submit`.
+        The ability estimation and item selection are run in the executor.
+
+        Args:
+            response (int): response to the current item
+
+        Returns:
+            TestItem | TestResult: next item or, if the test is finished, the result of the last step
+        """
+        return await self.__run_in_executor(self.submit, response)
+
+    def __exposure_control(self) -> Any:
+        if not isinstance(self.adaptive_test, TestAssembler) or self.adaptive_test.exposure_control is None:
+            return None
+        strategy = self.adaptive_test.selection_pipeline.strategy
+        return strategy if isinstance(strategy, (Randomesque, SympsonHetter)) else None
+
+    def snapshot(self, item_bank: ItemBank, include_results: bool = False) -> SessionSnapshot:
+        """Creates a compact snapshot of the session state:
+        administered items and responses, current ability estimate, current item,
+        removed items and the state of the exposure control (Randomesque, Sympson-Hetter).
+        The items are referenced by their position in `item_bank`, so the item ids have to be unique.
+        Counters of content balancing methods are not stored
+        because they are recalculated from the administered items.
+
+        Args:
+            item_bank (ItemBank): item bank containing all items of the test
+            include_results (bool): store the ability estimates and standard errors of the test results,
+                so that `restore` recreates the test results. Defaults to False.
+
+        Returns:
+            SessionSnapshot: snapshot (`SessionSnapshot.to_bytes` serializes it)
+        """
+        with self.__lock:
+            test = self.adaptive_test
+            administered = item_bank.positions_of_ids([item.id for item in test.answered_items])
+            removed = np.ones(len(item_bank), dtype=bool)
+            removed[item_bank.positions_of_ids([item.id for item in test.item_pool.test_items])] = False
+            removed[administered] = False
+
+            snapshot = SessionSnapshot(
+                bank_version=item_bank.version,
+                administered=administered,
+                responses=list(test.response_pattern),
+                ability_level=float(test.ability_level),
+                standard_error=float(test.standard_error),
+                current_item=None if self.current_item is None else item_bank.positions_of_ids(
+                    [self.current_item.id])[0],
+                finished=self.finished,
+                excluded=np.flatnonzero(removed).tolist()
+            )
+            if include_results:
+                snapshot.ability_estimates = [result.ability_estimation for result in test.test_results]
+                snapshot.standard_errors = [result.standard_error for result in test.test_results]
+            exposure_control = self.__exposure_control()
+            if exposure_control is not None:
+                snapshot.rng_state = dict(exposure_control.rng.bit_generator.state)
+                if isinstance(exposure_control, SympsonHetter):
+                    snapshot.rejected = item_bank.positions_of_ids(
+                        [item.id for item in exposure_control.rejected_items])
+            return snapshot
+
+    @staticmethod
+    def restore(snapshot: SessionSnapshot,
+                item_bank: ItemBank,
+                test_factory: Callable[[ItemPool], AdaptiveTest],
+                criterion: StoppingCriterion | list[StoppingCriterion] = StoppingCriterion.SE,
+                value: float | list[float | int] = 0.4,
+                executor: Executor | None = None) -> "CATSession":
+        """Restores a session from a snapshot.
+        The item pool of the restored test contains the items of `item_bank`
+        that have been neither administered nor removed. The items are not copied.
+        The enemy groups of `item_bank` (see `ItemBank.from_item_pool`)
+        are enforced for the remaining items.
+        If the snapshot includes the test results, they are recreated
+        (with the true ability level of the restored test).
+
+        Args:
+            snapshot (SessionSnapshot): snapshot of the session
+            item_bank (ItemBank): item bank the snapshot has been created with
+            test_factory (Callable[[ItemPool], AdaptiveTest]): creates the test for an item pool,
+                e.g., `partial(TestAssembler, simulation_id=..., participant_id=...,
+                ability_estimator=..., simulation=False, copy_item_pool=False)`
+            criterion (StoppingCriterion | list[StoppingCriterion]): stopping criterion or list of criteria
+            value (float | list[float | int]): threshold value(s) for the stopping criteria
+            executor (Executor | None): executor of the async variants
+
+        Returns:
+            CATSession: restored session
+
+        Raises:
+            ValueError: Raised if the snapshot has been created with a different item bank
+                or the included test results do not match the administered items.
+        """
+        if snapshot.bank_version != item_bank.version:
+            raise ValueError("The snapshot has been created with a different item bank.")
+        if snapshot.ability_estimates is not None and not (
+            len(snapshot.ability_estimates) == len(snapshot.standard_errors or []) == len(snapshot.administered)
+        ):
+            raise ValueError("The test results of the snapshot do not match the administered items.")
+        removed = np.zeros(len(item_bank), dtype=bool)
+        removed[snapshot.administered] = True
+        removed[snapshot.excluded] = True
+        items = item_bank.items
+        item_pool = ItemPool([items[position] for position in np.flatnonzero(~removed).tolist()])
+        item_pool.exclusions = item_bank.item_exclusions(removed)
+        test = test_factory(item_pool)
+        test.answered_items = [items[position] for position in snapshot.administered]
+        test.response_pattern = list(snapshot.responses)
+        test.ability_level = snapshot.ability_level
+        test.standard_error = snapshot.standard_error
+        if snapshot.ability_estimates is not None and snapshot.standard_errors is not None:
+            true_ability_level = test.true_ability_level if test.true_ability_level is not None else float("NaN")
+            test.test_results = [
+                TestResult(
+                    ability_estimation=ability_estimation,
+                    standard_error=standard_error,
+                    showed_item=item.as_dict(),
+                    response=response,
+                    test_id=test.simulation_id,
+                    true_ability_level=true_ability_level
+                )
+                for item, response, ability_estimation, standard_error in zip(
+                    test.answered_items, snapshot.responses, snapshot.ability_estimates, snapshot.standard_errors)
+            ]
+
+        session = CATSession(test, criterion, value, executor)
+        session.current_item = None if snapshot.current_item is None else items[snapshot.current_item]
+        session.finished = snapshot.finished
+        exposure_control = session.__exposure_control()
+        if exposure_control is not None:
+            if snapshot.rng_state is not None:
+                exposure_control.rng.bit_generator.state = snapshot.rng_state
+            if isinstance(exposure_control, SympsonHetter):
+                exposure_control.rejected_items = [items[position] for position in snapshot.rejected]
+        return session
@@ -0,0 +1,245 @@
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Hashable, Sequence
+import json
+import numpy as np
+
+
+def describe_value(value: Any, depth: int = 0) -> Any:
+    """Describes an argument of a test configuration by its value, e.g., to fingerprint a decision trie.
+    Objects are described by their type and attributes (e.g., the parameters of a prior),
+    functions and classes by their qualified name.
+
+    Args:
+        value (Any): argument
+        depth (int): nesting level of objects. Defaults to 0.
+
+    Returns:
+        Any: description that can be serialized as JSON
+
+    Raises:
+        TypeError: Raised if the value cannot be described by its value
+            (e.g., lambda functions or objects holding locks).
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Enum):
+        return f"{type(value).__qualname__}.{value.name}"
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (list, tuple)):
+        return [describe_value(element, depth) for element in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted([describe_value(element, depth) for element in value], key=json.dumps)
+    if isinstance(value, dict):
+        return {str(key): describe_value(element, depth)
+                for key, element in sorted(value.items(), key=lambda entry: str(entry[0]))}
+    if callable(value) and hasattr(value, "__qualname__"):
+        name = f"{getattr(value, '__module__', '')}.{value.__qualname__}"
+        if "<" in name:
+            raise TypeError(f"{name} cannot be described by its value.")
+        return name
+    if depth < 3 and hasattr(value, "__dict__"):
+        return {"type": f"{type(value).__module__}.{type(value).__qualname__}",
+                "attributes": describe_value(vars(value), depth + 1)}
+    raise TypeError(f"{type(value).__name__} cannot be described by its value.")
+
+
+class DecisionTrie:
+    __shared: OrderedDict[Hashable, "DecisionTrie"] = OrderedDict()
+    max_shared = 32
+    """Maximum number of trees shared within the process.
+    The least recently used tree is removed if the limit is exceeded."""
+
+    def __init__(self, fingerprint: str | None = None, max_depth: int | None = None):
+        """Prefix tree of the decisions of an adaptive test.
+        If the item selection is deterministic, all participants with the same responses
+        receive the same ability estimates and the same items.
+        For every response prefix, the tree stores the ability estimate,
+        its standard error and the id of the next item,
+        so that these steps only have to be calculated once.
+
+        A tree is only valid for one test configuration
+        (item pool, estimator, initial ability level and item selection).
+        The configuration is identified by `fingerprint`.
+        Trees can be saved and loaded (`save`, `load`),
+        e.g., to answer the first steps of a live test from a precompiled tree.
+
+        Args:
+            fingerprint (str | None): identifier of the test configuration
+            max_depth (int | None): maximum length of the stored response prefixes.
+                Deeper steps are not stored. Defaults to None (no limit).
+        """
+        self.fingerprint = fingerprint
+        self.max_depth = max_depth
+        self.root: dict[str, Any] = DecisionTrie.__node()
+        self.n_nodes = 1
+
+    @staticmethod
+    def __node() -> dict[str, Any]:
+        return {"ability_level": None, "standard_error": None, "item_id": None, "children": {}}
+
+    @staticmethod
+    def shared(key: Hashable, fingerprint: str | None = None, max_depth: int | None = None) -> "DecisionTrie":
+        """Returns the tree of a configuration that is shared within the process.
+        The tree is created on first access.
+        At most `max_shared` trees are kept (the least recently used tree is removed first).
+
+        Args:
+            key (Hashable): key of the configuration
+            fingerprint (str | None): identifier of the test configuration
+            max_depth (int | None): maximum length of the stored response prefixes
+
+        Returns:
+            DecisionTrie: shared tree
+        """
+        trie = DecisionTrie.__shared.get(key)
+        if trie is None:
+            trie = DecisionTrie(fingerprint, max_depth)
+            DecisionTrie.__shared[key] = trie
+            while len(DecisionTrie.__shared) > DecisionTrie.max_shared:
+                DecisionTrie.__shared.popitem(last=False)
+        else:
+            DecisionTrie.__shared.move_to_end(key)
+        return trie
+
+    @staticmethod
+    def n_shared() -> int:
+        """Number of trees shared within the process.
+
+        Returns:
+            int: number of trees
+        """
+        return len(DecisionTrie.__shared)
+
+    @staticmethod
+    def clear_shared():
+        """Removes all trees shared within the process."""
+        DecisionTrie.__shared.clear()
+
+    def __find(self, prefix: Sequence[int], create: bool = False) -> dict[str, Any] | None:
+        if self.max_depth is not None and len(prefix) > self.max_depth:
+            return None
+        node = self.root
+        for response in prefix:
+            child = node["children"].get(response)
+            if child is None:
+                if not create:
+                    return None
+                child = DecisionTrie.__node()
+                node["children"][response] = child
+                self.n_nodes += 1
+            node = child
+        return node
+
+    def get_estimate(self, prefix: Sequence[int]) -> tuple[float, float] | None:
+        """Looks up the ability estimate after a response prefix.
+
+        Args:
+            prefix (Sequence[int]): responses
+
+        Returns:
+            tuple[float, float] | None: ability estimate and standard error or None if not stored
+        """
+        node = self.__find(prefix)
+        if node is None or node["ability_level"] is None:
+            return None
+        return node["ability_level"], node["standard_error"]
+
+    def set_estimate(self, prefix: Sequence[int], ability_level: float, standard_error: float):
+        """Stores the ability estimate after a response prefix.
+
+        Args:
+            prefix (Sequence[int]): responses
+            ability_level (float): ability estimate
+            standard_error (float): standard error of the estimate
+        """
+        node = self.__find(prefix, create=True)
+        if node is not None:
+            node["ability_level"] = float(ability_level)
+            node["standard_error"] = float(standard_error)
+
+    def get_item_id(self, prefix: Sequence[int]) -> int | None:
+        """Looks up the id of the item selected after a response prefix.
+
+        Args:
+            prefix (Sequence[int]): responses
+
+        Returns:
+            int | None: item id or None if not stored
+        """
+        node = self.__find(prefix)
+        return None if node is None else node["item_id"]
+
+    def set_item_id(self, prefix: Sequence[int], item_id: int):
+        """Stores the id of the item selected after a response prefix.
+
+        Args:
+            prefix (Sequence[int]): responses
+            item_id (int): item id
+        """
+        node = self.__find(prefix, create=True)
+        if node is not None:
+            node["item_id"] = item_id
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the tree to a dictionary that can be serialized as JSON.
+
+        Returns:
+            dict[str, Any]: tree
+        """
+        def convert(node: dict[str, Any]) -> dict[str, Any]:
+            return {
+                "ability_level": node["ability_level"],
+                "standard_error": node["standard_error"],
+                "item_id": node["item_id"],
+                "children": {str(response): convert(child) for response, child in node["children"].items()}
+            }
+        return {"fingerprint": self.fingerprint, "max_depth": self.max_depth, "root": convert(self.root)}
+
+    @staticmethod
+    def from_dict(source: dict[str, Any]) -> "DecisionTrie":
+        """Creates a tree from a dictionary (see `to_dict`).
+
+        Args:
+            source (dict[str, Any]): tree
+
+        Returns:
+            DecisionTrie: tree
+        """
+        trie = DecisionTrie(source.get("fingerprint"), source.get("max_depth"))
+
+        def convert(node: dict[str, Any]) -> dict[str, Any]:
+            trie.n_nodes += len(node["children"])
+            return {
+                "ability_level": node["ability_level"],
+                "standard_error": node["standard_error"],
+                "item_id": node["item_id"],
+                "children": {int(response): convert(child) for response, child in node["children"].items()}
+            }
+        trie.root = convert(source["root"])
+        return trie
+
+    def save(self, path: str):
+        """Saves the tree as JSON file.
+
+        Args:
+            path (str): file path
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file)
+
+    @staticmethod
+    def load(path: str) -> "DecisionTrie":
+        """Loads a tree from a JSON file (see `save`).
+
+        Args:
+            path (str): file path
+
+        Returns:
+            DecisionTrie: tree
+        """
+        with open(path, "r", encoding="utf-8") as file:
+            return DecisionTrie.from_dict(json.load(file))
@@ -2,3 +2,8 @@ from .__default_implementation import DefaultImplementation
 from .__pre_test import PreTest
 from .__semi_implementation import SemiAdaptiveImplementation
 from .__test_assembler import TestAssembler
+from .__selection_pipeline import SelectionPipeline
+from .__decision_trie import DecisionTrie
+from .__session_snapshot import SessionSnapshot
+from .__cat_session import CATSession
+from .__session_manager import SessionManager
@@ -0,0 +1,71 @@
+from typing import Any, Callable
+from ..models.__test_item import TestItem
+from ..models.__item_selection_exception import ItemSelectionException
+
+
+class SelectionPipeline:
+    def __init__(self,
+                 select: Callable[[], TestItem | None],
+                 strategy: Any = None,
+                 error_message: str | None = None):
+        """Item selection of a test that is configured once
+        and reused for every item selection of the test.
+        The strategy object (e.g., `WeightedPenaltyModel` or `Randomesque`)
+        is kept for the whole test, so that its caches (information tables,
+        constraint counters or random number generators) are not rebuilt for every item.
+
+        Hooks can be registered to update additional state
+        after an item has been selected or administered.
+
+        Args:
+            select (Callable[[], TestItem | None]): function selecting the next item
+            strategy (Any): strategy object used by `select`. Defaults to None.
+            error_message (str | None): message of the exception raised if no item has been selected.
+                If None, the result of `select` is returned unchecked.
+        """
+        self.select = select
+        self.strategy = strategy
+        self.error_message = error_message
+        self.selection_hooks: list[Callable[[TestItem], None]] = []
+        self.administration_hooks: list[Callable[[TestItem], None]] = []
+
+    def add_selection_hook(self, hook: Callable[[TestItem], None]):
+        """Registers a function that is called with every selected item.
+
+        Args:
+            hook (Callable[[TestItem], None]): function taking the selected item
+        """
+        self.selection_hooks.append(hook)
+
+    def add_administration_hook(self, hook: Callable[[TestItem], None]):
+        """Registers a function that is called with every administered item.
+
+        Args:
+            hook (Callable[[TestItem], None]): function taking the administered item
+        """
+        self.administration_hooks.append(hook)
+
+    def select_item(self) -> TestItem:
+        """Selects the next item.
+
+        Returns:
+            TestItem: selected item
+
+        Raises:
+            ItemSelectionException: Raised if no item has been selected and an error message is set.
+        """
+        item = self.select()
+        if item is None and self.error_message is not None:
+            raise ItemSelectionException(self.error_message)
+        for hook in self.selection_hooks:
+            hook(item)  # type: ignore
+        return item  # type: ignore
+
+    def on_item_administered(self, item: TestItem):
+        """Calls the administration hooks.
+
+        Args:
+            item (TestItem): administered item
+        """
+        for hook in self.administration_hooks:
+            hook(item)
@@ -0,0 +1,374 @@
+from collections import OrderedDict
+from concurrent.futures import Executor
+from functools import partial
+from typing import Callable
+import asyncio
+import threading
+import uuid
+from ..models.__adaptive_test import AdaptiveTest
+from ..models.__item_bank import ItemBank
+from ..models.__item_pool import ItemPool
+from ..models.__test_item import TestItem
+from ..models.__test_result import TestResult
+from ..models.__misc import ResultOutputFormat, StoppingCriterion
+from ..services.__session_store_interface import ISessionStore
+from ..data.__session_store import SQLiteSessionStore
+from ..simulation.__simulation import create_test_results_context
+from .__cat_session import CATSession
+from .__session_snapshot import SessionSnapshot
+
+
+class _SessionEntry:
+    def __init__(self, session: CATSession | None = None):
+        # session in memory (None until it has been created or restored)
+        self.session = session
+        # number of steps using the session
+        self.in_use = 0
+        # held while the session is created, restored, spilled or finished
+        self.lock = threading.Lock()
+        # whether the test results of the finished session have been saved
+        self.closed = False
+
+
+class SessionManager:
+    def __init__(self,
+                 item_bank: ItemBank,
+                 test_factory: Callable[..., AdaptiveTest],
+                 simulation_id: str,
+                 criterion: StoppingCriterion | list[StoppingCriterion] = StoppingCriterion.SE,
+                 value: float | list[float | int] = 0.4,
+                 capacity: int = 1000,
+                 store: ISessionStore | None = None,
+                 test_result_output: ResultOutputFormat = ResultOutputFormat.SQLITE,
+                 executor: Executor | None = None):
+        """Serves many `CATSession`s of a live test.
+        At most `capacity` sessions are kept in memory.
+        If a new or rehydrated session exceeds the capacity, the least recently used idle session
+        is spilled: its snapshot (`SessionSnapshot`) including the ability estimates of its test results
+        is saved in `store`.
+        The next response to a spilled session transparently restores it from the store.
+
+        Finished sessions are removed from the memory and the store.
+        Their test results are saved once in the output format `test_result_output`
+        and recorded by the exposure counter of the test (if any).
+
+        The manager lock only protects the bookkeeping.
+        The store and the test results are read and written outside of it, while only the affected session
+        is locked, so that the other sessions are not blocked by the disk access.
+        Idle sessions are kept in order of their last use, so that a spilled session is found without a scan.
+
+        The manager counts cache hits and misses, evictions and rehydrations (`statistics`).
+
+        Args:
+            item_bank (ItemBank): item bank containing all items of the test (the item ids have to be unique)
+            test_factory (Callable[..., AdaptiveTest]): creates the test of a session.
+                It is called with the keyword arguments `item_pool`, `simulation_id`, `participant_id`
+                and `copy_item_pool`, e.g., `partial(TestAssembler, ability_estimator=MLEstimator, simulation=False)`.
+            simulation_id (str): simulation id used to save the test results
+            criterion (StoppingCriterion | list[StoppingCriterion]): stopping criterion or list of criteria.
+                Defaults to StoppingCriterion.SE.
+            value (float | list[float | int]): threshold value(s) for the stopping criteria. Defaults to 0.4.
+            capacity (int): maximum number of sessions kept in memory. Defaults to 1000.
+            store (ISessionStore | None): store of the spilled sessions.
+                Defaults to None (`SQLiteSessionStore` in `data/<simulation_id>_sessions.db`).
+            test_result_output (ResultOutputFormat): output format of the test results of finished sessions.
+                Only formats that load the results without loss are supported
+                (SQLITE, PICKLE and COLUMNAR). Defaults to ResultOutputFormat.SQLITE.
+            executor (Executor | None): executor of the async variants. Defaults to None (shared thread pool).
+
+        Raises:
+            ValueError: Raised if `capacity` is smaller than 1 or the output format is not supported.
+        """
+        if capacity < 1:
+            raise ValueError("capacity has to be at least 1.")
+        if test_result_output not in (ResultOutputFormat.SQLITE, ResultOutputFormat.PICKLE,
+                                      ResultOutputFormat.COLUMNAR):
+            raise ValueError(f"{test_result_output} cannot be used by a SessionManager. "
+                             "Use SQLITE, PICKLE or COLUMNAR.")
+        self.item_bank = item_bank
+        self.test_factory = test_factory
+        self.simulation_id = simulation_id
+        self.criterion = criterion
+        self.value = value
+        self.capacity = capacity
+        self.store = store if store is not None else SQLiteSessionStore(f"data/{simulation_id}_sessions.db")
+        self.test_result_output = test_result_output
+        self.executor = executor
+
+        self.hits = 0
+        """Number of steps served by a session in memory"""
+        self.misses = 0
+        """Number of steps whose session was not in memory"""
+        self.evictions = 0
+        """Number of sessions spilled to the store"""
+        self.rehydrations = 0
+        """Number of sessions restored from the store"""
+
+        # sessions in memory (including sessions that are being restored or spilled)
+        self.__entries: dict[str, _SessionEntry] = {}
+        # idle sessions in memory, least recently used first
+        self.__idle: OrderedDict[str, None] = OrderedDict()
+        self.__n_spilling = 0
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, session_id: object) -> bool:
+        if not isinstance(session_id, str):
+            return False
+        with self.__lock:
+            if session_id in self.__entries:
+                return True
+        return self.store.load(session_id) is not None
+
+    def statistics(self) -> dict[str, int]:
+        """Counters of the manager.
+
+        Returns:
+            dict[str, int]: hits, misses, evictions, rehydrations and number of sessions in memory
+        """
+        with self.__lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "rehydrations": self.rehydrations,
+                "in_memory": len(self.__entries)
+            }
+
+    def create(self, session_id: str | None = None) -> str:
+        """Creates a new session.
+
+        Args:
+            session_id (str | None): session id (used as participant id).
+                Defaults to None (random id).
+
+        Returns:
+            str: session id
+
+        Raises:
+            ValueError: Raised if a session with the id already exists.
+        """
+        session_id = session_id if session_id is not None else uuid.uuid4().hex
+        entry = _SessionEntry()
+        with self.__lock:
+            if session_id in self.__entries:
+                raise ValueError(f"Session {session_id} already exists.")
+            # the entry reserves the id while the store is checked
+            entry.in_use = 1
+            self.__entries[session_id] = entry
+        with entry.lock:
+            if self.store.load(session_id) is None:
+                test = self.test_factory(item_pool=ItemPool(list(self.item_bank.items)),
+                                         simulation_id=self.simulation_id,
+                                         participant_id=session_id,
+                                         copy_item_pool=False)
+                entry.session = CATSession(test, self.criterion, self.value, self.executor)
+        if entry.session is None:
+            with self.__lock:
+                entry.in_use -= 1
+                # a step waiting for the entry restores the stored session
+                if entry.in_use == 0:
+                    del self.__entries[session_id]
+            raise ValueError(f"Session {session_id} already exists.")
+        self.__release(session_id, entry)
+        return session_id
+
+    def __acquire(self, session_id: str) -> _SessionEntry:
+        with self.__lock:
+            entry = self.__entries.get(session_id)
+            if entry is not None:
+                self.hits += 1
+                self.__idle.pop(session_id, None)
+            else:
+                self.misses += 1
+                entry = _SessionEntry()
+                self.__entries[session_id] = entry
+            entry.in_use += 1
+            victims = self.__take_victims()
+        self.__spill(victims)
+
+        # the first step of a spilled session restores it, further steps wait for it
+        with entry.lock:
+            if entry.session is None:
+                try:
+                    entry.session = self.__rehydrate(session_id)
+                except BaseException:
+                    with self.__lock:
+                        entry.in_use -= 1
+                        if entry.in_use == 0 and self.__entries.get(session_id) is entry:
+                            del self.__entries[session_id]
+                    raise
+        return entry
+
+    def __release(self, session_id: str, entry: _SessionEntry):
+        session = entry.session
+        if session is not None and session.finished:
+            with entry.lock:
+                if not entry.closed:
+                    self.__save_results(session)
+                    self.store.delete(session_id)
+                    entry.closed = True
+        with self.__lock:
+            entry.in_use -= 1
+            if entry.in_use == 0 and self.__entries.get(session_id) is entry:
+                if entry.closed:
+                    del self.__entries[session_id]
+                else:
+                    self.__idle[session_id] = None
+            victims = self.__take_victims()
+        self.__spill(victims)
+
+    def __rehydrate(self, session_id: str) -> CATSession:
+        data = self.store.load(session_id)
+        if data is None:
+            raise KeyError(f"Session {session_id} does not exist.")
+        session = CATSession.restore(SessionSnapshot.from_bytes(data),
+                                     self.item_bank,
+                                     partial(self.test_factory,
+                                             simulation_id=self.simulation_id,
+                                             participant_id=session_id,
+                                             copy_item_pool=False),
+                                     self.criterion,
+                                     self.value,
+                                     self.executor)
+        with self.__lock:
+            self.rehydrations += 1
+        return session
+
+    def __save_results(self, session: CATSession):
+        test = session.adaptive_test
+        create_test_results_context(self.test_result_output,
+                                    simulation_id=self.simulation_id,
+                                    participant_id=test.participant_id).save(test.test_results)
+        if test.exposure_counter is not None:
+            test.exposure_counter.record(test.participant_id, [result.showed_item for result in test.test_results])
+
+    def __take_victims(self, session_ids: list[str] | None = None) -> list[tuple[str, _SessionEntry]]:
+        # called with the manager lock: removes the sessions to spill from the idle sessions
+        # (by default the least recently used sessions exceeding the capacity) and locks them
+        victims: list[tuple[str, _SessionEntry]] = []
+        if session_ids is None:
+            session_ids = []
+            n_spill = len(self.__entries) - self.__n_spilling - self.capacity
+            for session_id in self.__idle:
+                if len(session_ids) >= n_spill:
+                    break
+                session_ids.append(session_id)
+        for session_id in session_ids:
+            del self.__idle[session_id]
+            entry = self.__entries[session_id]
+            # idle sessions are not locked by other threads
+            entry.lock.acquire()
+            victims.append((session_id, entry))
+        self.__n_spilling += len(victims)
+        return victims
+
+    def __spill(self, victims: list[tuple[str, _SessionEntry]]):
+        for session_id, entry in victims:
+            try:
+                self.store.save(session_id,
+                                entry.session.snapshot(self.item_bank, include_results=True).to_bytes())  # type: ignore
+                with self.__lock:
+                    self.__n_spilling -= 1
+                    if entry.in_use == 0:
+                        del self.__entries[session_id]
+                        self.evictions += 1
+                    # otherwise, a step has requested the session during the spill and keeps it in memory
+            except BaseException:
+                with self.__lock:
+                    self.__n_spilling -= 1
+                    if entry.in_use == 0:
+                        self.__idle[session_id] = None
+                raise
+            finally:
+                entry.lock.release()
+
+    def evict(self, session_id: str) -> bool:
+        """Spills a session to the store, e.g., when the participant has been inactive for some time.
+
+        Args:
+            session_id (str): session id
+
+        Returns:
+            bool: whether the session has been spilled (False if it is not in memory or in use)
+        """
+        with self.__lock:
+            if session_id not in self.__idle:
+                return False
+            victims = self.__take_victims([session_id])
+        self.__spill(victims)
+        return True
+
+    def spill_all(self):
+        """Spills all idle sessions to the store, e.g., before the process is stopped."""
+        with self.__lock:
+            victims = self.__take_victims(list(self.__idle))
+        self.__spill(victims)
+
+    def start(self, session_id: str) -> TestItem:
+        """Starts the test of a session (see `CATSession.start`).
+
+        Args:
+            session_id (str): session id
+
+        Returns:
+            TestItem: first item
+
+        Raises:
+            KeyError: Raised if the session does not exist.
+        """
+        entry = self.__acquire(session_id)
+        try:
+            return entry.session.start()  # type: ignore
+        finally:
+            self.__release(session_id, entry)
+
+    def submit(self, session_id: str, response: int) -> TestItem | TestResult:
+        """Submits the response to the current item of a session (see `CATSession.submit`).
+        If the session has been spilled, it is restored first.
+        If the test is finished, the test results are saved and the session is removed.
+
+        Args:
+            session_id (str): session id
+            response (int): response to the current item
+
+        Returns:
+            TestItem | TestResult: next item or, if the test is finished, the result of the last step
+
+        Raises:
+            KeyError: Raised if the session does not exist.
+        """
+        entry = self.__acquire(session_id)
+        try:
+            return entry.session.submit(response)  # type: ignore
+        finally:
+            self.__release(session_id, entry)
+
+    async def __run_in_executor(self, function, *args):
+        executor = self.executor if self.executor is not None else CATSession.default_executor()
+        return await asyncio.get_running_loop().run_in_executor(executor, function, *args)
+
+    async def astart(self, session_id: str) -> TestItem:
+        """Async variant of `start`.
+
+        Args:
+            session_id (str): session id
+
+        Returns:
+            TestItem: first item
+        """
+        return await self.__run_in_executor(self.start, session_id)
+
+    async def asubmit(self, session_id: str, response: int) -> TestItem | TestResult:
+        """Async variant of `submit`.
+
+        Args:
+            session_id (str): session id
+            response (int): response to the current item
+
+        Returns:
+            TestItem | TestResult: next item or, if the test is finished, the result of the last step
+        """
+        return await self.__run_in_executor(self.submit, session_id, response)
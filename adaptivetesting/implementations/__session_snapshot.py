@@ -0,0 +1,145 @@
+from dataclasses import dataclass, field
+from typing import Any
+import struct
+import numpy as np
+
+
+@dataclass
+class SessionSnapshot:
+    """Compact state of a `CATSession` (see `CATSession.snapshot`).
+    Items are referenced by their position in an `ItemBank`,
+    so that the session can be restored on another worker
+    that has loaded the same item bank (`CATSession.restore`).
+    The test results of the previous steps are only part of the snapshot
+    if it has been created with `include_results` (ability estimates and standard errors of every step).
+    """
+    bank_version: bytes
+    """Hash of the item bank (`ItemBank.version`)"""
+    administered: list[int]
+    """Positions of the administered items"""
+    responses: list[int]
+    """Responses to the administered items"""
+    ability_level: float
+    """Current ability estimate"""
+    standard_error: float
+    """Standard error of the current ability estimate"""
+    current_item: int | None = None
+    """Position of the item waiting for a response"""
+    finished: bool = False
+    """Whether the test is finished"""
+    excluded: list[int] = field(default_factory=list)
+    """Positions of the items removed from the item pool without being administered"""
+    rejected: list[int] = field(default_factory=list)
+    """Positions of the items rejected by the exposure control (Sympson-Hetter)"""
+    rng_state: dict[str, Any] | None = None
+    """State of the random number generator of the exposure control (PCG64)"""
+    ability_estimates: list[float] | None = None
+    """Ability estimates of the test results of the administered items (None if the results are not included)"""
+    standard_errors: list[float] | None = None
+    """Standard errors of the test results of the administered items (None if the results are not included)"""
+
+    __header = struct.Struct("<4sB16sddiIIIB")
+    __rng = struct.Struct("<16s16sBI")
+    __magic = b"CATS"
+    __format_version = 1
+
+    def to_bytes(self) -> bytes:
+        """Serializes the snapshot into a compact binary format.
+
+        Returns:
+            bytes: serialized snapshot
+        """
+        results = self.ability_estimates is not None and self.standard_errors is not None
+        flags = int(self.finished) | (int(self.rng_state is not None) << 1) | (int(results) << 2)
+        parts = [
+            SessionSnapshot.__header.pack(
+                SessionSnapshot.__magic,
+                SessionSnapshot.__format_version,
+                self.bank_version,
+                self.ability_level,
+                self.standard_error,
+                -1 if self.current_item is None else self.current_item,
+                len(self.administered),
+                len(self.excluded),
+                len(self.rejected),
+                flags
+            ),
+            np.asarray(self.administered, dtype="<u4").tobytes(),
+            np.asarray(self.responses, dtype="<i2").tobytes(),
+            np.asarray(self.excluded, dtype="<u4").tobytes(),
+            np.asarray(self.rejected, dtype="<u4").tobytes()
+        ]
+        if results:
+            parts.append(np.asarray(self.ability_estimates, dtype="<f8").tobytes())
+            parts.append(np.asarray(self.standard_errors, dtype="<f8").tobytes())
+        if self.rng_state is not None:
+            state = self.rng_state["state"]
+            parts.append(SessionSnapshot.__rng.pack(
+                int(state["state"]).to_bytes(16, "little"),
+                int(state["inc"]).to_bytes(16, "little"),
+                int(self.rng_state["has_uint32"]),
+                int(self.rng_state["uinteger"])
+            ))
+        return b"".join(parts)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> "SessionSnapshot":
+        """Creates a snapshot from its binary format (see `to_bytes`).
+
+        Args:
+            data (bytes): serialized snapshot
+
+        Returns:
+            SessionSnapshot: snapshot
+
+        Raises:
+            ValueError: Raised if the data is not a session snapshot.
+        """
+        header = SessionSnapshot.__header
+        if len(data) < header.size:
+            raise ValueError("The data is not a session snapshot.")
+        (magic, format_version, bank_version, ability_level, standard_error,
+         current_item, n_administered, n_excluded, n_rejected, flags) = header.unpack_from(data)
+        if magic != SessionSnapshot.__magic or format_version != SessionSnapshot.__format_version:
+            raise ValueError("The data is not a session snapshot.")
+
+        offset = header.size
+        administered = np.frombuffer(data, dtype="<u4", count=n_administered, offset=offset)
+        offset += administered.nbytes
+        responses = np.frombuffer(data, dtype="<i2", count=n_administered, offset=offset)
+        offset += responses.nbytes
+        excluded = np.frombuffer(data, dtype="<u4", count=n_excluded, offset=offset)
+        offset += excluded.nbytes
+        rejected = np.frombuffer(data, dtype="<u4", count=n_rejected, offset=offset)
+        offset += rejected.nbytes
+        ability_estimates = standard_errors = None
+        if flags & 4:
+            ability_estimates = np.frombuffer(data, dtype="<f8", count=n_administered, offset=offset)
+            offset += ability_estimates.nbytes
+            standard_errors = np.frombuffer(data, dtype="<f8", count=n_administered, offset=offset)
+            offset += standard_errors.nbytes
+
+        rng_state = None
+        if flags & 2:
+            state, inc, has_uint32, uinteger = SessionSnapshot.__rng.unpack_from(data, offset)
+            rng_state = {
+                "bit_generator": "PCG64",
+                "state": {"state": int.from_bytes(state, "little"), "inc": int.from_bytes(inc, "little")},
+                "has_uint32": has_uint32,
+                "uinteger": uinteger
+            }
+
+        return SessionSnapshot(
+            bank_version=bank_version,
+            administered=administered.tolist(),
+            responses=responses.tolist(),
+            ability_level=ability_level,
+            standard_error=standard_error,
+            current_item=None if current_item < 0 else current_item,
+            finished=bool(flags & 1),
+            excluded=excluded.tolist(),
+            rejected=rejected.tolist(),
+            rng_state=rng_state,
+            ability_estimates=None if ability_estimates is None else ability_estimates.tolist(),
+            standard_errors=None if standard_errors is None else standard_errors.tolist()
+        )
@@ -1,23 +1,32 @@
-from ..models.__item_selection_exception import ItemSelectionException
 from ..math.content_balancing.__constraint import Constraint
 from ..models.__adaptive_test import AdaptiveTest
 from ..models.__test_item import TestItem
 from ..services.__estimator_interface import IEstimator
-from typing import Any, Type, TypedDict, Callable, Literal
+from typing import Any, Type, TypedDict, Callable, Literal, NotRequired
 from ..math.item_selection.__maximum_information_criterion import maximum_information_criterion
+from ..math.item_selection.__a_stratified_selection import AStratifiedSelector
 from ..models.__algorithm_exception import AlgorithmException
 from ..implementations.__pre_test import PreTest
+from .__selection_pipeline import SelectionPipeline
+from .__decision_trie import DecisionTrie, describe_value
 from ..models.__test_result import TestResult
 from ..models.__misc import ResultOutputFormat
+from ..models.__instrumentation import count, active_instrumentation
 from ..services.__item_selection_protocol import ItemSelectionStrategy
+from ..services.__exposure_counter_interface import IExposureCounter
 from ..math.content_balancing.__content_balancing import CONTENT_BALANCING
 from ..math.content_balancing.__weighted_penalty_model import WeightedPenaltyModel
 from ..math.content_balancing.__maximum_priority_index import MaximumPriorityIndex
+from ..math.content_balancing.__budgeted_selection import BudgetedSelection, BudgetStatistics, CandidateRanking
 from ..math.estimators.__prior import Prior
+from ..math.estimators.__functions.__diagnostics import EstimationDiagnostics
 from ..math.exposure_control.__exposure_control import EXPOSURE_CONTROL
 from ..math.exposure_control.__randomesque import Randomesque
 from ..math.exposure_control.__mpi_exposure_control import MaximumPriorityIndexExposureControl
+from ..math.exposure_control.__sympson_hetter import SympsonHetter, SympsonHetterParameters
+import hashlib
 import inspect
+import json
 
 
 class EstimatorArgs(TypedDict):
@@ -39,6 +48,14 @@ class ContentBalancingArgs(TypedDict):
     This can also be a function taking adaptive test as an input argument.
     This allows the user to specify custom weight values depending
     on the specific states and progress of the test."""
+    time_budget: NotRequired[float | None]
+    """Time budget (seconds) per item selection.
+    If set, the candidates are evaluated in the order of their distance to the ability estimate
+    until the budget is used up (see `BudgetedSelection`)."""
+    budget_chunk_size: NotRequired[int]
+    """Number of candidates evaluated at once with a time budget. Defaults to 128."""
+    budget_statistics: NotRequired[BudgetStatistics | None]
+    """Counters of the budgeted item selections (can be shared by several tests)."""
 
 
 class ExposureControlArgs(TypedDict):
@@ -54,6 +71,15 @@ class ExposureControlArgs(TypedDict):
     """number of items to select for Randomesque items selection"""
     seed: int | None
     """random seed for the final item selection during Randomesque item selection"""
+    exposure_counter: NotRequired[IExposureCounter | None]
+    """Store of the exposure counts (MPI only).
+    If set, the counts are read from this store instead of the previous test results
+    and the store is updated when the test results are saved.
+    `participant_ids` and `output_format` are then not required.
+    """
+    exposure_parameters: NotRequired[SympsonHetterParameters | None]
+    """Exposure control parameters (Sympson-Hetter only).
+    The random seed for the acceptance tests is set with `seed`."""
 
 
 class TestAssembler(AdaptiveTest):
@@ -106,6 +132,8 @@ class TestAssembler(AdaptiveTest):
                  exposure_control_args: None | ExposureControlArgs = None,
                  pretest: bool = False,
                  pretest_seed: int | None = None,
+                 decision_trie: DecisionTrie | bool = False,
+                 collect_diagnostics: bool = False,
                  true_ability_level=None,
                  initial_ability_level=0,
                  simulation=True,
@@ -146,6 +174,18 @@ class TestAssembler(AdaptiveTest):
 
             pretest_seed (int | None, optional): Random seed for pretest item selection. Defaults to None.
 
+            decision_trie (DecisionTrie | bool, optional): Caches the ability estimates and selected items
+                for every response prefix. If True, a tree that is shared by all tests with the same configuration
+                within the process is used. A (precompiled) tree can be passed as well.
+                A new tree is bound to the configuration of the first test using it
+                (see `decision_trie_fingerprint`).
+                The cache is not used with exposure control, pretest or a time budget,
+                because the item selection is then not deterministic. Defaults to False.
+
+            collect_diagnostics (bool, optional): Collect the convergence diagnostics of the ability estimates
+                in `estimation_diagnostics`. They are also collected while an `Instrumentation` is active.
+                Defaults to False.
+
             true_ability_level (optional): The true ability level of the participant (for simulation).
 
             initial_ability_level (optional): The initial ability estimate. Defaults to 0.
@@ -164,9 +204,24 @@ class TestAssembler(AdaptiveTest):
         self.content_balancing_args = content_balancing_args
         self.exposure_control = exposure_control
         self.exposure_control_args = exposure_control_args
+        if exposure_control_args is not None:
+            self.exposure_counter = exposure_control_args.get("exposure_counter")
         self.__pretest = pretest
         self.__pretest_seed = pretest_seed
         self.__estimator_args["model"] = model_type
+        self.initial_ability_level = initial_ability_level
+        self.collect_diagnostics = collect_diagnostics
+        self.estimation_diagnostics: EstimationDiagnostics | None = None
+        """Convergence diagnostics of the last ability estimate
+        (None if they are not collected, the estimator does not provide them
+        or the estimate has been taken from the decision trie)"""
+        # the decision trie is resolved on first use
+        self.__decision_trie_setting = decision_trie
+        self.__decision_trie: DecisionTrie | None = None
+        self.__items_by_id: dict[int, TestItem] = {}
+        # the item selection is compiled once and kept for the whole test
+        self.__selection_pipeline: SelectionPipeline | None = None
+        self.__selection_config: tuple | None = None
 
         super().__init__(item_pool,
                          simulation_id,
@@ -188,16 +243,35 @@ class TestAssembler(AdaptiveTest):
         and recalculates the standard error.
         Otherwise, it raises an AlgorithmException with additional context.
 
+        If a decision trie is used, the estimation is looked up for the current response pattern
+        and only calculated if it has not been stored yet.
+
         Returns:
             tuple[float, float]: A tuple containing the estimated ability level (float) and its standard error (float).
 
         Raises:
             AlgorithmException: If estimation fails for reasons other than all responses being identical.
         """
+        trie = self.decision_trie
+        if trie is None:
+            return self.__estimate_ability_level()
+        estimate = trie.get_estimate(self.response_pattern)
+        count("decision_trie.estimate_hits", int(estimate is not None))
+        if estimate is not None:
+            self.estimation_diagnostics = None
+        else:
+            estimate = self.__estimate_ability_level()
+            trie.set_estimate(self.response_pattern, *estimate)
+        return estimate
+
+    def __estimate_ability_level(self) -> tuple[float, float]:
         # filter estimator args
         sig = inspect.signature(self.__ability_estimator)
         allowed = set(sig.parameters.keys())
         filtered_estimator_args = {k: v for k, v in self.__estimator_args.items() if k in allowed}
+        if "collect_diagnostics" in allowed:
+            collect = self.collect_diagnostics or active_instrumentation() is not None
+            filtered_estimator_args["collect_diagnostics"] = collect
 
         # setup estimator
         estimator = self.__ability_estimator(
@@ -222,6 +296,8 @@ class TestAssembler(AdaptiveTest):
                 raise AlgorithmException(f"""Something
                 when wrong when running {type(estimator)}""") from exception
 
+        diagnostics = getattr(estimator, "diagnostics", None)
+        self.estimation_diagnostics = diagnostics[-1] if diagnostics else None
         return estimation, standard_error
 
     def get_next_item(self) -> TestItem:
@@ -232,35 +308,152 @@ class TestAssembler(AdaptiveTest):
         This also applies to exposure control.
         However, content balancing and exposure control cannot be specified at the same time
 
+        The configuration is compiled into a `SelectionPipeline` on the first call
+        (see `selection_pipeline`).
+        If a decision trie is used, the item stored for the current response pattern is returned
+        without running the item selection.
+
         Returns:
             TestItem: The next item to be administered in the test, as determined by the item selector.
 
         Raises:
             Any exceptions raised by the item selector function.
         """
-        item: TestItem | None
+        trie = self.decision_trie
+        if trie is None:
+            return self.__select_item()
+        item_id = trie.get_item_id(self.response_pattern)
+        item = self.__items_by_id.get(item_id) if item_id is not None else None
+        if item is None or not self.__is_available(item):
+            count("decision_trie.item_hits", 0)
+            item = self.__select_item()
+            trie.set_item_id(self.response_pattern, item.id)  # type: ignore
+        else:
+            count("decision_trie.item_hits", 1)
+        return item
+
+    def __select_item(self) -> TestItem:
+        count("selection.candidates", len(self.item_pool.test_items))
+        return self.selection_pipeline.select_item()
+
+    def __is_available(self, item: TestItem) -> bool:
+        if any([answered_item is item for answered_item in self.answered_items]):
+            return False
+        exclusions = self.item_pool.exclusions
+        if exclusions is not None and item.id in exclusions.positions:
+            return not exclusions.excluded[exclusions.positions[item.id]]  # type: ignore
+        return True
+
+    @property
+    def decision_trie(self) -> DecisionTrie | None:
+        """Decision trie caching the ability estimates and selected items of this test configuration.
+        None if no trie is used, the item selection is not deterministic
+        (exposure control, pretest or time budget)
+        or the item ids are not unique.
+
+        Raises:
+            ValueError: Raised if the passed trie has been created for a different test configuration.
+        """
+        if self.__decision_trie_setting is False or self.exposure_control is not None or self.__pretest:
+            return None
+        if self.content_balancing_args is not None and self.content_balancing_args.get("time_budget") is not None:
+            return None
+        if self.__decision_trie is None:
+            item_ids = [item.id for item in self.item_pool.test_items]
+            if None in item_ids or len(set(item_ids)) != len(item_ids):
+                return None
+            try:
+                fingerprint = self.decision_trie_fingerprint()
+            except ValueError:
+                # a passed tree cannot be validated, a shared tree cannot be found again
+                if isinstance(self.__decision_trie_setting, DecisionTrie):
+                    raise
+                return None
+            if isinstance(self.__decision_trie_setting, DecisionTrie):
+                if self.__decision_trie_setting.fingerprint is None:
+                    self.__decision_trie_setting.fingerprint = fingerprint
+                elif self.__decision_trie_setting.fingerprint != fingerprint:
+                    raise ValueError("The decision trie has been created for a different test configuration.")
+                self.__decision_trie = self.__decision_trie_setting
+            else:
+                self.__decision_trie = DecisionTrie.shared(fingerprint, fingerprint)
+            self.__items_by_id = {item.id: item for item in self.item_pool.test_items}  # type: ignore
+        return self.__decision_trie
+
+    def decision_trie_fingerprint(self) -> str:
+        """Identifier of the test configuration
+        (item pool, estimator and its arguments including the prior, initial ability level,
+        item selection and content balancing) that is stored with a decision trie.
+        The arguments are described by their values (see `describe_value`),
+        so that tests with equal priors or constraints share a tree.
+
+        Returns:
+            str: identifier
+
+        Raises:
+            ValueError: Raised if an argument cannot be described by its value.
+        """
+        try:
+            configuration = describe_value({
+                "estimator": self.__ability_estimator,
+                "estimator_args": self.__estimator_args,
+                "item_selector": self.__item_selector,
+                "item_selector_args": self.__item_selector_args,
+                "content_balancing": self.content_balancing,
+                "content_balancing_args": self.content_balancing_args,
+                "initial_ability_level": self.initial_ability_level,
+                "items": [[item.id, item.a, item.b, item.c, item.d] for item in self.item_pool.test_items]
+            })
+        except TypeError as error:
+            raise ValueError(f"The test configuration cannot be identified for a decision trie: {error}") from error
+        return hashlib.sha256(json.dumps(configuration).encode("utf-8")).hexdigest()
+
+    @property
+    def selection_pipeline(self) -> SelectionPipeline:
+        """Item selection compiled from the configuration of the test.
+        The pipeline is created on first access and recompiled
+        if the content balancing or exposure control settings are replaced.
+        """
+        config = (self.content_balancing, id(self.content_balancing_args),
+                  self.exposure_control, id(self.exposure_control_args))
+        if self.__selection_pipeline is None or self.__selection_config != config:
+            self.__selection_pipeline = self.compile_selection_pipeline()
+            self.__selection_config = config
+        return self.__selection_pipeline
+
+    def compile_selection_pipeline(self) -> SelectionPipeline:
+        """Validates the item selection settings and creates the strategy objects once.
+
+        Returns:
+            SelectionPipeline: item selection of the test
+
+        Raises:
+            ValueError: Raised if the settings are not correctly specified.
+        """
         if self.content_balancing is None and self.exposure_control_args is None:
             # content balancing an exposure control are not specified
             # filter item selection args
             sig = inspect.signature(self.__item_selector)
             allowed = set(sig.parameters.keys())
             filtered_item_selector_args = {k: v for k, v in self.__item_selector_args.items() if k in allowed}
+            item_selector = self.__item_selector
+            if isinstance(item_selector, AStratifiedSelector):
+                # the strata are shared by all tests, the stage and the available items belong to this test
+                item_selector = item_selector.create_state()
 
-            item = self.__item_selector(
+            return SelectionPipeline(lambda: item_selector(
                 self.item_pool.test_items,
                 self.ability_level,
                 **filtered_item_selector_args
-            )
-            return item
+            ))
         elif self.content_balancing and self.exposure_control:
             raise ValueError("Content balancing and exposure cannot be specified at the same time!")
         # content balancing only
         elif self.content_balancing and self.exposure_control is None:
             if self.content_balancing_args is not None:
+                error_message = f"""Something went wrong when selecting an item using {self.content_balancing}"""
                 # which strategy has been selected
                 if self.content_balancing == "WeightedPenaltyModel":
-                    # parse content balancing args
-
                     # setup wep
                     adaptive_test = self
                     wep = WeightedPenaltyModel(
@@ -274,13 +467,7 @@ class TestAssembler(AdaptiveTest):
                         information_weight=self.check_args_are_not_none(
                             "information_weight",
                             self.content_balancing_args["information_weight"]))
-
-                    item = wep.select_item()
-                    if item is None:
-                        raise ItemSelectionException(
-                            f"""Something went wrong when selecting an item using {self.content_balancing}""")
-                    else:
-                        return item
+                    return self.__content_balancing_pipeline(wep, error_message)
                 elif self.content_balancing == "MaximumPriorityIndex":
                     adaptive_test = self
                     mpi = MaximumPriorityIndex(
@@ -288,14 +475,7 @@ class TestAssembler(AdaptiveTest):
                         constraints=self.check_args_are_not_none(
                             "constraints",
                             self.content_balancing_args["constraints"]))
-
-                    item = mpi.select_item()
-
-                    if item is None:
-                        raise ItemSelectionException(
-                            f"""Something went wrong when selecting an item using {self.content_balancing}""")
-                    else:
-                        return item
+                    return self.__content_balancing_pipeline(mpi, error_message)
             else:
                 raise ValueError("content_balancing_args cannot be None when using content balancing.")
         # exposure control only
@@ -309,36 +489,69 @@ class TestAssembler(AdaptiveTest):
                 dict_keys = list(self.exposure_control_args.keys())
                 if "seed" not in dict_keys or "n_items" not in dict_keys:
                     raise ValueError("exposure_control_args are not correctly specified")
-                
+
                 if self.exposure_control_args["n_items"] is not None:
                     randomesque = Randomesque(
                         adaptive_test=adaptive_test,
                         n_items=self.exposure_control_args["n_items"],
                         seed=self.exposure_control_args["seed"]
                     )
-                    return randomesque.select_item()
+                    return SelectionPipeline(randomesque.select_item, randomesque)
                 else:
                     raise ValueError("n_items cannot be None.")
-                
+
             if self.exposure_control == "MaximumPriorityIndex":
-                if (self.exposure_control_args["participant_ids"]
+                if self.exposure_counter is None and (self.exposure_control_args["participant_ids"]
                    is None or self.exposure_control_args["output_format"] is None):
                     raise ValueError("exposure_control_args are not correctly specified")
-                mpi = MaximumPriorityIndexExposureControl(
+                mpi_exposure_control = MaximumPriorityIndexExposureControl(
                     self,
                     constraints=self.exposure_control_args["constraints"],
                     participant_ids=self.exposure_control_args["participant_ids"],
-                    format=self.exposure_control_args["output_format"]
+                    format=self.exposure_control_args["output_format"],
+                    exposure_counter=self.exposure_counter
                 )
-
-                selected_item = mpi.select_item()
-                if selected_item is None:
-                    raise ItemSelectionException("Fatal! Not appropriated item was "
-                                                 "selected using MPI for exposure control")
-                else:
-                    return selected_item
+                return SelectionPipeline(mpi_exposure_control.select_item,
+                                         mpi_exposure_control,
+                                         "Fatal! Not appropriated item was selected using MPI for exposure control")
+
+            if self.exposure_control == "SympsonHetter":
+                exposure_parameters = self.exposure_control_args.get("exposure_parameters")
+                if exposure_parameters is None:
+                    raise ValueError("exposure_parameters cannot be None.")
+                sympson_hetter = SympsonHetter(self,
+                                               exposure_parameters=exposure_parameters,
+                                               seed=self.exposure_control_args.get("seed"))
+                return SelectionPipeline(sympson_hetter.select_item,
+                                         sympson_hetter,
+                                         "No item could be selected using Sympson-Hetter exposure control")
         raise ValueError(f"Something went wrong when selecting an item using {self.content_balancing}.")
 
+    def __content_balancing_pipeline(self,
+                                     strategy: WeightedPenaltyModel | MaximumPriorityIndex,
+                                     error_message: str) -> SelectionPipeline:
+        time_budget = self.content_balancing_args.get("time_budget")  # type: ignore
+        if time_budget is None:
+            return SelectionPipeline(strategy.select_item, strategy, error_message)
+        ranking: CandidateRanking = strategy
+        budgeted = BudgetedSelection(self,
+                                     ranking,
+                                     time_budget,
+                                     self.content_balancing_args.get("budget_chunk_size", 128),  # type: ignore
+                                     self.content_balancing_args.get("budget_statistics"))  # type: ignore
+        return SelectionPipeline(budgeted.select_item, budgeted, error_message)
+
+    def on_item_administered(self, item: TestItem):
+        """Updates the exposure counts and calls the administration hooks
+        of the selection pipeline.
+
+        Args:
+            item (TestItem): administered item
+        """
+        super().on_item_administered(item)
+        if self.__selection_pipeline is not None:
+            self.__selection_pipeline.on_item_administered(item)
+
     def run_test_once(self):
         """
         Executes a single run of the test, including optional pretest logic.
@@ -375,6 +588,7 @@ class TestAssembler(AdaptiveTest):
                 self.response_pattern.append(response)
                 # add item to answered items list
                 self.answered_items.append(item)
+                self.on_item_administered(item)
 
                 # remove items
                 self.item_pool.delete_item(item)
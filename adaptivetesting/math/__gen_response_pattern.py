@@ -4,7 +4,6 @@ from .estimators.__functions.__poly.__grm import GRM
 from ..models.__test_item import TestItem
 import numpy as np
 from typing import Literal, cast
-from scipy.stats import multinomial
 from scipy.special import softmax
 
 
@@ -128,6 +127,7 @@ def gen_pattern_poly(
 
         # draw from multinomial distribution for final response
         # the probability for a response in k categories is 1
+        from scipy.stats import multinomial
         probabilities = softmax(np.array(log_probabilities))
         mn_draw = cast(np.ndarray, multinomial.rvs(
             n=1,
@@ -139,3 +139,38 @@ def gen_pattern_poly(
         responses.append(response)
 
     return responses
+
+
+def generate_response_matrix(abilities: list[float] | np.ndarray,
+                             items: list[TestItem],
+                             seed: int | None = None) -> np.ndarray:
+    """Generates response patterns for several ability levels at once.
+    The probabilities of success are calculated for all
+    ability levels and items in a single pass.
+    This function can only be used with dichotomous items.
+
+    Args:
+        abilities (list[float] | np.ndarray): ability level of every participant
+        items (list[TestItem]): test items
+        seed (int, optional): Seed for the random process.
+
+    Returns:
+        np.ndarray: response patterns with shape `(n_participants, n_items)`
+
+    Raises:
+        ValueError: Raised if the items are specified for polytomous IRT models.
+    """
+    if any([item.is_polytomous() for item in items]):
+        raise ValueError("Response matrices can only be generated for dichotomous items.")
+
+    mu = np.asarray(abilities, dtype=np.float64).reshape(-1, 1)
+    a = np.array([item.a for item in items], dtype=np.float64)
+    b = np.array([item.b for item in items], dtype=np.float64)
+    c = np.array([item.c for item in items], dtype=np.float64)
+    d = np.array([item.d for item in items], dtype=np.float64)
+
+    probabilities = np.reshape(probability_y1(mu, a, b, c, d), (mu.shape[0], len(items)))
+
+    rng = np.random.default_rng(seed)
+    responses = rng.random(probabilities.shape) < probabilities
+    return responses.astype(int)
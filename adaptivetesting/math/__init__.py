@@ -1 +1,2 @@
-from .__gen_response_pattern import generate_response_pattern
+from .__gen_response_pattern import generate_response_pattern, generate_response_matrix
+from .__kernels import set_backend, get_backend
@@ -0,0 +1,238 @@
+from types import SimpleNamespace
+from typing import Literal
+import math
+import os
+import warnings
+import numpy as np
+
+
+def _logistic(z: float) -> float:
+    if z >= 0:
+        return 1.0 / (1.0 + math.exp(-z))
+    exp_z = math.exp(z)
+    return exp_z / (1.0 + exp_z)
+
+
+def _probability_y1_4pl(mu: float, a: float, b: float, c: float, d: float) -> float:
+    z = min(max(a * (mu - b), -500.0), 500.0)
+    return min(max(c + (d - c) * _logistic(z), c), d)
+
+
+def _log_expit(z: float) -> float:
+    if z >= 0:
+        return -math.log1p(math.exp(-z))
+    return z - math.log1p(math.exp(z))
+
+
+def _logaddexp(x: float, y: float) -> float:
+    larger = max(x, y)
+    if larger == -math.inf:
+        return larger
+    return larger + math.log1p(math.exp(min(x, y) - larger))
+
+
+def probability_y1_kernel(mu: float, a: np.ndarray, b: np.ndarray, c: np.ndarray, d: np.ndarray) -> np.ndarray:
+    out = np.empty(a.shape[0])
+    for i in range(a.shape[0]):
+        out[i] = _probability_y1_4pl(mu, a[i], b[i], c[i], d[i])
+    return out
+
+
+def log_likelihood_kernel(mu: float,
+                          a: np.ndarray,
+                          b: np.ndarray,
+                          c: np.ndarray,
+                          d: np.ndarray,
+                          response_pattern: np.ndarray) -> float:
+    # log-space 4PL probabilities: log P = log(c + (d - c) * expit(z)), log(1 - P) = log((1 - d) + (d - c) * expit(-z))
+    result = 0.0
+    for i in range(a.shape[0]):
+        z = a[i] * (mu - b[i])
+        log_range = math.log(d[i] - c[i]) if d[i] > c[i] else -math.inf
+        log_p1 = _logaddexp(math.log(c[i]) if c[i] > 0 else -math.inf, log_range + _log_expit(z))
+        log_p0 = _logaddexp(math.log1p(-d[i]) if d[i] < 1 else -math.inf, log_range + _log_expit(-z))
+        response = response_pattern[i]
+        result += response * log_p1 + (1 - response) * log_p0
+    return result
+
+
+def item_information_kernel(mu: float, a: np.ndarray, b: np.ndarray, c: np.ndarray, d: np.ndarray) -> float:
+    # closed form of the derivative of the 4PL item response function
+    information = 0.0
+    for i in range(a.shape[0]):
+        z = min(max(a[i] * (mu - b[i]), -500.0), 500.0)
+        logistic = _logistic(z)
+        p1 = min(max(min(max(c[i] + (d[i] - c[i]) * logistic, c[i]), d[i]), 1e-10), 1 - 1e-10)
+        gradient = a[i] * (d[i] - c[i]) * logistic * (1.0 - logistic)
+        information += gradient * gradient / (p1 * (1.0 - p1))
+    return information
+
+
+def grm_category_prob_kernel(theta: float, a: float, thresholds: np.ndarray, category: int) -> float:
+    n_thresholds = thresholds.shape[0]
+    if category < 0 or category > n_thresholds:
+        return 1e-10
+    p_ge_k = 1.0 if category == 0 else _logistic(a * (theta - thresholds[category - 1]))
+    p_ge_k_plus_1 = 0.0 if category == n_thresholds else _logistic(a * (theta - thresholds[category]))
+    return max(p_ge_k - p_ge_k_plus_1, 1e-10)
+
+
+def gpcm_category_log_prob_kernel(theta: float, a: float, thresholds: np.ndarray, category: int) -> float:
+    n_thresholds = thresholds.shape[0]
+    if category < 0 or category > n_thresholds:
+        raise IndexError("category out of range")
+    etas = np.zeros(n_thresholds + 1)
+    for k in range(1, n_thresholds + 1):
+        etas[k] = etas[k - 1] + a * (theta - thresholds[k - 1])
+    largest = etas.max()
+    total = 0.0
+    for k in range(n_thresholds + 1):
+        total += math.exp(etas[k] - largest)
+    return etas[category] - (largest + math.log(total))
+
+
+def grm_log_likelihood_kernel(theta: float,
+                              a: np.ndarray,
+                              thresholds: np.ndarray,
+                              n_thresholds: np.ndarray,
+                              response_pattern: np.ndarray) -> float:
+    result = 0.0
+    for i in range(a.shape[0]):
+        probability = grm_category_prob_kernel(theta, a[i], thresholds[i, :n_thresholds[i]], response_pattern[i])
+        result += math.log(max(probability, 1e-12))
+    return result
+
+
+def gpcm_log_likelihood_kernel(theta: float,
+                               a: np.ndarray,
+                               thresholds: np.ndarray,
+                               n_thresholds: np.ndarray,
+                               response_pattern: np.ndarray) -> float:
+    result = 0.0
+    for i in range(a.shape[0]):
+        result += gpcm_category_log_prob_kernel(theta, a[i], thresholds[i, :n_thresholds[i]], response_pattern[i])
+    return result
+
+
+def pack_thresholds(thresholds_list: list[list[float]]) -> tuple[np.ndarray, np.ndarray]:
+    """Converts the thresholds of polytomous items to a padded matrix.
+
+    Args:
+        thresholds_list (list[list[float]]): thresholds of every item
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: thresholds with shape `(n_items, max_thresholds)`
+            and number of thresholds per item
+    """
+    n_thresholds = np.array([len(thresholds) for thresholds in thresholds_list], dtype=np.int64)
+    packed = np.zeros((len(thresholds_list), int(n_thresholds.max(initial=0))))
+    for i, thresholds in enumerate(thresholds_list):
+        packed[i, :len(thresholds)] = thresholds
+    return packed, n_thresholds
+
+
+_KERNELS = (
+    "probability_y1_kernel",
+    "log_likelihood_kernel",
+    "item_information_kernel",
+    "grm_category_prob_kernel",
+    "gpcm_category_log_prob_kernel",
+    "grm_log_likelihood_kernel",
+    "gpcm_log_likelihood_kernel"
+)
+_HELPERS = ("_logistic", "_log_expit", "_logaddexp", "_probability_y1_4pl")
+_python_kernels = SimpleNamespace(**{name: globals()[name] for name in _KERNELS})
+
+
+def python_kernels() -> SimpleNamespace:
+    """Returns the kernels as (uncompiled) Python functions, e.g., to compare them with the NumPy implementations.
+
+    Returns:
+        SimpleNamespace: kernels
+    """
+    return _python_kernels
+
+
+def _compile_kernels() -> SimpleNamespace | None:
+    try:
+        import numba  # type: ignore
+    except ImportError:
+        return None
+    module = globals()
+    # numba resolves the called functions in the module namespace,
+    # so the helpers are replaced by their compiled versions before the kernels are compiled
+    for name in _HELPERS + _KERNELS:
+        module[name] = numba.njit(cache=True)(module[name])
+    return SimpleNamespace(**{name: module[name] for name in _KERNELS})
+
+
+_active_kernels: SimpleNamespace | None = None
+_compiled_kernels: SimpleNamespace | None = None
+
+
+def active_kernels() -> SimpleNamespace | None:
+    """Returns the compiled kernels of the active backend.
+
+    Returns:
+        SimpleNamespace | None: kernels or None if the NumPy implementations are used
+    """
+    return _active_kernels
+
+
+def set_backend(backend: Literal["numpy", "numba"]):
+    """Selects the implementation of the IRT functions that are called for every item and ability level
+    (`probability_y1`, `log_likelihood`, the item information and the category probabilities
+    and log-likelihood of the GRM and GPCM) in the current process.
+
+    By default, the NumPy implementations are used.
+    The numba backend uses kernels that loop over the items and are compiled on their first call
+    (and cached on disk). They avoid the overhead of many NumPy calls on tiny arrays.
+    If numba is not installed, the NumPy implementations are kept and a warning is issued.
+    Calls that the kernels do not cover (e.g., several ability levels at once) always use NumPy.
+
+    The initial backend can be set with the environment variable `ADAPTIVETESTING_BACKEND`,
+    which is also inherited by the worker processes of a simulation pool.
+
+    Args:
+        backend (Literal["numpy", "numba"]): backend
+
+    Raises:
+        ValueError: Raised if the backend is unknown.
+    """
+    global _active_kernels, _compiled_kernels
+    if backend == "numpy":
+        _active_kernels = None
+    elif backend == "numba":
+        if _compiled_kernels is None:
+            _compiled_kernels = _compile_kernels()
+        if _compiled_kernels is None:
+            warnings.warn("numba is not installed. The NumPy implementations are used.", RuntimeWarning)
+        _active_kernels = _compiled_kernels
+    else:
+        raise ValueError(f"Unknown backend {backend}. Use 'numpy' or 'numba'.")
+
+
+def get_backend() -> Literal["numpy", "numba"]:
+    """Returns the backend that is used for the IRT kernels.
+
+    Returns:
+        Literal["numpy", "numba"]: backend
+    """
+    return "numpy" if _active_kernels is None else "numba"
+
+
+def numba_available() -> bool:
+    """Checks whether numba can be imported.
+
+    Returns:
+        bool: True if numba is installed
+    """
+    try:
+        import numba  # type: ignore # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+if os.environ.get("ADAPTIVETESTING_BACKEND", "numpy") != "numpy":
+    set_backend(os.environ["ADAPTIVETESTING_BACKEND"])  # type: ignore
@@ -0,0 +1,149 @@
+from typing import Callable, Protocol
+import threading
+import time
+import numpy as np
+from ...models.__test_item import TestItem
+from ...models.__adaptive_test import AdaptiveTest
+from ...models.__instrumentation import count
+
+
+class CandidateRanking(Protocol):
+    """Content balancing method that can rank single candidates
+    (`WeightedPenaltyModel`, `MaximumPriorityIndex`).
+
+    `candidate_keys` prepares the ranking of the available items of the item pool.
+    It returns the difficulties of the available items (used for the pre-ranking)
+    and a function that calculates the sort keys of candidates (indices of the available items).
+    The keys have the shape `(n_candidates, n_keys)`, are compared lexicographically (smaller is better)
+    and end with the index of the candidate.
+    """
+    def candidate_keys(self) -> tuple[np.ndarray, Callable[[np.ndarray], np.ndarray]]:
+        ...
+
+
+class BudgetStatistics:
+    def __init__(self):
+        """Counters of budgeted item selections.
+        One instance can be shared by the tests of a simulation or live test
+        to find out how often the time budget is too small for the item pool.
+        """
+        self.n_selections = 0
+        """Number of item selections"""
+        self.n_budget_exceeded = 0
+        """Number of item selections that have been stopped before all candidates were evaluated"""
+        self.n_evaluated = 0
+        """Number of evaluated candidates"""
+        self.n_candidates = 0
+        """Number of available candidates"""
+        self.__lock = threading.Lock()
+
+    def record(self, budget_exceeded: bool, n_evaluated: int, n_candidates: int):
+        """Counts an item selection.
+
+        Args:
+            budget_exceeded (bool): whether the selection has been stopped by the time budget
+            n_evaluated (int): number of evaluated candidates
+            n_candidates (int): number of available candidates
+        """
+        with self.__lock:
+            self.n_selections += 1
+            self.n_budget_exceeded += int(budget_exceeded)
+            self.n_evaluated += n_evaluated
+            self.n_candidates += n_candidates
+
+    @property
+    def budget_exceeded_rate(self) -> float:
+        """Proportion of the item selections stopped by the time budget"""
+        return self.n_budget_exceeded / self.n_selections if self.n_selections > 0 else 0.0
+
+    @property
+    def evaluated_fraction(self) -> float:
+        """Proportion of the available candidates that have been evaluated"""
+        return self.n_evaluated / self.n_candidates if self.n_candidates > 0 else 0.0
+
+
+class BudgetedSelection:
+    def __init__(self,
+                 adaptive_test: AdaptiveTest,
+                 strategy: CandidateRanking,
+                 time_budget: float,
+                 chunk_size: int = 128,
+                 statistics: BudgetStatistics | None = None):
+        """Item selection with a time budget per step (anytime selection).
+        The available items are pre-ranked by the distance between their difficulty
+        and the current ability estimate (see `pre_rank`).
+        The candidates are then ranked by the content balancing method in chunks of `chunk_size` items
+        in this order until all items have been evaluated or the time budget is used up.
+        The best item found so far is selected.
+        At least one chunk is evaluated in every step.
+        If the budget suffices to evaluate all items,
+        the same item is selected as by the content balancing method alone.
+
+        Args:
+            adaptive_test (AdaptiveTest): instance of the adaptive test
+            strategy (CandidateRanking): content balancing method ranking the candidates
+            time_budget (float): time budget (seconds) per item selection
+            chunk_size (int): number of candidates evaluated at once. Defaults to 128.
+            statistics (BudgetStatistics | None): counters of the item selections.
+                Defaults to None (new counters).
+
+        Raises:
+            ValueError: Raised if `time_budget` is not positive or `chunk_size` is smaller than 1.
+        """
+        if time_budget <= 0:
+            raise ValueError("time_budget has to be positive.")
+        if chunk_size < 1:
+            raise ValueError("chunk_size has to be at least 1.")
+        self.adaptive_test = adaptive_test
+        self.strategy = strategy
+        self.time_budget = time_budget
+        self.chunk_size = chunk_size
+        self.statistics = statistics if statistics is not None else BudgetStatistics()
+
+    @staticmethod
+    def pre_rank(difficulties: np.ndarray, ability: float) -> np.ndarray:
+        """Orders the items by the distance between their difficulty and the ability level.
+        The distances are binned (bin width 0.01), so that the order is found by a linear-time radix sort.
+        Within a bin, the items keep their order.
+
+        Args:
+            difficulties (np.ndarray): difficulties of the available items
+            ability (float): current ability estimate
+
+        Returns:
+            np.ndarray: indices of the items (closest item first)
+        """
+        bins = np.minimum(np.abs(difficulties - ability) * 100, np.iinfo(np.int16).max).astype(np.int16)
+        return np.argsort(bins, kind="stable")
+
+    def select_item(self) -> TestItem | None:
+        """Selects the best item found within the time budget.
+
+        Returns:
+            TestItem | None: selected item or None if no items are available
+        """
+        start = time.perf_counter()
+        items = self.adaptive_test.item_pool.test_items
+        if len(items) == 0:
+            return None
+        difficulties, keys = self.strategy.candidate_keys()
+        order = self.pre_rank(difficulties, self.adaptive_test.ability_level)
+
+        best: tuple[float, ...] | None = None
+        n_evaluated = 0
+        budget_exceeded = False
+        for begin in range(0, len(order), self.chunk_size):
+            if begin > 0 and time.perf_counter() - start >= self.time_budget:
+                budget_exceeded = True
+                break
+            candidates = order[begin:begin + self.chunk_size]
+            chunk_keys = keys(candidates)
+            # keys are compared lexicographically, smaller is better
+            chunk_best = tuple(chunk_keys[np.lexsort(chunk_keys.T[::-1])[0]].tolist())
+            if best is None or chunk_best < best:
+                best = chunk_best
+            n_evaluated += len(candidates)
+
+        self.statistics.record(budget_exceeded, n_evaluated, len(items))
+        count("selection.evaluated_candidates", n_evaluated)
+        return items[int(best[-1])]  # type: ignore
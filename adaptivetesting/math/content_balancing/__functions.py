@@ -3,6 +3,7 @@ from ...models.__test_item import TestItem
 from ...models.__item_selection_exception import ItemSelectionException
 from ...math.estimators.__test_information import item_information_function
 from typing import Literal
+import numpy as np
 
 
 def compute_priority_index(item: TestItem,
@@ -51,6 +52,62 @@ def compute_priority_index(item: TestItem,
 
     return priority_index
 
+
+def constraint_membership_matrix(items: list[TestItem],
+                                 constraints: list[Constraint]) -> np.ndarray:
+    """Creates the item × constraint membership matrix.
+    Every entry counts how often a constraint is listed in the `category` property of an item.
+
+    Args:
+        items (list[TestItem]): items
+        constraints (list[Constraint]): constraints
+
+    Returns:
+        np.ndarray: membership matrix with shape `(n_items, n_constraints)`
+
+    Raises:
+        ItemSelectionException: Raised if the additional properties of the items are not correctly formatted
+            or an item belongs to a category without constraint.
+    """
+    positions = {constraint.name: k for k, constraint in enumerate(constraints)}
+    membership = np.zeros((len(items), len(constraints)), dtype=np.int64)
+    for i, item in enumerate(items):
+        item_groups = item.additional_properties.get("category")
+        if not isinstance(item_groups, list):
+            raise ItemSelectionException("Additional properties of the items are not correctly formatted.")
+        for group in item_groups:
+            if group not in positions:
+                raise ItemSelectionException(f"No constraint has been specified for the category {group}.")
+            membership[i, positions[group]] += 1
+    return membership
+
+
+def compute_priority_indices(membership: np.ndarray,
+                             group_weights: np.ndarray,
+                             required_items: np.ndarray,
+                             shown_items: np.ndarray,
+                             information: np.ndarray) -> np.ndarray:
+    """Calculates the priority indices of several items at once.
+    This is the vectorized version of `compute_priority_index`.
+
+    Args:
+        membership (np.ndarray): membership matrix with shape `(n_items, n_constraints)`
+            (see `constraint_membership_matrix`)
+        group_weights (np.ndarray): weights of the constraints with shape `(n_constraints,)`
+        required_items (np.ndarray): number of items required to be shown per constraint
+        shown_items (np.ndarray): number of items already shown per constraint
+        information (np.ndarray): item information with shape `(n_items,)`
+
+    Returns:
+        np.ndarray: priority indices with shape `(n_items,)`
+    """
+    required_items = np.asarray(required_items, dtype=np.float64)
+    quota = (required_items - np.asarray(shown_items, dtype=np.float64)) / required_items
+    factors = np.asarray(group_weights, dtype=np.float64) * quota
+    # the factors of the constraints of every item are multiplied
+    # (the quota may be zero or negative, so a sum of logarithms cannot be used)
+    return np.prod(np.power(factors, membership), axis=1) * information
+
     
 def compute_quota_left(required_items: int | float,
                        shown_items: int | float) -> float:
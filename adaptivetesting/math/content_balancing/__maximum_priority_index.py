@@ -2,7 +2,9 @@ from .__content_balancing import ContentBalancing
 from ...models.__test_item import TestItem
 from ...models.__adaptive_test import AdaptiveTest
 from .__constraint import Constraint
-from .__functions import compute_priority_index
+from .__functions import constraint_membership_matrix, compute_priority_indices
+from ..estimators.__test_information import item_information_function, dicho_item_information_matrix
+from typing import Callable
 import numpy as np
 
 
@@ -31,49 +33,139 @@ class MaximumPriorityIndex(ContentBalancing):
         super().__init__(adaptive_test, constraints)
         self.adaptive_test = adaptive_test
         self.constraints = constraints
+        # the membership matrix and the item parameters are created once per item pool
+        self.__items: list[TestItem] = []
+        self.__rows: dict[int, int] = {}
+        self.__membership = np.zeros((0, 0), dtype=np.int64)
+        self.__parameters: np.ndarray | None = None
+        # number of administered items per constraint
+        self.__administered = np.zeros(len(constraints) if constraints is not None else 0)
+        self.__n_counted = 0
+
+    def __build(self, items: list[TestItem]):
+        self.__items = list(items)
+        self.__rows = {id(item): row for row, item in enumerate(items)}
+        self.__membership = constraint_membership_matrix(items, self.constraints)
+        if all([not isinstance(item.b, list) for item in items]):
+            self.__parameters = np.array([[item.a, item.b, item.c, item.d] for item in items],
+                                         dtype=np.float64).reshape(len(items), 4).T
+        else:
+            self.__parameters = None
+
+    def item_rows(self, items: list[TestItem]) -> np.ndarray:
+        """Finds the rows of the items in the membership matrix.
+        The matrix is rebuilt if the items are not part of it.
+
+        Args:
+            items (list[TestItem]): available items
 
-    def select_item(self) -> TestItem | None:
-        """Select the next item to administer based on the maximum priority index method.
         Returns:
-            TestItem: The selected test item.
+            np.ndarray: rows of the items
+        """
+        rows = [self.__rows.get(id(item)) for item in items]
+        if any([row is None for row in rows]):
+            self.__build(items)
+            return np.arange(len(items))
+        return np.array(rows, dtype=np.int64)
+
+    def item_information(self, items: list[TestItem], rows: np.ndarray) -> np.ndarray:
+        """Calculates the information of the available items at the current ability level.
+
+        Args:
+            items (list[TestItem]): available items
+            rows (np.ndarray): rows of the items in the membership matrix
+
+        Returns:
+            np.ndarray: item information
+        """
+        if self.__parameters is not None:
+            a, b, c, d = self.__parameters[:, rows]
+            return dicho_item_information_matrix(np.array([self.adaptive_test.ability_level], dtype=np.float64),
+                                                 a, b, c, d)[0]
+        return np.array([
+            float(item_information_function(ability=self.adaptive_test.ability_level, item=item))
+            for item in items
+        ])
+
+    def priority_indices(self, items: list[TestItem], shown_items: np.ndarray) -> np.ndarray:
+        """Calculates the priority indices of the available items.
+
+        Args:
+            items (list[TestItem]): available items
+            shown_items (np.ndarray): number of shown items per constraint
+
+        Returns:
+            np.ndarray: priority indices
+        """
+        rows = self.item_rows(items)
+        return compute_priority_indices(
+            membership=self.__membership[rows],
+            group_weights=np.array([constraint.weight for constraint in self.constraints]),
+            required_items=np.array([constraint.prevalence for constraint in self.constraints]),
+            shown_items=shown_items,
+            information=self.item_information(items, rows)
+        )
+
+    def count_administered_items(self) -> np.ndarray:
+        """Counts the items administered in the current test for every constraint.
+        Only the items administered since the last call are counted.
+
+        Returns:
+            np.ndarray: number of administered items (in the order of the constraints)
+        """
+        positions = {constraint.name: k for k, constraint in enumerate(self.constraints)}
+        answered_items = self.adaptive_test.answered_items
+        for item in answered_items[self.__n_counted:]:
+            for group in set(item.additional_properties["category"]):
+                if group in positions:
+                    self.__administered[positions[group]] += 1
+        self.__n_counted = len(answered_items)
+        return self.__administered.copy()
+
+    def candidate_keys(self) -> tuple[np.ndarray, Callable[[np.ndarray], np.ndarray]]:
+        """Prepares the ranking of single candidates for `BudgetedSelection`.
+
+        Returns:
+            tuple[np.ndarray, Callable[[np.ndarray], np.ndarray]]: difficulties of the available items
+                and function calculating the sort keys (negative priority index and index)
+                of candidates (indices of the available items)
         """
-        # compute priority index for every item
         available_items = self.adaptive_test.item_pool.test_items
-        shown_items = self.adaptive_test.answered_items
-        priority_indices: list[float] = []
-        
-        for item in available_items:
-            # get associated constraints
-            associated_constraints = [
-                constraint
-                for constraint in self.constraints
-                if constraint.name in item.additional_properties["category"]
-            ]
-
-            group_weights: dict[str, float] = {}
-            required_items: dict[str, float] = {}
-            shown_items_per_constraint: dict[str, float] = {}
-            
-            for constraint in associated_constraints:
-                group_weights[constraint.name] = constraint.weight
-                required_items[constraint.name] = constraint.prevalence
-                n_shown_items = len([
-                    shown_item
-                    for shown_item in shown_items
-                    if constraint.name in shown_item.additional_properties["category"]
-                ])
-                shown_items_per_constraint[constraint.name] = float(n_shown_items)
-
-            # calculate priority index
-            pix = compute_priority_index(
-                item=item,
+        rows = self.item_rows(available_items)
+        group_weights = np.array([constraint.weight for constraint in self.constraints])
+        required_items = np.array([constraint.prevalence for constraint in self.constraints])
+        shown_items = self.count_administered_items()
+
+        def keys(candidates: np.ndarray) -> np.ndarray:
+            candidate_rows = rows[candidates]
+            priority_indices = compute_priority_indices(
+                membership=self.__membership[candidate_rows],
                 group_weights=group_weights,
                 required_items=required_items,
-                shown_items=shown_items_per_constraint,
-                current_ability=self.adaptive_test.ability_level
+                shown_items=shown_items,
+                information=self.item_information([available_items[i] for i in candidates.tolist()],
+                                                  candidate_rows)
             )
+            return np.column_stack((-priority_indices, candidates))
 
-            priority_indices.append(pix)
+        if self.__parameters is not None:
+            difficulties = self.__parameters[1, rows]
+        else:
+            difficulties = np.array([np.mean(item.b) for item in available_items], dtype=np.float64)
+        return difficulties, keys
+
+    def select_item(self) -> TestItem | None:
+        """Select the next item to administer based on the maximum priority index method.
+        Returns:
+            TestItem: The selected test item.
+        """
+        available_items = self.adaptive_test.item_pool.test_items
+        # skip selection if item pool is empty
+        if len(available_items) == 0:
+            return None
+
+        # compute priority index for every item
+        priority_indices = self.priority_indices(available_items, self.count_administered_items())
 
         # select the item with the highest priority index
         max_p_i = np.argmax(priority_indices)
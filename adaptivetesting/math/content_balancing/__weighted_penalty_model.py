@@ -1,4 +1,5 @@
 from typing import Literal, Callable
+import numpy as np
 from ..estimators.__test_information import item_information_function
 from ...models.__test_item import TestItem
 from .__functions import (
@@ -11,6 +12,7 @@ from .__functions import (
 )
 from .__constraint import Constraint
 from .__content_balancing import ContentBalancing
+from .__weighted_penalty_model_state import WeightedPenaltyModelState, ITEM_GROUPS, ITEM_GROUP_RANKS
 from ...models.__adaptive_test import AdaptiveTest
 
 
@@ -54,65 +56,137 @@ class WeightedPenaltyModel(ContentBalancing):
                 on the specific states and progress of the test.
         """
         super().__init__(adaptive_test, constraints)
-        self.items = adaptive_test.item_pool.test_items
-        self.ability = adaptive_test.ability_level
-        self.shown_items = adaptive_test.answered_items
+        self.adaptive_test = adaptive_test
         self.constraints = constraints
-        
+        self.__constraint_weight = constraint_weight
+        self.__information_weight = information_weight
+
         # setup
         self.eligible_items: list[tuple[TestItem, float, ITEM_GROUP]] = []
+        # created on the first item selection and kept for the whole test
+        self.state: WeightedPenaltyModelState | None = None
+        self.refresh()
+
+    def refresh(self):
+        """Reads the current state of the adaptive test
+        (available items, ability level, shown items and weights)."""
+        self.items = self.adaptive_test.item_pool.test_items
+        self.ability = self.adaptive_test.ability_level
+        self.shown_items = self.adaptive_test.answered_items
 
         # only used internally
-        if callable(constraint_weight):
-            self.constraint_weight = constraint_weight(adaptive_test)
+        if callable(self.__constraint_weight):
+            self.constraint_weight = self.__constraint_weight(self.adaptive_test)
         else:
-            self.constraint_weight = constraint_weight
-        
-        if callable(information_weight):
-            self.information_weight = information_weight(adaptive_test)
+            self.constraint_weight = self.__constraint_weight
+
+        if callable(self.__information_weight):
+            self.information_weight = self.__information_weight(self.adaptive_test)
         else:
-            self.information_weight = information_weight
+            self.information_weight = self.__information_weight
 
     def select_item(self) -> TestItem | None:
         """Select the next item to administer based on the weighted penalty model.
+        The same instance can be used for all item selections of a test.
 
         Returns:
             TestItem | None: The selected TestItem or None if no eligible items are available.
         """
-        self.prepare_item_pool()
-        if len(self.eligible_items) > 0:
-            return self.eligible_items[0][0]
-        else:
+        self.refresh()
+        if len(self.items) == 0:
             return None
-    
-    def prepare_item_pool(self):
-        """Prepares item pool for the item selection
-        and calls are functions required to perform the necessary calculations"""
-        # calculate item information for every item
-        item_information_list = self.calculate_information()
+        order, _, _ = self.rank_items()
+        return self.items[int(order[0])]
 
-        max_item = max(item_information_list)
+    def rank_items(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Calculates the weighted penalty values and item groups of the available items
+        and orders the items by item group and weighted penalty value.
 
-        content_penalties = self.calculate_content_penalties()
-
-        max_content_penalty = max(content_penalties)
-        min_content_penalty = min(content_penalties)
-
-        self.calculate_weighted_penalty_for_all_items(
-            item_information_list=item_information_list,
-            max_item=max_item,
-            content_penalties=content_penalties,
-            max_content_penalty=max_content_penalty,
-            min_content_penalty=min_content_penalty
-        )
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: order of the items,
+                weighted penalty values and item groups (index of `ITEM_GROUPS`)
+        """
+        if self.state is None:
+            self.state = WeightedPenaltyModelState(self.items, self.constraints)
+        rows = self.state.update(self.shown_items, self.items)
+
+        information = self.state.information(rows, self.ability)
+        if information is None:
+            information = np.array(self.calculate_information())
+        content_penalties = self.state.content_penalties(rows)
+
+        # standardize content penalties and item information
+        penalty_range = content_penalties.max() - content_penalties.min()
+        if penalty_range == 0:
+            standardized_penalties = np.zeros(len(rows))
+        else:
+            standardized_penalties = (content_penalties - content_penalties.min()) / penalty_range
+        information_penalties = -((information / information.max()) ** 2)
+        weighted_penalties = self.constraint_weight * standardized_penalties \
+            + self.information_weight * information_penalties
 
-        group_assignment: list[tuple[Constraint, CONSTRAINT_GROUP]] = self.get_constraint_group_assignments()
+        # between group ordering: green, orange, yellow, red
+        # within group ordering: ascending order of weighted penalty value
+        item_groups = self.state.item_groups(rows)
+        order = np.lexsort((weighted_penalties, ITEM_GROUP_RANKS[item_groups]))
+        return order, weighted_penalties, item_groups
+
+    def candidate_keys(self) -> tuple[np.ndarray, Callable[[np.ndarray], np.ndarray]]:
+        """Prepares the ranking of single candidates for `BudgetedSelection`.
+        The content penalties and item groups are calculated once per combination of constraints
+        and standardized over all available items, so that the candidates are ranked as by `rank_items`.
+        The information penalties are standardized by the maximum information of all available items.
+        Therefore, the information of all available items is calculated here, before the time budget is checked:
+        for this method, the budget only bounds the ranking of the candidates, not the information pass.
 
-        # form a list of candidate items
-        self.form_list_of_candidate_items(group_assignment)
+        Returns:
+            tuple[np.ndarray, Callable[[np.ndarray], np.ndarray]]: difficulties of the available items
+                and function calculating the sort keys (item group rank, weighted penalty value and index)
+                of candidates (indices of the available items)
+        """
+        self.refresh()
+        if self.state is None:
+            self.state = WeightedPenaltyModelState(self.items, self.constraints)
+        rows = self.state.update(self.shown_items, self.items)
+
+        information = self.state.information(rows, self.ability)
+        if information is None:
+            information = np.array(self.calculate_information())
+        max_information = information.max()
+        pattern_ids = self.state.pattern_ids[rows]
+        pattern_penalties = self.state.pattern_content_penalties(len(rows))
+        available_penalties = pattern_penalties[np.unique(pattern_ids)]
+        min_penalty = available_penalties.min()
+        penalty_range = available_penalties.max() - min_penalty
+        pattern_ranks = ITEM_GROUP_RANKS[self.state.pattern_item_groups()]
+        constraint_weight, information_weight = self.constraint_weight, self.information_weight
+
+        def keys(candidates: np.ndarray) -> np.ndarray:
+            candidate_patterns = pattern_ids[candidates]
+            if penalty_range == 0:
+                standardized_penalties = np.zeros(len(candidates))
+            else:
+                standardized_penalties = (pattern_penalties[candidate_patterns] - min_penalty) / penalty_range
+            information_penalties = -((information[candidates] / max_information) ** 2)
+            weighted_penalties = constraint_weight * standardized_penalties \
+                + information_weight * information_penalties
+            return np.column_stack((pattern_ranks[candidate_patterns], weighted_penalties, candidates))
+
+        if self.state.parameters is not None:
+            difficulties = self.state.parameters[1, rows]
+        else:
+            difficulties = np.array([np.mean(item.b) for item in self.items], dtype=np.float64)
+        return difficulties, keys
 
-        # order items
-        self.order_candidate_items()
+    def prepare_item_pool(self):
+        """Prepares item pool for the item selection
+        and calls are functions required to perform the necessary calculations"""
+        self.refresh()
+        order, weighted_penalties, item_groups = self.rank_items()
+        self.eligible_items = [
+            (self.items[i], float(weighted_penalties[i]), ITEM_GROUPS[item_groups[i]])  # type: ignore
+            for i in order
+        ]
 
     def calculate_information(self,
                               model: Literal['GRM', 'GPCM'] | None = None) -> list[float]:
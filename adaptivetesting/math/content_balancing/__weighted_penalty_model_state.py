@@ -0,0 +1,228 @@
+from typing import Sequence
+import numpy as np
+from ...models.__test_item import TestItem
+from ...models.__item_selection_exception import ItemSelectionException
+from ..estimators.__test_information import dicho_item_information_matrix
+from .__constraint import Constraint
+
+
+CONSTRAINT_GROUP_CODES = {"A": 1, "B": 2, "C": 4}
+"""Bit of every constraint group"""
+ITEM_GROUPS = [None, "green", "yellow", "green", "red", "orange", "red", "orange"]
+"""Item group (color) for every combination of constraint group bits"""
+ITEM_GROUP_RANKS = np.array([4, 0, 2, 0, 3, 1, 3, 1])
+"""Rank of the item group for every combination of constraint group bits
+(green, orange, yellow, red, no group)"""
+
+
+class WeightedPenaltyModelState:
+    def __init__(self, items: Sequence[TestItem], constraints: list[Constraint]):
+        """Bookkeeping of the weighted penalty model for one test.
+        The item × constraint membership matrix and the item parameters are created once.
+        The number of administered and remaining items per constraint are updated
+        whenever new items have been administered, so that they do not have to be recounted
+        for every item selection.
+
+        Args:
+            items (Sequence[TestItem]): items of the item pool
+            constraints (list[Constraint]): constraints that are applied to the item selection
+
+        Raises:
+            ValueError: Raised if the lower or upper bound of a constraint is None.
+            ItemSelectionException: Raised if an item has no `category` property.
+        """
+        if any([constraint.lower is None or constraint.upper is None for constraint in constraints]):
+            raise ValueError("constraint.lower and constraint.upper may not be None.")
+        self.constraints = constraints
+        self.weights = np.array([constraint.weight for constraint in constraints], dtype=np.float64)
+        self.prevalences = np.array([constraint.prevalence for constraint in constraints], dtype=np.float64)
+        self.lower = np.array([constraint.lower for constraint in constraints], dtype=np.float64)
+        self.upper = np.array([constraint.upper for constraint in constraints], dtype=np.float64)
+        self.reset(items)
+
+    def reset(self, items: Sequence[TestItem]):
+        """Creates the membership matrix for new items
+        and resets the number of administered items.
+
+        Args:
+            items (Sequence[TestItem]): items of the item pool
+        """
+        self.items = list(items)
+        self.rows = {id(item): row for row, item in enumerate(self.items)}
+        self.membership = np.array([
+            [constraint.name in self.__categories(item) for constraint in self.constraints]
+            for item in self.items
+        ], dtype=bool).reshape(len(self.items), len(self.constraints))
+        # items with the same constraints share their content penalty and item group
+        self.patterns, pattern_ids = np.unique(self.membership, axis=0, return_inverse=True)
+        self.pattern_ids = pattern_ids.reshape(-1)
+        if all([not isinstance(item.b, list) for item in self.items]):
+            self.parameters: np.ndarray | None = np.array([[item.a, item.b, item.c, item.d] for item in self.items],
+                                                          dtype=np.float64).reshape(len(self.items), 4).T
+        else:
+            self.parameters = None
+        self.available = np.ones(len(self.items), dtype=bool)
+        self.remaining = self.membership.sum(axis=0)
+        self.administered = np.zeros(len(self.constraints), dtype=np.int64)
+        self.test_length = 0
+
+    @staticmethod
+    def __categories(item: TestItem) -> list[str]:
+        try:
+            return item.additional_properties["category"]
+        except KeyError:
+            raise ItemSelectionException("Additional properties of the items are not correctly formatted.")
+
+    def administer(self, item: TestItem):
+        """Updates the counts after an item has been administered.
+
+        Args:
+            item (TestItem): administered item
+        """
+        categories = self.__categories(item)
+        self.administered += np.array([constraint.name in categories for constraint in self.constraints],
+                                      dtype=np.int64)
+        self.test_length += 1
+        row = self.rows.get(id(item))
+        if row is not None and self.available[row]:
+            self.available[row] = False
+            self.remaining -= self.membership[row]
+
+    def update(self, shown_items: Sequence[TestItem], available_items: Sequence[TestItem]) -> np.ndarray:
+        """Counts the newly administered items and finds the rows of the available items.
+        If the available items are not part of the membership matrix, the state is rebuilt.
+
+        Args:
+            shown_items (Sequence[TestItem]): administered items
+            available_items (Sequence[TestItem]): available items
+
+        Returns:
+            np.ndarray: rows of the available items (in the order of `available_items`)
+        """
+        for item in shown_items[self.test_length:]:
+            self.administer(item)
+
+        rows = [self.rows.get(id(item)) for item in available_items]
+        if any([row is None for row in rows]):
+            self.reset(available_items)
+            for item in shown_items:
+                self.administer(item)
+            return np.arange(len(available_items))
+
+        row_array = np.array(rows, dtype=np.int64)
+        if len(row_array) != int(self.available.sum()):
+            # items have been removed without being administered
+            self.available[:] = False
+            self.available[row_array] = True
+            self.remaining = self.membership[row_array].sum(axis=0)
+        return row_array
+
+    def information(self, rows: np.ndarray, ability: float) -> np.ndarray | None:
+        """Calculates the item information of dichotomous items.
+
+        Args:
+            rows (np.ndarray): rows of the items
+            ability (float): current ability level
+
+        Returns:
+            np.ndarray | None: item information or None if the item pool contains polytomous items
+        """
+        if self.parameters is None:
+            return None
+        a, b, c, d = self.parameters[:, rows]
+        return dicho_item_information_matrix(np.array([ability], dtype=np.float64), a, b, c, d)[0]
+
+    def proportions(self, n_remaining: np.ndarray | int) -> np.ndarray:
+        """Calculates the expected proportion of every constraint (see `compute_prop`).
+
+        Args:
+            n_remaining (np.ndarray | int): number of remaining items
+
+        Returns:
+            np.ndarray: expected proportions
+        """
+        if self.test_length == 0:
+            return np.zeros(len(self.constraints))
+        return (self.administered + self.prevalences * n_remaining) / self.test_length
+
+    def content_penalties(self, rows: np.ndarray) -> np.ndarray:
+        """Calculates the total content penalty value of the available items
+        (see `compute_total_content_penalty_value_for_item`).
+
+        Args:
+            rows (np.ndarray): rows of the available items
+
+        Returns:
+            np.ndarray: total content penalty values
+        """
+        return np.where(self.membership[rows], self.constraint_penalties(len(rows)), 0.0).sum(axis=1)
+
+    def constraint_penalties(self, n_available: int) -> np.ndarray:
+        """Calculates the weighted penalty value of every constraint.
+
+        Args:
+            n_available (int): number of available items
+
+        Returns:
+            np.ndarray: weighted penalty values (in the order of the constraints)
+        """
+        prop = self.proportions(n_available)
+        mid = (self.upper + self.lower) / 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            penalty = np.select(
+                [prop >= self.upper, (self.upper > prop) & (prop >= self.lower), prop < self.lower],
+                [
+                    (1 / (2 * (self.upper - mid))) * (prop - mid) ** 2 + (self.upper - mid) / 2,
+                    prop - mid,
+                    (1 / (2 * (self.lower - mid))) * (prop - mid) ** 2 + (self.lower - mid) / 2
+                ],
+                default=np.nan
+            )
+        return penalty * self.weights
+
+    def pattern_content_penalties(self, n_available: int) -> np.ndarray:
+        """Calculates the total content penalty value of every combination of constraints
+        (`patterns`, the pattern of an item is `pattern_ids[row]`).
+
+        Args:
+            n_available (int): number of available items
+
+        Returns:
+            np.ndarray: total content penalty values
+        """
+        return np.where(self.patterns, self.constraint_penalties(n_available), 0.0).sum(axis=1)
+
+    def constraint_groups(self) -> np.ndarray:
+        """Assigns every constraint to a constraint group (A, B or C)
+        depending on the number of administered and remaining items of the constraint.
+
+        Returns:
+            np.ndarray: bit of the constraint group of every constraint (see `CONSTRAINT_GROUP_CODES`)
+        """
+        prop = self.proportions(self.remaining)
+        return np.select(
+            [prop <= self.lower, (self.lower <= prop) & (prop <= self.upper), self.upper <= prop],
+            [CONSTRAINT_GROUP_CODES["A"], CONSTRAINT_GROUP_CODES["B"], CONSTRAINT_GROUP_CODES["C"]],
+            default=0
+        )
+
+    def item_groups(self, rows: np.ndarray) -> np.ndarray:
+        """Combines the constraint groups of the constraints of every available item.
+
+        Args:
+            rows (np.ndarray): rows of the available items
+
+        Returns:
+            np.ndarray: combination of constraint group bits of every item (index of `ITEM_GROUPS`)
+        """
+        return np.bitwise_or.reduce(np.where(self.membership[rows], self.constraint_groups(), 0),
+                                    axis=1).astype(np.int64)
+
+    def pattern_item_groups(self) -> np.ndarray:
+        """Combines the constraint groups of every combination of constraints (`patterns`).
+
+        Returns:
+            np.ndarray: combination of constraint group bits (index of `ITEM_GROUPS`)
+        """
+        return np.bitwise_or.reduce(np.where(self.patterns, self.constraint_groups(), 0),
+                                    axis=1).astype(np.int64)
@@ -0,0 +1,311 @@
+from typing import Callable, Literal, Type
+import numpy as np
+from scipy.integrate import trapezoid
+from ...services.__estimator_interface import IEstimator
+from .__ml_estimation import MLEstimator
+from .__bayes_modal_estimation import BayesModal
+from .__expect_a_posteriori import ExpectedAPosteriori
+from .__prior import Prior
+from .__functions.__estimators import probability_y1
+from .__test_information import dicho_item_information_matrix, prior_information_function
+
+
+type BATCH_ESTIMATION_METHOD = Literal["ML", "BM", "EAP"]
+"""Estimation methods supported by the batch estimator."""
+
+
+class BatchEstimator:
+    def __init__(self,
+                 a: np.ndarray,
+                 b: np.ndarray,
+                 c: np.ndarray,
+                 d: np.ndarray,
+                 n_examinees: int,
+                 max_length: int,
+                 method: BATCH_ESTIMATION_METHOD = "ML",
+                 prior: Prior | None = None,
+                 optimization_interval: tuple[float, float] = (-10, 10),
+                 n_grid_points: int = 41,
+                 xatol: float = 1e-6):
+        """Estimates the ability levels of many examinees at once.
+        Every examinee has its own list of answered items which is
+        extended with `add_responses`. Only dichotomous items are supported.
+
+        For ML and Bayes Modal estimation, the maximum is searched
+        on a coarse grid first and then refined for all examinees
+        simultaneously using a golden-section search.
+        For EAP estimation, the log-posterior on the quadrature grid
+        is updated incrementally after every administered item.
+
+        Args:
+            a (np.ndarray): discrimination parameters of the item bank
+            b (np.ndarray): difficulty parameters of the item bank
+            c (np.ndarray): guessing parameters of the item bank
+            d (np.ndarray): slipping parameters of the item bank
+            n_examinees (int): number of examinees
+            max_length (int): maximum number of items answered by a single examinee
+            method (BATCH_ESTIMATION_METHOD): estimation method. Defaults to `"ML"`.
+            prior (Prior | None): prior distribution. Required for Bayes Modal and EAP.
+            optimization_interval (tuple[float, float]): interval used for the optimization
+                and the numerical integration. Defaults to (-10, 10).
+            n_grid_points (int): number of grid points used to bracket the maximum (ML and BM only).
+                Defaults to 41.
+            xatol (float): absolute tolerance of the golden-section search (ML and BM only).
+                Defaults to 1e-6.
+        """
+        if method in ("BM", "EAP") and prior is None:
+            raise ValueError(f"prior cannot be None when using {method}.")
+
+        self.a = np.asarray(a, dtype=np.float64)
+        self.b = np.asarray(b, dtype=np.float64)
+        self.c = np.asarray(c, dtype=np.float64)
+        self.d = np.asarray(d, dtype=np.float64)
+        self.method: BATCH_ESTIMATION_METHOD = method
+        self.prior = prior
+        self.optimization_interval = optimization_interval
+        self.n_grid_points = n_grid_points
+        self.xatol = xatol
+
+        # answered items are referenced by their index in the item bank
+        self.answered_items = np.zeros((n_examinees, max_length), dtype=np.intp)
+        self.responses = np.zeros((n_examinees, max_length), dtype=np.int64)
+        self.lengths = np.zeros(n_examinees, dtype=np.intp)
+
+        self.prior_information = 0.0
+        if method == "BM" and prior is not None:
+            self.prior_information = float(prior_information_function(prior, optimization_interval))
+
+        if method == "EAP" and prior is not None:
+            self.grid = np.linspace(optimization_interval[0], optimization_interval[1], 1000)
+            log_prior = self.log_prior(self.grid)
+            self.log_posterior = np.tile(log_prior, (n_examinees, 1))
+
+    @staticmethod
+    def from_estimator(ability_estimator: Type[IEstimator],
+                       a: np.ndarray,
+                       b: np.ndarray,
+                       c: np.ndarray,
+                       d: np.ndarray,
+                       n_examinees: int,
+                       max_length: int,
+                       prior: Prior | None = None,
+                       optimization_interval: tuple[float, float] = (-10, 10)) -> "BatchEstimator":
+        """Creates a batch estimator that reproduces the given estimator class.
+
+        Args:
+            ability_estimator (Type[IEstimator]): `MLEstimator`, `BayesModal` or `ExpectedAPosteriori`
+            a (np.ndarray): discrimination parameters of the item bank
+            b (np.ndarray): difficulty parameters of the item bank
+            c (np.ndarray): guessing parameters of the item bank
+            d (np.ndarray): slipping parameters of the item bank
+            n_examinees (int): number of examinees
+            max_length (int): maximum number of items answered by a single examinee
+            prior (Prior | None): prior distribution
+            optimization_interval (tuple[float, float]): interval used for the estimation
+
+        Raises:
+            ValueError: Raised if the estimator has no batched counterpart.
+
+        Returns:
+            BatchEstimator: batch estimator
+        """
+        method: BATCH_ESTIMATION_METHOD
+        # EAP inherits from BayesModal, therefore, it has to be checked first
+        if issubclass(ability_estimator, ExpectedAPosteriori):
+            method = "EAP"
+        elif issubclass(ability_estimator, BayesModal):
+            method = "BM"
+        elif issubclass(ability_estimator, MLEstimator):
+            method = "ML"
+        else:
+            raise ValueError(f"{ability_estimator.__name__} is not supported by the batch estimator.")
+
+        return BatchEstimator(a, b, c, d,
+                              n_examinees=n_examinees,
+                              max_length=max_length,
+                              method=method,
+                              prior=prior,
+                              optimization_interval=optimization_interval)
+
+    def log_prior(self, x: np.ndarray) -> np.ndarray:
+        """Log-density of the prior distribution.
+
+        Args:
+            x (np.ndarray): points at which to evaluate the prior
+
+        Returns:
+            np.ndarray: log-density
+        """
+        if self.prior is None:
+            return np.zeros_like(x)
+        if hasattr(self.prior, "logpdf"):
+            return np.asarray(self.prior.logpdf(x), dtype=np.float64)
+        return np.log(np.clip(np.asarray(self.prior.pdf(x), dtype=np.float64), 1e-300, None))
+
+    def add_responses(self,
+                      rows: np.ndarray,
+                      item_indices: np.ndarray,
+                      responses: np.ndarray) -> None:
+        """Adds one answered item to every given examinee.
+
+        Args:
+            rows (np.ndarray): examinee indices
+            item_indices (np.ndarray): indices of the answered items in the item bank
+            responses (np.ndarray): responses to the answered items
+        """
+        positions = self.lengths[rows]
+        self.answered_items[rows, positions] = item_indices
+        self.responses[rows, positions] = responses
+        self.lengths[rows] += 1
+
+        if self.method == "EAP":
+            p_y1 = self.__probability(
+                self.grid[np.newaxis, :],
+                self.a[item_indices][:, np.newaxis],
+                self.b[item_indices][:, np.newaxis],
+                self.c[item_indices][:, np.newaxis],
+                self.d[item_indices][:, np.newaxis]
+            )
+            response = responses[:, np.newaxis]
+            self.log_posterior[rows] += response * np.log(p_y1 + 1e-300) + \
+                (1 - response) * np.log(1 - p_y1 + 1e-300)
+
+    def estimate(self, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Estimates the ability levels and standard errors of the given examinees.
+
+        Args:
+            rows (np.ndarray): examinee indices
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: ability estimations and standard errors
+        """
+        if len(rows) == 0:
+            return np.empty(0), np.empty(0)
+
+        if self.method == "EAP":
+            return self.__posterior_mean(rows)
+
+        objective = self.__log_likelihood_objective(rows)
+        estimation = self.__maximize(objective, len(rows))
+
+        if self.method == "ML":
+            # the likelihood has no maximum if all responses are the same
+            # in this case, the estimation is set to one of the boundaries
+            # (see TestAssembler.estimate_ability_level)
+            lengths = self.lengths[rows]
+            valid = np.arange(self.responses.shape[1])[np.newaxis, :] < lengths[:, np.newaxis]
+            n_correct = np.sum(self.responses[rows] * valid, axis=1)
+            estimation = np.where(n_correct == 0, -10.0, estimation)
+            estimation = np.where(n_correct == lengths, 10.0, estimation)
+
+        test_information = self.test_information(rows, estimation) + self.prior_information
+        with np.errstate(divide="ignore"):
+            standard_error = 1 / np.sqrt(test_information)
+        return estimation, standard_error
+
+    def test_information(self, rows: np.ndarray, abilities: np.ndarray) -> np.ndarray:
+        """Calculates the test information of the answered items.
+
+        Args:
+            rows (np.ndarray): examinee indices
+            abilities (np.ndarray): ability level of every examinee
+
+        Returns:
+            np.ndarray: test information of every examinee
+        """
+        items, valid = self.__answered(rows)
+        information = dicho_item_information_matrix(
+            abilities,
+            self.a[items],
+            self.b[items],
+            self.c[items],
+            self.d[items]
+        )
+        return np.sum(information * valid, axis=1)
+
+    def __answered(self, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        max_length = int(self.lengths[rows].max()) if len(rows) > 0 else 0
+        items = self.answered_items[rows, :max_length]
+        valid = np.arange(max_length)[np.newaxis, :] < self.lengths[rows][:, np.newaxis]
+        return items, valid
+
+    @staticmethod
+    def __probability(mu: np.ndarray,
+                      a: np.ndarray,
+                      b: np.ndarray,
+                      c: np.ndarray,
+                      d: np.ndarray) -> np.ndarray:
+        shape = np.broadcast_shapes(mu.shape, a.shape)
+        return np.reshape(probability_y1(mu, a, b, c, d), shape)
+
+    def __log_likelihood_objective(self, rows: np.ndarray) -> Callable[[np.ndarray], np.ndarray]:
+        """Creates the objective function (log-likelihood or log-posterior)
+        for the given examinees. The objective takes ability levels with shape
+        `(n_rows, k)` and returns the function values with the same shape."""
+        items, valid = self.__answered(rows)
+        a = self.a[items][:, np.newaxis, :]
+        b = self.b[items][:, np.newaxis, :]
+        c = self.c[items][:, np.newaxis, :]
+        d = self.d[items][:, np.newaxis, :]
+        responses = self.responses[rows, :items.shape[1]][:, np.newaxis, :]
+        mask = valid[:, np.newaxis, :]
+
+        def objective(mu: np.ndarray) -> np.ndarray:
+            p_y1 = self.__probability(mu[:, :, np.newaxis], a, b, c, d)
+            terms = responses * np.log(p_y1 + 1e-300) + (1 - responses) * np.log(1 - p_y1 + 1e-300)
+            values = np.sum(terms * mask, axis=2)
+            if self.method == "BM":
+                values = values + self.log_prior(mu)
+            return np.where(np.isfinite(values), values, -1e300)
+
+        return objective
+
+    def __maximize(self,
+                   objective: Callable[[np.ndarray], np.ndarray],
+                   n_rows: int) -> np.ndarray:
+        """Maximizes the objective function for every examinee.
+        A coarse grid search brackets the maximum
+        which is then refined using a vectorized golden-section search."""
+        lower, upper = self.optimization_interval
+        grid = np.linspace(lower, upper, self.n_grid_points)
+        values = objective(np.broadcast_to(grid, (n_rows, len(grid))))
+        best = grid[np.argmax(values, axis=1)]
+        step = grid[1] - grid[0]
+
+        left = np.clip(best - step, lower, upper)
+        right = np.clip(best + step, lower, upper)
+
+        inverse_phi = (np.sqrt(5) - 1) / 2
+        x1 = right - inverse_phi * (right - left)
+        x2 = left + inverse_phi * (right - left)
+        f1 = objective(x1[:, np.newaxis])[:, 0]
+        f2 = objective(x2[:, np.newaxis])[:, 0]
+
+        while np.max(right - left) > self.xatol:
+            # if f1 < f2, the maximum lies within [x1, right]
+            move_right = f1 < f2
+            left = np.where(move_right, x1, left)
+            right = np.where(move_right, right, x2)
+
+            new_x1 = np.where(move_right, x2, right - inverse_phi * (right - left))
+            new_x2 = np.where(move_right, left + inverse_phi * (right - left), x1)
+            # only one new point has to be evaluated per examinee
+            evaluated = objective(np.where(move_right, new_x2, new_x1)[:, np.newaxis])[:, 0]
+            f1, f2 = np.where(move_right, f2, evaluated), np.where(move_right, evaluated, f1)
+            x1, x2 = new_x1, new_x2
+
+        return (left + right) / 2
+
+    def __posterior_mean(self, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        log_posterior = self.log_posterior[rows]
+        # use log-sum-exp stabilization
+        max_log = np.nanmax(log_posterior, axis=1, keepdims=True)
+        weights = np.exp(log_posterior - max_log)
+
+        numerator = trapezoid(self.grid * weights, self.grid, axis=1)
+        denominator = trapezoid(weights, self.grid, axis=1)
+        estimation = numerator / (denominator + np.finfo(float).eps)
+
+        squared_deviation = (self.grid[np.newaxis, :] - estimation[:, np.newaxis]) ** 2
+        variance = trapezoid(squared_deviation * weights, self.grid, axis=1) / denominator
+        return estimation, np.sqrt(variance)
@@ -15,7 +15,8 @@ class BayesModal(IEstimator):
                  items: list[TestItem],
                  prior: Prior,
                  optimization_interval: Tuple[float, float] = (-10, 10),
-                 model: Literal["GRM", "GPCM"] | None = None,):
+                 model: Literal["GRM", "GPCM"] | None = None,
+                 collect_diagnostics: bool = False):
         """This class can be used to estimate the current ability level
             of a respondent given the response pattern and the corresponding
             item difficulties.
@@ -33,8 +34,11 @@ class BayesModal(IEstimator):
                 optimization_interval (Tuple[float, float]): interval used for the optimization function
 
                 model (Literal["GRM", "GPCM"], optional): model type (required for polytomous models)
+
+                collect_diagnostics (bool): collect the convergence diagnostics of the estimates in `diagnostics`
             """
-        super().__init__(response_pattern, items, optimization_interval)
+        super().__init__(response_pattern, items, optimization_interval,
+                         collect_diagnostics=collect_diagnostics)
 
         self.prior = prior
 
@@ -63,7 +67,8 @@ class BayesModal(IEstimator):
                                       self.d,
                                       self.response_pattern,
                                       self.prior,
-                                      optimization_interval=self.optimization_interval)
+                                      optimization_interval=self.optimization_interval,
+                                      diagnostics=self.requested_diagnostics)
     
         if self.type == "poly":
             if self.model == "GRM":
@@ -73,7 +78,8 @@ class BayesModal(IEstimator):
                     self.thresholds_list,
                     cast(list[int], self.response_pattern.tolist()),
                     self.prior,
-                    self.optimization_interval
+                    self.optimization_interval,
+                    diagnostics=self.requested_diagnostics
                 )
                 
             if self.model == "GPCM":
@@ -83,7 +89,8 @@ class BayesModal(IEstimator):
                     self.thresholds_list,
                     cast(list[int], self.response_pattern.tolist()),
                     self.prior,
-                    self.optimization_interval
+                    self.optimization_interval,
+                    diagnostics=self.requested_diagnostics
                 )
         raise ValueError("model and/or type have not been correctly specified")
 
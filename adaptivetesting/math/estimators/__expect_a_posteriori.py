@@ -2,7 +2,8 @@ import numpy as np
 from scipy.integrate import trapezoid
 from .__bayes_modal_estimation import BayesModal
 from ...models.__test_item import TestItem
-from .__functions.__estimators import log_likelihood
+from .__functions.__log_probabilities import LogLikelihoodWorkspace
+from .__functions.__diagnostics import quadrature_diagnostics, record_diagnostics, diagnostics_requested
 from .__prior import Prior
 from math import pow
 from typing import Literal, cast
@@ -16,7 +17,8 @@ class ExpectedAPosteriori(BayesModal):
                  items: list[TestItem],
                  prior: Prior,
                  optimization_interval: tuple[float, float] = (-10, 10),
-                 model: Literal["GRM", "GPCM"] | None = None,):
+                 model: Literal["GRM", "GPCM"] | None = None,
+                 collect_diagnostics: bool = False):
         """This class can be used to estimate the current ability level
             of a respondent given the response pattern and the corresponding
             item difficulties.
@@ -33,8 +35,11 @@ class ExpectedAPosteriori(BayesModal):
                 optimization_interval (Tuple[float, float]): interval used for the optimization function
 
                 model (Literal["GRM", "GPCM"], optional): model type (required for polytomous models)
+
+                collect_diagnostics (bool): collect the convergence diagnostics of the estimates in `diagnostics`
         """
-        super().__init__(response_pattern, items, prior, optimization_interval)
+        super().__init__(response_pattern, items, prior, optimization_interval,
+                         collect_diagnostics=collect_diagnostics)
 
         # decide type of model used
         if all([isinstance(item.b, list) for item in items]):
@@ -60,7 +65,8 @@ class ExpectedAPosteriori(BayesModal):
                     self.thresholds_list,
                     cast(list[int], self.response_pattern.tolist()),
                     self.prior,
-                    self.optimization_interval
+                    self.optimization_interval,
+                    diagnostics=self.requested_diagnostics
                 )
             
             if self.model == "GPCM":
@@ -70,7 +76,8 @@ class ExpectedAPosteriori(BayesModal):
                     self.thresholds_list,
                     cast(list[int], self.response_pattern.tolist()),
                     self.prior,
-                    self.optimization_interval
+                    self.optimization_interval,
+                    diagnostics=self.requested_diagnostics
                 )
         raise ValueError("model and/or type have not been correctly specified")
         
@@ -82,14 +89,9 @@ class ExpectedAPosteriori(BayesModal):
         else:
             log_prior = np.log(self.prior.pdf(x) + 1e-300)
         
-        log_likelihood_vals = np.vectorize(
-            lambda mu: log_likelihood(mu,
-                                      self.a,
-                                      self.b,
-                                      self.c,
-                                      self.d,
-                                      self.response_pattern)
-        )(x)
+        # all grid points are evaluated at once
+        log_likelihood_vals = LogLikelihoodWorkspace(self.a, self.b, self.c, self.d,
+                                                     self.response_pattern).log_likelihood(x)
         
         log_posterior = log_likelihood_vals + log_prior
         # use log-sum-exp stabilization
@@ -104,6 +106,9 @@ class ExpectedAPosteriori(BayesModal):
             raise ValueError("Denominator (integral of posterior) is zero or "
                              "non-finite — check interval/prior/likelihood.")
 
+        if diagnostics_requested(self.requested_diagnostics):
+            record_diagnostics(quadrature_diagnostics(x, weights), self.requested_diagnostics)
+
         estimation = numerator / denominator
         return estimation
 
@@ -129,12 +134,8 @@ class ExpectedAPosteriori(BayesModal):
         log_likelihood_vals: np.ndarray
         
         if self.type == "dich":
-            log_likelihood_vals = np.vectorize(lambda mu: log_likelihood(mu,
-                                                                         self.a,
-                                                                         self.b,
-                                                                         self.c,
-                                                                         self.d,
-                                                                         self.response_pattern))(x)
+            log_likelihood_vals = LogLikelihoodWorkspace(self.a, self.b, self.c, self.d,
+                                                         self.response_pattern).log_likelihood(x)
         if self.type == "poly":
             if self.model == "GPCM":
                 log_likelihood_vec = np.vectorize(
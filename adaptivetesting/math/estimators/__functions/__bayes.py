@@ -3,7 +3,9 @@ from scipy.optimize import minimize_scalar, OptimizeResult # type: ignore
 from ..__prior import Prior
 from ....models.__algorithm_exception import AlgorithmException
 from .__estimators import log_likelihood
-from .__estimators import probability_y0, probability_y1
+from .__log_probabilities import LogLikelihoodWorkspace
+from .__diagnostics import (EstimationDiagnostics, tracked_objective, diagnostics_requested,
+                            optimization_diagnostics, record_diagnostics)
 
 
 def maximize_posterior(
@@ -13,7 +15,8 @@ def maximize_posterior(
     d: np.ndarray,
     response_pattern: np.ndarray,
     prior: Prior,
-    optimization_interval: tuple[float, float] = (-10, 10)
+    optimization_interval: tuple[float, float] = (-10, 10),
+    diagnostics: list[EstimationDiagnostics] | None = None
 ) -> float:
     """Get the maximum of the posterior distribution
 
@@ -25,12 +28,17 @@ def maximize_posterior(
         response_pattern (np.ndarray): response pattern (simulated or user generated)
         prior (Prior): prior distribution
         optimization_interval (Tuple[float, float]): interval used for the optimization function
+        diagnostics (list[EstimationDiagnostics] | None): list the convergence diagnostics
+            of the estimate are appended to. Defaults to None.
 
     Returns:
         float: Bayes Modal estimator for the given parameters
     """
+    # the workspace keeps its buffers across the iterations of the optimizer
+    workspace = LogLikelihoodWorkspace(a, b, c, d, response_pattern)
+
     def log_posterior(mu):
-        log_likelihood_res = log_likelihood(mu, a, b, c, d, response_pattern)
+        log_likelihood_res = workspace.log_likelihood(mu)
 
         if hasattr(prior, "logpdf"):
             log_prior = prior.logpdf(mu)
@@ -44,10 +52,13 @@ def maximize_posterior(
         else:
             return float(log_post.ravel()[0])
     
-    result: OptimizeResult = minimize_scalar(lambda mu: -log_posterior(mu),
+    points: list[float] | None = [] if diagnostics_requested(diagnostics) else None
+    result: OptimizeResult = minimize_scalar(tracked_objective(lambda mu: -log_posterior(mu), points),
                                              bounds=optimization_interval,
                                              method="bounded") # type: ignore
 
+    if points is not None:
+        record_diagnostics(optimization_diagnostics(result, optimization_interval, points), diagnostics)
     if not result.success:
         raise AlgorithmException(f"Optimization failed: {result.message}")
 
@@ -63,12 +74,4 @@ def likelihood(mu: np.ndarray,
                response_pattern: np.ndarray
                ):
     
-    p1 = probability_y1(mu, a, b, c, d)
-    p0 = probability_y0(mu, a, b, c, d)
-
-    log_likelihood = np.sum(
-        (response_pattern * np.log(p1 + 1e-300)) + (
-            (1 - response_pattern) * np.log(p0 + 1e-300)
-        ))
-
-    return -np.exp(log_likelihood)
+    return -np.exp(log_likelihood(mu, a, b, c, d, response_pattern))
@@ -0,0 +1,138 @@
+from dataclasses import dataclass
+from typing import Any, Callable
+import numpy as np
+from scipy.integrate import trapezoid  # type: ignore
+from scipy.optimize import OptimizeResult  # type: ignore
+from ....models.__instrumentation import active_instrumentation
+
+
+@dataclass
+class EstimationDiagnostics:
+    """Convergence diagnostics of one ability estimate.
+    The estimation functions append them to the list passed as `diagnostics`
+    and the estimators collect the diagnostics of their estimates (`IEstimator.diagnostics`).
+    If an `Instrumentation` is active, they are also aggregated in its counters
+    (`estimation.iterations`, `estimation.objective_evaluations`, `estimation.bracket_width`,
+    `estimation.boundary_hits` and, for quadrature, `estimation.edge_mass`).
+    """
+    method: str
+    """Estimation method (`bounded` optimization or `quadrature`)"""
+    iterations: int
+    """Number of iterations of the optimizer (0 for quadrature)"""
+    function_evaluations: int
+    """Number of evaluations of the objective function (grid points for quadrature)"""
+    bracket_width: float
+    """Width of the smallest interval around the estimate bounded by evaluated points or the interval borders
+    (grid spacing for quadrature)"""
+    boundary_hit: bool
+    """Whether the estimate lies at the border of the optimization interval
+    (for quadrature: whether the posterior is largest at the first or last grid point)"""
+    edge_mass: float | None = None
+    """Share of the posterior mass in the outer 1% of the grid at both ends (quadrature only)"""
+    success: bool = True
+    """Whether the optimizer converged"""
+
+
+def tracked_objective(objective: Callable[[Any], Any],
+                      points: list[float] | None) -> Callable[[Any], Any]:
+    """Records the points at which an objective function is evaluated.
+
+    Args:
+        objective (Callable[[Any], Any]): objective function
+        points (list[float] | None): list the points are appended to.
+            If None, the objective function is returned unchanged.
+
+    Returns:
+        Callable[[Any], Any]: objective function
+    """
+    if points is None:
+        return objective
+
+    def wrapper(mu: Any) -> Any:
+        points.append(float(mu))
+        return objective(mu)
+    return wrapper
+
+
+def diagnostics_requested(diagnostics: list[EstimationDiagnostics] | None) -> bool:
+    """Checks whether diagnostics have to be calculated.
+
+    Args:
+        diagnostics (list[EstimationDiagnostics] | None): list of the caller
+
+    Returns:
+        bool: True if a list is passed or an instrumentation is active
+    """
+    return diagnostics is not None or active_instrumentation() is not None
+
+
+def optimization_diagnostics(result: OptimizeResult,
+                             interval: tuple[float, float],
+                             points: list[float]) -> EstimationDiagnostics:
+    """Creates the diagnostics of a bounded scalar optimization.
+
+    Args:
+        result (OptimizeResult): result of `minimize_scalar`
+        interval (tuple[float, float]): optimization interval
+        points (list[float]): evaluated points
+
+    Returns:
+        EstimationDiagnostics: diagnostics
+    """
+    estimate = float(result.x)
+    lower = max((point for point in points if point < estimate), default=interval[0])
+    upper = min((point for point in points if point > estimate), default=interval[1])
+    bracket_width = upper - lower
+    return EstimationDiagnostics(
+        method="bounded",
+        iterations=int(result.get("nit", 0)),
+        function_evaluations=int(result.nfev),
+        bracket_width=bracket_width,
+        boundary_hit=min(estimate - interval[0], interval[1] - estimate) <= bracket_width,
+        success=bool(result.success)
+    )
+
+
+def quadrature_diagnostics(grid: np.ndarray, weights: np.ndarray) -> EstimationDiagnostics:
+    """Creates the diagnostics of an estimate calculated by numerical integration of the posterior.
+
+    Args:
+        grid (np.ndarray): equally spaced grid points
+        weights (np.ndarray): unnormalized posterior at the grid points
+
+    Returns:
+        EstimationDiagnostics: diagnostics
+    """
+    edge = max(len(grid) // 100, 1)
+    total = trapezoid(weights, grid)
+    edge_mass = trapezoid(weights[:edge + 1], grid[:edge + 1]) + trapezoid(weights[-edge - 1:], grid[-edge - 1:])
+    peak = int(np.nanargmax(weights))
+    return EstimationDiagnostics(
+        method="quadrature",
+        iterations=0,
+        function_evaluations=len(grid),
+        bracket_width=float(grid[1] - grid[0]),
+        boundary_hit=peak == 0 or peak == len(grid) - 1,
+        edge_mass=float(edge_mass / total) if total > 0 else None
+    )
+
+
+def record_diagnostics(estimate_diagnostics: EstimationDiagnostics,
+                       diagnostics: list[EstimationDiagnostics] | None):
+    """Appends the diagnostics of an estimate to the list of the caller
+    and adds them to the active instrumentation.
+
+    Args:
+        estimate_diagnostics (EstimationDiagnostics): diagnostics of the estimate
+        diagnostics (list[EstimationDiagnostics] | None): list of the caller
+    """
+    if diagnostics is not None:
+        diagnostics.append(estimate_diagnostics)
+    instrumentation = active_instrumentation()
+    if instrumentation is not None:
+        instrumentation.count("estimation.iterations", estimate_diagnostics.iterations)
+        instrumentation.count("estimation.objective_evaluations", estimate_diagnostics.function_evaluations)
+        instrumentation.count("estimation.bracket_width", estimate_diagnostics.bracket_width)
+        instrumentation.count("estimation.boundary_hits", int(estimate_diagnostics.boundary_hit))
+        if estimate_diagnostics.edge_mass is not None:
+            instrumentation.count("estimation.edge_mass", estimate_diagnostics.edge_mass)
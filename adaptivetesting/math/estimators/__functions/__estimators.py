@@ -1,6 +1,24 @@
 import numpy as np
 from scipy.optimize import minimize_scalar, OptimizeResult # type: ignore
+from scipy.special import expit  # type: ignore
 from ....models.__algorithm_exception import AlgorithmException
+from ...__kernels import active_kernels
+from .__log_probabilities import log_probabilities, LogLikelihoodWorkspace
+from .__diagnostics import (EstimationDiagnostics, tracked_objective, diagnostics_requested,
+                            optimization_diagnostics, record_diagnostics)
+
+
+def kernel_item_parameters(mu, a, b, c, d) -> tuple[float, np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None:
+    """Checks whether a call can be evaluated by the kernels of the numba backend
+    (one ability level and equally shaped item parameters).
+
+    Returns:
+        tuple[float, np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None: ability level and 1-D item parameters
+            or None if the NumPy implementation has to be used
+    """
+    if np.ndim(mu) != 0 or np.ndim(a) > 1 or not (np.shape(a) == np.shape(b) == np.shape(c) == np.shape(d)):
+        return None
+    return float(mu), np.atleast_1d(a), np.atleast_1d(b), np.atleast_1d(c), np.atleast_1d(d)
 
 
 def probability_y1(mu: np.ndarray,
@@ -20,38 +38,14 @@ def probability_y1(mu: np.ndarray,
     Returns:
         np.ndarray: probability of getting the item correct
     """
-    # Compute the exponent safely
-    z = a * (mu - b)
-
-    # Use log-sum-exp trick for numerical stability
-    # For large positive z: exp(z)/(1+exp(z)) ≈ 1
-    # For large negative z: exp(z)/(1+exp(z)) ≈ exp(z)
-
-    # Clip z to prevent overflow in exp()
-    z_clipped = np.clip(z, -500, 500)  # exp(-500) and exp(500) are safe
-
-    # Compute the logistic function safely
-    # Use different formulas based on the sign of z for stability
-    result = np.empty_like(z_clipped)
+    kernels = active_kernels()
+    if kernels is not None:
+        arguments = kernel_item_parameters(mu, a, b, c, d)
+        if arguments is not None:
+            return np.squeeze(kernels.probability_y1_kernel(*arguments))
 
-    # For large positive values, use alternative formula to avoid overflow
-    mask_positive = z_clipped > 20  # exp(20) is large but manageable
-    mask_negative = z_clipped < -20  # exp(-20) is very small
-    mask_medium = ~(mask_positive | mask_negative)
-
-    # Large positive z: 1/(1+exp(-z)) is more stable
-    result[mask_positive] = 1.0 / (1.0 + np.exp(-z_clipped[mask_positive]))
-
-    # Large negative z: exp(z)/(1+exp(z)) is stable
-    exp_z_neg = np.exp(z_clipped[mask_negative])
-    result[mask_negative] = exp_z_neg / (1.0 + exp_z_neg)
-
-    # Medium values: use standard formula
-    exp_z_med = np.exp(z_clipped[mask_medium])
-    result[mask_medium] = exp_z_med / (1.0 + exp_z_med)
-
-    # Apply the 4PL transformation
-    value = c + (d - c) * result
+    # expit is evaluated stably for all exponents
+    value = c + (d - c) * expit(a * (mu - b))
 
     # Ensure probabilities are within valid range [c, d]
     value = np.clip(value, c, d)
@@ -133,10 +127,15 @@ def log_likelihood(mu: np.ndarray,
     Returns:
         float: log-likelihood value of given ability value
     """
-    p1 = probability_y1(mu, a, b, c, d)
-    p0 = probability_y0(mu, a, b, c, d)
-    result = np.sum((response_pattern * np.log(p1 + 1e-300)) + ((1 - response_pattern) * np.log(p0 + 1e-300)))
-    
+    kernels = active_kernels()
+    if kernels is not None:
+        arguments = kernel_item_parameters(mu, a, b, c, d)
+        if arguments is not None and np.shape(response_pattern) == np.shape(a):
+            return kernels.log_likelihood_kernel(*arguments, np.atleast_1d(response_pattern))
+
+    _, log_p1, log_p0 = log_probabilities(mu, a, b, c, d)
+    result = np.sum(response_pattern * log_p1 + (1 - response_pattern) * log_p0)
+
     return result
 
 
@@ -145,7 +144,8 @@ def maximize_likelihood_function(a: np.ndarray,
                                  c: np.ndarray,
                                  d: np.ndarray,
                                  response_pattern: np.ndarray,
-                                 border: tuple[float, float] = (-10, 10)) -> float:
+                                 border: tuple[float, float] = (-10, 10),
+                                 diagnostics: list[EstimationDiagnostics] | None = None) -> float:
     """Find the ability value that maximizes the likelihood function.
     This function uses the minimize_scalar function from scipy and the "bounded" method.
 
@@ -157,12 +157,12 @@ def maximize_likelihood_function(a: np.ndarray,
         response_pattern (np.ndarray): response pattern of the item
         border (tuple[float, float], optional): border of the optimization interval.
             Defaults to (-10, 10).
+        diagnostics (list[EstimationDiagnostics] | None, optional): list the convergence diagnostics
+            of the estimate are appended to. Defaults to None.
 
     Raises:
         AlgorithmException: if the optimization fails or the response
             pattern consists of only one type of response.
-        AlgorithmException: if the optimization fails or the response
-            pattern consists of only one type of response.
 
     Returns:
         float: optimized ability value
@@ -172,10 +172,15 @@ def maximize_likelihood_function(a: np.ndarray,
         raise AlgorithmException(
             "Response pattern is invalid. It consists of only one type of response.")
 
-    result: OptimizeResult = minimize_scalar(lambda mu: -log_likelihood(mu, a, b, c, d, response_pattern),
+    # the workspace keeps its buffers across the iterations of the optimizer
+    workspace = LogLikelihoodWorkspace(a, b, c, d, response_pattern)
+    points: list[float] | None = [] if diagnostics_requested(diagnostics) else None
+    result: OptimizeResult = minimize_scalar(tracked_objective(lambda mu: -workspace.log_likelihood(mu), points),
                                              bounds=border,
                                              method='bounded') # type: ignore
 
+    if points is not None:
+        record_diagnostics(optimization_diagnostics(result, border, points), diagnostics)
     if not result.success:
         raise AlgorithmException(f"Optimization failed: {result.message}")
     else:
@@ -0,0 +1,141 @@
+import numpy as np
+from scipy.special import log_expit  # type: ignore
+from ...__kernels import active_kernels
+
+
+def _log_constants(c: np.ndarray, d: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # log(c), log(d - c) and log(1 - d); c = 0 and d = 1 result in -inf
+    with np.errstate(divide="ignore"):
+        return np.log(c), np.log(d - c), np.log1p(-d)
+
+
+def _fused_log_probabilities(mu: np.ndarray | float,
+                             a: np.ndarray,
+                             b: np.ndarray,
+                             log_c: np.ndarray,
+                             log_range: np.ndarray,
+                             log_one_minus_d: np.ndarray,
+                             guessing: bool,
+                             slipping: bool,
+                             out: tuple[np.ndarray, np.ndarray, np.ndarray]
+                             ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    p, log_p, log_q = out
+    # the buffer of P holds the exponent until P is calculated
+    z = np.subtract(mu, b, out=p)
+    np.multiply(z, a, out=z)
+    log_expit(z, out=log_p)
+    np.negative(z, out=log_q)
+    log_expit(log_q, out=log_q)
+    if guessing or slipping:
+        # log P = log(c + (d - c) * expit(z)), log(1 - P) = log((1 - d) + (d - c) * expit(-z))
+        np.add(log_p, log_range, out=log_p)
+        np.add(log_q, log_range, out=log_q)
+        if guessing:
+            np.logaddexp(log_p, log_c, out=log_p)
+        if slipping:
+            np.logaddexp(log_q, log_one_minus_d, out=log_q)
+    np.exp(log_p, out=p)
+    return p, log_p, log_q
+
+
+def log_probabilities(mu: np.ndarray | float,
+                      a: np.ndarray,
+                      b: np.ndarray,
+                      c: np.ndarray,
+                      d: np.ndarray,
+                      out: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+                      ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Probability of getting the item correct (P) and the log-probabilities of getting the item
+    correct and wrong (log P, log(1 - P)) of the 4-PL model, calculated in log space in one pass.
+    The logistic function is evaluated with `log_expit`, so that the log-probabilities
+    are accurate for very large and small exponents and no masks or temporary arrays are created.
+
+    Args:
+        mu (np.ndarray | float): latent ability level
+        a (np.ndarray): item discrimination parameter
+        b (np.ndarray): item difficulty parameter
+        c (np.ndarray): pseudo guessing parameter
+        d (np.ndarray): inattention parameter
+        out (tuple[np.ndarray, np.ndarray, np.ndarray] | None): buffers for P, log P and log(1 - P)
+            with the broadcast shape of the arguments. Defaults to None (new arrays).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: P, log P and log(1 - P)
+    """
+    c = np.asarray(c)
+    d = np.asarray(d)
+    log_c, log_range, log_one_minus_d = _log_constants(c, d)
+    if out is None:
+        shape = np.broadcast_shapes(np.shape(mu), np.shape(a), np.shape(b), c.shape, d.shape)
+        out = (np.empty(shape), np.empty(shape), np.empty(shape))
+    return _fused_log_probabilities(mu, a, b, log_c, log_range, log_one_minus_d,
+                                    bool(np.any(c != 0)), bool(np.any(d != 1)), out)
+
+
+class LogLikelihoodWorkspace:
+    def __init__(self,
+                 a: np.ndarray,
+                 b: np.ndarray,
+                 c: np.ndarray,
+                 d: np.ndarray,
+                 response_pattern: np.ndarray):
+        """Log-likelihood of one response pattern under the 4-PL model for repeated evaluations,
+        e.g., across the iterations of an optimizer or at the points of a quadrature grid.
+        The logarithms of the item parameters are calculated once
+        and the buffers of `log_probabilities` are reused by every evaluation.
+
+        Args:
+            a (np.ndarray): item discrimination parameter
+            b (np.ndarray): item difficulty parameter
+            c (np.ndarray): pseudo guessing parameter
+            d (np.ndarray): inattention parameter
+            response_pattern (np.ndarray): response pattern of the answered items
+        """
+        self.a = np.atleast_1d(np.asarray(a, dtype=np.float64))
+        self.b = np.atleast_1d(np.asarray(b, dtype=np.float64))
+        self.c = np.atleast_1d(np.asarray(c, dtype=np.float64))
+        self.d = np.atleast_1d(np.asarray(d, dtype=np.float64))
+        self.response_pattern = np.atleast_1d(np.asarray(response_pattern, dtype=np.float64))
+        self.__wrong = 1 - self.response_pattern
+        self.__log_c, self.__log_range, self.__log_one_minus_d = _log_constants(self.c, self.d)
+        self.__guessing = bool(np.any(self.c != 0))
+        self.__slipping = bool(np.any(self.d != 1))
+        self.__buffers: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+
+    def log_probabilities(self, mu: np.ndarray | float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Calculates P, log P and log(1 - P) of all items (see `log_probabilities`).
+        The returned arrays are overwritten by the next evaluation.
+
+        Args:
+            mu (np.ndarray | float): ability level or 1-D array of ability levels
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: P, log P and log(1 - P)
+                with the shape `(n_items,)` or `(n_abilities, n_items)`
+        """
+        shape = self.a.shape
+        if np.ndim(mu) > 0:
+            mu = np.reshape(mu, (-1, 1))
+            shape = (mu.shape[0],) + shape
+        if self.__buffers is None or self.__buffers[0].shape != shape:
+            self.__buffers = (np.empty(shape), np.empty(shape), np.empty(shape))
+        return _fused_log_probabilities(mu, self.a, self.b, self.__log_c, self.__log_range,
+                                        self.__log_one_minus_d, self.__guessing, self.__slipping,
+                                        self.__buffers)
+
+    def log_likelihood(self, mu: np.ndarray | float) -> np.ndarray:
+        """Log-likelihood of the response pattern.
+        Single ability levels are evaluated by the kernels of the active backend (see `set_backend`).
+
+        Args:
+            mu (np.ndarray | float): ability level or 1-D array of ability levels
+
+        Returns:
+            np.ndarray: log-likelihood value (one per ability level)
+        """
+        kernels = active_kernels()
+        if kernels is not None and np.ndim(mu) == 0:
+            return np.asarray(kernels.log_likelihood_kernel(float(mu), self.a, self.b, self.c, self.d,
+                                                            self.response_pattern))
+        _, log_p, log_q = self.log_probabilities(mu)
+        return log_p @ self.response_pattern + log_q @ self.__wrong
@@ -1,8 +1,8 @@
 import numpy as np
 from scipy.special import logsumexp
-import numdifftools as nd
 import math
 from .__poly_math import PolyModelFunctions
+from ....__kernels import active_kernels, pack_thresholds
 
 
 class GPCM(PolyModelFunctions):
@@ -11,6 +11,12 @@ class GPCM(PolyModelFunctions):
                       a: float,
                       thresholds_list: list[float],
                       response_pattern: int):
+        kernels = active_kernels()
+        if kernels is not None and np.ndim(theta) == 0:
+            return kernels.gpcm_category_log_prob_kernel(float(theta), float(a),
+                                                         np.asarray(thresholds_list, dtype=np.float64),
+                                                         int(response_pattern))
+
         m = len(thresholds_list)
 
         # Compute eta_k values (log numerators)
@@ -32,6 +38,13 @@ class GPCM(PolyModelFunctions):
                        a_params: list[float],
                        thresholds_list: list[list[float]],
                        response_pattern: list[int]):
+        kernels = active_kernels()
+        if kernels is not None and np.ndim(theta) == 0:
+            thresholds, n_thresholds = pack_thresholds(thresholds_list)
+            return kernels.gpcm_log_likelihood_kernel(float(theta), np.asarray(a_params, dtype=np.float64),
+                                                      thresholds, n_thresholds,
+                                                      np.asarray(response_pattern, dtype=np.int64))
+
         log_lik = 0.0
         # Iterate over item indices
         for item_idx in range(len(a_params)):
@@ -53,6 +66,8 @@ class GPCM(PolyModelFunctions):
         p. 185
         primary citation Dodd, DeAyala & Koch 1995
         """
+        import numdifftools as nd
+
         def prob(x: float, category: int):
             p = math.exp(GPCM.category_prob(x, a, thresholds, category))
             p = max(p, 1e-12)
@@ -1,11 +1,16 @@
 import numpy as np
-import numdifftools as nd
 from .__poly_math import PolyModelFunctions
+from ....__kernels import active_kernels, pack_thresholds
 
 
 class GRM(PolyModelFunctions):
     @staticmethod
     def category_prob(theta, a: float, thresholds: list[float], response_pattern: int):
+        kernels = active_kernels()
+        if kernels is not None and np.ndim(theta) == 0:
+            return kernels.grm_category_prob_kernel(float(theta), float(a),
+                                                    np.asarray(thresholds, dtype=np.float64), int(response_pattern))
+
         k = response_pattern
         # k is the category index (0, 1, ..., num_thresholds)
         num_thresholds = len(thresholds)
@@ -39,6 +44,13 @@ class GRM(PolyModelFunctions):
                        a_params: list[float],
                        thresholds_list: list[list[float]],
                        response_pattern: list[int]):
+        kernels = active_kernels()
+        if kernels is not None and np.ndim(theta) == 0:
+            thresholds, n_thresholds = pack_thresholds(thresholds_list)
+            return kernels.grm_log_likelihood_kernel(float(theta), np.asarray(a_params, dtype=np.float64),
+                                                     thresholds, n_thresholds,
+                                                     np.asarray(response_pattern, dtype=np.int64))
+
         log_lik = 0.0
         # Iterate over item indices
         for item_idx in range(len(a_params)):
@@ -60,6 +72,9 @@ class GRM(PolyModelFunctions):
         p. 185
         primary citation Dodd, DeAyala & Koch 1995
         """
+        # numdifftools is only needed for polytomous items and imported on first use
+        import numdifftools as nd
+
         def prob(x: float, category: int):
             p = GRM.category_prob(x, a, thresholds, category)
             p = max(p, 1e-12)
@@ -4,6 +4,8 @@ from .....models.__algorithm_exception import AlgorithmException
 from ...__prior import Prior
 import numpy as np
 from scipy.integrate import trapezoid
+from ..__diagnostics import (EstimationDiagnostics, tracked_objective, diagnostics_requested,
+                             optimization_diagnostics, quadrature_diagnostics, record_diagnostics)
 
 
 class PolyModelFunctions(ABC):
@@ -67,7 +69,8 @@ class PolyModelFunctions(ABC):
                                      a_params: list[float],
                                      thresholds_list: list[list[float]],
                                      response_pattern: list[int],
-                                     border: tuple[float, float] = (-10, 10)):
+                                     border: tuple[float, float] = (-10, 10),
+                                     diagnostics: list[EstimationDiagnostics] | None = None):
         """
         Maximize the likelihood function of the model.
 
@@ -76,18 +79,24 @@ class PolyModelFunctions(ABC):
             thresholds_list (list[list[float]]): list of thresholds for each item
             response_pattern (list[int]): response pattern
             border (tuple[float, float]): interval used for numerical optimization. Defaults to (-10, 10).
+            diagnostics (list[EstimationDiagnostics] | None): list the convergence diagnostics
+                of the estimate are appended to. Defaults to None.
 
         Returns:
             float: point (theta) where the likelihood function is maximized
         """
 
-        result: OptimizeResult = minimize_scalar(lambda mu: -self.log_likelihood(mu,
-                                                                                 a_params,
-                                                                                 thresholds_list,
-                                                                                 response_pattern),
+        points: list[float] | None = [] if diagnostics_requested(diagnostics) else None
+        result: OptimizeResult = minimize_scalar(tracked_objective(lambda mu: -self.log_likelihood(mu,
+                                                                                                   a_params,
+                                                                                                   thresholds_list,
+                                                                                                   response_pattern),
+                                                                   points),
                                                  bounds=border,
                                                  method='bounded')
 
+        if points is not None:
+            record_diagnostics(optimization_diagnostics(result, border, points), diagnostics)
         if not result.success:
             raise AlgorithmException(f"Optimization failed: {result.message}")
         else:
@@ -98,7 +107,8 @@ class PolyModelFunctions(ABC):
                            thresholds_list: list[list[float]],
                            response_pattern: list[int],
                            prior: Prior,
-                           optimization_interval: tuple[float, float] = (-10, 10)
+                           optimization_interval: tuple[float, float] = (-10, 10),
+                           diagnostics: list[EstimationDiagnostics] | None = None
                            ) -> float:
         """
             Maximize the posterior function of the model.
@@ -110,6 +120,8 @@ class PolyModelFunctions(ABC):
                 optimization_interval (tuple[float, float]): interval used for numerical optimization.
                     Defaults to (-10, 10).
                 prior (Prior): prior distribution used
+                diagnostics (list[EstimationDiagnostics] | None): list the convergence diagnostics
+                    of the estimate are appended to. Defaults to None.
 
             Returns:
                 float: point (theta) where the posterior function is maximized
@@ -132,10 +144,13 @@ class PolyModelFunctions(ABC):
             else:
                 return float(log_post.ravel()[0])
         
-        result: OptimizeResult = minimize_scalar(lambda mu: -log_posterior(mu),
+        points: list[float] | None = [] if diagnostics_requested(diagnostics) else None
+        result: OptimizeResult = minimize_scalar(tracked_objective(lambda mu: -log_posterior(mu), points),
                                                  bounds=optimization_interval,
                                                  method="bounded") # type: ignore
         
+        if points is not None:
+            record_diagnostics(optimization_diagnostics(result, optimization_interval, points), diagnostics)
         if not result.success:
             raise AlgorithmException(f"Optimization failed: {result.message}")
         
@@ -147,7 +162,8 @@ class PolyModelFunctions(ABC):
                        thresholds_list: list[list[float]],
                        response_pattern: list[int],
                        prior: Prior,
-                       optimization_interval: tuple[float, float] = (-10, 10)) -> float:
+                       optimization_interval: tuple[float, float] = (-10, 10),
+                       diagnostics: list[EstimationDiagnostics] | None = None) -> float:
         """
             Calculate the posterior mean of the model.
 
@@ -158,6 +174,8 @@ class PolyModelFunctions(ABC):
                 optimization_interval (tuple[float, float]): interval used for numerical optimization.
                         Defaults to (-10, 10).
                 prior (Prior): prior distribution used
+                diagnostics (list[EstimationDiagnostics] | None): list the diagnostics
+                    of the estimate (e.g., posterior mass at the grid edges) are appended to. Defaults to None.
 
                 Returns:
                     float: posterior mean
@@ -189,5 +207,8 @@ class PolyModelFunctions(ABC):
             raise ValueError("Denominator (integral of posterior) is zero or "
                              "non-finite — check interval/prior/likelihood.")
 
+        if diagnostics_requested(diagnostics):
+            record_diagnostics(quadrature_diagnostics(x, weights), diagnostics)
+
         estimation = numerator / denominator
         return estimation
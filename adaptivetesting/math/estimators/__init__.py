@@ -4,4 +4,7 @@ from .__expect_a_posteriori import ExpectedAPosteriori
 from .__prior import Prior, NormalPrior, CustomPrior, CustomPriorException, EmpiricalPrior, SkewNormalPrior
 from .__functions.__estimators import probability_y0, probability_y1, maximize_likelihood_function, likelihood
 from .__functions.__bayes import maximize_posterior
+from .__functions.__diagnostics import EstimationDiagnostics
+from .__functions.__log_probabilities import log_probabilities, LogLikelihoodWorkspace
 from .__test_information import test_information_function, item_information_function, prior_information_function
+from .__batch_estimation import BatchEstimator
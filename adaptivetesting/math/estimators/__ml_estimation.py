@@ -14,6 +14,7 @@ class MLEstimator(IEstimator):
                  items: list[TestItem],
                  model: Literal["GRM", "GPCM"] | None = None,
                  optimization_interval: Tuple[float, float] = (-10, 10),
+                 collect_diagnostics: bool = False,
                  **kwargs):
         """This class can be used to estimate the current ability level
         of a respondent given the response pattern and the corresponding
@@ -28,8 +29,11 @@ class MLEstimator(IEstimator):
             model (Literal["GRM", "GPCM"], optional): model type (required for polytomous models)
 
             optimization_interval (Tuple[float, float]): tuple of (min, max) intervals used for numerical optimization.
+
+            collect_diagnostics (bool): collect the convergence diagnostics of the estimates in `diagnostics`
         """
-        IEstimator.__init__(self, response_pattern, items, optimization_interval)
+        IEstimator.__init__(self, response_pattern, items, optimization_interval,
+                            collect_diagnostics=collect_diagnostics)
 
         # decide type of model used
         if all([item.is_polytomous() for item in items]):
@@ -55,7 +59,8 @@ class MLEstimator(IEstimator):
                                                 c=self.c,
                                                 d=self.d,
                                                 response_pattern=self.response_pattern,
-                                                border=self.optimization_interval)
+                                                border=self.optimization_interval,
+                                                diagnostics=self.requested_diagnostics)
         if self.type == "poly":
             if self.model == "GRM":
                 grm = GRM()
@@ -63,7 +68,8 @@ class MLEstimator(IEstimator):
                     self.a_params,
                     self.thresholds_list,
                     cast(list[int], self.response_pattern.tolist()),
-                    self.optimization_interval
+                    self.optimization_interval,
+                    diagnostics=self.requested_diagnostics
                 )
 
             if self.model == "GPCM":
@@ -72,7 +78,8 @@ class MLEstimator(IEstimator):
                     self.a_params,
                     self.thresholds_list,
                     cast(list[int], self.response_pattern.tolist()),
-                    self.optimization_interval
+                    self.optimization_interval,
+                    diagnostics=self.requested_diagnostics
                 )
         raise ValueError("model and/or type have not been correctly specified")
 
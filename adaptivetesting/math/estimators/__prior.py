@@ -1,6 +1,9 @@
 import numpy as np
 from abc import ABC, abstractmethod
-from scipy.stats import norm, skewnorm, rv_continuous, gaussian_kde
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from scipy.stats import rv_continuous
 
 
 class Prior(ABC):
@@ -44,9 +47,12 @@ class NormalPrior(Prior):
         Returns:
             ndarray: function value
         """
+        # scipy.stats is imported on first use (it is slow to import)
+        from scipy.stats import norm
         return norm.pdf(x, self.mean, self.sd) # type: ignore
     
     def logpdf(self, x: float | np.ndarray):
+        from scipy.stats import norm
         return norm.logpdf(x, self.mean, self.sd)
     
 
@@ -73,12 +79,14 @@ class SkewNormalPrior(Prior):
         Returns:
             ndarray: function value
         """
+        from scipy.stats import skewnorm
         return skewnorm.pdf(x,
                             self.skewness,
                             loc=self.loc,
                             scale=self.scale)
     
     def logpdf(self, x: float | np.ndarray):
+        from scipy.stats import skewnorm
         return skewnorm.logpdf(x, self.skewness,
                                loc=self.loc,
                                scale=self.scale)
@@ -86,7 +94,7 @@ class SkewNormalPrior(Prior):
 
 class CustomPrior(Prior):
     def __init__(self,
-                 random_variable: rv_continuous,
+                 random_variable: "rv_continuous",
                  *args: float,
                  loc: float = 0,
                  scale: float = 1):
@@ -153,6 +161,7 @@ class EmpiricalPrior(Prior):
         """
         super().__init__()
 
+        from scipy.stats import gaussian_kde
         self.kde = gaussian_kde(dataset)
     
     def pdf(self, x):
@@ -1,9 +1,9 @@
 import numpy as np
-from .__functions.__estimators import probability_y1
+from .__functions.__estimators import probability_y1, kernel_item_parameters
+from ..__kernels import active_kernels
 from .__prior import Prior
 from scipy.integrate import trapezoid
 import numpy
-from scipy.differentiate import derivative
 from typing import Literal, cast
 from .__functions.__poly.__gpcm import GPCM
 from .__functions.__poly.__grm import GRM
@@ -71,6 +71,12 @@ def dicho_item_information_function(
     Returns:
         np.ndarray: item information
     """
+    kernels = active_kernels()
+    if kernels is not None:
+        arguments = kernel_item_parameters(mu, a, b, c, d)
+        if arguments is not None:
+            return np.asarray(kernels.item_information_kernel(*arguments))
+
     p_y1 = probability_y1(mu, a, b, c, d)
 
     # Clip probabilities
@@ -86,6 +92,41 @@ def dicho_item_information_function(
     return information
 
 
+def dicho_item_information_matrix(
+        mu: np.ndarray,
+        a: np.ndarray,
+        b: np.ndarray,
+        c: np.ndarray,
+        d: np.ndarray
+) -> np.ndarray:
+    """
+    Calculates the item information of dichotomous items
+    for several ability levels at once.
+    The closed form of the 4PL item information is used
+    instead of a numerical derivative.
+
+    Args:
+        mu (np.ndarray): ability levels with shape `(n,)`
+        a (np.ndarray): discrimination parameters with shape `(n_items,)`
+        b (np.ndarray): difficulty parameters with shape `(n_items,)`
+        c (np.ndarray): guessing parameters with shape `(n_items,)`
+        d (np.ndarray): slipping parameters with shape `(n_items,)`
+
+    Returns:
+        np.ndarray: item information with shape `(n, n_items)`
+    """
+    mu = np.asarray(mu, dtype=np.float64).reshape(-1, 1)
+    z = np.clip(a * (mu - b), -500, 500)
+    logistic = 1.0 / (1.0 + np.exp(-z))
+    p_y1 = np.clip(c + (d - c) * logistic, c, d)
+    p_y1_clipped = np.clip(p_y1, 1e-10, 1 - 1e-10)
+
+    # derivative of the 4PL item response function
+    gradient = a * (d - c) * logistic * (1.0 - logistic)
+
+    return (gradient ** 2) / (p_y1_clipped * (1 - p_y1_clipped))
+
+
 def prior_information_function(prior: Prior,
                                optimization_interval: tuple[float, float] = (-10, 10)) -> np.ndarray:
     """Calculates the fisher information for the probability density function
@@ -102,6 +143,7 @@ def prior_information_function(prior: Prior,
     def log_prior(x):
         epsilon = 1e-12  # Small value to avoid log(0)
         return numpy.log(prior.pdf(x) + epsilon)
+    from scipy.differentiate import derivative
     x_vals = np.linspace(optimization_interval[0], optimization_interval[1], 1000)
     score_values = np.array(derivative(log_prior, x_vals).df)
 
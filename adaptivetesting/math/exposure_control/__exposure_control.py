@@ -4,7 +4,7 @@ from ...models.__test_item import TestItem
 from ...models.__adaptive_test import AdaptiveTest
 
 
-type EXPOSURE_CONTROL = Literal["Randomesque", "MaximumPriorityIndex"]
+type EXPOSURE_CONTROL = Literal["Randomesque", "MaximumPriorityIndex", "SympsonHetter"]
 
 
 class ExposureControl(ABC):
@@ -1,2 +1,3 @@
 from .__exposure_control import ExposureControl
-from .__randomesque import Randomesque
\ No newline at end of file
+from .__randomesque import Randomesque
+from .__sympson_hetter import SympsonHetter, SympsonHetterParameters
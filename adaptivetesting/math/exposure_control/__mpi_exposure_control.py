@@ -2,9 +2,9 @@ from ..content_balancing.__maximum_priority_index import MaximumPriorityIndex
 from .__exposure_control import ExposureControl
 from ...models.__test_item import TestItem
 from ...models.__misc import ResultOutputFormat
-from ..content_balancing.__functions import compute_priority_index
 import numpy as np
 from ...data.__read_prev_items_exp_cont import read_prev_items
+from ...services.__exposure_counter_interface import IExposureCounter
 from typing import Literal
 
 
@@ -12,67 +12,79 @@ class MaximumPriorityIndexExposureControl(MaximumPriorityIndex, ExposureControl)
     """This is a reimplementation of the Maximum Priority Index for Exposure Control.
     For further information see `MaximumPriorityIndex`.
     """
-    def __init__(self, adaptive_test, constraints, participant_ids: list[str], format: ResultOutputFormat):
+    def __init__(self,
+                 adaptive_test,
+                 constraints,
+                 participant_ids: list[str] | None,
+                 format: ResultOutputFormat | None,
+                 exposure_counter: IExposureCounter | None = None):
+        """
+        Args:
+            adaptive_test (AdaptiveTest): instance of the adaptive test
+            constraints (list[Constraint]): constraints
+            participant_ids (list[str] | None): participants whose previous tests are read.
+                Not required if an exposure counter is used.
+            format (ResultOutputFormat | None): format of the previous test results.
+                Not required if an exposure counter is used.
+            exposure_counter (IExposureCounter | None): store of the exposure counts.
+                If set, the counts are read from this store instead of the previous test results.
+        """
         super().__init__(adaptive_test, constraints)
         self.participant_ids = participant_ids
         self.format = format
+        self.exposure_counter = exposure_counter
+
+    def count_shown_items(self) -> dict[str, float]:
+        """Counts the items that have been shown to other participants for every constraint.
 
-    def select_item(self, **kwargs) -> TestItem | None:
-        """Select the next item to administer based on the maximum priority index method.
         Returns:
-            TestItem: The selected test item.
+            dict[str, float]: number of shown items (key: constraint name)
         """
-        # compute priority index for every item
-        available_items = self.adaptive_test.item_pool.test_items
-        # skip selection if item pool is empty
-        if len(available_items) == 0:
-            return None
+        constraint_names = [constraint.name for constraint in self.constraints]
+        if self.exposure_counter is not None:
+            counts = self.exposure_counter.constraint_counts(constraint_names)
+            return {name: float(counts.get(name, 0)) for name in constraint_names}
 
         # load items that have been shown to other users
-        format: Literal["CSV", "PICKLE"]
+        format: Literal["CSV", "PICKLE", "COLUMNAR", "SQLITE"]
         if self.format is ResultOutputFormat.CSV:
             format = "CSV"
         if self.format is ResultOutputFormat.PICKLE:
             format = "PICKLE"
+        if self.format is ResultOutputFormat.COLUMNAR:
+            format = "COLUMNAR"
+        if self.format is ResultOutputFormat.SQLITE:
+            format = "SQLITE"
         shown_items = read_prev_items(
             test_id=self.adaptive_test.simulation_id,
-            participant_ids=self.participant_ids,
+            participant_ids=self.participant_ids if self.participant_ids is not None else [],
             format=format
         )
-        priority_indices: list[float] = []
-        
-        for item in available_items:
-            # get associated constraints
-            associated_constraints = [
-                constraint
-                for constraint in self.constraints
-                if constraint.name in item.additional_properties["category"]
-            ]
+        return {
+            name: float(len([
+                shown_item
+                for shown_item in shown_items
+                if name in shown_item.additional_properties["category"]
+            ]))
+            for name in constraint_names
+        }
 
-            group_weights: dict[str, float] = {}
-            required_items: dict[str, float] = {}
-            shown_items_per_constraint: dict[str, float] = {}
-            
-            for constraint in associated_constraints:
-                group_weights[constraint.name] = constraint.weight
-                required_items[constraint.name] = constraint.prevalence
-                n_shown_items = len([
-                    shown_item
-                    for shown_item in shown_items
-                    if constraint.name in shown_item.additional_properties["category"]
-                ])
-                shown_items_per_constraint[constraint.name] = float(n_shown_items)
+    def select_item(self, **kwargs) -> TestItem | None:
+        """Select the next item to administer based on the maximum priority index method.
+        Returns:
+            TestItem: The selected test item.
+        """
+        available_items = self.adaptive_test.item_pool.test_items
+        # skip selection if item pool is empty
+        if len(available_items) == 0:
+            return None
 
-            # calculate priority index
-            pix = compute_priority_index(
-                item=item,
-                group_weights=group_weights,
-                required_items=required_items,
-                shown_items=shown_items_per_constraint,
-                current_ability=self.adaptive_test.ability_level
-            )
+        # the counts are only determined once per selection
+        shown_items_per_name = self.count_shown_items()
+        shown_items = np.array([shown_items_per_name[constraint.name] for constraint in self.constraints])
 
-            priority_indices.append(pix)
+        # compute priority index for every item
+        priority_indices = self.priority_indices(available_items, shown_items)
 
         # select the item with the highest priority index
         max_p_i = np.argmax(priority_indices)
@@ -1,8 +1,10 @@
 from typing import Callable, Any
 import random
+import numpy as np
 from .__exposure_control import ExposureControl
 from ...models.__adaptive_test import AdaptiveTest
 from ...models.__test_item import TestItem
+from ...models.__item_bank import ItemBank
 from ..estimators.__test_information import item_information_function
 from typing import Literal
 
@@ -19,10 +21,15 @@ class Randomesque(ExposureControl):
         From this selection, the final item is drawn randomly. For this process, a seed
         can be specified.
 
+        The instance can be reused for all item selections of a test.
+        The item information is calculated for all items at once
+        and the final item is drawn with a random number generator
+        that is created once per instance.
+
         Args:
             adaptive_test (AdaptiveTest): instance of the adaptive test
             n_items (int): number of items to select
-            seed (int | None): random seed for the final item selection
+            seed (int | None): seed of the random number generator for the final item selection
             reverse (bool): If `True` the most informative items are selected. Default `True`.
 
 
@@ -44,6 +51,10 @@ class Randomesque(ExposureControl):
         self.n_items = n_items
         self.seed = seed
         self.reverse = reverse
+        self.rng = np.random.default_rng(seed)
+        # item parameters of the item pool (created on the first item selection)
+        self.__item_bank: ItemBank | None = None
+        self.__rows: dict[int, int] = {}
 
     def select_item(self, **kwargs) -> TestItem:
         """Select an item based on the implemented selection rules
@@ -55,14 +66,66 @@ class Randomesque(ExposureControl):
         Returns:
             TestItem | None: selected test item
         """
-        selected_items = self.radomesque_item_selection(
-            self.items,
-            self.ability_estimate,
-            self.n_items,
-            self.reverse,
-            seed=self.seed
-        )
-        return selected_items
+        # the instance may be reused for several item selections of a test
+        self.items = self.adaptive_test.item_pool.test_items
+        self.ability_estimate = self.adaptive_test.ability_level
+        information = self.item_information(self.items)
+        position = self.sample_top_k(information, self.n_items, self.rng, self.reverse)
+        return self.items[position]
+
+    def item_information(self, items: list[TestItem]) -> np.ndarray:
+        """Calculates the information of the items at the current ability estimate.
+        For dichotomous items, the information of all items is calculated at once.
+
+        Args:
+            items (list[TestItem]): available items
+
+        Returns:
+            np.ndarray: item information
+        """
+        if any([item.is_polytomous() for item in items]):
+            return np.array([
+                float(item_information_function(ability=self.ability_estimate, item=item))
+                for item in items
+            ])
+
+        rows = [self.__rows.get(id(item)) for item in items]
+        if self.__item_bank is None or any([row is None for row in rows]):
+            self.__item_bank = ItemBank(items)
+            self.__rows = {id(item): row for row, item in enumerate(items)}
+            rows = list(range(len(items)))
+        information = self.__item_bank.information(np.array([self.ability_estimate], dtype=np.float64))[0]
+        return information[np.array(rows, dtype=np.int64)]
+
+    @staticmethod
+    def sample_top_k(information: np.ndarray,
+                     n_items: int,
+                     rng: np.random.Generator,
+                     reverse: bool = True) -> int:
+        """Draws one of the `n_items` most (or least) informative items.
+        The candidates are determined with a partial sort (`np.argpartition`).
+
+        Args:
+            information (np.ndarray): item information
+            n_items (int): number of candidate items
+            rng (np.random.Generator): random number generator
+            reverse (bool): If `True` the most informative items are candidates. Default `True`.
+
+        Returns:
+            int: position of the drawn item
+
+        Raises:
+            ValueError: Raised if there are no candidate items.
+        """
+        k = min(n_items, len(information))
+        if k < 1:
+            raise ValueError("At least one item is required for randomesque item selection.")
+        scores = -information if reverse else information
+        if k < len(information):
+            candidates = np.sort(np.argpartition(scores, k - 1)[:k])
+        else:
+            candidates = np.arange(len(information))
+        return int(candidates[rng.integers(k)])
 
     @staticmethod
     def sort_by_information(item_entry: tuple[float, int]) -> float:
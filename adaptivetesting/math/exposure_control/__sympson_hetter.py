@@ -0,0 +1,155 @@
+from dataclasses import dataclass, field
+import numpy as np
+from .__exposure_control import ExposureControl
+from ...models.__adaptive_test import AdaptiveTest
+from ...models.__test_item import TestItem
+from ...models.__item_bank import ItemBank
+from ..estimators.__test_information import item_information_function
+
+
+@dataclass
+class SympsonHetterParameters:
+    """Exposure control parameters of the Sympson-Hetter method.
+    For the conditional Sympson-Hetter method,
+    one set of parameters is stored for every ability interval.
+    """
+    item_ids: list[int]
+    """Item ids (columns of `parameters`)"""
+    parameters: np.ndarray
+    """Probability of administering a selected item with shape `(n_intervals, n_items)`"""
+    cut_points: np.ndarray = field(default_factory=lambda: np.empty(0))
+    """Limits of the ability intervals (`n_intervals - 1` values).
+    Empty for the unconditional method."""
+    exposure_rates: np.ndarray | None = None
+    """Exposure rates observed in the last calibration round with shape `(n_intervals, n_items)`"""
+    columns: dict[int, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.parameters = np.atleast_2d(np.asarray(self.parameters, dtype=np.float64))
+        self.cut_points = np.asarray(self.cut_points, dtype=np.float64)
+        if self.parameters.shape != (len(self.cut_points) + 1, len(self.item_ids)):
+            raise ValueError("parameters has to be of shape (n_intervals, n_items).")
+        self.columns = {item_id: column for column, item_id in enumerate(self.item_ids)}
+
+    def interval(self, ability: float) -> int:
+        """Finds the ability interval of an ability level.
+
+        Args:
+            ability (float): ability level
+
+        Returns:
+            int: index of the interval
+        """
+        return int(np.searchsorted(self.cut_points, ability, side="right"))
+
+    def for_items(self, items: list[TestItem], ability: float) -> np.ndarray:
+        """Looks up the exposure control parameters of items.
+        Items without a parameter are always administered.
+
+        Args:
+            items (list[TestItem]): items
+            ability (float): current ability level
+
+        Returns:
+            np.ndarray: exposure control parameters of the items
+        """
+        parameters = self.parameters[self.interval(ability)]
+        return np.array([
+            parameters[self.columns[item.id]] if item.id in self.columns else 1.0  # type: ignore
+            for item in items
+        ], dtype=np.float64)
+
+
+class SympsonHetter(ExposureControl):
+    def __init__(self,
+                 adaptive_test: AdaptiveTest,
+                 exposure_parameters: SympsonHetterParameters,
+                 seed: int | None = None):
+        """
+        Exposure Control using the (conditional) Sympson-Hetter method.
+        The available items are ordered by their information.
+        Starting with the most informative item, every item passes an acceptance test:
+        it is administered with the probability given by its exposure control parameter.
+        Items that did not pass the test are not selected again during the test
+        unless no other item is left.
+        If no item passes the test, the most informative item is administered.
+
+        The exposure control parameters are determined beforehand
+        with `calibrate_sympson_hetter`.
+        For the conditional method, the parameters of the current ability estimate are used.
+
+        Args:
+            adaptive_test (AdaptiveTest): instance of the adaptive test
+            exposure_parameters (SympsonHetterParameters): exposure control parameters
+            seed (int | None): seed of the random number generator for the acceptance tests
+
+        References
+        ------------
+        Sympson, J. B., & Hetter, R. D. (1985). Controlling item-exposure rates in computerized adaptive testing.
+        Proceedings of the 27th Annual Meeting of the Military Testing Association, 973–977.
+
+        Stocking, M. L., & Lewis, C. (1998). Controlling item exposure conditional on ability
+        in computerized adaptive testing. Journal of Educational and Behavioral Statistics, 23(1), 57–75.
+        https://doi.org/10.3102/10769986023001057
+        """
+        super().__init__(adaptive_test)
+        self.exposure_parameters = exposure_parameters
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.rejected_items: list[TestItem] = []
+        # item parameters of the item pool (created on the first item selection)
+        self.__item_bank: ItemBank | None = None
+        self.__rows: dict[int, int] = {}
+
+    def item_information(self, items: list[TestItem], ability: float) -> np.ndarray:
+        """Calculates the information of the items.
+        For dichotomous items, the information of all items is calculated at once.
+
+        Args:
+            items (list[TestItem]): available items
+            ability (float): current ability estimate
+
+        Returns:
+            np.ndarray: item information
+        """
+        if any([item.is_polytomous() for item in items]):
+            return np.array([float(item_information_function(ability=ability, item=item)) for item in items])
+
+        rows = [self.__rows.get(id(item)) for item in items]
+        if self.__item_bank is None or any([row is None for row in rows]):
+            self.__item_bank = ItemBank(items)
+            self.__rows = {id(item): row for row, item in enumerate(items)}
+            rows = list(range(len(items)))
+        information = self.__item_bank.information(np.array([ability], dtype=np.float64))[0]
+        return information[np.array(rows, dtype=np.int64)]
+
+    def select_item(self, **kwargs) -> TestItem | None:
+        """Select an item based on the Sympson-Hetter method.
+
+        Args:
+            **kwargs: additional arguments for item selection function.
+                Not used here but implemented for compatibility.
+
+        Returns:
+            TestItem | None: selected test item
+        """
+        rejected_ids = set([id(item) for item in self.rejected_items])
+        items = [item for item in self.adaptive_test.item_pool.test_items if id(item) not in rejected_ids]
+        if len(items) == 0:
+            # rejected items become available again if no other item is left
+            # (as in `simulate_sympson_hetter_round`)
+            self.rejected_items.clear()
+            items = list(self.adaptive_test.item_pool.test_items)
+        if len(items) == 0:
+            return None
+
+        ability = self.adaptive_test.ability_level
+        order = np.argsort(-self.item_information(items, ability), kind="stable")
+        parameters = self.exposure_parameters.for_items(items, ability)[order]
+        accepted = self.rng.random(len(items)) < parameters
+        if not np.any(accepted):
+            return items[order[0]]
+        position = int(np.argmax(accepted))
+
+        self.rejected_items.extend([items[i] for i in order[:position]])
+        return items[order[position]]
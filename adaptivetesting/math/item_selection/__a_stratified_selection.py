@@ -0,0 +1,262 @@
+from bisect import bisect_left
+from typing import Sequence
+import numpy as np
+from ...models.__test_item import TestItem
+from ...models.__item_selection_exception import ItemSelectionException
+
+
+class AStratifiedSelector:
+    def __init__(self, items: Sequence[TestItem], n_strata: int, test_length: int):
+        """a-stratified item selection (Chang & Ying, 1999).
+        The item pool is partitioned into `n_strata` strata of ascending discrimination (`a`).
+        The test is divided into stages of equal length.
+        In the first stage, items are selected from the stratum with the lowest discrimination,
+        in the last stage from the stratum with the highest discrimination.
+        Within a stratum, the available item whose difficulty (`b`) is closest
+        to the current ability estimate is selected.
+        If a stratum has no items left, the next stratum is used.
+
+        The strata are created once when the selector is created.
+        Every stratum keeps its items sorted by difficulty,
+        so that the closest item is found by binary search
+        instead of calculating the information of all available items.
+        The strata do not change during the tests, so that one selector can be shared by all tests
+        (also by the threads of a parallel simulation).
+        The items are matched to the strata by their ids (by the objects if the ids are not unique),
+        so that copies of the item pool, e.g., of a `TestAssembler`, use the same strata.
+
+        The stage of a test and the available items are kept in an `AStratifiedSelectorState`.
+        `TestAssembler` creates a state for every test (see `create_state`).
+        If the selector is called directly, it uses one state for all calls.
+
+        The selector implements the `ItemSelectionStrategy` protocol
+        and can be passed to the `item_selector` argument of `TestAssembler`.
+        Only dichotomous items are supported.
+
+        Args:
+            items (Sequence[TestItem]): items of the item pool
+            n_strata (int): number of strata
+            test_length (int): number of items of the test (used to determine the current stage)
+
+        Raises:
+            ValueError: Raised if `n_strata` or `test_length` are smaller than 1
+                or the item pool contains polytomous items.
+
+        References
+        ------------
+        Chang, H.-H., & Ying, Z. (1999). a-Stratified Multistage Computerized Adaptive Testing.
+        Applied Psychological Measurement, 23(3), 211–222. https://doi.org/10.1177/01466219922031338
+        """
+        if n_strata < 1:
+            raise ValueError("n_strata has to be at least 1.")
+        if test_length < 1:
+            raise ValueError("test_length has to be at least 1.")
+        self.n_strata = n_strata
+        self.test_length = test_length
+        self.__build(items)
+
+    def __build(self, items: Sequence[TestItem]):
+        if any([item.is_polytomous() for item in items]):
+            raise ValueError("a-stratified item selection cannot be used with polytomous IRT model items!")
+        self.items = list(items)
+        item_ids = [item.id for item in self.items]
+        self.__by_id = None not in item_ids and len(set(item_ids)) == len(item_ids)
+        self.positions = {self.key(item): position for position, item in enumerate(self.items)}
+        a = np.array([item.a for item in self.items], dtype=np.float64)
+        b = np.array([item.b for item in self.items], dtype=np.float64)
+
+        # strata of ascending discrimination, every stratum sorted by difficulty
+        self.strata: list[np.ndarray] = []
+        self.difficulties: list[list[float]] = []
+        for members in np.array_split(np.argsort(a, kind="stable"), self.n_strata):
+            members = members[np.argsort(b[members], kind="stable")]
+            self.strata.append(members)
+            self.difficulties.append(b[members].tolist())
+        self.__state: AStratifiedSelectorState | None = None
+
+    def key(self, item: TestItem) -> int | None:
+        """Key of an item in `positions`: the item id or, if the ids are not unique, the object.
+
+        Args:
+            item (TestItem): item
+
+        Returns:
+            int | None: key of the item
+        """
+        return item.id if self.__by_id else id(item)
+
+    def create_state(self) -> "AStratifiedSelectorState":
+        """Creates the state of a new test.
+
+        Returns:
+            AStratifiedSelectorState: state selecting the items of one test
+        """
+        return AStratifiedSelectorState(self)
+
+    def current_stratum(self) -> int:
+        """Determines the stratum of the current stage of the test of the directly called selector
+        (see `AStratifiedSelectorState.current_stratum`).
+
+        Returns:
+            int: index of the stratum (0: lowest discrimination)
+
+        Raises:
+            ItemSelectionException: Raised if no items are available.
+        """
+        if self.__state is None:
+            self.__state = self.create_state()
+        return self.__state.current_stratum()
+
+    def __call__(self, items: list[TestItem], ability: float, **kwargs) -> TestItem:
+        """Selects the available item of the current stratum
+        whose difficulty is closest to the ability level.
+        All direct calls share one state (see `create_state`).
+
+        Args:
+            items (list[TestItem]): list of available items
+            ability (float): currently estimated ability
+            **kwargs: additional arguments for item selection function.
+                Not used here but implemented for compatibility.
+
+        Returns:
+            TestItem: selected item
+
+        Raises:
+            ItemSelectionException: raised if no appropriate item was found
+        """
+        if self.__state is None:
+            self.__state = self.create_state()
+        return self.__state(items, ability)
+
+
+class AStratifiedSelectorState:
+    def __init__(self, selector: AStratifiedSelector):
+        """Stage and available items of one test using an `AStratifiedSelector`.
+        The state keeps track of the items it returned.
+        If the available items passed to the state do not match
+        (different number of items or the first or last item is not available, e.g., at the beginning of the test),
+        the availability is recreated from the passed items.
+        If the passed items are not part of the strata of the selector,
+        separate strata are created from the passed items.
+
+        The state implements the `ItemSelectionStrategy` protocol.
+
+        Args:
+            selector (AStratifiedSelector): selector containing the strata
+        """
+        self.selector = selector
+        self.n_administered = 0
+        """Number of administered items"""
+        self.__items: list[TestItem | None] = [None] * len(selector.items)
+        self.__reset(np.zeros(len(selector.items), dtype=bool))
+
+    def __reset(self, available: np.ndarray):
+        # For every stratum, the next available item to the right (left) of a rank
+        # is found with path compression. Ranks are shifted by one to leave room for sentinels.
+        self.__right: list[list[int]] = []
+        self.__left: list[list[int]] = []
+        self.__n_available: list[int] = []
+        for members in self.selector.strata:
+            shifted = [False] + available[members].tolist() + [False]
+            self.__right.append(list(range(len(shifted))))
+            self.__left.append(list(range(len(shifted))))
+            self.__n_available.append(int(sum(shifted)))
+            for rank in range(1, len(shifted) - 1):
+                if not shifted[rank]:
+                    self.__remove_rank(len(self.__right) - 1, rank)
+        # number of items that has been administered before the items were passed
+        self.n_administered = len(self.selector.items) - int(available.sum())
+        self.__expected_length = int(available.sum())
+        self.__available = available.tolist()
+
+    @staticmethod
+    def __find(parents: list[int], rank: int) -> int:
+        root = rank
+        while parents[root] != root:
+            root = parents[root]
+        while parents[rank] != root:
+            parents[rank], rank = root, parents[rank]
+        return root
+
+    def __remove_rank(self, stratum: int, rank: int):
+        self.__right[stratum][rank] = rank + 1
+        self.__left[stratum][rank] = rank - 1
+
+    def __is_current(self, item: TestItem) -> bool:
+        position = self.selector.positions.get(self.selector.key(item))
+        return position is not None and self.__items[position] is item and self.__available[position]
+
+    def __sync(self, items: list[TestItem]):
+        if len(items) == self.__expected_length and all([
+            self.__is_current(item) for item in items[:1] + items[-1:]
+        ]):
+            return
+        positions = self.selector.positions
+        item_positions = [positions.get(self.selector.key(item)) for item in items]
+        if any([position is None for position in item_positions]):
+            self.selector = AStratifiedSelector(items, self.selector.n_strata, self.selector.test_length)
+            item_positions = list(range(len(items)))
+        # the items of the test (e.g., copies of the items of the selector) are returned
+        self.__items = [None] * len(self.selector.items)
+        for item, position in zip(items, item_positions):
+            self.__items[position] = item  # type: ignore
+        available = np.zeros(len(self.selector.items), dtype=bool)
+        available[np.array(item_positions, dtype=np.int64)] = True
+        self.__reset(available)
+
+    def current_stratum(self) -> int:
+        """Determines the stratum of the current stage of the test.
+        If the stratum has no items left, the next stratum with available items is returned
+        (strata with higher discrimination are preferred).
+
+        Returns:
+            int: index of the stratum (0: lowest discrimination)
+
+        Raises:
+            ItemSelectionException: Raised if no items are available.
+        """
+        n_strata = self.selector.n_strata
+        stage = min(self.n_administered * n_strata // self.selector.test_length, n_strata - 1)
+        for stratum in list(range(stage, n_strata)) + list(range(stage - 1, -1, -1)):
+            if self.__n_available[stratum] > 0:
+                return stratum
+        raise ItemSelectionException("No appropriate item could be selected.")
+
+    def __call__(self, items: list[TestItem], ability: float, **kwargs) -> TestItem:
+        """Selects the available item of the current stratum
+        whose difficulty is closest to the ability level.
+
+        Args:
+            items (list[TestItem]): list of available items
+            ability (float): currently estimated ability
+            **kwargs: additional arguments for item selection function.
+                Not used here but implemented for compatibility.
+
+        Returns:
+            TestItem: selected item
+
+        Raises:
+            ItemSelectionException: raised if no appropriate item was found
+        """
+        self.__sync(items)
+        stratum = self.current_stratum()
+        difficulties = self.selector.difficulties[stratum]
+
+        # closest available items below and above the ability level
+        rank = bisect_left(difficulties, ability) + 1
+        right = self.__find(self.__right[stratum], rank)
+        left = self.__find(self.__left[stratum], rank - 1)
+        if right > len(difficulties) or (
+            left > 0 and ability - difficulties[left - 1] <= difficulties[right - 1] - ability
+        ):
+            rank = left
+        else:
+            rank = right
+
+        position = int(self.selector.strata[stratum][rank - 1])
+        self.__remove_rank(stratum, rank)
+        self.__available[position] = False
+        self.__n_available[stratum] -= 1
+        self.n_administered += 1
+        self.__expected_length = len(items) - 1
+        return self.__items[position]  # type: ignore
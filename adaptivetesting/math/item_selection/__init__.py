@@ -1,2 +1,4 @@
 from .__urrys_rule import urrys_rule
-from .__maximum_information_criterion import maximum_information_criterion
+from .__maximum_information_criterion import maximum_information_criterion, tabulated_maximum_information_criterion
+from .__a_stratified_selection import AStratifiedSelector, AStratifiedSelectorState
+from .__selection_scheduler import SelectionScheduler
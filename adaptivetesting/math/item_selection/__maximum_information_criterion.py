@@ -1,4 +1,6 @@
+import numpy as np
 from ...models.__test_item import TestItem
+from ...models.__shared_item_bank import SharedItemBank
 from ...models.__item_selection_exception import ItemSelectionException
 from ..estimators.__test_information import item_information_function
 from ...models.__algorithm_exception import AlgorithmException
@@ -48,3 +50,30 @@ def maximum_information_criterion(items: list[TestItem],
         raise ItemSelectionException("No appropriate item could be selected.")
     
     return best_item
+
+
+def tabulated_maximum_information_criterion(items: list[TestItem],
+                                            ability: float,
+                                            item_bank: SharedItemBank) -> TestItem:
+    """Maximum information criterion that uses the precomputed information table
+    of a shared item bank instead of calculating the item information for every item.
+    The information is linearly interpolated between the grid points of the table.
+    Therefore, the selected item may differ from `maximum_information_criterion`
+    if the information of two items is very close.
+
+    Args:
+        items (list[TestItem]): list of available items
+        ability (float): currently estimated ability
+        item_bank (SharedItemBank): shared item bank containing all available items
+
+    Returns:
+        TestItem: item that has the highest information value
+
+    Raises:
+        ItemSelectionException: raised if no appropriate item was found
+    """
+    if len(items) == 0:
+        raise ItemSelectionException("No appropriate item could be selected.")
+
+    information = item_bank.information(np.array([ability]), item_bank.positions(items))[0]
+    return items[int(np.argmax(information))]
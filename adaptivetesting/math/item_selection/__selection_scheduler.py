@@ -0,0 +1,123 @@
+from concurrent.futures import Future, wait
+import threading
+import numpy as np
+from ...models.__test_item import TestItem
+from ...models.__item_bank import ItemBank
+from ...models.__item_selection_exception import ItemSelectionException
+from ...models.__instrumentation import count
+
+
+class _SelectionRequest:
+    def __init__(self, items: list[TestItem], positions: np.ndarray, ability: float):
+        self.items = items
+        self.positions = positions
+        self.ability = ability
+        self.future: Future = Future()
+
+
+class SelectionScheduler:
+    def __init__(self, item_bank: ItemBank, max_batch_size: int = 64, max_delay: float = 0.002):
+        """Maximum information criterion for many concurrent sessions.
+        Selection requests arriving at the same time are collected
+        until `max_batch_size` requests are waiting or the first request has waited `max_delay` seconds.
+        The item information of the whole batch is then calculated
+        as one (sessions × items) matrix with `ItemBank.information`,
+        the items that are not available to a session are masked
+        and the most informative item of every session is returned to the waiting request.
+        A request therefore waits at most `max_delay` seconds longer than with `maximum_information_criterion`,
+        but a batch needs much less time per request than selecting the items one after another.
+
+        The scheduler implements the `ItemSelectionStrategy` protocol and can be passed
+        to the `item_selector` argument of `TestAssembler`.
+        One scheduler is shared by all tests, e.g., the sessions of a `SessionManager`.
+        The requests wait in the threads running the item selection,
+        so the executor of the sessions needs at least `max_batch_size` workers to fill a batch.
+
+        The available items are matched to the item bank by their ids,
+        so the item ids have to be unique.
+        Only dichotomous items are supported.
+
+        Args:
+            item_bank (ItemBank): item bank containing all items of the tests
+            max_batch_size (int): maximum number of requests per batch. Defaults to 64.
+            max_delay (float): maximum waiting time (seconds) of the first request of a batch.
+                Defaults to 0.002.
+
+        Raises:
+            ValueError: Raised if `max_batch_size` is smaller than 1 or `max_delay` is negative.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size has to be at least 1.")
+        if max_delay < 0:
+            raise ValueError("max_delay must not be negative.")
+        self.item_bank = item_bank
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.n_requests = 0
+        """Number of evaluated selection requests"""
+        self.n_batches = 0
+        """Number of evaluated batches"""
+        self.__pending: list[_SelectionRequest] = []
+        self.__lock = threading.Lock()
+
+    def __call__(self, items: list[TestItem], ability: float, **kwargs) -> TestItem:
+        """Selects the item with the highest information value.
+        The call blocks until the batch of the request has been evaluated.
+
+        Args:
+            items (list[TestItem]): list of available items
+            ability (float): currently estimated ability
+            **kwargs: additional arguments for item selection function.
+                Not used here but implemented for compatibility.
+
+        Returns:
+            TestItem: item that has the highest information value
+
+        Raises:
+            ItemSelectionException: raised if no appropriate item was found
+            ValueError: raised if an item is not part of the item bank
+        """
+        if len(items) == 0:
+            raise ItemSelectionException("No appropriate item could be selected.")
+        request = _SelectionRequest(
+            items,
+            np.array(self.item_bank.positions_of_ids([item.id for item in items]), dtype=np.intp),
+            float(ability)
+        )
+
+        batch: list[_SelectionRequest] = []
+        with self.__lock:
+            self.__pending.append(request)
+            leader = len(self.__pending) == 1
+            if len(self.__pending) >= self.max_batch_size:
+                batch, self.__pending = self.__pending, []
+
+        if len(batch) == 0 and leader:
+            # the first request of a batch evaluates it when the waiting time is over
+            # (unless the batch has been filled and evaluated in the meantime)
+            if len(wait([request.future], timeout=self.max_delay).done) == 0:
+                with self.__lock:
+                    if len(self.__pending) > 0 and self.__pending[0] is request:
+                        batch, self.__pending = self.__pending, []
+        if len(batch) > 0:
+            self.__evaluate(batch)
+        return request.future.result()
+
+    def __evaluate(self, batch: list[_SelectionRequest]):
+        try:
+            information = self.item_bank.information(np.array([request.ability for request in batch]))
+            rows = np.repeat(np.arange(len(batch)), [len(request.positions) for request in batch])
+            available = np.zeros(information.shape, dtype=bool)
+            available[rows, np.concatenate([request.positions for request in batch])] = True
+            best = np.where(available, information, -np.inf).argmax(axis=1)
+        except Exception as error:
+            for request in batch:
+                request.future.set_exception(error)
+            return
+
+        with self.__lock:
+            self.n_requests += len(batch)
+            self.n_batches += 1
+        count("selection_scheduler.batch_size", len(batch))
+        for request, position in zip(batch, best.tolist()):
+            request.future.set_result(request.items[int(np.argmax(request.positions == position))])
@@ -2,12 +2,17 @@ from typing import List
 import abc
 import copy
 from .__test_item import TestItem
-from ..math.__gen_response_pattern import generate_response_pattern
 from .__test_result import TestResult
 from .__item_pool import ItemPool
+from .__misc import StoppingCriterion
+from .__instrumentation import timed
+from ..services.__exposure_counter_interface import IExposureCounter
 
 
 class AdaptiveTest(abc.ABC):
+    exposure_counter: IExposureCounter | None = None
+    """Store of the exposure counts that is updated when the test results are saved."""
+
     def __init__(self, item_pool: ItemPool,
                  simulation_id: str,
                  participant_id: str,
@@ -15,6 +20,7 @@ class AdaptiveTest(abc.ABC):
                  initial_ability_level: float = 0,
                  simulation: bool = True,
                  DEBUG=False,
+                 copy_item_pool: bool = True,
                  **kwargs):
         """Abstract implementation of an adaptive test.
         All abstract methods have to be overridden
@@ -36,6 +42,10 @@ class AdaptiveTest(abc.ABC):
                 `AdaptiveTest(..., seed=1234)`
 
             DEBUG (bool): enables debug mode
+            copy_item_pool (bool): whether the item pool is copied.
+                If False, administered items are deleted from the passed item pool.
+                This avoids copying the items, e.g., when a session is restored
+                from a snapshot (see `CATSession.restore`). Defaults to True.
         """
         self.true_ability_level = true_ability_level
         self.simulation_id = simulation_id
@@ -49,7 +59,7 @@ class AdaptiveTest(abc.ABC):
         # make a deep copy of the item pool so
         # that it can be referenced by other instances as well
         # without modifying all other instances
-        self.item_pool = copy.deepcopy(item_pool)
+        self.item_pool = copy.deepcopy(item_pool) if copy_item_pool else item_pool
 
         # debug
         self.DEBUG = DEBUG
@@ -61,6 +71,8 @@ class AdaptiveTest(abc.ABC):
         if simulation:
             if self.item_pool.simulated_responses is None:
                 if self.true_ability_level is not None:
+                    # imported here because the math package depends on the models package
+                    from ..math.__gen_response_pattern import generate_response_pattern
                     self.item_pool.simulated_responses = generate_response_pattern(
                         ability=self.true_ability_level,
                         items=self.item_pool.test_items,
@@ -107,26 +119,57 @@ class AdaptiveTest(abc.ABC):
         """
         raise NotImplementedError("This functionality is not implemented by default.")
 
+    def on_item_administered(self, item: TestItem):
+        """Called directly after an item has been administered.
+        Updates the live exposure counts.
+
+        Args:
+            item (TestItem): administered item
+        """
+        if self.exposure_counter is not None:
+            self.exposure_counter.on_item_administered(item)
+
     def run_test_once(self):
         """
         Runs the test procedure once.
         Saves the result to test_results of
         the current instance.
+
+        If an `Instrumentation` is active, the duration of the step and its phases
+        (`selection`, `response`, `estimation`, `pool_deletion` and `result`) is measured.
         """
-        # get item
-        item = self.get_next_item()
-        if item is not None:
-            if self.DEBUG:
-                print(f"Selected {item.b} for an ability level of {self.ability_level}.")
-
-        # check if simulation is running
-        response = None
-        if self.simulation:
-            response = self.item_pool.get_item_response(item)
-        else:
-            # not simulation
-            response = self.get_response(item)
+        with timed("step"):
+            # get item
+            with timed("selection"):
+                item = self.get_next_item()
+            if item is not None:
+                if self.DEBUG:
+                    print(f"Selected {item.b} for an ability level of {self.ability_level}.")
+
+            # check if simulation is running
+            response = None
+            with timed("response"):
+                if self.simulation:
+                    response = self.item_pool.get_item_response(item)
+                else:
+                    # not simulation
+                    response = self.get_response(item)
+
+            self.administer_item(item, response)
+
+    def administer_item(self, item: TestItem, response: int) -> TestResult:
+        """Records the response to an item, updates the ability estimation
+        and removes the item from the item pool.
+        This is the second half of `run_test_once`
+        and can be used to drive the test step by step (see `CATSession`).
 
+        Args:
+            item (TestItem): administered item
+            response (int): response to the item
+
+        Returns:
+            TestResult: result of the step (also added to test_results)
+        """
         if self.DEBUG:
             print(f"Response: {response}")
 
@@ -134,9 +177,11 @@ class AdaptiveTest(abc.ABC):
         self.response_pattern.append(response)
         # add item to answered items list
         self.answered_items.append(item)
+        self.on_item_administered(item)
 
         # estimate ability level
-        estimation, sd_error = self.estimate_ability_level()
+        with timed("estimation"):
+            estimation, sd_error = self.estimate_ability_level()
 
         # update estimated ability level and standard error
         self.ability_level = estimation
@@ -145,21 +190,50 @@ class AdaptiveTest(abc.ABC):
             print(f"New estimation is {self.ability_level} with standard error {self.standard_error}.")
 
         # remove item from item pool
-        self.item_pool.delete_item(item)
+        with timed("pool_deletion"):
+            self.item_pool.delete_item(item)
         if self.DEBUG:
             print(f"Now, there are only {len(self.item_pool.test_items)} left in the item pool.")
         # create result
-        result: TestResult = TestResult(
-            ability_estimation=float(estimation),
-            standard_error=self.standard_error,
-            showed_item=item.as_dict(),
-            response=response,
-            test_id=self.simulation_id,
-            true_ability_level=self.true_ability_level if self.true_ability_level is not None else float("NaN")
-        )
+        with timed("result"):
+            result: TestResult = TestResult(
+                ability_estimation=float(estimation),
+                standard_error=self.standard_error,
+                showed_item=item.as_dict(),
+                response=response,
+                test_id=self.simulation_id,
+                true_ability_level=self.true_ability_level if self.true_ability_level is not None else float("NaN")
+            )
 
         # add result to memory
         self.test_results.append(result)
+        return result
+
+    def check_stopping_criteria(self,
+                                criterion: StoppingCriterion | list[StoppingCriterion],
+                                value: float | list[float | int]) -> bool:
+        """Checks whether the test has to be stopped.
+        The test is stopped if no items are left or any of the criteria is met.
+
+        Args:
+            criterion (StoppingCriterion | list[StoppingCriterion]): stopping criterion or list of criteria
+            value (float | list[float | int]): threshold value(s) for the stopping criteria
+
+        Returns:
+            bool: whether the test has to be stopped
+        """
+        # check available items
+        if len(self.item_pool.test_items) == 0:
+            return True
+        # Support both single criterion and list of criteria/values
+        criteria = criterion if isinstance(criterion, list) else [criterion]
+        values = value if isinstance(value, list) else [value]
+        return any(
+            self.check_se_criterion(v) if c == StoppingCriterion.SE
+            else self.check_length_criterion(v) if c == StoppingCriterion.LENGTH
+            else False
+            for c, v in zip(criteria, values)
+        )
 
     def check_se_criterion(self, value: float) -> bool:
         if self.standard_error <= value:
@@ -1,7 +1,11 @@
 from .__adaptive_test import AdaptiveTest
 from .__algorithm_exception import AlgorithmException
 from .__item_pool import ItemPool 
+from .__item_bank import ItemBank
+from .__item_exclusions import ItemExclusions
+from .__shared_item_bank import SharedItemBank
 from .__item_selection_exception import ItemSelectionException
 from .__test_item import TestItem
 from .__test_result import TestResult
 from .__misc import ResultOutputFormat, StoppingCriterion
+from .__instrumentation import Instrumentation, Histogram, active_instrumentation
@@ -0,0 +1,264 @@
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, ContextManager, Iterator
+import json
+import math
+import threading
+import time
+
+
+class Histogram:
+    def __init__(self):
+        """Histogram of non-negative values with logarithmic buckets.
+        A value `v` is counted in the bucket `e` with `2 ** (e - 1) <= v < 2 ** e`
+        (zero is counted in the bucket `None`).
+        """
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.buckets: dict[int | None, int] = {}
+
+    def add(self, value: float):
+        """Adds a value.
+
+        Args:
+            value (float): value
+        """
+        bucket = math.frexp(value)[1] if value > 0 else None
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: "Histogram"):
+        """Adds the values of another histogram.
+
+        Args:
+            other (Histogram): histogram
+        """
+        for bucket, count in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        """Mean of the values (NaN if empty)"""
+        return self.total / self.count if self.count > 0 else math.nan
+
+    def quantile(self, q: float) -> float:
+        """Approximates a quantile by the upper bound of its bucket.
+
+        Args:
+            q (float): probability between 0 and 1
+
+        Returns:
+            float: upper bound of the bucket containing the quantile (NaN if empty)
+        """
+        if self.count == 0:
+            return math.nan
+        rank = q * self.count
+        cumulative = 0
+        for bucket in sorted(self.buckets, key=lambda b: -math.inf if b is None else b):
+            cumulative += self.buckets[bucket]
+            if cumulative >= rank:
+                return min(0.0 if bucket is None else 2.0 ** bucket, self.max)
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the histogram to a dictionary that can be serialized as JSON.
+
+        Returns:
+            dict[str, Any]: count, total, mean, min, max, approximate median and 99th percentile and buckets
+                (the bucket of zero is named "zero")
+        """
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean if self.count > 0 else None,
+            "min": self.min if self.count > 0 else None,
+            "max": self.max if self.count > 0 else None,
+            "p50": self.quantile(0.5) if self.count > 0 else None,
+            "p99": self.quantile(0.99) if self.count > 0 else None,
+            "buckets": {("zero" if bucket is None else str(bucket)): count
+                        for bucket, count in sorted(self.buckets.items(),
+                                                    key=lambda entry: -math.inf if entry[0] is None else entry[0])}
+        }
+
+
+class Instrumentation:
+    def __init__(self):
+        """Collects the duration of the phases of adaptive tests (item selection, response,
+        ability estimation, ...) and counters (e.g., evaluations of the estimator objective function
+        or items scored per item selection) in histograms.
+
+        The instrumentation is opt-in: measurements are only taken while an instance is activated
+        (`activate`) in the current context. Otherwise, the instrumented code only looks up
+        the active instance, so that the overhead is negligible.
+        """
+        self.timers: dict[str, Histogram] = {}
+        """Durations (seconds) per phase"""
+        self.counters: dict[str, Histogram] = {}
+        """Counted values per event"""
+        self.__lock = threading.Lock()
+
+    @contextmanager
+    def activate(self) -> Iterator["Instrumentation"]:
+        """Activates the instrumentation in the current context (thread or task).
+
+        Yields:
+            Instrumentation: this instance
+        """
+        token = _active_instrumentation.set(self)
+        try:
+            yield self
+        finally:
+            _active_instrumentation.reset(token)
+
+    def record_time(self, phase: str, seconds: float):
+        """Adds the duration of a phase.
+
+        Args:
+            phase (str): name of the phase
+            seconds (float): duration
+        """
+        with self.__lock:
+            histogram = self.timers.get(phase)
+            if histogram is None:
+                histogram = self.timers[phase] = Histogram()
+            histogram.add(seconds)
+
+    def count(self, event: str, value: float = 1):
+        """Adds a counted value.
+
+        Args:
+            event (str): name of the event
+            value (float): counted value. Defaults to 1.
+        """
+        with self.__lock:
+            histogram = self.counters.get(event)
+            if histogram is None:
+                histogram = self.counters[event] = Histogram()
+            histogram.add(value)
+
+    @contextmanager
+    def time(self, phase: str) -> Iterator[None]:
+        """Measures the duration of a phase.
+
+        Args:
+            phase (str): name of the phase
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_time(phase, time.perf_counter() - start)
+
+    def merge(self, other: "Instrumentation"):
+        """Adds the measurements of another instance, e.g., of a worker process.
+
+        Args:
+            other (Instrumentation): instrumentation
+        """
+        with self.__lock:
+            for target, source in ((self.timers, other.timers), (self.counters, other.counters)):
+                for name, histogram in source.items():
+                    target.setdefault(name, Histogram()).merge(histogram)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Converts the measurements to a dictionary that can be serialized as JSON.
+
+        Returns:
+            dict[str, Any]: histograms of the timers and counters
+        """
+        return {
+            "timers": {name: histogram.to_dict() for name, histogram in sorted(self.timers.items())},
+            "counters": {name: histogram.to_dict() for name, histogram in sorted(self.counters.items())}
+        }
+
+    def to_json(self) -> str:
+        """Exports the measurements as JSON.
+
+        Returns:
+            str: JSON document (see `to_dict`)
+        """
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_text(self) -> str:
+        """Exports the measurements as a text table.
+        Durations are given in milliseconds.
+
+        Returns:
+            str: table
+        """
+        lines = [f"{'timer':<28}{'count':>10}{'total ms':>12}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}"]
+        for name, histogram in sorted(self.timers.items()):
+            lines.append(f"{name:<28}{histogram.count:>10}{histogram.total * 1e3:>12.3f}{histogram.mean * 1e3:>10.4f}"
+                         f"{histogram.quantile(0.5) * 1e3:>10.4f}{histogram.quantile(0.99) * 1e3:>10.4f}"
+                         f"{histogram.max * 1e3:>10.4f}")
+        lines.append("")
+        lines.append(f"{'counter':<28}{'count':>10}{'total':>12}{'mean':>10}{'p50':>10}{'p99':>10}{'max':>10}")
+        for name, histogram in sorted(self.counters.items()):
+            lines.append(f"{name:<28}{histogram.count:>10}{histogram.total:>12g}{histogram.mean:>10.4g}"
+                         f"{histogram.quantile(0.5):>10g}{histogram.quantile(0.99):>10g}{histogram.max:>10g}")
+        return "\n".join(lines)
+
+    def save(self, path: str):
+        """Saves the measurements as JSON file.
+
+        Args:
+            path (str): file path
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(self.to_json())
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"timers": self.timers, "counters": self.counters}
+
+    def __setstate__(self, state: dict[str, Any]):
+        self.timers = state["timers"]
+        self.counters = state["counters"]
+        self.__lock = threading.Lock()
+
+
+_active_instrumentation: ContextVar[Instrumentation | None] = ContextVar("adaptivetesting_instrumentation",
+                                                                         default=None)
+_inactive = nullcontext()
+
+
+def active_instrumentation() -> Instrumentation | None:
+    """Returns the instrumentation activated in the current context.
+
+    Returns:
+        Instrumentation | None: active instrumentation or None
+    """
+    return _active_instrumentation.get()
+
+
+def timed(phase: str) -> ContextManager:
+    """Measures the duration of a phase if an instrumentation is active.
+
+    Args:
+        phase (str): name of the phase
+
+    Returns:
+        ContextManager: timer (does nothing if no instrumentation is active)
+    """
+    instrumentation = _active_instrumentation.get()
+    return _inactive if instrumentation is None else instrumentation.time(phase)
+
+
+def count(event: str, value: float = 1):
+    """Adds a counted value if an instrumentation is active.
+
+    Args:
+        event (str): name of the event
+        value (float): counted value. Defaults to 1.
+    """
+    instrumentation = _active_instrumentation.get()
+    if instrumentation is not None:
+        instrumentation.count(event, value)
@@ -0,0 +1,144 @@
+from typing import Sequence
+import copy
+import hashlib
+import numpy as np
+from .__test_item import TestItem
+from .__item_pool import ItemPool
+from .__item_exclusions import ItemExclusions
+from ..math.estimators.__functions.__estimators import probability_y1
+from ..math.estimators.__test_information import dicho_item_information_matrix
+
+
+class ItemBank:
+    def __init__(self, items: Sequence[TestItem], enemy_groups: Sequence[Sequence[int]] | None = None):
+        """Columnar representation of a dichotomous item pool.
+        The item parameters are stored as NumPy arrays so that
+        probabilities and item information can be calculated
+        for many ability levels and all items at once.
+
+        The bank does not change when items are administered.
+        Items are referenced by their position in the bank.
+
+        Args:
+            items (Sequence[TestItem]): dichotomous test items
+            enemy_groups (Sequence[Sequence[int]] | None): groups of item ids that are enemies of each other
+                (see `ItemPool.set_enemy_groups`), e.g., to restore the sessions of a test with enemy items.
+                Defaults to None.
+
+        Raises:
+            ValueError: Raised if the items are specified for polytomous IRT models.
+        """
+        if any([item.is_polytomous() for item in items]):
+            raise ValueError("The item bank can only be used with dichotomous IRT models and items.")
+
+        self.items: list[TestItem] = list(items)
+        self.ids: list[int | None] = [item.id for item in self.items]
+        self.a = np.array([item.a for item in self.items], dtype=np.float64)
+        self.b = np.array([item.b for item in self.items], dtype=np.float64)
+        self.c = np.array([item.c for item in self.items], dtype=np.float64)
+        self.d = np.array([item.d for item in self.items], dtype=np.float64)
+        self.enemy_groups: list[list[int]] = [list(group) for group in enemy_groups] if enemy_groups is not None else []
+        self.__enemy_index: ItemExclusions | None = None
+        self.__version: bytes | None = None
+        self.__id_positions: dict[int | None, int] | None = None
+
+    @staticmethod
+    def from_item_pool(item_pool: ItemPool) -> "ItemBank":
+        """Creates an item bank from the items currently available in an item pool.
+        The enemy groups of the item pool are restricted to these items.
+
+        Args:
+            item_pool (ItemPool): item pool
+
+        Returns:
+            ItemBank: item bank
+        """
+        enemy_groups = None
+        if item_pool.exclusions is not None:
+            ids = set([item.id for item in item_pool.test_items])
+            enemy_groups = [[item_id for item_id in group if item_id in ids]
+                            for group in item_pool.exclusions.enemy_groups]
+        return ItemBank(item_pool.test_items, enemy_groups)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @property
+    def version(self) -> bytes:
+        """Hash (16 bytes) of the item ids, parameters and enemy groups.
+        Identifies the item bank, e.g., when a session snapshot is restored."""
+        if self.__version is None:
+            digest = hashlib.sha256(repr(self.ids).encode("utf-8"))
+            for parameters in (self.a, self.b, self.c, self.d):
+                digest.update(parameters.tobytes())
+            if len(self.enemy_groups) > 0:
+                digest.update(repr(self.enemy_groups).encode("utf-8"))
+            self.__version = digest.digest()[:16]
+        return self.__version
+
+    def item_exclusions(self, excluded: np.ndarray) -> ItemExclusions | None:
+        """Creates the exclusion constraints of a test from the enemy groups of the bank.
+        The enemy index is built once and shared by the returned objects.
+
+        Args:
+            excluded (np.ndarray): mask of the items that have been administered or excluded
+                (indexed by item position)
+
+        Returns:
+            ItemExclusions | None: exclusion constraints (None if the bank has no enemy groups)
+        """
+        if len(self.enemy_groups) == 0:
+            return None
+        if self.__enemy_index is None:
+            self.__enemy_index = ItemExclusions(self.ids, self.enemy_groups)
+        exclusions = copy.copy(self.__enemy_index)
+        exclusions.excluded = np.array(excluded, dtype=bool)
+        return exclusions
+
+    def positions_of_ids(self, item_ids: Sequence[int | None]) -> list[int]:
+        """Finds the positions of items by their ids.
+
+        Args:
+            item_ids (Sequence[int | None]): item ids
+
+        Returns:
+            list[int]: positions of the items in the bank
+
+        Raises:
+            ValueError: Raised if an item id is not part of the bank.
+        """
+        if self.__id_positions is None:
+            self.__id_positions = {item_id: position for position, item_id in enumerate(self.ids)}
+        try:
+            return [self.__id_positions[item_id] for item_id in item_ids]
+        except KeyError as error:
+            raise ValueError(f"Item with id {error.args[0]} is not part of the item bank.")
+
+    def probability(self, abilities: np.ndarray) -> np.ndarray:
+        """Probability of a correct response for every ability level and item.
+
+        Args:
+            abilities (np.ndarray): ability levels with shape `(n,)`
+
+        Returns:
+            np.ndarray: probabilities with shape `(n, n_items)`
+        """
+        mu = np.asarray(abilities, dtype=np.float64).reshape(-1, 1)
+        return np.atleast_2d(probability_y1(mu, self.a, self.b, self.c, self.d)).reshape(mu.shape[0], len(self))
+
+    def information(self, abilities: np.ndarray) -> np.ndarray:
+        """Item information for every ability level and item.
+
+        Args:
+            abilities (np.ndarray): ability levels with shape `(n,)`
+
+        Returns:
+            np.ndarray: item information with shape `(n, n_items)`
+        """
+        return dicho_item_information_matrix(
+            np.asarray(abilities, dtype=np.float64),
+            self.a,
+            self.b,
+            self.c,
+            self.d
+        )
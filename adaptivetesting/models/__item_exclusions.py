@@ -0,0 +1,128 @@
+from typing import Sequence
+import numpy as np
+
+
+class ItemExclusions:
+    def __init__(self,
+                 item_ids: Sequence[int | None],
+                 enemy_groups: Sequence[Sequence[int]] | None = None):
+        """Exclusion constraints of an item pool.
+        Items of an enemy group must not be administered in the same test:
+        as soon as one item of a group has been administered, all other items of the group are excluded.
+        Additionally, single items can be excluded,
+        e.g., because the participant has seen them in an earlier attempt.
+
+        The enemies of every item are stored in compressed sparse row format
+        (`enemy_pointers` and `enemy_indices`) and the excluded items as a boolean mask
+        indexed by the position of the items.
+        Administering an item therefore only updates the mask entries of its enemies.
+
+        Args:
+            item_ids (Sequence[int | None]): item ids (in the order of the item pool)
+            enemy_groups (Sequence[Sequence[int]] | None): groups of item ids that are enemies of each other
+
+        Raises:
+            ValueError: Raised if the item ids are not unique
+                or an enemy group contains an unknown item id.
+        """
+        if None in item_ids or len(set(item_ids)) != len(item_ids):
+            raise ValueError("The items need unique ids for item exclusions.")
+        self.item_ids = list(item_ids)
+        self.positions: dict[int, int] = {
+            item_id: position for position, item_id in enumerate(item_ids)  # type: ignore
+        }
+        self.enemy_groups = [list(group) for group in enemy_groups] if enemy_groups is not None else []
+
+        enemies: list[set[int]] = [set() for _ in self.item_ids]
+        for group in self.enemy_groups:
+            positions = self.__positions(group)
+            for position in positions:
+                enemies[position].update(positions)
+                enemies[position].discard(position)
+        counts = np.array([len(item_enemies) for item_enemies in enemies], dtype=np.int64)
+        self.enemy_pointers = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+        """Start of the enemies of every item in `enemy_indices`"""
+        self.enemy_indices = np.array([position for item_enemies in enemies for position in sorted(item_enemies)],
+                                      dtype=np.int64)
+        """Positions of the enemies of all items"""
+        self.excluded = np.zeros(len(self.item_ids), dtype=bool)
+        """Mask of the excluded items (indexed by item position)"""
+
+    def __positions(self, item_ids: Sequence[int]) -> list[int]:
+        try:
+            return [self.positions[item_id] for item_id in item_ids]
+        except KeyError as error:
+            raise ValueError(f"Item with id {error.args[0]} is not part of the item pool.")
+
+    @property
+    def available(self) -> np.ndarray:
+        """Mask of the items that may still be administered (indexed by item position)"""
+        return ~self.excluded
+
+    def enemies(self, item_id: int) -> np.ndarray:
+        """Positions of the enemies of an item.
+
+        Args:
+            item_id (int): item id
+
+        Returns:
+            np.ndarray: positions of the enemies (empty for unknown items)
+        """
+        position = self.positions.get(item_id)
+        if position is None:
+            return np.empty(0, dtype=np.int64)
+        return self.enemy_indices[self.enemy_pointers[position]:self.enemy_pointers[position + 1]]
+
+    def enemy_pairs(self, rows: np.ndarray, positions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Finds the enemies of several items at once,
+        e.g., the enemies of the items administered to many participants in a batch simulation.
+
+        Args:
+            rows (np.ndarray): row (participant) of every administered item
+            positions (np.ndarray): positions of the administered items
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: rows and positions of all enemies
+        """
+        starts = self.enemy_pointers[positions]
+        counts = self.enemy_pointers[positions + 1] - starts
+        offsets = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+        return np.repeat(rows, counts), self.enemy_indices[np.repeat(starts, counts) + offsets]
+
+    def exclude(self, item_ids: Sequence[int]) -> list[int]:
+        """Excludes items, e.g., items that the participant has seen in an earlier attempt.
+        Unknown item ids are ignored.
+
+        Args:
+            item_ids (Sequence[int]): ids of the excluded items
+
+        Returns:
+            list[int]: ids of the items that have not been excluded before
+        """
+        positions = np.array([self.positions[item_id] for item_id in item_ids if item_id in self.positions],
+                             dtype=np.int64)
+        return self.__exclude_positions(positions)
+
+    def administer(self, item_id: int) -> list[int]:
+        """Excludes an administered item and its enemies.
+
+        Args:
+            item_id (int): id of the administered item
+
+        Returns:
+            list[int]: ids of the enemies that have not been excluded before
+        """
+        position = self.positions.get(item_id)
+        if position is None:
+            return []
+        self.excluded[position] = True
+        return self.__exclude_positions(self.enemies(item_id))
+
+    def __exclude_positions(self, positions: np.ndarray) -> list[int]:
+        new_positions = np.unique(positions[~self.excluded[positions]])
+        self.excluded[new_positions] = True
+        return [self.item_ids[position] for position in new_positions.tolist()]  # type: ignore
+
+    def reset(self):
+        """Makes all items available again."""
+        self.excluded[:] = False
@@ -1,6 +1,10 @@
 from .__test_item import TestItem
-from typing import List, Tuple, cast
-from pandas import DataFrame
+from .__item_exclusions import ItemExclusions
+from typing import TYPE_CHECKING, List, Sequence, Tuple, cast
+import numpy as np
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
 
 
 class ItemPool:
@@ -21,6 +25,8 @@ class ItemPool:
         """
         self.test_items: List[TestItem] = test_items
         self.simulated_responses: List[int] | None = simulated_responses
+        self.exclusions: ItemExclusions | None = None
+        """Enemy groups and excluded items (see `set_enemy_groups` and `exclude_items`)"""
 
     def get_item_by_index(self, index: int) -> Tuple[TestItem, int] | TestItem:
         """Returns item and if defined the simulated response.
@@ -86,6 +92,63 @@ class ItemPool:
         # remove response at index
         if self.simulated_responses is not None:
             self.simulated_responses.pop(index)
+        # remove the enemies of the item
+        if self.exclusions is not None:
+            self.__remove_items(self.exclusions.administer(item.id))  # type: ignore
+
+    def set_enemy_groups(self, enemy_groups: Sequence[Sequence[int]]) -> None:
+        """Defines groups of enemy items.
+        Only one item of every group is administered in a test:
+        as soon as an item has been deleted from the item pool (i.e., administered),
+        all its enemies are deleted as well.
+        The items need unique ids.
+
+        Args:
+            enemy_groups (Sequence[Sequence[int]]): groups of item ids that are enemies of each other
+        """
+        excluded = [] if self.exclusions is None else [
+            self.exclusions.item_ids[position] for position in np.flatnonzero(self.exclusions.excluded)
+        ]
+        self.exclusions = ItemExclusions([item.id for item in self.test_items], enemy_groups)
+        self.exclusions.exclude(excluded)  # type: ignore
+
+    def exclude_items(self, item_ids: Sequence[int]) -> None:
+        """Deletes items that must not be administered,
+        e.g., because the participant has seen them in an earlier attempt.
+        The items need unique ids.
+
+        Args:
+            item_ids (Sequence[int]): ids of the items to exclude
+        """
+        if self.exclusions is None:
+            self.exclusions = ItemExclusions([item.id for item in self.test_items])
+        self.__remove_items(self.exclusions.exclude(item_ids))
+
+    def __remove_items(self, item_ids: list[int]) -> None:
+        if len(item_ids) == 0:
+            return
+        positions = self.exclusions.positions  # type: ignore
+        # the items keep the order of the exclusion index and are only moved forward by removed items,
+        # so that an item is searched between its position and its position minus the number of removed items
+        # (in descending order, so that removing an item does not move the remaining ones)
+        for item_id in sorted(item_ids, key=positions.__getitem__, reverse=True):
+            index = self.__index_of_id(item_id, positions[item_id])
+            if index is None:
+                continue
+            self.test_items.pop(index)
+            if self.simulated_responses is not None:
+                self.simulated_responses.pop(index)
+
+    def __index_of_id(self, item_id: int, position: int) -> int | None:
+        n_removed = len(self.exclusions.item_ids) - len(self.test_items)  # type: ignore
+        for index in range(min(position, len(self.test_items) - 1), max(position - n_removed, 0) - 1, -1):
+            if self.test_items[index].id == item_id:
+                return index
+        # the items have been reordered or removed without the item pool
+        for index, item in enumerate(self.test_items):
+            if item.id == item_id:
+                return index
+        return None
 
 # STATIC LOAD METHODS
     @staticmethod
@@ -244,7 +307,7 @@ class ItemPool:
         return item_pool
 
     @staticmethod
-    def load_from_dataframe(source: DataFrame) -> "ItemPool":
+    def load_from_dataframe(source: "DataFrame") -> "ItemPool":
         """Creates item pool from a pandas DataFrame.
         Required columns are: `a`, `b`.
         `c`, `d` are optional (ignored for polytomous items).
@@ -8,6 +8,8 @@ class ResultOutputFormat(Enum):
     """
     CSV = 1
     PICKLE = 2
+    COLUMNAR = 3
+    SQLITE = 4
 
 
 class StoppingCriterion(Enum):
@@ -0,0 +1,192 @@
+from multiprocessing.shared_memory import SharedMemory
+from typing import Sequence
+import sys
+import numpy as np
+from .__test_item import TestItem
+from .__item_bank import ItemBank
+
+
+class SharedItemBank:
+    def __init__(self,
+                 shared_memory: SharedMemory,
+                 ids: list[int | None],
+                 n_grid_points: int,
+                 owner: bool = False):
+        """Read-only item bank stored in a `multiprocessing.shared_memory` block.
+        The block contains the item parameters `a`, `b`, `c`, `d`,
+        an ability grid and the item information of every item at every grid point.
+        All attributes are read-only NumPy views of the shared block.
+
+        Instances are created with `SharedItemBank.create`.
+        When an instance is pickled, only the name of the block and the item ids are transferred.
+        Worker processes then attach to the existing block,
+        so that the memory usage does not grow with the number of workers.
+
+        The process that created the bank has to release the block
+        by calling `unlink` (or by using the bank as a context manager)
+        after all workers are finished.
+
+        Args:
+            shared_memory (SharedMemory): shared memory block
+            ids (list[int | None]): item ids
+            n_grid_points (int): number of points of the ability grid
+            owner (bool): whether this instance created the shared memory block
+        """
+        self.ids = ids
+        self.n_grid_points = n_grid_points
+        self.owner = owner
+        self.__shared_memory = shared_memory
+        self.__positions = {item_id: position for position, item_id in enumerate(ids)}
+
+        n_items = len(ids)
+        buffer = np.ndarray((SharedItemBank.buffer_size(n_items, n_grid_points),),
+                            dtype=np.float64,
+                            buffer=shared_memory.buf)
+        buffer.flags.writeable = False
+        self.a = buffer[0:n_items]
+        self.b = buffer[n_items:2 * n_items]
+        self.c = buffer[2 * n_items:3 * n_items]
+        self.d = buffer[3 * n_items:4 * n_items]
+        self.grid = buffer[4 * n_items:4 * n_items + n_grid_points]
+        self.information_table = buffer[4 * n_items + n_grid_points:].reshape(n_grid_points, n_items)
+
+    @staticmethod
+    def buffer_size(n_items: int, n_grid_points: int) -> int:
+        """Number of float64 values stored in the shared memory block.
+
+        Args:
+            n_items (int): number of items
+            n_grid_points (int): number of points of the ability grid
+
+        Returns:
+            int: number of values
+        """
+        return 4 * n_items + n_grid_points + n_grid_points * n_items
+
+    @staticmethod
+    def create(item_bank: ItemBank, grid: np.ndarray | None = None) -> "SharedItemBank":
+        """Publishes an item bank and its item information table
+        into a new shared memory block.
+
+        Args:
+            item_bank (ItemBank): item bank
+            grid (np.ndarray | None): strictly increasing ability grid used for the information table.
+                Defaults to 401 equally spaced points between -10 and 10.
+
+        Returns:
+            SharedItemBank: item bank that owns the shared memory block
+
+        Raises:
+            ValueError: Raised if the item ids are not unique or the grid is invalid.
+        """
+        if len(set(item_bank.ids)) != len(item_bank.ids):
+            raise ValueError("The items of a shared item bank need unique ids.")
+        grid = np.linspace(-10, 10, 401) if grid is None else np.asarray(grid, dtype=np.float64)
+        if grid.ndim != 1 or grid.shape[0] < 2 or np.any(np.diff(grid) <= 0):
+            raise ValueError("The grid has to contain at least two strictly increasing values.")
+
+        n_items = len(item_bank)
+        n_grid_points = grid.shape[0]
+        size = SharedItemBank.buffer_size(n_items, n_grid_points) * np.dtype(np.float64).itemsize
+        shared_memory = SharedMemory(create=True, size=max(size, 1))
+
+        buffer = np.ndarray((SharedItemBank.buffer_size(n_items, n_grid_points),),
+                            dtype=np.float64,
+                            buffer=shared_memory.buf)
+        buffer[:4 * n_items] = np.concatenate([item_bank.a, item_bank.b, item_bank.c, item_bank.d])
+        buffer[4 * n_items:4 * n_items + n_grid_points] = grid
+        buffer[4 * n_items + n_grid_points:] = item_bank.information(grid).ravel()
+        del buffer
+
+        return SharedItemBank(shared_memory, list(item_bank.ids), n_grid_points, owner=True)
+
+    @staticmethod
+    def attach(name: str, ids: list[int | None], n_grid_points: int) -> "SharedItemBank":
+        """Attaches to an existing shared item bank.
+
+        Args:
+            name (str): name of the shared memory block
+            ids (list[int | None]): item ids
+            n_grid_points (int): number of points of the ability grid
+
+        Returns:
+            SharedItemBank: item bank that does not own the shared memory block
+        """
+        if sys.version_info >= (3, 13):
+            # the block is released by the creating process
+            shared_memory = SharedMemory(name=name, create=False, track=False)
+        else:
+            shared_memory = SharedMemory(name=name, create=False)
+        return SharedItemBank(shared_memory, ids, n_grid_points)
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block"""
+        return self.__shared_memory.name
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __reduce__(self):
+        return (SharedItemBank.attach, (self.name, self.ids, self.n_grid_points))
+
+    def __enter__(self) -> "SharedItemBank":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+        if self.owner:
+            self.unlink()
+
+    def __del__(self):
+        if "_SharedItemBank__shared_memory" in self.__dict__:
+            self.close()
+
+    def close(self):
+        """Closes the access to the shared memory block.
+        Afterwards, the item parameters and information cannot be accessed anymore.
+        """
+        for attribute in ["a", "b", "c", "d", "grid", "information_table"]:
+            self.__dict__.pop(attribute, None)
+        self.__shared_memory.close()
+
+    def unlink(self):
+        """Releases the shared memory block.
+        Only the process that created the bank should call this method.
+        """
+        self.__shared_memory.unlink()
+
+    def positions(self, items: Sequence[TestItem]) -> np.ndarray:
+        """Positions of the items in the bank.
+
+        Args:
+            items (Sequence[TestItem]): test items
+
+        Returns:
+            np.ndarray: positions
+
+        Raises:
+            ValueError: Raised if an item is not part of the bank.
+        """
+        try:
+            return np.array([self.__positions[item.id] for item in items], dtype=np.intp)
+        except KeyError as e:
+            raise ValueError(f"Item with id {e} is not part of the shared item bank.")
+
+    def information(self, abilities: np.ndarray, positions: np.ndarray | None = None) -> np.ndarray:
+        """Item information for every ability level and item.
+        The values are linearly interpolated from the information table.
+        Ability levels outside the grid are set to the closest grid point.
+
+        Args:
+            abilities (np.ndarray): ability levels with shape `(n,)`
+            positions (np.ndarray | None): positions of the items. Defaults to all items.
+
+        Returns:
+            np.ndarray: item information with shape `(n, n_items)`
+        """
+        table = self.information_table if positions is None else self.information_table[:, positions]
+        mu = np.clip(np.asarray(abilities, dtype=np.float64).reshape(-1), self.grid[0], self.grid[-1])
+        lower = np.clip(np.searchsorted(self.grid, mu, side="right") - 1, 0, self.n_grid_points - 2)
+        weight = ((mu - self.grid[lower]) / (self.grid[lower + 1] - self.grid[lower])).reshape(-1, 1)
+        return table[lower] * (1.0 - weight) + table[lower + 1] * weight
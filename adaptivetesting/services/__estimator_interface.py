@@ -1,15 +1,19 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple, cast, Literal
+from typing import TYPE_CHECKING, List, Tuple, cast, Literal
 import numpy as np
 from ..models.__test_item import TestItem
 
+if TYPE_CHECKING:
+    from ..math.estimators.__functions.__diagnostics import EstimationDiagnostics
+
 
 class IEstimator(ABC):
     def __init__(self,
                  response_pattern: List[int] | np.ndarray,
                  items: list[TestItem],
                  optimization_interval: Tuple[float, float] = (-10, 10),
-                 model: Literal["GRM", "GPCM"] | None = None):
+                 model: Literal["GRM", "GPCM"] | None = None,
+                 collect_diagnostics: bool = False):
         """This is the interface required for every possible
         estimator.
         Any estimator inherits from this class and implements
@@ -19,12 +23,18 @@ class IEstimator(ABC):
             response_pattern (List[int]): list of responses (0: wrong, 1:right)
             items (list[TestItem]): list of answered items
             model: model type. Required for polytomous IRT models.
+            collect_diagnostics (bool): collect the convergence diagnostics of the estimates
+                in `diagnostics`. Defaults to False.
         """
         if type(response_pattern) is not np.ndarray:
             self.response_pattern = np.array(response_pattern)
         else:
             self.response_pattern = response_pattern
         self.optimization_interval = optimization_interval
+        self.collect_diagnostics = collect_diagnostics
+        self.diagnostics: list["EstimationDiagnostics"] = []
+        """Convergence diagnostics of the estimates calculated by `get_estimation`
+        (empty if `collect_diagnostics` is False or the estimator does not provide them)"""
 
         # decide type of model used
         if all([isinstance(item.b, list) for item in items]):
@@ -38,6 +48,12 @@ class IEstimator(ABC):
             self.c = np.array([i.c for i in items_t])
             self.d = np.array([i.d for i in items_t])
         
+    @property
+    def requested_diagnostics(self) -> list["EstimationDiagnostics"] | None:
+        """List passed as `diagnostics` to the estimation functions
+        (None if the diagnostics are not collected)"""
+        return self.diagnostics if self.collect_diagnostics else None
+
     @abstractmethod
     def get_estimation(self) -> float:
         """Get the currently estimated ability.
@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from ..models.__test_item import TestItem
+
+
+class IExposureCounter(ABC):
+    """Interface for stores counting how often items
+    and constraints have been administered across tests.
+    The counts are updated when the results of a test are saved
+    (or directly after every administration)
+    and are used to perform exposure control without reading previous test results.
+    """
+
+    def on_item_administered(self, item: TestItem) -> None:
+        """Called by the adaptive test directly after an item has been administered.
+        Stores that count live exposures override this method.
+        By default, nothing is done.
+
+        Args:
+            item (TestItem): administered item
+        """
+        pass
+
+    @abstractmethod
+    def record(self, participant_id: str, items: list[dict]) -> None:
+        """Adds the administered items of a test to the counts.
+
+        Args:
+            participant_id (str): participant id
+            items (list[dict]): administered items (`TestItem.as_dict`)
+        """
+        pass
+
+    @abstractmethod
+    def constraint_counts(self, constraint_names: list[str]) -> dict[str, int]:
+        """Number of administered items for every constraint.
+
+        Args:
+            constraint_names (list[str]): constraint names
+
+        Returns:
+            dict[str, int]: number of administered items (key: constraint name)
+        """
+        pass
+
+    @abstractmethod
+    def item_counts(self) -> dict[int, int]:
+        """Number of administrations of every item.
+
+        Returns:
+            dict[int, int]: number of administrations (key: item id)
+        """
+        pass
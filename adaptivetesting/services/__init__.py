@@ -1,3 +1,5 @@
 from .__test_results_interface import ITestResults
 from .__estimator_interface import IEstimator
 from .__item_selection_protocol import ItemSelectionStrategy
+from .__exposure_counter_interface import IExposureCounter
+from .__session_store_interface import ISessionStore
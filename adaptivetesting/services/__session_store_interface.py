@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+
+
+class ISessionStore(ABC):
+    """Interface for stores keeping the snapshots of idle sessions
+    (`SessionSnapshot.to_bytes`) outside of the memory.
+    """
+
+    @abstractmethod
+    def save(self, session_id: str, snapshot: bytes) -> None:
+        """Saves the snapshot of a session.
+        A previously saved snapshot of the session is replaced.
+
+        Args:
+            session_id (str): session id
+            snapshot (bytes): serialized snapshot
+        """
+        pass
+
+    @abstractmethod
+    def load(self, session_id: str) -> bytes | None:
+        """Loads the snapshot of a session.
+
+        Args:
+            session_id (str): session id
+
+        Returns:
+            bytes | None: serialized snapshot or None if the session is not stored
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, session_id: str) -> None:
+        """Deletes the snapshot of a session.
+
+        Args:
+            session_id (str): session id
+        """
+        pass
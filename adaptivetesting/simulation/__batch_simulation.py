@@ -0,0 +1,235 @@
+from typing import Sequence, Type
+import numpy as np
+from ..models.__item_pool import ItemPool
+from ..models.__item_bank import ItemBank
+from ..models.__item_exclusions import ItemExclusions
+from ..models.__test_result import TestResult
+from ..models.__misc import ResultOutputFormat, StoppingCriterion
+from ..services.__estimator_interface import IEstimator
+from ..implementations.__test_assembler import EstimatorArgs
+from ..math.__gen_response_pattern import generate_response_pattern, generate_response_matrix
+from ..math.estimators.__batch_estimation import BatchEstimator
+from .__simulation import create_test_results_context
+
+
+class BatchSimulation:
+    def __init__(self,
+                 item_pool: ItemPool,
+                 simulation_id: str,
+                 participant_ids: list[str],
+                 true_ability_levels: list[float] | np.ndarray,
+                 ability_estimator: Type[IEstimator],
+                 estimator_args: EstimatorArgs | None = None,
+                 test_result_output: ResultOutputFormat = ResultOutputFormat.CSV,
+                 initial_ability_level: float = 0,
+                 simulated_responses: np.ndarray | None = None,
+                 seeds: Sequence[int | None] | None = None,
+                 seed: int | None = None,
+                 excluded_item_ids: Sequence[Sequence[int]] | None = None):
+        """
+        This class can be used for simulating CAT for many participants at once.
+        All participants advance through the test in lock step.
+        In every step, the item information is calculated as
+        (participants x items) matrix, the next items are selected using the
+        maximum information criterion and the ability levels are updated with a batched estimator.
+        Participants drop out as soon as the stopping criteria are met.
+
+        Enemy groups of the item pool (`ItemPool.set_enemy_groups`) are respected:
+        after an item has been administered, its enemies are removed from the available items of the participant.
+
+        Only dichotomous items and the estimators `MLEstimator`, `BayesModal` and
+        `ExpectedAPosteriori` are supported.
+        For small cases, the results match the results of `TestAssembler` simulated with `Simulation`.
+
+        Args:
+            item_pool (ItemPool): item pool used for all participants
+            simulation_id (str): simulation id
+            participant_ids (list[str]): participant ids
+            true_ability_levels (list[float] | np.ndarray): true ability level of every participant
+            ability_estimator (Type[IEstimator]): The estimator class used for ability estimation.
+            estimator_args (EstimatorArgs, optional): Arguments for the ability estimator.
+                Defaults to {"prior": None, "optimization_interval": (-10, 10)}.
+            test_result_output (ResultOutputFormat): test results output format. Defaults to CSV.
+            initial_ability_level (float): initially assumed ability level. Defaults to 0.
+            simulated_responses (np.ndarray, optional): simulated responses with shape (participants x items).
+                If not set, the simulated responses of the item pool are used for all participants.
+                If these are not set either, responses are generated for the true ability levels.
+            seeds (Sequence[int | None], optional): Seed for every participant.
+                The responses are then generated in the same way as for a single `AdaptiveTest`.
+            seed (int, optional): Seed used to generate the response matrix for all participants at once.
+            excluded_item_ids (Sequence[Sequence[int]], optional): ids of the items
+                that must not be administered to every participant
+                (e.g., items seen in an earlier attempt).
+        """
+        if len(participant_ids) != len(true_ability_levels):
+            raise ValueError("Length of participant_ids and true_ability_levels has to be the same.")
+
+        self.item_bank = ItemBank.from_item_pool(item_pool)
+        self.simulation_id = simulation_id
+        self.participant_ids = participant_ids
+        self.true_ability_levels = np.asarray(true_ability_levels, dtype=np.float64)
+        self.ability_estimator = ability_estimator
+        self.estimator_args: EstimatorArgs = estimator_args if estimator_args is not None else {
+            "prior": None,
+            "optimization_interval": (-10, 10),
+            "model": None
+        }
+        self.test_result_output = test_result_output
+        self.initial_ability_level = initial_ability_level
+
+        n_participants = len(participant_ids)
+        # set simulated responses
+        if simulated_responses is not None:
+            self.simulated_responses = np.asarray(simulated_responses, dtype=int)
+        elif item_pool.simulated_responses is not None:
+            self.simulated_responses = np.tile(np.asarray(item_pool.simulated_responses, dtype=int),
+                                               (n_participants, 1))
+        elif seeds is not None:
+            if len(seeds) != n_participants:
+                raise ValueError("Length of seeds and participant_ids has to be the same.")
+            self.simulated_responses = np.array([
+                generate_response_pattern(float(ability), self.item_bank.items, seed=participant_seed)
+                for ability, participant_seed in zip(self.true_ability_levels, seeds)
+            ], dtype=int).reshape(n_participants, len(self.item_bank))
+        else:
+            self.simulated_responses = generate_response_matrix(self.true_ability_levels,
+                                                                self.item_bank.items,
+                                                                seed=seed)
+
+        if self.simulated_responses.shape != (n_participants, len(self.item_bank)):
+            raise ValueError("simulated_responses has to be of shape (participants x items).")
+
+        # exclusion constraints
+        self.exclusions: ItemExclusions | None = None
+        if item_pool.exclusions is not None:
+            ids = set(self.item_bank.ids)
+            self.exclusions = ItemExclusions(
+                self.item_bank.ids,
+                [[item_id for item_id in group if item_id in ids] for group in item_pool.exclusions.enemy_groups]
+            )
+        if excluded_item_ids is not None and len(excluded_item_ids) != n_participants:
+            raise ValueError("Length of excluded_item_ids and participant_ids has to be the same.")
+        self.excluded_item_ids = excluded_item_ids
+
+        # state
+        self.ability_levels = np.full(n_participants, float(initial_ability_level))
+        self.standard_errors = np.full(n_participants, float("NaN"))
+        self.test_lengths = np.zeros(n_participants, dtype=np.intp)
+        self.__steps: list[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = []
+        self.__test_results: dict[str, list[TestResult]] | None = None
+
+    def simulate(self,
+                 criterion: StoppingCriterion | list[StoppingCriterion] = StoppingCriterion.SE,
+                 value: float | list[float | int] = 0.4):
+        """
+        Runs the simulation until the specified stopping criterion or criteria
+        are met for every participant.
+
+        Args:
+            criterion (StoppingCriterion | list[StoppingCriterion]):
+                The stopping criterion or list of criteria to determine when the test should stop.
+                Supported values are StoppingCriterion.SE (standard error) and StoppingCriterion.LENGTH (test length).
+
+            value (float | list[float | int]):
+                The threshold value(s) for the stopping criterion. For SE, this is the maximum allowed standard error.
+                For LENGTH, this is the maximum number of items administered.
+        """
+        criteria = criterion if isinstance(criterion, list) else [criterion]
+        values = value if isinstance(value, list) else [value]
+
+        n_participants = len(self.participant_ids)
+        n_items = len(self.item_bank)
+        # determine the maximum test length to allocate the estimator state
+        max_length = n_items
+        for c, v in zip(criteria, values):
+            if c == StoppingCriterion.LENGTH:
+                max_length = min(max_length, max(int(np.ceil(v)), 1))
+
+        estimator = BatchEstimator.from_estimator(
+            self.ability_estimator,
+            self.item_bank.a,
+            self.item_bank.b,
+            self.item_bank.c,
+            self.item_bank.d,
+            n_examinees=n_participants,
+            max_length=max_length,
+            prior=self.estimator_args.get("prior"),
+            optimization_interval=self.estimator_args.get("optimization_interval", (-10, 10))
+        )
+
+        available = np.ones((n_participants, n_items), dtype=bool)
+        if self.excluded_item_ids is not None:
+            positions = {item_id: position for position, item_id in enumerate(self.item_bank.ids)}
+            for participant, item_ids in enumerate(self.excluded_item_ids):
+                available[participant, [positions[item_id] for item_id in item_ids if item_id in positions]] = False
+        active = available.any(axis=1)
+
+        while np.any(active):
+            rows = np.flatnonzero(active)
+
+            # select the most informative available item for every participant
+            information = self.item_bank.information(self.ability_levels[rows])
+            information[~available[rows]] = -np.inf
+            selected_items = np.argmax(information, axis=1)
+            available[rows, selected_items] = False
+            if self.exclusions is not None:
+                available[self.exclusions.enemy_pairs(rows, selected_items)] = False
+
+            # get responses and update estimations
+            responses = self.simulated_responses[rows, selected_items]
+            estimator.add_responses(rows, selected_items, responses)
+            estimations, standard_errors = estimator.estimate(rows)
+            self.ability_levels[rows] = estimations
+            self.standard_errors[rows] = standard_errors
+            self.test_lengths[rows] += 1
+
+            self.__steps.append((rows, selected_items, responses, estimations, standard_errors))
+
+            # check stopping criteria
+            stop = ~available[rows].any(axis=1)
+            for c, v in zip(criteria, values):
+                if c == StoppingCriterion.SE:
+                    stop |= standard_errors <= v
+                elif c == StoppingCriterion.LENGTH:
+                    stop |= self.test_lengths[rows] >= v
+            active[rows[stop]] = False
+
+        self.__test_results = None
+
+    @property
+    def test_results(self) -> dict[str, list[TestResult]]:
+        """Test results of every participant (key: participant id)."""
+        if self.__test_results is None:
+            test_results: dict[str, list[TestResult]] = {
+                participant_id: [] for participant_id in self.participant_ids
+            }
+            item_dicts = [item.as_dict() for item in self.item_bank.items]
+            for rows, selected_items, responses, estimations, standard_errors in self.__steps:
+                for row, item_index, response, estimation, standard_error in zip(
+                        rows.tolist(),
+                        selected_items.tolist(),
+                        responses.tolist(),
+                        estimations.tolist(),
+                        standard_errors.tolist()):
+                    test_results[self.participant_ids[row]].append(TestResult(
+                        ability_estimation=float(estimation),
+                        standard_error=float(standard_error),
+                        showed_item=item_dicts[item_index],
+                        response=int(response),
+                        test_id=self.simulation_id,
+                        true_ability_level=float(self.true_ability_levels[row])
+                    ))
+            self.__test_results = test_results
+        return self.__test_results
+
+    def save_test_results(self):
+        """Saves the test results of every participant to the specified output format."""
+        for participant_id, test_results in self.test_results.items():
+            if len(test_results) == 0:
+                continue
+            data_context = create_test_results_context(
+                self.test_result_output,
+                simulation_id=self.simulation_id,
+                participant_id=participant_id
+            )
+            data_context.save(test_results)
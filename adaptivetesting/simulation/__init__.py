@@ -2,4 +2,13 @@ from .__simulation import (
     Simulation,
     setup_simulation_and_start,
     SimulationPool
-)
\ No newline at end of file
+)
+from .__batch_simulation import BatchSimulation
+from .__spec_simulation_pool import (
+    SimulationSpec,
+    SpecSimulationPool,
+    initialize_spec_worker,
+    run_simulation_specs,
+    chunk_specs
+)
+from .__sympson_hetter_calibration import calibrate_sympson_hetter, simulate_sympson_hetter_round
@@ -1,8 +1,12 @@
 from ..models.__adaptive_test import AdaptiveTest
 from ..data.__csv_context import CSVContext
 from ..data.__pickle_context import PickleContext
+from ..data.__columnar_context import ColumnarContext
+from ..data.__sqlite_context import SQLiteContext
+from ..data.__shared_exposure_counter import SharedExposureCounter
 from ..services.__test_results_interface import ITestResults
 from ..models.__misc import ResultOutputFormat, StoppingCriterion
+from ..models.__instrumentation import Instrumentation
 from functools import partial
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from tqdm import tqdm
@@ -12,16 +16,20 @@ import platform
 class Simulation:
     def __init__(self,
                  test: AdaptiveTest,
-                 test_result_output: ResultOutputFormat):
+                 test_result_output: ResultOutputFormat,
+                 instrumentation: Instrumentation | None = None):
         """
         This class can be used for simulating CAT.
 
         Args:
             test (AdaptiveTest): instance of an adaptive test implementation (see implementations module)
             test_result_output (ResultOutputFormat): test results output format
+            instrumentation (Instrumentation | None): collects the duration of the phases of every step
+                and further counters while the simulation is running. Defaults to None.
         """
         self.test = test
         self.test_result_output = test_result_output
+        self.instrumentation = instrumentation
 
     def simulate(self,
                  criterion: StoppingCriterion | list[StoppingCriterion] = StoppingCriterion.SE,
@@ -39,43 +47,77 @@ class Simulation:
                 For LENGTH, this is the maximum number of items administered.
 
         """
+        if self.instrumentation is not None:
+            with self.instrumentation.activate():
+                self.__simulate(criterion, value)
+        else:
+            self.__simulate(criterion, value)
+
+    def __simulate(self,
+                   criterion: StoppingCriterion | list[StoppingCriterion],
+                   value: float | list[float | int]):
         stop_test = False
         while not stop_test:
             # run test
             self.test.run_test_once()
-            # check available items
-            if len(self.test.item_pool.test_items) == 0:
-                stop_test = True
-            else:
-                # Support both single criterion and list of criteria/values
-                criteria = criterion if isinstance(criterion, list) else [criterion]
-                values = value if isinstance(value, list) else [value]
-                stop_test = any(
-                    self.test.check_se_criterion(v) if c == StoppingCriterion.SE
-                    else self.test.check_length_criterion(v) if c == StoppingCriterion.LENGTH
-                    else False
-                    for c, v in zip(criteria, values)
-                )
+            stop_test = self.test.check_stopping_criteria(criterion, value)
 
     def save_test_results(self):
         """Saves the test results to the specified output format."""
-        data_context: ITestResults
-        if self.test_result_output == ResultOutputFormat.PICKLE:
-            data_context = PickleContext(simulation_id=self.test.simulation_id,
-                                         participant_id=self.test.participant_id)
-        else:
-            data_context = CSVContext(
-                simulation_id=self.test.simulation_id,
-                participant_id=self.test.participant_id
-            )
+        data_context = create_test_results_context(
+            self.test_result_output,
+            simulation_id=self.test.simulation_id,
+            participant_id=self.test.participant_id
+        )
         # save results
         data_context.save(self.test.test_results)
+        # update the exposure counts
+        if self.test.exposure_counter is not None:
+            self.test.exposure_counter.record(
+                self.test.participant_id,
+                [result.showed_item for result in self.test.test_results]
+            )
+
+
+def create_test_results_context(test_result_output: ResultOutputFormat,
+                                simulation_id: str,
+                                participant_id: str) -> ITestResults:
+    """
+    Creates the data context used to save the test results
+    in the specified output format.
+    CSV is used if the output format is not recognized.
+
+    Args:
+        test_result_output (ResultOutputFormat): test results output format
+        simulation_id (str): simulation id
+        participant_id (str): participant id
+
+    Returns:
+        ITestResults: data context
+    """
+    data_context: ITestResults
+    if test_result_output == ResultOutputFormat.PICKLE:
+        data_context = PickleContext(simulation_id=simulation_id,
+                                     participant_id=participant_id)
+    elif test_result_output == ResultOutputFormat.COLUMNAR:
+        data_context = ColumnarContext(simulation_id=simulation_id,
+                                       participant_id=participant_id)
+    elif test_result_output == ResultOutputFormat.SQLITE:
+        data_context = SQLiteContext(simulation_id=simulation_id,
+                                     participant_id=participant_id)
+    else:
+        data_context = CSVContext(
+            simulation_id=simulation_id,
+            participant_id=participant_id
+        )
+    return data_context
 
 
 def setup_simulation_and_start(test: AdaptiveTest,
                                test_result_output: ResultOutputFormat,
                                criterion: StoppingCriterion | list[StoppingCriterion],
-                               value: float):
+                               value: float,
+                               instrumented: bool = False) -> Instrumentation | None:
     """
     Sets up and runs a simulation for an adaptive test, then saves the results.
 
@@ -86,13 +128,19 @@ def setup_simulation_and_start(test: AdaptiveTest,
             The criterion used to determine when the simulation should stop.
         value (float):
             The value associated with the stopping criterion (e.g., maximum number of items, target standard error).
+        instrumented (bool): whether the simulation is instrumented. Defaults to False.
+
+    Returns:
+        Instrumentation | None: measurements of the simulation (None if not instrumented)
     """
     simulation = Simulation(test=test,
-                            test_result_output=test_result_output)
+                            test_result_output=test_result_output,
+                            instrumentation=Instrumentation() if instrumented else None)
     simulation.simulate(criterion=criterion,
                         value=value)
     # save results
     simulation.save_test_results()
+    return simulation.instrumentation
 
 
 class SimulationPool:
@@ -100,7 +148,8 @@ class SimulationPool:
                  adaptive_tests: list[AdaptiveTest],
                  test_result_output: ResultOutputFormat,
                  criterion: StoppingCriterion | list[StoppingCriterion] = StoppingCriterion.SE,
-                 value: float = 0.4):
+                 value: float = 0.4,
+                 instrumentation: Instrumentation | None = None):
         """
         A pool manager for running multiple adaptive test simulations in parallel.
         
@@ -111,11 +160,15 @@ class SimulationPool:
                 Stopping criterion or list of criteria for the simulations.
             
             value (float): Value associated with the stopping criterion (default is 0.4).
+
+            instrumentation (Instrumentation | None): collects the measurements of all simulations.
+                Every worker instruments its simulations and the results are merged. Defaults to None.
         """
         self.adaptive_tests = adaptive_tests
         self.test_results_output = test_result_output
         self.criterion = criterion
         self.value = value
+        self.instrumentation = instrumentation
         
     def start(self, parallel: bool = True):
         """
@@ -138,26 +191,36 @@ class SimulationPool:
                 setup_simulation_and_start,
                 test_result_output=self.test_results_output,
                 criterion=self.criterion,
-                value=self.value
+                value=self.value,
+                instrumented=self.instrumentation is not None
             )
             # check for platform
             # this is because multiprocessing is not as well-supported on windows
             # therefore, multithreading is used instead
             if platform.system() == "Windows":
                 with ThreadPoolExecutor(max_workers=60) as executor:
-                    futures = [executor.submit(func, (test,)) for test in self.adaptive_tests]
-                    for _ in tqdm(as_completed(futures), total=len(futures)):
-                        pass
+                    futures = [executor.submit(func, test) for test in self.adaptive_tests]
+                    for future in tqdm(as_completed(futures), total=len(futures)):
+                        self.__merge(future.result())
             else:
-                with ProcessPoolExecutor() as executor:
-                    futures = [executor.submit(func, (test,)) for test in self.adaptive_tests]
-                    for _ in tqdm(as_completed(futures), total=len(futures)):
-                        pass
+                # the locks of shared exposure counters are passed to the workers on creation
+                counters = {test.exposure_counter.name: test.exposure_counter for test in self.adaptive_tests
+                            if isinstance(test.exposure_counter, SharedExposureCounter)}
+                with ProcessPoolExecutor(initializer=SharedExposureCounter.install,
+                                         initargs=(list(counters.values()),)) as executor:
+                    futures = [executor.submit(func, test) for test in self.adaptive_tests]
+                    for future in tqdm(as_completed(futures), total=len(futures)):
+                        self.__merge(future.result())
         else:
             for test in tqdm(self.adaptive_tests):
-                setup_simulation_and_start(
+                self.__merge(setup_simulation_and_start(
                     test=test,
                     test_result_output=self.test_results_output,
                     criterion=self.criterion,
-                    value=self.value
-                )
+                    value=self.value,
+                    instrumented=self.instrumentation is not None
+                ))
+
+    def __merge(self, instrumentation: Instrumentation | None):
+        if self.instrumentation is not None and instrumentation is not None:
+            self.instrumentation.merge(instrumentation)
@@ -0,0 +1,202 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from itertools import islice
+from tqdm import tqdm
+import platform
+from ..models.__adaptive_test import AdaptiveTest
+from ..models.__item_pool import ItemPool
+from ..models.__misc import ResultOutputFormat, StoppingCriterion
+from .__simulation import setup_simulation_and_start
+
+
+@dataclass
+class SimulationSpec:
+    """Compact description of a single simulated participant"""
+    participant_id: str
+    """Participant id"""
+    true_ability_level: float
+    """True ability level of the participant"""
+    seed: int | None = None
+    """Seed used to generate the responses of the participant"""
+
+
+# state of a worker process (set once by the initializer)
+_worker_state: dict[str, Any] = {}
+
+
+def initialize_spec_worker(item_pool: ItemPool,
+                           test_factory: Callable[..., AdaptiveTest],
+                           simulation_id: str,
+                           test_result_output: ResultOutputFormat,
+                           criterion: StoppingCriterion | list[StoppingCriterion],
+                           value: float | list[float | int]):
+    """
+    Initializes a worker of the `SpecSimulationPool`.
+    The item pool and the test factory are stored in the worker,
+    so that they only have to be transferred once per worker.
+
+    Args:
+        item_pool (ItemPool): item pool used for all tests
+        test_factory (Callable[..., AdaptiveTest]): callable creating the adaptive test of a participant
+        simulation_id (str): simulation id
+        test_result_output (ResultOutputFormat): test results output format
+        criterion (StoppingCriterion | list[StoppingCriterion]): stopping criterion or criteria
+        value (float | list[float | int]): value(s) associated with the stopping criterion
+    """
+    _worker_state["item_pool"] = item_pool
+    _worker_state["test_factory"] = test_factory
+    _worker_state["simulation_id"] = simulation_id
+    _worker_state["test_result_output"] = test_result_output
+    _worker_state["criterion"] = criterion
+    _worker_state["value"] = value
+
+
+def run_simulation_specs(specs: list[SimulationSpec]) -> int:
+    """
+    Creates and simulates the adaptive tests of a chunk of specs
+    inside an initialized worker (see `initialize_spec_worker`).
+    The results are saved for every participant.
+
+    Args:
+        specs (list[SimulationSpec]): specs of the participants
+
+    Returns:
+        int: number of simulated participants
+    """
+    for spec in specs:
+        test = _worker_state["test_factory"](
+            item_pool=_worker_state["item_pool"],
+            simulation_id=_worker_state["simulation_id"],
+            participant_id=spec.participant_id,
+            true_ability_level=spec.true_ability_level,
+            seed=spec.seed
+        )
+        setup_simulation_and_start(
+            test=test,
+            test_result_output=_worker_state["test_result_output"],
+            criterion=_worker_state["criterion"],
+            value=_worker_state["value"]
+        )
+    return len(specs)
+
+
+def chunk_specs(specs: Iterable[SimulationSpec], chunk_size: int) -> Iterator[list[SimulationSpec]]:
+    """
+    Splits the specs into chunks.
+
+    Args:
+        specs (Iterable[SimulationSpec]): specs of the participants
+        chunk_size (int): maximum number of specs in one chunk
+
+    Returns:
+        Iterator[list[SimulationSpec]]: chunks of specs
+    """
+    iterator = iter(specs)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+class SpecSimulationPool:
+    def __init__(self,
+                 item_pool: ItemPool,
+                 test_factory: Callable[..., AdaptiveTest],
+                 specs: list[SimulationSpec],
+                 simulation_id: str,
+                 test_result_output: ResultOutputFormat,
+                 criterion: StoppingCriterion | list[StoppingCriterion] = StoppingCriterion.SE,
+                 value: float | list[float | int] = 0.4,
+                 chunk_size: int = 64,
+                 max_workers: int | None = None):
+        """
+        A pool manager for running many adaptive test simulations in parallel
+        that share the same item pool.
+        In contrast to `SimulationPool`, the tests are not created upfront.
+        The item pool and the test factory are sent to every worker only once.
+        Afterwards, only compact specs (participant id, true ability level and seed)
+        are sent to the workers in chunks. The workers create the tests locally.
+
+        The test factory is called with the keyword arguments
+        `item_pool`, `simulation_id`, `participant_id`, `true_ability_level` and `seed`.
+        Therefore, it can be created using `functools.partial`, e.g.
+        `partial(TestAssembler, ability_estimator=MLEstimator)`.
+        For parallel processing, the factory has to be picklable.
+
+        Args:
+            item_pool (ItemPool): item pool used for all tests
+            test_factory (Callable[..., AdaptiveTest]): callable creating the adaptive test of a participant
+            specs (list[SimulationSpec]): specs of the participants
+            simulation_id (str): simulation id
+            test_result_output (ResultOutputFormat): Format for outputting test results.
+            criterion (StoppingCriterion | list[StoppingCriterion]):
+                Stopping criterion or list of criteria for the simulations.
+            value (float | list[float | int]): Value associated with the stopping criterion (default is 0.4).
+            chunk_size (int): number of specs sent to a worker at once. Defaults to 64.
+            max_workers (int | None): maximum number of workers.
+                If `None`, the default of the executor is used.
+
+        Raises:
+            ValueError: chunk_size or max_workers is smaller than 1
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size has to be at least 1.")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers has to be at least 1.")
+
+        self.item_pool = item_pool
+        self.test_factory = test_factory
+        self.specs = specs
+        self.simulation_id = simulation_id
+        self.test_results_output = test_result_output
+        self.criterion = criterion
+        self.value = value
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+
+    def start(self, parallel: bool = True):
+        """
+        Starts the simulation of all specs.
+
+        Depending on the operating system, uses either multithreading (on Windows)
+        or multiprocessing (on other platforms).
+        Progress is displayed using a progress bar.
+
+        Note that parallel processing is not supported for the use in jupyter notebooks.
+        For that, `parallel` has to be set to `False`.
+
+        Args:
+            parallel (bool): process all simulations in parallel. Not supported in jupyter notebooks.
+                Default `True`.
+        """
+        initargs = (
+            self.item_pool,
+            self.test_factory,
+            self.simulation_id,
+            self.test_results_output,
+            self.criterion,
+            self.value
+        )
+        chunks = chunk_specs(self.specs, self.chunk_size)
+
+        if parallel:
+            executor: Executor
+            # multiprocessing is not as well-supported on windows
+            # therefore, multithreading is used instead
+            if platform.system() == "Windows":
+                executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                              initializer=initialize_spec_worker,
+                                              initargs=initargs)
+            else:
+                executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                               initializer=initialize_spec_worker,
+                                               initargs=initargs)
+            with executor:
+                futures = [executor.submit(run_simulation_specs, chunk) for chunk in chunks]
+                with tqdm(total=len(self.specs)) as progress:
+                    for future in as_completed(futures):
+                        progress.update(future.result())
+        else:
+            initialize_spec_worker(*initargs)
+            with tqdm(total=len(self.specs)) as progress:
+                for chunk in chunks:
+                    progress.update(run_simulation_specs(chunk))
@@ -0,0 +1,183 @@
+from typing import Type
+import numpy as np
+from ..models.__item_pool import ItemPool
+from ..models.__item_bank import ItemBank
+from ..services.__estimator_interface import IEstimator
+from ..implementations.__test_assembler import EstimatorArgs
+from ..math.__gen_response_pattern import generate_response_matrix
+from ..math.estimators.__batch_estimation import BatchEstimator
+from ..math.exposure_control.__sympson_hetter import SympsonHetterParameters
+
+
+def simulate_sympson_hetter_round(item_bank: ItemBank,
+                                  exposure_parameters: np.ndarray,
+                                  intervals: np.ndarray,
+                                  responses: np.ndarray,
+                                  test_length: int,
+                                  estimator: BatchEstimator,
+                                  initial_ability_level: float,
+                                  rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+    """Simulates fixed length tests for all simulees at once
+    using maximum information item selection with Sympson-Hetter exposure control.
+
+    Args:
+        item_bank (ItemBank): item bank
+        exposure_parameters (np.ndarray): exposure control parameters with shape `(n_intervals, n_items)`
+        intervals (np.ndarray): ability interval of every simulee
+        responses (np.ndarray): simulated responses with shape `(n_simulees, n_items)`
+        test_length (int): test length
+        estimator (BatchEstimator): batch estimator of the simulees (without responses)
+        initial_ability_level (float): initially assumed ability level
+        rng (np.random.Generator): random number generator for the acceptance tests
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: number of times every item has been selected
+            and administered per ability interval (shape `(n_intervals, n_items)`)
+    """
+    n_simulees, n_items = responses.shape
+    rows = np.arange(n_simulees)
+    ability_levels = np.full(n_simulees, float(initial_ability_level))
+    administered_items = np.zeros((n_simulees, n_items), dtype=bool)
+    # items that have been neither administered nor rejected
+    available = np.ones((n_simulees, n_items), dtype=bool)
+    selected_counts = np.zeros(exposure_parameters.shape, dtype=np.int64)
+    administered_counts = np.zeros(exposure_parameters.shape, dtype=np.int64)
+
+    for _ in range(min(test_length, n_items)):
+        # rejected items become available again if no other item is left
+        exhausted = ~available.any(axis=1)
+        available[exhausted] = ~administered_items[exhausted]
+
+        information = item_bank.information(ability_levels)
+        information[~available] = -np.inf
+        order = np.argsort(-information, axis=1, kind="stable")
+        available_in_order = np.take_along_axis(available, order, axis=1)
+
+        # acceptance tests in the order of the item information
+        parameters_in_order = np.take_along_axis(exposure_parameters[intervals], order, axis=1)
+        accepted = (rng.random((n_simulees, n_items)) < parameters_in_order) & available_in_order
+        any_accepted = accepted.any(axis=1)
+        positions = np.where(any_accepted, np.argmax(accepted, axis=1), 0)
+        tried_in_order = available_in_order & (
+            (np.arange(n_items) <= positions[:, None]) | ~any_accepted[:, None]
+        )
+        tried = np.zeros((n_simulees, n_items), dtype=bool)
+        np.put_along_axis(tried, order, tried_in_order, axis=1)
+        selected_items = order[rows, positions]
+
+        # rejected items are not selected again
+        available[any_accepted] &= ~tried[any_accepted]
+        available[rows, selected_items] = False
+        administered_items[rows, selected_items] = True
+        np.add.at(selected_counts, intervals, tried.astype(np.int64))
+        np.add.at(administered_counts, (intervals, selected_items), 1)
+
+        estimator.add_responses(rows, selected_items, responses[rows, selected_items])
+        ability_levels, _ = estimator.estimate(rows)
+
+    return selected_counts, administered_counts
+
+
+def calibrate_sympson_hetter(item_pool: ItemPool,
+                             true_ability_levels: list[float] | np.ndarray,
+                             test_length: int,
+                             max_exposure_rate: float,
+                             ability_estimator: Type[IEstimator],
+                             estimator_args: EstimatorArgs | None = None,
+                             cut_points: list[float] | None = None,
+                             n_rounds: int = 20,
+                             tolerance: float = 0.01,
+                             initial_ability_level: float = 0,
+                             seed: int | None = None) -> SympsonHetterParameters:
+    """Determines the exposure control parameters of the (conditional) Sympson-Hetter method
+    with iterative simulations.
+    In every round, fixed length tests are simulated for all simulees at once
+    (new responses are generated every round) and the parameters are adjusted
+    so that no item is administered to more than `max_exposure_rate` of the simulees:
+    `K = max_exposure_rate / P(S)` if the selection rate `P(S)` exceeds `max_exposure_rate`, else `K = 1`.
+    At least `test_length` items per ability interval keep a parameter of 1.
+    The calibration stops as soon as all exposure rates are below `max_exposure_rate + tolerance`.
+
+    If `cut_points` are set, the conditional method is used:
+    the simulees are grouped into ability intervals by their true ability level
+    and the parameters are determined for every interval.
+
+    Only dichotomous items and the estimators `MLEstimator`, `BayesModal` and
+    `ExpectedAPosteriori` are supported.
+
+    Args:
+        item_pool (ItemPool): item pool
+        true_ability_levels (list[float] | np.ndarray): true ability levels of the simulees
+        test_length (int): test length
+        max_exposure_rate (float): maximum exposure rate of an item (between 0 and 1)
+        ability_estimator (Type[IEstimator]): The estimator class used for ability estimation.
+        estimator_args (EstimatorArgs, optional): Arguments for the ability estimator.
+        cut_points (list[float] | None): limits of the ability intervals of the conditional method.
+            Defaults to None (unconditional method).
+        n_rounds (int): maximum number of simulation rounds. Defaults to 20.
+        tolerance (float): accepted excess of the exposure rates. Defaults to 0.01.
+        initial_ability_level (float): initially assumed ability level. Defaults to 0.
+        seed (int | None): seed of the simulations
+
+    Returns:
+        SympsonHetterParameters: exposure control parameters
+
+    Raises:
+        ValueError: Raised if `max_exposure_rate` is not between 0 and 1,
+            the items are polytomous or the item ids are not unique.
+    """
+    if not 0 < max_exposure_rate <= 1:
+        raise ValueError("max_exposure_rate has to be between 0 and 1.")
+    item_ids = [item.id for item in item_pool.test_items]
+    if None in item_ids or len(set(item_ids)) != len(item_ids):
+        raise ValueError("The items need unique ids for Sympson-Hetter exposure control.")
+    if estimator_args is None:
+        estimator_args = {"prior": None, "optimization_interval": (-10, 10), "model": None}
+
+    item_bank = ItemBank.from_item_pool(item_pool)
+    abilities = np.asarray(true_ability_levels, dtype=np.float64)
+    limits = np.sort(np.asarray(cut_points if cut_points is not None else [], dtype=np.float64))
+    intervals = np.searchsorted(limits, abilities, side="right")
+    n_intervals = len(limits) + 1
+    n_simulees_per_interval = np.maximum(np.bincount(intervals, minlength=n_intervals), 1)[:, None]
+    rng = np.random.default_rng(seed)
+
+    exposure_parameters = np.ones((n_intervals, len(item_bank)))
+    exposure_rates = np.zeros((n_intervals, len(item_bank)))
+    for calibration_round in range(n_rounds):
+        estimator = BatchEstimator.from_estimator(
+            ability_estimator,
+            item_bank.a,
+            item_bank.b,
+            item_bank.c,
+            item_bank.d,
+            n_examinees=len(abilities),
+            max_length=max(min(test_length, len(item_bank)), 1),
+            prior=estimator_args.get("prior"),
+            optimization_interval=estimator_args.get("optimization_interval", (-10, 10))
+        )
+        responses = generate_response_matrix(abilities, item_bank.items, seed=int(rng.integers(2 ** 32)))
+        selected_counts, administered_counts = simulate_sympson_hetter_round(
+            item_bank, exposure_parameters, intervals, responses, test_length,
+            estimator, initial_ability_level, rng
+        )
+        exposure_rates = administered_counts / n_simulees_per_interval
+        if exposure_rates.max(initial=0) <= max_exposure_rate + tolerance or calibration_round == n_rounds - 1:
+            break
+
+        # adjust the parameters
+        selection_rates = selected_counts / n_simulees_per_interval
+        exposure_parameters = np.where(selection_rates > max_exposure_rate,
+                                       max_exposure_rate / np.maximum(selection_rates, 1e-12),
+                                       1.0)
+        for interval in range(n_intervals):
+            if np.sum(exposure_parameters[interval] == 1) < test_length:
+                top = np.argsort(-exposure_parameters[interval], kind="stable")[:test_length]
+                exposure_parameters[interval, top] = 1.0
+
+    return SympsonHetterParameters(
+        item_ids=list(item_bank.ids),  # type: ignore
+        parameters=exposure_parameters,
+        cut_points=limits,
+        exposure_rates=exposure_rates
+    )
@@ -0,0 +1,61 @@
+import numpy as np
+import adaptivetesting as adt
+
+
+def create_item_pool(n_items: int,
+                     seed: int,
+                     a_range: tuple[float, float] = (0.7, 2),
+                     guessing: bool = False,
+                     slipping: bool = False,
+                     first_id: int = 0,
+                     categories: list[str] | None = None,
+                     **columns) -> adt.ItemPool:
+    """Creates a random item pool for the tests.
+    The parameters are drawn in the order a, b, c, d and content categories,
+    so that the pools of a seed do not change if further options are added.
+
+    Args:
+        n_items (int): number of items
+        seed (int): seed of the random number generator
+        a_range (tuple[float, float]): range of the discrimination parameters. Defaults to (0.7, 2).
+        guessing (bool): draw guessing parameters between 0 and 0.2. Defaults to False (c = 0).
+        slipping (bool): draw inattention parameters between 0.9 and 1. Defaults to False (d = 1).
+        first_id (int): id of the first item (the ids are consecutive). Defaults to 0.
+        categories (list[str] | None): content categories.
+            If given, every item gets one or two random categories. Defaults to None.
+        **columns: further arguments of `ItemPool.load_from_list`,
+            which replace the drawn parameters (e.g., `b`)
+
+    Returns:
+        adt.ItemPool: item pool
+    """
+    rng = np.random.default_rng(seed)
+    arguments: dict = {
+        "a": rng.uniform(a_range[0], a_range[1], n_items).tolist(),
+        "b": rng.normal(0, 1, n_items).tolist(),
+        "ids": list(range(first_id, first_id + n_items))
+    }
+    if guessing:
+        arguments["c"] = rng.uniform(0, 0.2, n_items).tolist()
+    if slipping:
+        arguments["d"] = rng.uniform(0.9, 1, n_items).tolist()
+    if categories is not None:
+        arguments["content_categories"] = [rng.choice(categories, size=rng.integers(1, 3), replace=False).tolist()
+                                           for _ in range(n_items)]
+    # the item pool keeps the lists, so that shared arguments are copied
+    arguments.update({name: list(values) if isinstance(values, list) else values for name, values in columns.items()})
+    return adt.ItemPool.load_from_list(**arguments)
+
+
+def create_item_bank(n_items: int, seed: int, **kwargs) -> adt.ItemBank:
+    """Creates an item bank of a random item pool (see `create_item_pool`).
+
+    Args:
+        n_items (int): number of items
+        seed (int): seed of the random number generator
+        **kwargs: further arguments of `create_item_pool`
+
+    Returns:
+        adt.ItemBank: item bank
+    """
+    return adt.ItemBank(create_item_pool(n_items, seed, **kwargs).test_items)
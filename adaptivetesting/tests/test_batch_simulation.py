@@ -0,0 +1,132 @@
+import unittest
+import numpy as np
+import adaptivetesting as adt
+from adaptivetesting.tests.__item_pools import create_item_pool
+
+
+class TestBatchSimulation(unittest.TestCase):
+    def run_both_engines(self, estimator, estimator_args, n_participants=4, length=6):
+        item_pool = create_item_pool(20, 1, guessing=True, slipping=True)
+        true_abilities = [-1.2, -0.3, 0.4, 1.5][:n_participants]
+        seeds = list(range(n_participants))
+
+        single_results = []
+        for i, (ability, seed) in enumerate(zip(true_abilities, seeds)):
+            test = adt.TestAssembler(item_pool, "batch", str(i), estimator,
+                                     estimator_args=dict(estimator_args), # type: ignore
+                                     true_ability_level=ability,
+                                     seed=seed)
+            simulation = adt.Simulation(test, adt.ResultOutputFormat.CSV)
+            simulation.simulate(adt.StoppingCriterion.LENGTH, length)
+            single_results.append(test.test_results)
+
+        batch = adt.BatchSimulation(item_pool, "batch",
+                                    [str(i) for i in range(n_participants)],
+                                    true_abilities,
+                                    estimator,
+                                    estimator_args=dict(estimator_args), # type: ignore
+                                    seeds=seeds)
+        batch.simulate(adt.StoppingCriterion.LENGTH, length)
+        return single_results, batch
+
+    def assert_same_results(self, single_results, batch, places):
+        for i, expected in enumerate(single_results):
+            actual = batch.test_results[str(i)]
+            self.assertEqual([r.showed_item["id"] for r in expected],
+                             [r.showed_item["id"] for r in actual])
+            self.assertEqual([r.response for r in expected],
+                             [r.response for r in actual])
+            for expected_result, actual_result in zip(expected, actual):
+                self.assertAlmostEqual(expected_result.ability_estimation,
+                                       actual_result.ability_estimation,
+                                       places=places)
+
+    def test_matches_single_engine_ml(self):
+        single_results, batch = self.run_both_engines(
+            adt.MLEstimator,
+            {"prior": None, "optimization_interval": (-10, 10), "model": None}
+        )
+        self.assert_same_results(single_results, batch, places=4)
+
+    def test_matches_single_engine_bayes_modal(self):
+        single_results, batch = self.run_both_engines(
+            adt.BayesModal,
+            {"prior": adt.NormalPrior(0, 1), "optimization_interval": (-10, 10), "model": None}
+        )
+        self.assert_same_results(single_results, batch, places=4)
+
+    def test_matches_single_engine_eap(self):
+        single_results, batch = self.run_both_engines(
+            adt.ExpectedAPosteriori,
+            {"prior": adt.NormalPrior(0, 1), "optimization_interval": (-4, 4), "model": None},
+            n_participants=2,
+            length=4
+        )
+        self.assert_same_results(single_results, batch, places=6)
+        for i, expected in enumerate(single_results):
+            self.assertAlmostEqual(expected[-1].standard_error,
+                                   batch.test_results[str(i)][-1].standard_error,
+                                   places=6)
+
+    def test_participants_drop_out_on_se_criterion(self):
+        item_pool = create_item_pool(20, 1, guessing=True, slipping=True)
+        batch = adt.BatchSimulation(item_pool, "batch",
+                                    [str(i) for i in range(20)],
+                                    np.linspace(-2, 2, 20),
+                                    adt.BayesModal,
+                                    estimator_args={"prior": adt.NormalPrior(0, 1),
+                                                    "optimization_interval": (-10, 10),
+                                                    "model": None},
+                                    seed=12)
+        batch.simulate([adt.StoppingCriterion.SE, adt.StoppingCriterion.LENGTH], [0.5, 15])
+
+        stopped_by_se = batch.standard_errors <= 0.5
+        self.assertTrue(np.all(stopped_by_se | (batch.test_lengths == 15)))
+        self.assertTrue(np.all(batch.test_lengths <= 15))
+        for i, results in enumerate(batch.test_results.values()):
+            self.assertEqual(len(results), batch.test_lengths[i])
+            # items are never administered twice
+            ids = [result.showed_item["id"] for result in results]
+            self.assertEqual(len(ids), len(set(ids)))
+
+    def test_polytomous_items_are_rejected(self):
+        item_pool = adt.ItemPool.load_from_list(b=[[0.2, 0.9], [0.1, 1.0]], a=[1, 1])
+        with self.assertRaises(ValueError):
+            adt.BatchSimulation(item_pool, "batch", ["1"], [0.0], adt.MLEstimator)
+
+
+class TestBatchEstimator(unittest.TestCase):
+    def test_ml_estimation_matches_single_estimator(self):
+        item_pool = adt.ItemPool.load_from_list(b=[0.7, 0.9, 0.6])
+        bank = adt.ItemBank.from_item_pool(item_pool)
+        estimator = adt.BatchEstimator(bank.a, bank.b, bank.c, bank.d,
+                                       n_examinees=1,
+                                       max_length=3)
+        rows = np.array([0])
+        for index, response in enumerate([0, 1, 0]):
+            estimator.add_responses(rows, np.array([index]), np.array([response]))
+        estimation, standard_error = estimator.estimate(rows)
+
+        single = adt.MLEstimator([0, 1, 0], item_pool.test_items)
+        expected = single.get_estimation()
+        self.assertAlmostEqual(float(estimation[0]), expected, places=4)
+        self.assertAlmostEqual(float(standard_error[0]), single.get_standard_error(expected), places=4)
+
+    def test_unsupported_estimator(self):
+        with self.assertRaises(ValueError):
+            adt.BatchEstimator.from_estimator(adt.IEstimator, # type: ignore
+                                              np.ones(1), np.zeros(1), np.zeros(1), np.ones(1),
+                                              n_examinees=1, max_length=1)
+
+
+class TestItemBank(unittest.TestCase):
+    def test_information_matches_item_information_function(self):
+        item_pool = create_item_pool(5, 1, guessing=True, slipping=True)
+        bank = adt.ItemBank.from_item_pool(item_pool)
+        information = bank.information(np.array([-1.0, 0.5]))
+        self.assertEqual(information.shape, (2, 5))
+        for row, ability in enumerate([-1.0, 0.5]):
+            for column, item in enumerate(item_pool.test_items):
+                self.assertAlmostEqual(information[row, column],
+                                       adt.item_information_function(ability, item),
+                                       places=5)
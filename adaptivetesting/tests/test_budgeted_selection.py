@@ -0,0 +1,69 @@
+import unittest
+import numpy as np
+import adaptivetesting as adt
+from adaptivetesting.tests.__item_pools import create_item_pool
+
+
+CONSTRAINTS = [adt.Constraint(name, 1, 0.25, 0.15, 0.35) for name in ["Math", "English", "Physics", "History"]]
+
+
+def content_balancing_args(method: str, **budget) -> dict:
+    if method == "WeightedPenaltyModel":
+        return {"constraints": CONSTRAINTS, "constraint_weight": 0.6, "information_weight": 0.4, **budget}
+    return {"constraints": [adt.Constraint(c.name, 1, 4) for c in CONSTRAINTS],
+            "constraint_weight": None, "information_weight": None, **budget}
+
+
+class TestBudgetedSelection(unittest.TestCase):
+    def run_test(self, method: str, **budget) -> adt.TestAssembler:
+        item_pool = create_item_pool(300, 8, categories=["Math", "English", "Physics", "History"])
+        item_pool.simulated_responses = adt.generate_response_pattern(0.4, item_pool.test_items, seed=5)
+        test = adt.TestAssembler(item_pool, "budget", "1", adt.MLEstimator, true_ability_level=0.4,
+                                 content_balancing=method,  # type: ignore
+                                 content_balancing_args=content_balancing_args(method, **budget))  # type: ignore
+        for _ in range(12):
+            test.run_test_once()
+        return test
+
+    def test_large_budget(self):
+        for method in ["WeightedPenaltyModel", "MaximumPriorityIndex"]:
+            with self.subTest(method=method):
+                statistics = adt.BudgetStatistics()
+                test = self.run_test(method, time_budget=60, budget_chunk_size=16, budget_statistics=statistics)
+                self.assertIsInstance(test.selection_pipeline.strategy, adt.BudgetedSelection)
+                expected = self.run_test(method)
+                self.assertEqual([item.id for item in test.answered_items],
+                                 [item.id for item in expected.answered_items])
+                self.assertEqual(statistics.n_selections, 12)
+                self.assertEqual(statistics.budget_exceeded_rate, 0)
+                self.assertEqual(statistics.evaluated_fraction, 1)
+
+    def test_exhausted_budget(self):
+        statistics = adt.BudgetStatistics()
+        for method in ["WeightedPenaltyModel", "MaximumPriorityIndex"]:
+            test = self.run_test(method, time_budget=1e-12, budget_chunk_size=10, budget_statistics=statistics)
+            self.assertIsNone(test.decision_trie)
+
+            # only the first chunk (the items closest to the ability estimate) is evaluated
+            selection = test.selection_pipeline.strategy
+            items = test.item_pool.test_items
+            difficulties = np.array([item.b for item in items])
+            closest = {id(items[i]) for i in selection.pre_rank(difficulties, test.ability_level)[:10].tolist()}
+            self.assertIn(id(selection.select_item()), closest)
+
+        self.assertEqual(statistics.n_selections, 2 * 13)
+        self.assertEqual(statistics.budget_exceeded_rate, 1)
+        self.assertEqual(statistics.n_evaluated, 2 * 13 * 10)
+        self.assertLess(statistics.evaluated_fraction, 0.05)
+
+    def test_invalid_arguments(self):
+        test = self.run_test("MaximumPriorityIndex")
+        strategy = test.selection_pipeline.strategy
+        with self.assertRaises(ValueError):
+            adt.BudgetedSelection(test, strategy, 0)
+        with self.assertRaises(ValueError):
+            adt.BudgetedSelection(test, strategy, 0.01, chunk_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import adaptivetesting as adt
+from adaptivetesting.tests.__item_pools import create_item_pool
+
+
+def create_test(item_pool: adt.ItemPool, participant_id: str) -> adt.TestAssembler:
+    return adt.TestAssembler(item_pool, "session", participant_id, adt.MLEstimator, simulation=False)
+
+
+class TestCATSession(unittest.TestCase):
+    def test_matches_simulation(self):
+        item_pool = create_item_pool(30, 6)
+        responses = adt.generate_response_pattern(0.5, item_pool.test_items, seed=3)
+        item_pool.simulated_responses = responses
+        simulated = adt.TestAssembler(item_pool, "session", "1", adt.MLEstimator)
+        adt.Simulation(simulated, adt.ResultOutputFormat.CSV).simulate(adt.StoppingCriterion.LENGTH, 6)
+
+        session = adt.CATSession(create_test(item_pool, "1"), adt.StoppingCriterion.LENGTH, 6)
+        step = session.start()
+        self.assertIs(session.start(), step)
+        while not session.finished:
+            assert isinstance(step, adt.TestItem)
+            step = session.submit(responses[step.id])  # type: ignore
+        self.assertIsInstance(step, adt.TestResult)
+        self.assertIs(step, session.result)
+        self.assertEqual([result.showed_item for result in session.adaptive_test.test_results],
+                         [result.showed_item for result in simulated.test_results])
+        self.assertEqual(session.adaptive_test.ability_level, simulated.ability_level)
+
+        with self.assertRaises(ValueError):
+            session.submit(1)
+        with self.assertRaises(ValueError):
+            adt.CATSession(create_test(item_pool, "2")).submit(1)
+
+    def test_async_sessions(self):
+        item_pool = create_item_pool(30, 6)
+        responses = [adt.generate_response_pattern(ability, item_pool.test_items, seed=i)
+                     for i, ability in enumerate([-1.0, 0.0, 1.0, 2.0])]
+
+        async def run(session: adt.CATSession, pattern: list[int]) -> list[int]:
+            step = await session.astart()
+            while not session.finished:
+                step = await session.asubmit(pattern[step.id])  # type: ignore
+            return [item.id for item in session.adaptive_test.answered_items]  # type: ignore
+
+        async def run_all(executor) -> list[list[int]]:
+            sessions = [adt.CATSession(create_test(item_pool, str(i)), adt.StoppingCriterion.LENGTH, 5, executor)
+                        for i in range(len(responses))]
+            return await asyncio.gather(*[run(session, pattern) for session, pattern in zip(sessions, responses)])
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            administered = asyncio.run(run_all(executor))
+        self.assertEqual(administered, asyncio.run(run_all(None)))
+
+        for pattern, item_ids in zip(responses, administered):
+            session = adt.CATSession(create_test(item_pool, "x"), adt.StoppingCriterion.LENGTH, 5)
+            step = session.start()
+            while not session.finished:
+                step = session.submit(pattern[step.id])  # type: ignore
+            self.assertEqual([item.id for item in session.adaptive_test.answered_items], item_ids)
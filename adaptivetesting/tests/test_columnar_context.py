@@ -0,0 +1,90 @@
+import unittest
+import pathlib
+from functools import partial
+import numpy as np
+import pandas as pd
+import adaptivetesting as adt
+
+
+def create_results(participant: int, length: int) -> list[adt.TestResult]:
+    return [
+        adt.TestResult(
+            test_id="columnar",
+            ability_estimation=participant + step / 10,
+            standard_error=1 / (step + 1),
+            showed_item={"id": step, "a": 1.0, "b": step / 2, "c": 0.0, "d": 1.0,
+                         "additional_properties": {"category": ["Math"]}},
+            response=step % 2,
+            true_ability_level=float(participant)
+        )
+        for step in range(length)
+    ]
+
+
+class TestColumnarContext(unittest.TestCase):
+    def setUp(self):
+        def clean_up():
+            adt.flush_columnar_results()
+            for path in pathlib.Path("data").glob("columnar*.npz"):
+                path.unlink()
+
+        clean_up()
+        self.addCleanup(clean_up)
+
+    def save_participants(self, n_participants: int, **kwargs):
+        for participant in range(n_participants):
+            context = adt.ColumnarContext("columnar", str(participant), **kwargs)
+            context.save(create_results(participant, participant + 1))
+
+    def test_save_and_load(self):
+        self.save_participants(5, chunk_size=2)
+        # chunks of two participants are written immediately
+        self.assertTrue(pathlib.Path("data/columnar.npz").exists())
+
+        for participant in range(5):
+            results = adt.ColumnarContext("columnar", str(participant)).load()
+            self.assertEqual(results, create_results(participant, participant + 1))
+
+    def test_single_file(self):
+        self.save_participants(7, chunk_size=3, compress=True)
+        adt.flush_columnar_results()
+        self.assertEqual([path.name for path in pathlib.Path("data").glob("columnar*")], ["columnar.npz"])
+        # the file can be read with numpy
+        with np.load("data/columnar.npz") as file:
+            self.assertIn("chunk000000/ability_estimation", file.files)
+
+    def test_read_columns(self):
+        self.save_participants(4, chunk_size=3)
+        results = adt.read_columnar_results("columnar")
+        self.assertIsInstance(results, dict)
+        assert isinstance(results, dict)
+        self.assertEqual(results["ability_estimation"].dtype, np.float64)
+        self.assertEqual(results["participant_id"].tolist(), ["0", "1", "1", "2", "2", "2", "3", "3", "3", "3"])
+        self.assertEqual(results["step"].tolist(), [0, 0, 1, 0, 1, 2, 0, 1, 2, 3])
+        self.assertEqual(results["item_id"].tolist(), [0, 0, 1, 0, 1, 2, 0, 1, 2, 3])
+
+        frame = adt.read_columnar_results("columnar", as_dataframe=True)
+        self.assertIsInstance(frame, pd.DataFrame)
+        self.assertEqual(len(frame), 10)
+
+    def test_load_final_test_results(self):
+        self.save_participants(3)
+        final_results = adt.load_final_test_results("columnar", ["0", "1", "2"], adt.ResultOutputFormat.COLUMNAR)
+        self.assertEqual([result.ability_estimation for result in final_results], [0.0, 1.1, 2.2])
+
+    def test_parallel_simulation(self):
+        item_pool = adt.ItemPool.load_from_list(b=[-1, -0.5, 0, 0.5, 1], ids=list(range(5)))
+        specs = [adt.SimulationSpec(str(i), ability, seed=i) for i, ability in enumerate([-1.0, 0.0, 1.0])]
+        adt.SpecSimulationPool(item_pool,
+                               partial(adt.TestAssembler, ability_estimator=adt.MLEstimator),
+                               specs,
+                               "columnar",
+                               adt.ResultOutputFormat.COLUMNAR,
+                               criterion=adt.StoppingCriterion.LENGTH,
+                               value=3,
+                               chunk_size=1,
+                               max_workers=2).start(parallel=True)
+        test_results = adt.read_columnar_test_results("columnar")
+        self.assertEqual(sorted(test_results.keys()), ["0", "1", "2"])
+        for results in test_results.values():
+            self.assertEqual(len(results), 3)
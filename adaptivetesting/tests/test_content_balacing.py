@@ -1,6 +1,7 @@
 import unittest
 import adaptivetesting as adt
 import pandas as pd
+import numpy as np
 
 
 class TestMaximumPriorityIndex(unittest.TestCase):
@@ -129,3 +130,84 @@ class TestMPIPolyModels(unittest.TestCase):
     def test_quota_calculation(self):
         result = adt.compute_quota_left(10, 5)
         self.assertAlmostEqual(result, 0.5)
+
+
+class TestVectorizedPriorityIndex(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1234)
+        categories = [["Math"], ["English"], ["Math", "English"], ["Art"]]
+        self.items = adt.ItemPool.load_from_list(
+            a=rng.uniform(0.5, 2, 40).tolist(),
+            b=rng.normal(0, 1, 40).tolist(),
+            c=rng.uniform(0, 0.2, 40).tolist(),
+            content_categories=[categories[i % 4] for i in range(40)]
+        ).test_items
+        self.constraints = [
+            adt.Constraint("Math", weight=0.5, prevalence=6),
+            adt.Constraint("English", weight=0.8, prevalence=4),
+            adt.Constraint("Art", weight=1.0, prevalence=2)
+        ]
+
+    def test_membership_matrix(self):
+        membership = adt.constraint_membership_matrix(self.items[:4], self.constraints)
+        self.assertEqual(membership.tolist(), [[1, 0, 0], [0, 1, 0], [1, 1, 0], [0, 0, 1]])
+
+        with self.assertRaises(adt.ItemSelectionException):
+            adt.constraint_membership_matrix(self.items[:4], self.constraints[:2])
+
+    def test_matches_single_item_calculation(self):
+        shown_items = {"Math": 2.0, "English": 4.0, "Art": 3.0}
+        expected = [
+            adt.compute_priority_index(
+                item=item,
+                group_weights={constraint.name: constraint.weight for constraint in self.constraints},
+                required_items={constraint.name: constraint.prevalence for constraint in self.constraints},
+                shown_items=shown_items,
+                current_ability=0.3
+            )
+            for item in self.items
+        ]
+        information = np.array([adt.item_information_function(0.3, item) for item in self.items])
+        priority_indices = adt.compute_priority_indices(
+            membership=adt.constraint_membership_matrix(self.items, self.constraints),
+            group_weights=np.array([constraint.weight for constraint in self.constraints]),
+            required_items=np.array([constraint.prevalence for constraint in self.constraints]),
+            shown_items=np.array([shown_items[constraint.name] for constraint in self.constraints]),
+            information=information
+        )
+        np.testing.assert_allclose(priority_indices, expected, rtol=1e-10, atol=1e-14)
+
+    def test_test_counts_administered_items(self):
+        test = adt.TestAssembler(
+            item_pool=adt.ItemPool(self.items),
+            simulation_id="mpi",
+            participant_id="1",
+            ability_estimator=adt.MLEstimator,
+            true_ability_level=0.5,
+            content_balancing="MaximumPriorityIndex",
+            content_balancing_args={
+                "constraints": self.constraints,
+                "constraint_weight": None,
+                "information_weight": None
+            },
+            seed=1
+        )
+        mpi = adt.MaximumPriorityIndex(test, self.constraints)
+        for _ in range(8):
+            item = mpi.select_item()
+            test.response_pattern.append(test.item_pool.get_item_response(item))  # type: ignore
+            test.answered_items.append(item)  # type: ignore
+            test.item_pool.delete_item(item)  # type: ignore
+            counts = {
+                constraint.name: len([
+                    answered_item for answered_item in test.answered_items
+                    if constraint.name in answered_item.additional_properties["category"]
+                ])
+                for constraint in self.constraints
+            }
+            self.assertEqual(mpi.count_administered_items().tolist(),
+                             [counts[constraint.name] for constraint in self.constraints])
+        # a full test with a persistent MPI instance
+        for _ in range(4):
+            test.run_test_once()
+        self.assertEqual(len(test.answered_items), 12)
@@ -0,0 +1,124 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import adaptivetesting as adt
+from adaptivetesting.tests.__item_pools import create_item_pool
+
+
+class TestDecisionTrie(unittest.TestCase):
+    def setUp(self):
+        adt.DecisionTrie.clear_shared()
+
+    def run_tests(self, item_pool: adt.ItemPool, decision_trie, n_tests: int = 12, **kwargs):
+        results = []
+        for i in range(n_tests):
+            test = adt.TestAssembler(item_pool, "trie", str(i), adt.MLEstimator,
+                                     true_ability_level=float(i % 5 - 2), seed=i,
+                                     decision_trie=decision_trie, **kwargs)
+            for _ in range(4):
+                test.run_test_once()
+            results.append((test.ability_level, test.standard_error,
+                            [item.id for item in test.answered_items], test.response_pattern))
+        return results
+
+    def test_trie(self):
+        trie = adt.DecisionTrie("config", max_depth=2)
+        trie.set_item_id([], 3)
+        trie.set_estimate([1], 0.5, 1.2)
+        trie.set_item_id([1], 7)
+        trie.set_estimate([1, 0, 1], 0.1, 0.8)
+        self.assertEqual(trie.get_item_id([]), 3)
+        self.assertEqual(trie.get_estimate([1]), (0.5, 1.2))
+        self.assertIsNone(trie.get_estimate([0]))
+        self.assertIsNone(trie.get_estimate([1, 0, 1]))
+        self.assertEqual(trie.n_nodes, 2)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trie.json")
+            trie.save(path)
+            loaded = adt.DecisionTrie.load(path)
+        self.assertEqual(loaded.to_dict(), trie.to_dict())
+        self.assertEqual(loaded.get_item_id([1]), 7)
+        self.assertEqual(loaded.n_nodes, 2)
+
+    def test_shared_trie(self):
+        item_pool = create_item_pool(30, 4)
+        expected = self.run_tests(item_pool, False)
+        self.assertEqual(self.run_tests(item_pool, True), expected)
+
+        test = adt.TestAssembler(item_pool, "trie", "x", adt.MLEstimator, decision_trie=True)
+        trie = test.decision_trie
+        assert trie is not None
+        self.assertGreater(trie.n_nodes, 1)
+        self.assertIsNotNone(trie.get_item_id([]))
+        # different configurations do not share the tree
+        other = adt.TestAssembler(item_pool, "trie", "x", adt.MLEstimator, decision_trie=True,
+                                  initial_ability_level=1)
+        self.assertIsNot(other.decision_trie, trie)
+
+    def test_precompiled_trie(self):
+        item_pool = create_item_pool(30, 4)
+        trie = adt.DecisionTrie()
+        expected = self.run_tests(item_pool, trie)
+        compiled = adt.DecisionTrie.from_dict(trie.to_dict())
+
+        # all steps are answered from the tree
+        with patch.object(adt.TestAssembler, "compile_selection_pipeline", side_effect=AssertionError), \
+             patch.object(adt.MLEstimator, "get_estimation", side_effect=AssertionError):
+            results = self.run_tests(item_pool, compiled)
+        self.assertEqual(results, expected)
+
+        other_pool = create_item_pool(31, 4)
+        test = adt.TestAssembler(other_pool, "trie", "x", adt.MLEstimator, decision_trie=compiled)
+        with self.assertRaises(ValueError):
+            test.get_next_item()
+
+    def test_prior(self):
+        item_pool = create_item_pool(30, 4)
+        # equal priors share a tree
+        for i in range(5):
+            test = adt.TestAssembler(item_pool, "trie", str(i), adt.BayesModal,
+                                     estimator_args={"prior": adt.NormalPrior(0, 1)},  # type: ignore
+                                     true_ability_level=0.5, seed=i, decision_trie=True)
+            test.run_test_once()
+        self.assertEqual(adt.DecisionTrie.n_shared(), 1)
+
+        trie = adt.DecisionTrie()
+        test = adt.TestAssembler(item_pool, "trie", "x", adt.BayesModal,
+                                 estimator_args={"prior": adt.NormalPrior(0, 1)},  # type: ignore
+                                 true_ability_level=0.5, decision_trie=trie)
+        for _ in range(3):
+            test.run_test_once()
+
+        # a tree built with a different prior is rejected
+        test = adt.TestAssembler(item_pool, "trie", "y", adt.BayesModal,
+                                 estimator_args={"prior": adt.NormalPrior(2, 0.5)},  # type: ignore
+                                 true_ability_level=0.5, decision_trie=trie)
+        with self.assertRaises(ValueError):
+            test.run_test_once()
+
+    def test_shared_trie_limit(self):
+        item_pool = create_item_pool(30, 4)
+        with patch.object(adt.DecisionTrie, "max_shared", 3):
+            for i in range(6):
+                test = adt.TestAssembler(item_pool, "trie", "x", adt.MLEstimator, decision_trie=True,
+                                         initial_ability_level=i / 10)
+                self.assertIsNotNone(test.decision_trie)
+            self.assertEqual(adt.DecisionTrie.n_shared(), 3)
+
+    def test_bypass(self):
+        item_pool = create_item_pool(30, 4)
+        test = adt.TestAssembler(item_pool, "trie", "x", adt.MLEstimator, decision_trie=True,
+                                 exposure_control="Randomesque",
+                                 exposure_control_args={"constraints": None, "participant_ids": None,
+                                                        "output_format": None, "n_items": 3, "seed": 1})
+        self.assertIsNone(test.decision_trie)
+        test = adt.TestAssembler(item_pool, "trie", "x", adt.MLEstimator, decision_trie=True, pretest=True)
+        self.assertIsNone(test.decision_trie)
+        test = adt.TestAssembler(item_pool, "trie", "x", adt.MLEstimator)
+        self.assertIsNone(test.decision_trie)
+        # item selectors that cannot be identified by their value are not cached
+        test = adt.TestAssembler(item_pool, "trie", "x", adt.MLEstimator, decision_trie=True,
+                                 item_selector=lambda items, ability, **kwargs: items[0])
+        self.assertIsNone(test.decision_trie)
@@ -0,0 +1,110 @@
+import unittest
+import numpy as np
+import adaptivetesting as adt
+
+
+a = np.array([1.0, 1.2, 0.8, 1.5, 1.1])
+b = np.array([-1.0, -0.5, 0.0, 0.5, 1.0])
+c = np.zeros(5)
+d = np.ones(5)
+
+
+class TestEstimationDiagnostics(unittest.TestCase):
+    def test_maximize_likelihood_function(self):
+        diagnostics: list[adt.EstimationDiagnostics] = []
+        estimate = adt.maximize_likelihood_function(a, b, c, d, np.array([1, 1, 0, 1, 0]), diagnostics=diagnostics)
+        self.assertEqual(len(diagnostics), 1)
+        result = diagnostics[0]
+        self.assertEqual(result.method, "bounded")
+        self.assertTrue(result.success)
+        self.assertFalse(result.boundary_hit)
+        self.assertGreater(result.iterations, 0)
+        self.assertGreaterEqual(result.function_evaluations, result.iterations)
+        self.assertLess(result.bracket_width, 1e-3)
+        self.assertIsNone(result.edge_mass)
+
+        # the diagnostics do not change the estimate
+        self.assertEqual(estimate, adt.maximize_likelihood_function(a, b, c, d, np.array([1, 1, 0, 1, 0])))
+
+    def test_boundary_hit(self):
+        diagnostics: list[adt.EstimationDiagnostics] = []
+        estimate = adt.maximize_posterior(a, b, c, d, np.array([1, 1, 1, 1, 1]), adt.NormalPrior(0, 1),
+                                          optimization_interval=(-1, 1), diagnostics=diagnostics)
+        self.assertAlmostEqual(estimate, 1, places=4)
+        self.assertTrue(diagnostics[0].boundary_hit)
+
+    def test_estimators(self):
+        items = adt.ItemPool.load_from_list(a=a.tolist(), b=b.tolist()).test_items
+        estimator = adt.BayesModal([1, 0, 1, 1, 0], items, adt.NormalPrior(0, 1), collect_diagnostics=True)
+        estimator.get_estimation()
+        self.assertEqual(len(estimator.diagnostics), 1)
+        self.assertEqual(estimator.diagnostics[0].method, "bounded")
+
+        poly_items = adt.ItemPool.load_from_list(
+            a=[0.943, 0.972, 1.210],
+            b=[[0.071, 0.129], [0.461, 1.715], [-1.265, -0.687]]
+        ).test_items
+        ml_estimator = adt.MLEstimator([2, 1, 2], poly_items, model="GRM", collect_diagnostics=True)
+        ml_estimator.get_estimation()
+        self.assertEqual(ml_estimator.diagnostics[0].method, "bounded")
+
+    def test_not_collected_by_default(self):
+        items = adt.ItemPool.load_from_list(a=a.tolist(), b=b.tolist()).test_items
+        for estimator in [adt.MLEstimator([1, 0, 1, 1, 0], items),
+                          adt.BayesModal([1, 0, 1, 1, 0], items, adt.NormalPrior(0, 1)),
+                          adt.ExpectedAPosteriori([1, 0, 1, 1, 0], items, adt.NormalPrior(0, 1))]:
+            with self.subTest(estimator=type(estimator).__name__):
+                self.assertIsNone(estimator.requested_diagnostics)
+                estimator.get_estimation()
+                self.assertEqual(estimator.diagnostics, [])
+
+        item_pool = adt.ItemPool.load_from_list(a=a.tolist() * 4, b=b.tolist() * 4, ids=list(range(20)))
+        test = adt.TestAssembler(item_pool, "diagnostics", "1", adt.BayesModal,
+                                 estimator_args={"prior": adt.NormalPrior(0, 1)},  # type: ignore
+                                 true_ability_level=0.3, seed=2)
+        test.run_test_once()
+        self.assertIsNone(test.estimation_diagnostics)
+
+        item_pool = adt.ItemPool.load_from_list(a=a.tolist() * 4, b=b.tolist() * 4, ids=list(range(20)))
+        test = adt.TestAssembler(item_pool, "diagnostics", "1", adt.BayesModal,
+                                 estimator_args={"prior": adt.NormalPrior(0, 1)},  # type: ignore
+                                 collect_diagnostics=True, true_ability_level=0.3, seed=2)
+        test.run_test_once()
+        self.assertEqual(test.estimation_diagnostics.method, "bounded")  # type: ignore
+
+    def test_edge_mass(self):
+        items = adt.ItemPool.load_from_list(a=a.tolist(), b=b.tolist()).test_items
+        estimator = adt.ExpectedAPosteriori([1, 0, 1, 1, 0], items, adt.NormalPrior(0, 1),
+                                            collect_diagnostics=True)
+        estimator.get_estimation()
+        result = estimator.diagnostics[0]
+        self.assertEqual(result.method, "quadrature")
+        self.assertEqual(result.function_evaluations, 1000)
+        self.assertFalse(result.boundary_hit)
+        self.assertLess(result.edge_mass or 0, 1e-10)
+
+        # a narrow grid cuts off the posterior
+        estimator = adt.ExpectedAPosteriori([1, 1, 1, 1, 1], items, adt.NormalPrior(0, 10),
+                                            optimization_interval=(-3, 3), collect_diagnostics=True)
+        estimator.get_estimation()
+        result = estimator.diagnostics[0]
+        self.assertTrue(result.boundary_hit)
+        self.assertGreater(result.edge_mass or 0, 0.01)
+
+    def test_instrumentation(self):
+        item_pool = adt.ItemPool.load_from_list(a=a.tolist() * 4, b=b.tolist() * 4, ids=list(range(20)))
+        test = adt.TestAssembler(item_pool, "diagnostics", "1", adt.BayesModal,
+                                 estimator_args={"prior": adt.NormalPrior(0, 1)},  # type: ignore
+                                 true_ability_level=0.3, seed=2)
+        instrumentation = adt.Instrumentation()
+        adt.Simulation(test, adt.ResultOutputFormat.CSV, instrumentation).simulate(adt.StoppingCriterion.LENGTH, 6)
+
+        self.assertIsNotNone(test.estimation_diagnostics)
+        for counter in ["estimation.iterations", "estimation.objective_evaluations",
+                        "estimation.bracket_width", "estimation.boundary_hits"]:
+            self.assertEqual(instrumentation.counters[counter].count, 6)
+        self.assertEqual(instrumentation.counters["estimation.boundary_hits"].total, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -38,9 +38,7 @@ class MPIExposureControlTests(unittest.TestCase):
         "adaptivetesting.math.exposure_control.__mpi_exposure_control.read_prev_items",
         return_value=[],
     )
-    @patch(
-        "adaptivetesting.math.exposure_control.__mpi_exposure_control.compute_priority_index"
-    )
+    @patch.object(MaximumPriorityIndexExposureControl, "priority_indices")
     def test_selects_item_with_highest_priority_index(self, mock_compute, _mock_read):
         # arrange: three items with different categories
         i1 = DummyItem("i1", ["A"])
@@ -55,9 +53,8 @@ class MPIExposureControlTests(unittest.TestCase):
 
         scores = {"i1": 0.2, "i2": 0.8, "i3": 0.5}
 
-        def fake_compute(item, **kwargs):
-            res = scores.get(str(getattr(item, "identifier", None)), 0.0)
-            return res
+        def fake_compute(items, shown_items):
+            return [scores.get(str(getattr(item, "identifier", None)), 0.0) for item in items]
 
         mock_compute.side_effect = fake_compute
 
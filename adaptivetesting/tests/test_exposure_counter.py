@@ -0,0 +1,98 @@
+import unittest
+import pathlib
+import shutil
+from unittest.mock import patch
+import adaptivetesting as adt
+
+
+def item_dict(item_id: int, categories: list[str]) -> dict:
+    return {"id": item_id, "a": 1.0, "b": 0.0, "c": 0.0, "d": 1.0,
+            "additional_properties": {"category": categories}}
+
+
+class TestSQLiteExposureCounter(unittest.TestCase):
+    def setUp(self):
+        def clean_up():
+            for path in pathlib.Path("data").glob("exposure*.db*"):
+                path.unlink()
+            for folder in ["exposure_legacy"]:
+                if pathlib.Path("data", folder).exists():
+                    shutil.rmtree(pathlib.Path("data", folder))
+
+        clean_up()
+        self.addCleanup(clean_up)
+
+    def test_record_and_counts(self):
+        counter = adt.SQLiteExposureCounter("exposure")
+        counter.record("1", [item_dict(1, ["Math"]), item_dict(2, ["English", "Math"])])
+        counter.record("2", [item_dict(2, ["English", "Math"])])
+        # participants are only counted once
+        counter.record("2", [item_dict(2, ["English", "Math"])])
+
+        self.assertEqual(counter.constraint_counts(["Math", "English", "Art"]),
+                         {"Math": 3, "English": 2, "Art": 0})
+        self.assertEqual(counter.item_counts(), {1: 1, 2: 2})
+        counter.close()
+
+        # the counts are persistent
+        self.assertEqual(adt.SQLiteExposureCounter("exposure").constraint_counts(["Math"]), {"Math": 3})
+
+    @patch("adaptivetesting.math.exposure_control.__mpi_exposure_control.read_prev_items")
+    def test_mpi_reads_counter(self, mock_read):
+        counter = adt.SQLiteExposureCounter("exposure")
+        counter.record("1", [item_dict(1, ["Math"]), item_dict(3, ["Math"])])
+
+        item_pool = adt.ItemPool.load_from_list(b=[0.0, 0.1, 0.0], ids=[1, 2, 3],
+                                                content_categories=[["Math"], ["English"], ["Math"]])
+        test = adt.TestAssembler(item_pool, "exposure", "2", adt.MLEstimator,
+                                 exposure_control="MaximumPriorityIndex",
+                                 exposure_control_args={
+                                     "constraints": [adt.Constraint("Math", 1, 2), adt.Constraint("English", 1, 2)],
+                                     "participant_ids": None,
+                                     "output_format": None,
+                                     "n_items": None,
+                                     "seed": None,
+                                     "exposure_counter": counter
+                                 },
+                                 true_ability_level=0)
+        # Math is exhausted, therefore the English item is selected
+        self.assertEqual(test.get_next_item().id, 2)
+        mock_read.assert_not_called()
+
+    def test_simulation_matches_reading_previous_results(self):
+        item_pool = adt.ItemPool.load_from_list(
+            a=[1.32, 1.07, 0.84, 1.2, 0.9, 1.1],
+            b=[-0.63, 0.18, -0.84, 0.4, 0.0, -0.2],
+            c=[0.17, 0.10, 0.19, 0.1, 0.1, 0.1],
+            d=[0.87, 0.93, 1, 1, 1, 1],
+            ids=[1, 2, 3, 4, 5, 6],
+            content_categories=[["Math"], ["English"], ["Math"], ["English"], ["Math"], ["English"]]
+        )
+        constraints = [adt.Constraint("Math", weight=0.5, prevalence=4), adt.Constraint("English", 0.5, 4)]
+
+        def run(simulation_id: str, participant: int, counter: adt.IExposureCounter | None):
+            exposure_control_args: adt.ExposureControlArgs = {
+                "constraints": constraints,
+                "participant_ids": [str(i) for i in range(participant)],
+                "output_format": adt.ResultOutputFormat.PICKLE,
+                "n_items": None,
+                "seed": None,
+                "exposure_counter": counter
+            }
+            test = adt.TestAssembler(item_pool, simulation_id, str(participant), adt.MLEstimator,
+                                     exposure_control="MaximumPriorityIndex",
+                                     exposure_control_args=exposure_control_args,
+                                     true_ability_level=0.5,
+                                     seed=participant)
+            simulation = adt.Simulation(test, adt.ResultOutputFormat.PICKLE)
+            simulation.simulate(adt.StoppingCriterion.LENGTH, 3)
+            simulation.save_test_results()
+            return [result.showed_item["id"] for result in test.test_results]
+
+        counter = adt.SQLiteExposureCounter("exposure_counter")
+        for participant in range(4):
+            self.assertEqual(run("exposure_legacy", participant, None),
+                             run("exposure_counter", participant, counter))
+        self.assertEqual(sum(counter.item_counts().values()), 12)
+        counter.close()
+        shutil.rmtree("data/exposure_counter")
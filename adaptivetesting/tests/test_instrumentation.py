@@ -0,0 +1,82 @@
+import json
+import math
+import pathlib
+import pickle
+import shutil
+import unittest
+import adaptivetesting as adt
+from adaptivetesting.tests.__item_pools import create_item_pool
+
+
+def create_test(participant_id: str, ability: float) -> adt.TestAssembler:
+    return adt.TestAssembler(create_item_pool(40, 4), "instrumentation", participant_id, adt.MLEstimator,
+                             true_ability_level=ability, seed=int(participant_id))
+
+
+class TestHistogram(unittest.TestCase):
+    def test_buckets(self):
+        histogram = adt.Histogram()
+        for value in [0, 0.75, 1, 3, 3.5, 100]:
+            histogram.add(value)
+        self.assertEqual(histogram.buckets, {None: 1, 0: 1, 1: 1, 2: 2, 7: 1})
+        self.assertEqual(histogram.count, 6)
+        self.assertAlmostEqual(histogram.mean, 108.25 / 6)
+        self.assertEqual(histogram.quantile(0.5), 2)
+        self.assertEqual(histogram.quantile(1), 100)
+        self.assertTrue(math.isnan(adt.Histogram().quantile(0.5)))
+
+        other = adt.Histogram()
+        other.add(5)
+        histogram.merge(other)
+        self.assertEqual(histogram.buckets[3], 1)
+        self.assertEqual(histogram.count, 7)
+        self.assertEqual(histogram.to_dict()["buckets"], {"zero": 1, "0": 1, "1": 1, "2": 2, "3": 1, "7": 1})
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        def clean_up():
+            path = pathlib.Path("data/instrumentation")
+            if path.exists():
+                shutil.rmtree(path)
+
+        self.addCleanup(clean_up)
+
+    def test_simulation(self):
+        instrumentation = adt.Instrumentation()
+        test = create_test("1", 0.5)
+        simulation = adt.Simulation(test, adt.ResultOutputFormat.CSV, instrumentation)
+        simulation.simulate(adt.StoppingCriterion.LENGTH, 8)
+        self.assertIsNone(adt.active_instrumentation())
+
+        for phase in ["step", "selection", "response", "estimation", "pool_deletion", "result"]:
+            self.assertEqual(instrumentation.timers[phase].count, 8)
+        self.assertGreater(instrumentation.timers["step"].total, instrumentation.timers["selection"].total)
+        self.assertEqual(instrumentation.counters["selection.candidates"].max, 40)
+        self.assertEqual(instrumentation.counters["selection.candidates"].min, 33)
+        self.assertGreater(instrumentation.counters["estimation.objective_evaluations"].total, 0)
+
+        exported = json.loads(instrumentation.to_json())
+        self.assertEqual(exported["timers"]["estimation"]["count"], 8)
+        self.assertIn("selection.candidates", instrumentation.to_text())
+
+    def test_inactive(self):
+        instrumentation = adt.Instrumentation()
+        adt.Simulation(create_test("2", 0.0), adt.ResultOutputFormat.CSV).simulate(adt.StoppingCriterion.LENGTH, 3)
+        self.assertEqual(instrumentation.timers, {})
+
+    def test_simulation_pool(self):
+        instrumentation = adt.Instrumentation()
+        tests: list[adt.AdaptiveTest] = [create_test(str(i), ability) for i, ability in enumerate([-1.0, 0.0, 1.0])]
+        adt.SimulationPool(tests, adt.ResultOutputFormat.CSV, adt.StoppingCriterion.LENGTH, 5,
+                           instrumentation=instrumentation).start(parallel=False)
+        self.assertEqual(instrumentation.timers["step"].count, 15)
+
+        restored = pickle.loads(pickle.dumps(instrumentation))
+        restored.merge(instrumentation)
+        self.assertEqual(restored.timers["step"].count, 30)
+        self.assertEqual(restored.counters.keys(), instrumentation.counters.keys())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+from typing import Any
+import numpy as np
+import adaptivetesting as adt
+from adaptivetesting.tests.__item_pools import create_item_pool
+
+
+# ordered difficulties and alternating simulated responses
+EXCLUSION_POOL: dict[str, Any] = {
+    "a_range": (0.8, 2),
+    "b": np.linspace(-2, 2, 12).tolist(),
+    "simulated_responses": [i % 2 for i in range(12)]
+}
+
+
+class TestItemExclusions(unittest.TestCase):
+    def test_enemies(self):
+        exclusions = adt.ItemExclusions([10, 11, 12, 13, 14], [[10, 12], [12, 13, 14]])
+        self.assertEqual(exclusions.enemies(12).tolist(), [0, 3, 4])
+        self.assertEqual(exclusions.enemies(11).tolist(), [])
+
+        self.assertEqual(exclusions.administer(13), [12, 14])
+        self.assertEqual(exclusions.available.tolist(), [True, True, False, False, False])
+        self.assertEqual(exclusions.exclude([10, 12, 99]), [10])
+
+        rows, positions = exclusions.enemy_pairs(np.array([0, 1, 2]), np.array([2, 1, 0]))
+        self.assertEqual(rows.tolist(), [0, 0, 0, 2])
+        self.assertEqual(positions.tolist(), [0, 3, 4, 2])
+
+        with self.assertRaises(ValueError):
+            adt.ItemExclusions([1, 2], [[1, 3]])
+        with self.assertRaises(ValueError):
+            adt.ItemExclusions([1, 1])
+
+    def test_item_pool(self):
+        item_pool = create_item_pool(12, 8, **EXCLUSION_POOL)
+        item_pool.exclude_items([0, 5])
+        self.assertEqual([item.id for item in item_pool.test_items], [1, 2, 3, 4, 6, 7, 8, 9, 10, 11])
+        self.assertEqual(item_pool.simulated_responses, [1, 0, 1, 0, 0, 1, 0, 1, 0, 1])
+
+        item_pool.set_enemy_groups([[1, 2, 3], [7, 11]])
+        item_pool.delete_item(item_pool.test_items[1])
+        self.assertEqual([item.id for item in item_pool.test_items], [4, 6, 7, 8, 9, 10, 11])
+        self.assertEqual(item_pool.simulated_responses, [0, 0, 1, 0, 1, 0, 1])
+        assert item_pool.exclusions is not None
+        self.assertEqual([item_pool.exclusions.item_ids[position]
+                          for position in np.flatnonzero(item_pool.exclusions.excluded)], [1, 2, 3])
+
+    def test_remove_enemies(self):
+        item_pool = create_item_pool(40, 8, simulated_responses=[i % 2 for i in range(40)])
+        item_pool.set_enemy_groups([[i, 39 - i] for i in range(20)])
+        item_pool.exclude_items([3, 17])
+        rng = np.random.default_rng(2)
+        removed = {3, 17}
+        while len(item_pool.test_items) > 0:
+            item = item_pool.test_items[rng.integers(len(item_pool.test_items))]
+            item_pool.delete_item(item)
+            removed.update([item.id, 39 - item.id])  # type: ignore
+            self.assertEqual([item.id for item in item_pool.test_items],
+                             [item_id for item_id in range(40) if item_id not in removed])
+            self.assertEqual(item_pool.simulated_responses,
+                             [item_id % 2 for item_id in range(40) if item_id not in removed])
+
+        # items that have been moved without the item pool are found as well
+        item_pool = create_item_pool(6, 8)
+        item_pool.set_enemy_groups([[0, 5]])
+        item_pool.test_items.reverse()
+        item_pool.delete_item(item_pool.test_items[0])
+        self.assertEqual([item.id for item in item_pool.test_items], [4, 3, 2, 1])
+
+    def test_test_assembler(self):
+        item_pool = create_item_pool(12, 8, **EXCLUSION_POOL)
+        # the two most informative items for a medium ability level are enemies
+        item_pool.set_enemy_groups([[5, 6], [4, 7]])
+        test = adt.TestAssembler(item_pool, "exclusions", "1", adt.MLEstimator,
+                                 true_ability_level=0.0, seed=1)
+        test.item_pool.exclude_items([3])
+        for _ in range(6):
+            test.run_test_once()
+        administered = [item.id for item in test.answered_items]
+        self.assertNotIn(3, administered)
+        self.assertLessEqual(len(set(administered) & {5, 6}), 1)
+        self.assertLessEqual(len(set(administered) & {4, 7}), 1)
+        # the original item pool is not modified
+        self.assertEqual(len(item_pool.test_items), 12)
+
+    def test_batch_simulation(self):
+        item_pool = create_item_pool(12, 8, **EXCLUSION_POOL)
+        item_pool.set_enemy_groups([[5, 6], [4, 7], [0, 1, 2]])
+        simulation = adt.BatchSimulation(item_pool, "exclusions", ["1", "2", "3"], [-1.0, 0.0, 1.0],
+                                         adt.MLEstimator, seed=3,
+                                         excluded_item_ids=[[], [5], [0, 11]])
+        simulation.simulate(adt.StoppingCriterion.LENGTH, 20)
+        results = simulation.test_results
+        for participant, excluded, length in zip(["1", "2", "3"], [set(), {5}, {0, 11}], [8, 8, 7]):
+            administered = set([result.showed_item["id"] for result in results[participant]])
+            self.assertEqual(len(administered), length)
+            self.assertFalse(administered & excluded)
+            self.assertLessEqual(len(administered & {5, 6}), 1)
+            self.assertLessEqual(len(administered & {0, 1, 2}), 1)
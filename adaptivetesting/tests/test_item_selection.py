@@ -1,5 +1,12 @@
 import unittest
-from adaptivetesting.math.item_selection import urrys_rule, maximum_information_criterion
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from adaptivetesting.math.item_selection import urrys_rule, maximum_information_criterion, AStratifiedSelector
+from adaptivetesting.models import ItemSelectionException
+from adaptivetesting.services import ItemSelectionStrategy
+from adaptivetesting.implementations import TestAssembler
+from adaptivetesting.math.estimators import MLEstimator
+import numpy as np
 from adaptivetesting.models import TestItem, ItemPool
 
 
@@ -68,3 +75,98 @@ class TestMaximumInformationCriterion(unittest.TestCase):
                               "d": 0.8456,
                               "additional_properties": {},
                               "id": None})
+
+
+# unittests for a-stratified item selection
+class TestAStratifiedSelector(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.item_pool = ItemPool.load_from_list(
+            a=rng.uniform(0.5, 2.5, 60).tolist(),
+            b=rng.normal(0, 1, 60).tolist(),
+            ids=list(range(60))
+        )
+
+    def reference(self, items: list[TestItem], ability: float, stratum: list[TestItem]) -> TestItem:
+        candidates = [item for item in stratum if item in items]
+        return min(candidates, key=lambda item: (abs(float(item.b) - ability), float(item.b)))  # type: ignore
+
+    def test_strata(self):
+        selector = AStratifiedSelector(self.item_pool.test_items, n_strata=3, test_length=6)
+        self.assertIsInstance(selector, ItemSelectionStrategy)
+        self.assertEqual([len(stratum) for stratum in selector.strata], [20, 20, 20])
+        a = [[self.item_pool.test_items[i].a for i in stratum] for stratum in selector.strata]
+        self.assertLessEqual(max(a[0]), min(a[1]))
+        self.assertLessEqual(max(a[1]), min(a[2]))
+        for difficulties in selector.difficulties:
+            self.assertEqual(difficulties, sorted(difficulties))
+
+    def test_selection(self):
+        items = list(self.item_pool.test_items)
+        selector = AStratifiedSelector(items, n_strata=3, test_length=6)
+        strata = [[items[i] for i in stratum] for stratum in selector.strata]
+        abilities = [0.0, 0.3, 0.35, -1.2, 2.5, 0.1]
+        for step, ability in enumerate(abilities):
+            expected = self.reference(items, ability, strata[step // 2])
+            selected = selector(items, ability)
+            self.assertIs(selected, expected)
+            items.remove(selected)
+
+    def test_exhausted_stratum(self):
+        items = list(self.item_pool.test_items)
+        selector = AStratifiedSelector(items, n_strata=3, test_length=3)
+        lowest = [items[i] for i in selector.strata[0]]
+        # all items of the first stratum have been administered elsewhere
+        # and 20 items have been administered: the last stratum is used
+        remaining = [item for item in items if item not in lowest]
+        selected = selector(remaining, 0.0)
+        self.assertIn(selected, [items[i] for i in selector.strata[2]])
+
+        # only the first stratum is left
+        selected = selector(lowest[:1], 0.0)
+        self.assertIs(selected, lowest[0])
+        with self.assertRaises(ItemSelectionException):
+            selector([], 0.0)
+
+    def test_test_assembler(self):
+        selector = AStratifiedSelector(self.item_pool.test_items, n_strata=3, test_length=6)
+        test = TestAssembler(self.item_pool, "a_stratified", "1", MLEstimator,
+                             item_selector=selector,
+                             true_ability_level=0.5, seed=2)
+        for _ in range(6):
+            test.run_test_once()
+        strata = [set([selector.items[i].id for i in stratum]) for stratum in selector.strata]
+        administered = [item.id for item in test.answered_items]
+        self.assertTrue(set(administered[:2]) <= strata[0])
+        self.assertTrue(set(administered[2:4]) <= strata[1])
+        self.assertTrue(set(administered[4:]) <= strata[2])
+
+    def test_shared_selector(self):
+        selector = AStratifiedSelector(self.item_pool.test_items, n_strata=3, test_length=6)
+
+        def run_test(participant: int) -> list[int | None]:
+            test = TestAssembler(self.item_pool, "a_stratified", str(participant), MLEstimator,
+                                 item_selector=selector,
+                                 true_ability_level=participant / 4 - 1, seed=participant)
+            for _ in range(6):
+                test.run_test_once()
+            return [item.id for item in test.answered_items]
+
+        # the copies of the item pool use the strata of the selector
+        with patch("adaptivetesting.math.item_selection.__a_stratified_selection.np.argsort",
+                   wraps=np.argsort) as argsort:
+            expected = [run_test(participant) for participant in range(8)]
+        self.assertEqual(argsort.call_count, 0)
+        # every test has its own stage and available items
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            self.assertEqual(list(executor.map(run_test, range(8))), expected)
+
+    def test_new_items(self):
+        selector = AStratifiedSelector(self.item_pool.test_items[:30], n_strata=2, test_length=4)
+        items = self.item_pool.test_items[30:]
+        selected = selector(items, 0.0)
+        self.assertIn(selected, items)
+        self.assertEqual(sum([len(stratum) for stratum in selector.strata]), 30)
+
+        with self.assertRaises(ValueError):
+            AStratifiedSelector(self.item_pool.test_items, n_strata=0, test_length=4)
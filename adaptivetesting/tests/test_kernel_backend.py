@@ -0,0 +1,123 @@
+import unittest
+import warnings
+from unittest.mock import patch
+import numpy as np
+import adaptivetesting as adt
+from adaptivetesting.math.__kernels import python_kernels, pack_thresholds, numba_available
+from adaptivetesting.math.estimators.__test_information import dicho_item_information_function
+from adaptivetesting.math.estimators.__functions.__estimators import log_likelihood
+from adaptivetesting.math.estimators.__functions.__poly.__grm import GRM
+from adaptivetesting.math.estimators.__functions.__poly.__gpcm import GPCM
+
+
+rng = np.random.default_rng(12)
+a = rng.uniform(0.5, 2.5, 30)
+b = rng.normal(0, 1.5, 30)
+c = rng.uniform(0, 0.25, 30)
+d = rng.uniform(0.9, 1, 30)
+responses = rng.integers(0, 2, 30)
+abilities = [-600.0, -8.0, -1.3, 0.0, 0.4, 2.7, 9.0, 600.0]
+
+poly_a = [0.943, 0.972, 1.210, 1.5]
+poly_thresholds = [[0.071, 0.129], [0.461, 1.715], [-1.265, -0.687, 0.3], [-0.5]]
+poly_responses = [2, 1, 3, 0]
+
+
+def evaluate_functions() -> list:
+    """Values of the public functions for the active backend"""
+    items = adt.ItemPool.load_from_list(a=a[:8].tolist(), b=b[:8].tolist(), c=c[:8].tolist(),
+                                        d=d[:8].tolist()).test_items
+    poly_items = adt.ItemPool.load_from_list(a=poly_a, b=poly_thresholds).test_items
+    return [
+        [adt.probability_y1(np.array(mu), a, b, c, d) for mu in abilities],
+        adt.probability_y1(np.array(0.3), np.array(1.2), np.array(0.1), np.array(0.2), np.array(1.0)),
+        [log_likelihood(np.array(mu), a, b, c, d, responses) for mu in abilities],
+        [adt.item_information_function(mu, item) for mu in [-2.0, 0.5] for item in items],
+        adt.maximize_likelihood_function(a, b, c, d, responses),
+        adt.MLEstimator(poly_responses, poly_items, model="GRM").get_estimation(),
+        adt.MLEstimator(poly_responses, poly_items, model="GPCM").get_estimation(),
+        [adt.item_information_function(0.2, item, "GRM") for item in poly_items],
+        [adt.item_information_function(0.2, item, "GPCM") for item in poly_items]
+    ]
+
+
+class TestKernelParity(unittest.TestCase):
+    """The kernels return the same values as the NumPy implementations."""
+    kernels = python_kernels()
+
+    def test_dichotomous(self):
+        for mu in abilities:
+            np.testing.assert_allclose(self.kernels.probability_y1_kernel(mu, a, b, c, d),
+                                       adt.probability_y1(np.array(mu), a, b, c, d), rtol=1e-12, atol=1e-300)
+            np.testing.assert_allclose(self.kernels.log_likelihood_kernel(mu, a, b, c, d, responses),
+                                       log_likelihood(np.array(mu), a, b, c, d, responses), rtol=1e-12)
+            np.testing.assert_allclose(self.kernels.item_information_kernel(mu, a, b, c, d),
+                                       dicho_item_information_function(np.array(mu), a, b, c, d),
+                                       rtol=1e-5, atol=1e-12)
+
+    def test_polytomous(self):
+        packed, n_thresholds = pack_thresholds(poly_thresholds)
+        for theta in [-12.0, -1.0, 0.0, 0.7, 3.0, 12.0]:
+            for item_a, thresholds in zip(poly_a, poly_thresholds):
+                for category in range(len(thresholds) + 2):
+                    self.assertAlmostEqual(
+                        self.kernels.grm_category_prob_kernel(theta, item_a, np.array(thresholds), category),
+                        GRM.category_prob(theta, item_a, thresholds, category), places=12)
+                for category in range(len(thresholds) + 1):
+                    self.assertAlmostEqual(
+                        self.kernels.gpcm_category_log_prob_kernel(theta, item_a, np.array(thresholds), category),
+                        GPCM.category_prob(theta, item_a, thresholds, category), places=10)
+            self.assertAlmostEqual(
+                self.kernels.grm_log_likelihood_kernel(theta, np.array(poly_a), packed, n_thresholds,
+                                                       np.array(poly_responses)),
+                GRM.log_likelihood(theta, poly_a, poly_thresholds, poly_responses), places=10)
+            self.assertAlmostEqual(
+                self.kernels.gpcm_log_likelihood_kernel(theta, np.array(poly_a), packed, n_thresholds,
+                                                        np.array(poly_responses)),
+                GPCM.log_likelihood(theta, poly_a, poly_thresholds, poly_responses), places=10)
+
+    def test_dispatch(self):
+        # the public functions route the supported calls to the kernels of the active backend
+        expected = evaluate_functions()
+        with patch("adaptivetesting.math.__kernels._active_kernels", python_kernels()):
+            self.assertEqual(adt.get_backend(), "numba")
+            actual = evaluate_functions()
+        self.assertEqual(adt.get_backend(), "numpy")
+        for expected_value, actual_value in zip(expected, actual):
+            np.testing.assert_allclose(np.asarray(actual_value, dtype=float),
+                                       np.asarray(expected_value, dtype=float), rtol=1e-4, atol=1e-12)
+
+        # several ability levels at once are calculated with NumPy
+        with patch("adaptivetesting.math.__kernels._active_kernels", python_kernels()):
+            matrix = adt.probability_y1(np.array([[0.0], [1.0]]), a, b, c, d)
+        self.assertEqual(matrix.shape, (2, 30))
+
+
+class TestBackendSetting(unittest.TestCase):
+    def tearDown(self):
+        adt.set_backend("numpy")
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            adt.set_backend("cuda")  # type: ignore
+
+    @unittest.skipIf(numba_available(), "numba is installed")
+    def test_fallback_without_numba(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            adt.set_backend("numba")
+        self.assertEqual(adt.get_backend(), "numpy")
+        self.assertTrue(any(issubclass(warning.category, RuntimeWarning) for warning in caught))
+
+    @unittest.skipUnless(numba_available(), "numba is not installed")
+    def test_numba_parity(self):
+        expected = evaluate_functions()
+        adt.set_backend("numba")
+        self.assertEqual(adt.get_backend(), "numba")
+        for expected_value, actual_value in zip(expected, evaluate_functions()):
+            np.testing.assert_allclose(np.asarray(actual_value, dtype=float),
+                                       np.asarray(expected_value, dtype=float), rtol=1e-4, atol=1e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+import adaptivetesting as adt
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_dichotomous_test_without_heavy_dependencies(self):
+        code = """
+import json, sys
+import adaptivetesting as adt
+item_pool = adt.ItemPool.load_from_list(a=[1.0] * 10, b=[i / 5 for i in range(-5, 5)], ids=list(range(10)))
+test = adt.TestAssembler(item_pool, "lazy_imports", "1", adt.MLEstimator, true_ability_level=0.5, seed=3)
+for _ in range(3):
+    test.run_test_once()
+print(json.dumps([m for m in ["matplotlib", "pandas", "numdifftools", "adaptivetesting.tests"] if m in sys.modules]))
+"""
+        output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True,
+                                cwd=ROOT).stdout
+        self.assertEqual(json.loads(output.strip().splitlines()[-1]), [])
+
+    def test_subpackage_entry_points(self):
+        # the modules are not imported in a fixed order anymore, so every subpackage has to be importable first
+        for subpackage in ["data", "implementations", "math", "math.estimators", "models", "services", "simulation"]:
+            process = subprocess.run([sys.executable, "-c", f"import adaptivetesting.{subpackage}"],
+                                     capture_output=True, text=True, cwd=ROOT)
+            self.assertEqual(process.returncode, 0, process.stderr)
+
+    def test_public_names(self):
+        for name in adt.__all__:
+            self.assertIsNotNone(getattr(adt, name), name)
+        self.assertIn("TestAssembler", dir(adt))
+        self.assertIs(adt.utils.plot_icc, adt.plot_icc)
+        self.assertIs(adt.models.ItemPool, adt.ItemPool)
+        with self.assertRaises(AttributeError):
+            adt.does_not_exist  # type: ignore
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+from unittest.mock import patch
+import numpy as np
+import adaptivetesting as adt
+from adaptivetesting.math.__kernels import python_kernels
+from adaptivetesting.math.estimators.__functions.__estimators import log_likelihood
+
+
+rng = np.random.default_rng(5)
+a = rng.uniform(0.5, 2.5, 25)
+b = rng.normal(0, 1.5, 25)
+c = rng.uniform(0, 0.25, 25)
+d = rng.uniform(0.9, 1, 25)
+responses = rng.integers(0, 2, 25)
+
+
+class TestLogProbabilities(unittest.TestCase):
+    def test_probabilities(self):
+        for mu in [-4.0, -0.7, 0.0, 1.3, 4.0]:
+            p, log_p, log_q = adt.log_probabilities(mu, a, b, c, d)
+            np.testing.assert_allclose(p, adt.probability_y1(np.array(mu), a, b, c, d), rtol=1e-12)
+            np.testing.assert_allclose(log_p, np.log(adt.probability_y1(np.array(mu), a, b, c, d)), rtol=1e-12)
+            np.testing.assert_allclose(log_q, np.log(adt.probability_y0(np.array(mu), a, b, c, d)), rtol=1e-10)
+
+    def test_two_parameter_items(self):
+        zeros = np.zeros(25)
+        ones = np.ones(25)
+        p, log_p, log_q = adt.log_probabilities(0.5, a, b, zeros, ones)
+        np.testing.assert_allclose(p, 1 / (1 + np.exp(-a * (0.5 - b))), rtol=1e-12)
+        np.testing.assert_allclose(np.exp(log_p) + np.exp(log_q), 1, rtol=1e-12)
+
+        # the log-probabilities stay finite far away from the item difficulty
+        _, log_p, log_q = adt.log_probabilities(np.array([-800.0, 800.0]), np.ones(2), np.zeros(2),
+                                                np.zeros(2), np.ones(2))
+        np.testing.assert_allclose(log_p, [-800.0, 0.0], atol=1e-300)
+        np.testing.assert_allclose(log_q, [0.0, -800.0], atol=1e-300)
+
+    def test_out_buffers(self):
+        out = (np.empty((3, 25)), np.empty((3, 25)), np.empty((3, 25)))
+        result = adt.log_probabilities(np.array([[-1.0], [0.0], [1.0]]), a, b, c, d, out=out)
+        for buffer, array in zip(out, result):
+            self.assertIs(buffer, array)
+        np.testing.assert_allclose(out[0][1], adt.probability_y1(np.array(0.0), a, b, c, d), rtol=1e-12)
+
+
+class TestLogLikelihoodWorkspace(unittest.TestCase):
+    def test_log_likelihood(self):
+        workspace = adt.LogLikelihoodWorkspace(a, b, c, d, responses)
+        grid = np.linspace(-5, 5, 41)
+        expected = [log_likelihood(np.array(mu), a, b, c, d, responses) for mu in grid]
+        np.testing.assert_allclose([workspace.log_likelihood(mu) for mu in grid], expected, rtol=1e-12)
+        np.testing.assert_allclose(workspace.log_likelihood(grid), expected, rtol=1e-12)
+
+        # the kernels of the numba backend give the same values
+        with patch("adaptivetesting.math.__kernels._active_kernels", python_kernels()):
+            np.testing.assert_allclose([workspace.log_likelihood(mu) for mu in grid], expected, rtol=1e-12)
+
+    def test_buffers_are_reused(self):
+        workspace = adt.LogLikelihoodWorkspace(a, b, c, d, responses)
+        first = workspace.log_probabilities(0.1)
+        second = workspace.log_probabilities(0.9)
+        for buffer, array in zip(first, second):
+            self.assertIs(buffer, array)
+        self.assertEqual(workspace.log_probabilities(np.linspace(-1, 1, 7))[0].shape, (7, 25))
+
+    def test_estimators(self):
+        # the estimators evaluate the workspace instead of the log-likelihood function
+        estimate = adt.maximize_likelihood_function(a, b, c, d, responses)
+        grid = np.linspace(-10, 10, 20001)
+        reference = grid[np.argmax([log_likelihood(np.array(mu), a, b, c, d, responses) for mu in grid])]
+        self.assertAlmostEqual(estimate, reference, places=3)
+
+        items = adt.ItemPool.load_from_list(a=a.tolist(), b=b.tolist(), c=c.tolist(), d=d.tolist()).test_items
+        eap = adt.ExpectedAPosteriori(responses.tolist(), items, adt.NormalPrior(0, 1)).get_estimation()
+        x = np.linspace(-10, 10, 1000)
+        weights = np.exp([log_likelihood(np.array(mu), a, b, c, d, responses) for mu in x]) * np.exp(-x ** 2 / 2)
+        self.assertAlmostEqual(eap, np.sum(x * weights) / np.sum(weights), places=4)
+
+
+if __name__ == "__main__":
+    unittest.main()
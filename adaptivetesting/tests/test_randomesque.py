@@ -0,0 +1,72 @@
+import unittest
+import numpy as np
+import adaptivetesting as adt
+from adaptivetesting.tests.__item_pools import create_item_pool
+from adaptivetesting.math.exposure_control import Randomesque
+
+
+class DummyAdaptiveTest:
+    def __init__(self, item_pool: adt.ItemPool, ability_level: float):
+        self.item_pool = item_pool
+        self.ability_level = ability_level
+
+
+class TestRandomesque(unittest.TestCase):
+    def setUp(self):
+        self.item_pool = create_item_pool(60, 7, a_range=(0.5, 2))
+
+    def legacy_candidates(self, ability: float, n_items: int, reverse: bool = True) -> set[int | None]:
+        information = sorted([(adt.item_information_function(ability, item), item.id)
+                              for item in self.item_pool.test_items], reverse=reverse)
+        return set([item_id for _, item_id in information[:n_items]])
+
+    def test_selects_from_top_k(self):
+        test = DummyAdaptiveTest(self.item_pool, 0.4)
+        randomesque = Randomesque(test, n_items=5, seed=1)  # type: ignore
+        selected = set([randomesque.select_item().id for _ in range(200)])
+        self.assertEqual(selected, self.legacy_candidates(0.4, 5))
+
+        least_informative = Randomesque(test, n_items=4, seed=1, reverse=False)  # type: ignore
+        selected = set([least_informative.select_item().id for _ in range(200)])
+        self.assertEqual(selected, self.legacy_candidates(0.4, 4, reverse=False))
+
+    def test_reproducible(self):
+        first = Randomesque(DummyAdaptiveTest(self.item_pool, 0.0), n_items=5, seed=3)  # type: ignore
+        second = Randomesque(DummyAdaptiveTest(self.item_pool, 0.0), n_items=5, seed=3)  # type: ignore
+        self.assertEqual([first.select_item().id for _ in range(10)],
+                         [second.select_item().id for _ in range(10)])
+
+    def test_pool_changes(self):
+        test = DummyAdaptiveTest(self.item_pool, 0.0)
+        randomesque = Randomesque(test, n_items=3, seed=2)  # type: ignore
+        for step in range(20):
+            item = randomesque.select_item()
+            self.assertIn(item.id, self.legacy_candidates(test.ability_level, 3))
+            self.item_pool.delete_item(item)
+            test.ability_level = -1 + step / 10
+        self.assertEqual(len(self.item_pool.test_items), 40)
+
+    def test_sample_top_k(self):
+        rng = np.random.default_rng(0)
+        information = np.array([0.1, 0.9, 0.5, 0.7])
+        self.assertEqual(Randomesque.sample_top_k(information, 1, rng), 1)
+        self.assertEqual(Randomesque.sample_top_k(information, 1, rng, reverse=False), 0)
+        self.assertIn(Randomesque.sample_top_k(information, 10, rng), range(4))
+        with self.assertRaises(ValueError):
+            Randomesque.sample_top_k(information, 0, rng)
+
+    def test_polytomous_items(self):
+        item_pool = adt.ItemPool.load_from_list(a=[1.0, 1.5, 0.8], b=[[-1, 0.5], [0.2, 1.0], [-0.5, 0.3]])
+        randomesque = Randomesque(DummyAdaptiveTest(item_pool, 0.0), n_items=1, seed=1)  # type: ignore
+        information = [adt.item_information_function(0.0, item) for item in item_pool.test_items]
+        self.assertIs(randomesque.select_item(), item_pool.test_items[int(np.argmax(information))])
+
+    def test_test_assembler(self):
+        test = adt.TestAssembler(self.item_pool, "randomesque", "1", adt.MLEstimator,
+                                 exposure_control="Randomesque",
+                                 exposure_control_args={"constraints": None, "participant_ids": None,
+                                                        "output_format": None, "n_items": 4, "seed": 5},
+                                 true_ability_level=0.0, seed=5)
+        for _ in range(6):
+            test.run_test_once()
+        self.assertEqual(len(set([item.id for item in test.answered_items])), 6)
@@ -0,0 +1,80 @@
+import unittest
+import inspect
+from unittest.mock import patch
+import adaptivetesting as adt
+from adaptivetesting.math.exposure_control import Randomesque
+
+
+def create_item_pool() -> adt.ItemPool:
+    return adt.ItemPool.load_from_list(
+        a=[1.32, 1.07, 0.84, 1.2, 0.9, 1.1, 1.4, 0.7],
+        b=[-0.63, 0.18, -0.84, 0.4, 0.0, -0.2, 1.1, -1.3],
+        ids=list(range(8)),
+        content_categories=[["Math"], ["English"]] * 4
+    )
+
+
+class TestSelectionPipeline(unittest.TestCase):
+    def create_test(self, **kwargs) -> adt.TestAssembler:
+        return adt.TestAssembler(create_item_pool(), "pipeline", "1", adt.MLEstimator,
+                                 true_ability_level=0.3, seed=2, **kwargs)
+
+    def test_compiled_once(self):
+        test = self.create_test()
+        with patch("inspect.signature", wraps=inspect.signature) as signature:
+            for _ in range(4):
+                test.run_test_once()
+        # the signature of the item selector is only inspected once
+        # (the remaining calls belong to the ability estimator)
+        self.assertEqual(signature.call_count, 1 + 4)
+        self.assertEqual(len(test.answered_items), 4)
+
+    def test_strategy_is_kept(self):
+        test = self.create_test(
+            content_balancing="WeightedPenaltyModel",
+            content_balancing_args={
+                "constraints": [adt.Constraint("Math", 0.5, 0.5, 0.3, 0.7),
+                                adt.Constraint("English", 0.5, 0.5, 0.3, 0.7)],
+                "constraint_weight": 0.5,
+                "information_weight": 0.5
+            }
+        )
+        pipeline = test.selection_pipeline
+        self.assertIsInstance(pipeline.strategy, adt.WeightedPenaltyModel)
+        for _ in range(3):
+            test.run_test_once()
+        self.assertIs(test.selection_pipeline, pipeline)
+        self.assertEqual(pipeline.strategy.state.test_length, 2)
+
+    def test_recompiled_on_new_settings(self):
+        test = self.create_test(exposure_control="Randomesque",
+                                exposure_control_args={"constraints": None, "participant_ids": None,
+                                                       "output_format": None, "n_items": 3, "seed": 1})
+        pipeline = test.selection_pipeline
+        self.assertIsInstance(pipeline.strategy, Randomesque)
+        test.exposure_control = None
+        test.exposure_control_args = None
+        self.assertIsNot(test.selection_pipeline, pipeline)
+        self.assertIsNone(test.selection_pipeline.strategy)
+
+    def test_hooks(self):
+        test = self.create_test()
+        selected: list[adt.TestItem] = []
+        administered: list[adt.TestItem] = []
+        test.selection_pipeline.add_selection_hook(selected.append)
+        test.selection_pipeline.add_administration_hook(administered.append)
+        for _ in range(3):
+            test.run_test_once()
+        self.assertEqual(selected, test.answered_items)
+        self.assertEqual(administered, test.answered_items)
+
+    def test_invalid_settings(self):
+        test = self.create_test(content_balancing="MaximumPriorityIndex",
+                                exposure_control="Randomesque")
+        with self.assertRaises(ValueError):
+            test.get_next_item()
+
+    def test_missing_item(self):
+        pipeline = adt.SelectionPipeline(lambda: None, error_message="no item")
+        with self.assertRaises(adt.ItemSelectionException):
+            pipeline.select_item()
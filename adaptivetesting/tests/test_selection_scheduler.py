@@ -0,0 +1,85 @@
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import adaptivetesting as adt
+from adaptivetesting.tests.__item_pools import create_item_pool
+
+
+class TestSelectionScheduler(unittest.TestCase):
+    def setUp(self):
+        self.items = create_item_pool(50, 21, guessing=True).test_items
+        self.item_bank = adt.ItemBank(self.items)
+
+    def test_batch_matches_maximum_information(self):
+        rng = np.random.default_rng(3)
+        requests = [
+            ([item for item in self.items if rng.random() < 0.6], float(rng.normal()))
+            for _ in range(16)
+        ]
+        scheduler = adt.SelectionScheduler(self.item_bank, max_batch_size=16, max_delay=10)
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            selected = list(executor.map(lambda request: scheduler(*request), requests))
+
+        for (items, ability), item in zip(requests, selected):
+            self.assertIs(item, adt.maximum_information_criterion(items, ability))
+        self.assertEqual(scheduler.n_batches, 1)
+        self.assertEqual(scheduler.n_requests, 16)
+
+    def test_single_request(self):
+        scheduler = adt.SelectionScheduler(self.item_bank, max_batch_size=8, max_delay=0.001)
+        items = self.items[10:]
+        self.assertIs(scheduler(items, 0.3), adt.maximum_information_criterion(items, 0.3))
+        self.assertEqual(scheduler.n_batches, 1)
+
+        with self.assertRaises(adt.ItemSelectionException):
+            scheduler([], 0.0)
+        unknown = adt.TestItem()
+        unknown.id = 1000
+        with self.assertRaises(ValueError):
+            scheduler([unknown], 0.0)
+        with self.assertRaises(ValueError):
+            adt.SelectionScheduler(self.item_bank, max_batch_size=0)
+        with self.assertRaises(ValueError):
+            adt.SelectionScheduler(self.item_bank, max_delay=-1)
+
+    def test_concurrent_sessions(self):
+        item_pool = create_item_pool(50, 21, guessing=True)
+        patterns = [adt.generate_response_pattern(ability, self.items, seed=i)
+                    for i, ability in enumerate(np.linspace(-2, 2, 8))]
+        # the batches are only evaluated when full, so that the 8 sessions select their items in lockstep
+        scheduler = adt.SelectionScheduler(self.item_bank, max_batch_size=8, max_delay=10)
+
+        expected = []
+        for pattern in patterns:
+            test = adt.TestAssembler(item_pool, "scheduler", "0", adt.MLEstimator, simulation=False)
+            session = adt.CATSession(test, adt.StoppingCriterion.LENGTH, 6)
+            step = session.start()
+            while not session.finished:
+                step = session.submit(pattern[step.id])  # type: ignore
+            expected.append([item.id for item in test.answered_items])
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            sessions = []
+
+            async def run_all():
+                for pattern in patterns:
+                    test = adt.TestAssembler(item_pool, "scheduler", "0", adt.MLEstimator,
+                                             item_selector=scheduler, simulation=False)
+                    sessions.append(adt.CATSession(test, adt.StoppingCriterion.LENGTH, 6, executor))
+
+                async def steps(session: adt.CATSession, pattern: list[int]):
+                    step = await session.astart()
+                    while not session.finished:
+                        step = await session.asubmit(pattern[step.id])  # type: ignore
+                await asyncio.gather(*[steps(session, pattern) for session, pattern in zip(sessions, patterns)])
+            asyncio.run(run_all())
+
+        self.assertEqual([[item.id for item in session.adaptive_test.answered_items] for session in sessions],
+                         expected)
+        self.assertEqual(scheduler.n_requests, 8 * 6)
+        self.assertEqual(scheduler.n_batches, 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
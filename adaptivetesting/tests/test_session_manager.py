@@ -0,0 +1,238 @@
+import asyncio
+import pathlib
+import shutil
+import tempfile
+import threading
+import unittest
+from functools import partial
+import adaptivetesting as adt
+from adaptivetesting.tests.__item_pools import create_item_bank
+
+
+test_factory = partial(adt.TestAssembler, ability_estimator=adt.MLEstimator, simulation=False)
+
+
+class TestSessionStores(unittest.TestCase):
+    def check_store(self, store):
+        self.assertIsNone(store.load("a"))
+        store.save("a", b"first")
+        store.save("a/b", b"second")
+        store.save("a", b"third")
+        self.assertEqual(store.load("a"), b"third")
+        self.assertEqual(store.load("a/b"), b"second")
+        self.assertEqual(len(store), 2)
+        store.delete("a")
+        store.delete("unknown")
+        self.assertIsNone(store.load("a"))
+        self.assertEqual(len(store), 1)
+
+    def test_sqlite_store(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = adt.SQLiteSessionStore(f"{directory}/sessions.db")
+            self.check_store(store)
+            store.close()
+
+    def test_file_store(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.check_store(adt.FileSessionStore(directory))
+
+
+class TestSessionManager(unittest.TestCase):
+    def setUp(self):
+        def clean_up():
+            for path in pathlib.Path("data").glob("session_manager*"):
+                if path.is_dir():
+                    shutil.rmtree(path)
+                else:
+                    path.unlink()
+
+        clean_up()
+        self.addCleanup(clean_up)
+        self.directory = tempfile.TemporaryDirectory()
+        self.item_bank = create_item_bank(40, 11)
+        self.patterns = {
+            str(i): adt.generate_response_pattern(ability, self.item_bank.items, seed=i)
+            for i, ability in enumerate([-1.5, -0.5, 0.0, 0.5, 1.5])
+        }
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def create_manager(self, capacity: int) -> adt.SessionManager:
+        return adt.SessionManager(self.item_bank, test_factory, "session_manager",
+                                  adt.StoppingCriterion.LENGTH, 6, capacity=capacity,
+                                  store=adt.FileSessionStore(self.directory.name))
+
+    def expected(self, session_id: str) -> tuple[list[int | None], float]:
+        test = test_factory(item_pool=adt.ItemPool(list(self.item_bank.items)), simulation_id="expected",
+                            participant_id=session_id)
+        session = adt.CATSession(test, adt.StoppingCriterion.LENGTH, 6)
+        step = session.start()
+        while not session.finished:
+            step = session.submit(self.patterns[session_id][step.id])  # type: ignore
+        return [item.id for item in test.answered_items], test.ability_level
+
+    def test_eviction_and_rehydration(self):
+        manager = self.create_manager(capacity=2)
+        current = {session_id: manager.start(manager.create(session_id)) for session_id in self.patterns}
+        self.assertEqual(len(manager), 2)
+        self.assertEqual(manager.evictions, 3)
+        self.assertIn("0", manager)
+
+        final: dict[str, adt.TestResult] = {}
+        while len(current) > 0:
+            # answer the sessions in turns, so that every step needs a spilled session
+            for session_id in list(current):
+                step = manager.submit(session_id, self.patterns[session_id][current[session_id].id])  # type: ignore
+                if isinstance(step, adt.TestResult):
+                    final[session_id] = step
+                    del current[session_id]
+                else:
+                    current[session_id] = step
+
+        for session_id in self.patterns:
+            items, ability_level = self.expected(session_id)
+            results = adt.SQLiteContext("session_manager", session_id).load()
+            self.assertEqual([result.showed_item["id"] for result in results], items)
+            self.assertAlmostEqual(final[session_id].ability_estimation, ability_level)
+            self.assertNotIn(session_id, manager)
+
+        statistics = manager.statistics()
+        self.assertEqual(statistics["hits"] + statistics["misses"], 5 * 7)
+        self.assertGreater(statistics["misses"], 0)
+        self.assertEqual(statistics["rehydrations"], statistics["misses"])
+        self.assertEqual(statistics["in_memory"], 0)
+
+    def test_evict(self):
+        manager = self.create_manager(capacity=10)
+        session_id = manager.create()
+        item = manager.start(session_id)
+        self.assertFalse(manager.evict("unknown"))
+        self.assertTrue(manager.evict(session_id))
+        self.assertEqual(len(manager), 0)
+        self.assertIs(manager.start(session_id), item)
+        self.assertEqual(manager.statistics()["rehydrations"], 1)
+
+        manager.spill_all()
+        self.assertEqual(len(manager), 0)
+        with self.assertRaises(ValueError):
+            manager.create(session_id)
+        with self.assertRaises(KeyError):
+            manager.submit("unknown", 1)
+        with self.assertRaises(ValueError):
+            self.create_manager(capacity=0)
+
+    def test_output_formats(self):
+        for output_format in [adt.ResultOutputFormat.SQLITE, adt.ResultOutputFormat.PICKLE,
+                              adt.ResultOutputFormat.COLUMNAR]:
+            with self.subTest(output_format=output_format):
+                simulation_id = f"session_manager_{output_format.name.lower()}"
+                manager = adt.SessionManager(self.item_bank, test_factory, simulation_id,
+                                             adt.StoppingCriterion.LENGTH, 6, capacity=1,
+                                             store=adt.FileSessionStore(self.directory.name),
+                                             test_result_output=output_format)
+                current = {session_id: manager.start(manager.create(session_id)) for session_id in ["0", "1"]}
+                while len(current) > 0:
+                    # every step spills the other session and rehydrates this one
+                    for session_id in list(current):
+                        step = manager.submit(session_id,
+                                              self.patterns[session_id][current[session_id].id])  # type: ignore
+                        if isinstance(step, adt.TestResult):
+                            del current[session_id]
+                        else:
+                            current[session_id] = step
+                self.assertGreater(manager.rehydrations, 0)
+                for session_id in ["0", "1"]:
+                    results = adt.load_test_results_single_participant(simulation_id, session_id, output_format)
+                    self.assertEqual([result.showed_item["id"] for result in results], self.expected(session_id)[0])
+                if output_format == adt.ResultOutputFormat.COLUMNAR:
+                    # the results are only saved when the test is finished
+                    participant_ids = adt.read_columnar_results(simulation_id)["participant_id"].tolist()
+                    self.assertEqual(sorted(participant_ids), ["0"] * 6 + ["1"] * 6)
+
+        # the CSV results cannot be loaded again without loss
+        with self.assertRaises(ValueError):
+            adt.SessionManager(self.item_bank, test_factory, "session_manager",
+                               store=adt.FileSessionStore(self.directory.name),
+                               test_result_output=adt.ResultOutputFormat.CSV)
+
+    def test_spill_keeps_results(self):
+        manager = self.create_manager(capacity=10)
+        session_id = manager.create()
+        item = manager.start(session_id)
+        step = manager.submit(session_id, self.patterns["0"][item.id])  # type: ignore
+        self.assertTrue(manager.evict(session_id))
+        self.assertFalse(manager.evict(session_id))
+        manager.spill_all()
+        self.assertEqual(manager.evictions, 1)
+        # the test results are restored from the snapshot
+        data = adt.FileSessionStore(self.directory.name).load(session_id)
+        snapshot = adt.SessionSnapshot.from_bytes(data)  # type: ignore
+        restored = adt.CATSession.restore(snapshot, self.item_bank,
+                                          partial(test_factory, simulation_id="session_manager",
+                                                  participant_id=session_id, copy_item_pool=False))
+        test = test_factory(item_pool=adt.ItemPool(list(self.item_bank.items)), simulation_id="session_manager",
+                            participant_id=session_id, copy_item_pool=False)
+        test.administer_item(item, self.patterns["0"][item.id])  # type: ignore
+        self.assertEqual([(result.showed_item, result.ability_estimation, result.standard_error, result.response)
+                          for result in restored.adaptive_test.test_results],
+                         [(result.showed_item, result.ability_estimation, result.standard_error, result.response)
+                          for result in test.test_results])
+        self.assertIs(manager.submit(session_id, self.patterns["0"][step.id]).__class__, adt.TestItem)  # type: ignore
+
+    def test_store_access_does_not_block_other_sessions(self):
+        blocking = threading.Event()
+        loading = threading.Event()
+        proceed = threading.Event()
+        store = adt.FileSessionStore(self.directory.name)
+
+        class SlowStore(adt.FileSessionStore):
+            def load(self, session_id: str) -> bytes | None:
+                if session_id == "slow" and blocking.is_set():
+                    loading.set()
+                    proceed.wait(10)
+                return store.load(session_id)
+
+        manager = adt.SessionManager(self.item_bank, test_factory, "session_manager",
+                                     adt.StoppingCriterion.LENGTH, 6, capacity=10,
+                                     store=SlowStore(self.directory.name))
+        slow_item = manager.start(manager.create("slow"))
+        self.assertTrue(manager.evict("slow"))
+        fast_item = manager.start(manager.create("fast"))
+
+        blocking.set()
+        slow = threading.Thread(target=manager.submit, args=("slow", self.patterns["0"][slow_item.id]))  # type: ignore
+        slow.start()
+        self.assertTrue(loading.wait(10))
+        # the other session is served while the spilled session is being loaded
+        fast = threading.Thread(target=manager.submit, args=("fast", self.patterns["1"][fast_item.id]))  # type: ignore
+        fast.start()
+        fast.join(5)
+        finished = not fast.is_alive()
+        proceed.set()
+        slow.join()
+        fast.join()
+        self.assertTrue(finished)
+
+    def test_async(self):
+        manager = self.create_manager(capacity=2)
+
+        async def run(session_id: str) -> list[int]:
+            manager.create(session_id)
+            step = await manager.astart(session_id)
+            ids = []
+            while isinstance(step, adt.TestItem):
+                ids.append(step.id)
+                step = await manager.asubmit(session_id, self.patterns[session_id][step.id])  # type: ignore
+            return ids
+
+        async def run_all() -> list[list[int]]:
+            return await asyncio.gather(*[run(session_id) for session_id in self.patterns])
+
+        for session_id, ids in zip(self.patterns, asyncio.run(run_all())):
+            self.assertEqual(ids, self.expected(session_id)[0])
+        self.assertEqual(len(manager), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+from typing import Any
+from functools import partial
+import numpy as np
+import adaptivetesting as adt
+from adaptivetesting.tests.__item_pools import create_item_pool
+
+
+class TestSessionSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.item_pool = create_item_pool(60, 9, first_id=100)
+        self.item_bank = adt.ItemBank.from_item_pool(self.item_pool)
+        self.responses = adt.generate_response_pattern(0.3, self.item_pool.test_items, seed=4)
+
+    def response(self, item: adt.TestItem) -> int:
+        return self.responses[item.id - 100]  # type: ignore
+
+    def run_session(self, test_factory, restore_after: int | None = None,
+                    length: int = 8) -> tuple[list[int | None], float, int]:
+        session = adt.CATSession(test_factory(self.item_pool), adt.StoppingCriterion.LENGTH, length)
+        step = session.start()
+        size = 0
+        while not session.finished:
+            step = session.submit(self.response(step))  # type: ignore
+            if len(session.adaptive_test.answered_items) == restore_after:
+                data = session.snapshot(self.item_bank).to_bytes()
+                size = len(data)
+                session = adt.CATSession.restore(adt.SessionSnapshot.from_bytes(data), self.item_bank,
+                                                 partial(test_factory, copy_item_pool=False),
+                                                 adt.StoppingCriterion.LENGTH, length)
+                step = session.current_item  # type: ignore
+        return [item.id for item in session.adaptive_test.answered_items], session.adaptive_test.ability_level, size
+
+    def test_roundtrip(self):
+        snapshot = adt.SessionSnapshot(self.item_bank.version, [3, 1], [1, 0], 0.25, 1.5, 7,
+                                       excluded=[9], rng_state=dict(np.random.default_rng(2).bit_generator.state))
+        restored = adt.SessionSnapshot.from_bytes(snapshot.to_bytes())
+        self.assertEqual(restored, snapshot)
+        self.assertLess(len(snapshot.to_bytes()), 120)
+
+        with self.assertRaises(ValueError):
+            adt.SessionSnapshot.from_bytes(b"nothing")
+
+    def test_restore(self):
+        test_factory = partial(adt.TestAssembler, simulation_id="snapshot", participant_id="1",
+                               ability_estimator=adt.MLEstimator, simulation=False)
+        self.item_pool.exclude_items([105])
+        expected = self.run_session(test_factory)
+        items, ability_level, size = self.run_session(test_factory, restore_after=4)
+        self.assertEqual((items, ability_level), expected[:2])
+        self.assertNotIn(105, items)
+        self.assertLess(size, 300)
+
+    def test_restore_enemy_groups(self):
+        test_factory = partial(adt.TestAssembler, simulation_id="snapshot", participant_id="1",
+                               ability_estimator=adt.MLEstimator, simulation=False)
+        # every item has one enemy, so that the test ends when one item of every pair has been administered
+        self.item_pool.set_enemy_groups([[100 + i, 159 - i] for i in range(30)])
+        self.item_bank = adt.ItemBank.from_item_pool(self.item_pool)
+        expected = self.run_session(test_factory, length=30)
+        self.assertEqual(sorted([min(item_id, 259 - item_id) for item_id in expected[0]]),  # type: ignore
+                         list(range(100, 130)))
+        for restore_after in [1, 12]:
+            self.assertEqual(self.run_session(test_factory, restore_after, length=30)[:2], expected[:2])
+
+    def test_restore_exposure_control(self):
+        parameters = adt.SympsonHetterParameters(self.item_bank.ids, np.full((1, 60), 0.5))  # type: ignore
+        settings: list[tuple[Any, dict[str, Any]]] = [
+            ("Randomesque", {"n_items": 5}),
+            ("SympsonHetter", {"n_items": None, "exposure_parameters": parameters})
+        ]
+        for exposure_control, args in settings:
+            test_factory = partial(adt.TestAssembler, simulation_id="snapshot", participant_id="1",
+                                   ability_estimator=adt.MLEstimator, simulation=False,
+                                   exposure_control=exposure_control,
+                                   exposure_control_args={"constraints": None, "participant_ids": None,
+                                                          "output_format": None, "seed": 3, **args})  # type: ignore
+            expected = self.run_session(test_factory)
+            for restore_after in [1, 5]:
+                self.assertEqual(self.run_session(test_factory, restore_after)[:2], expected[:2])
+
+    def test_different_bank(self):
+        session = adt.CATSession(adt.TestAssembler(self.item_pool, "snapshot", "1", adt.MLEstimator,
+                                                   simulation=False))
+        session.start()
+        snapshot = session.snapshot(self.item_bank)
+        other_bank = adt.ItemBank.from_item_pool(create_item_pool(61, 9, first_id=100))
+        with self.assertRaises(ValueError):
+            adt.CATSession.restore(snapshot, other_bank, lambda item_pool: adt.TestAssembler(
+                item_pool, "snapshot", "1", adt.MLEstimator, simulation=False))
@@ -0,0 +1,142 @@
+import unittest
+import pathlib
+import pickle
+from typing import Any
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import adaptivetesting as adt
+from adaptivetesting.data.__shared_exposure_counter import _process_locks
+
+
+def create_item_pool() -> adt.ItemPool:
+    return adt.ItemPool.load_from_list(
+        a=[1.32, 1.07, 0.84, 1.2, 0.9, 1.1],
+        b=[-0.63, 0.18, -0.84, 0.4, 0.0, -0.2],
+        ids=[1, 2, 3, 4, 5, 6],
+        content_categories=[["Math"], ["English"], ["Math"], ["English"], ["Math"], ["English", "Math"]]
+    )
+
+
+class TestSharedExposureCounter(unittest.TestCase):
+    def setUp(self):
+        self.item_pool = create_item_pool()
+        self.counter = adt.SharedExposureCounter.create(self.item_pool.test_items, n_locks=4)
+
+        def clean_up():
+            self.counter.close()
+            self.counter.unlink()
+            path = pathlib.Path("data/shared_exposure")
+            if path.exists():
+                shutil.rmtree(path)
+
+        self.addCleanup(clean_up)
+
+    def test_counts(self):
+        self.counter.on_item_administered(self.item_pool.test_items[5])
+        self.counter.on_item_administered(self.item_pool.test_items[0])
+        self.counter.on_item_administered(self.item_pool.test_items[5])
+        self.assertEqual(self.counter.counts.tolist(), [1, 0, 0, 0, 0, 2])
+        self.assertEqual(self.counter.constraint_counts(["Math", "English", "Art"]),
+                         {"Math": 3, "English": 2, "Art": 0})
+        self.assertEqual(self.counter.item_counts()[6], 2)
+        # counts are not increased again when the results are saved
+        self.counter.record("1", [self.item_pool.test_items[0].as_dict()])
+        self.assertEqual(self.counter.item_counts()[1], 1)
+
+    def test_attached_counter_shares_counts(self):
+        attached = adt.SharedExposureCounter.attach(self.counter.name,
+                                                    self.counter.item_ids,
+                                                    self.counter.constraint_names,
+                                                    self.counter.item_constraints,
+                                                    [self.counter._SharedExposureCounter__locks[0]])  # type: ignore
+        attached.on_item_administered(self.item_pool.test_items[1])
+        self.assertEqual(self.counter.constraint_counts(["English"]), {"English": 1})
+        attached.close()
+
+    def test_concurrent_increments(self):
+        item = self.item_pool.test_items[2]
+
+        def administer(_):
+            for _ in range(500):
+                self.counter.on_item_administered(item)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(administer, range(4)))
+        self.assertEqual(self.counter.item_counts()[3], 2000)
+        self.assertEqual(self.counter.constraint_counts(["Math"]), {"Math": 2000})
+
+    def test_unknown_item(self):
+        item = adt.TestItem()
+        item.id = 100
+        with self.assertRaises(ValueError):
+            self.counter.on_item_administered(item)
+
+    def test_parallel_simulation_with_mpi(self):
+        test_factory = partial(
+            adt.TestAssembler,
+            ability_estimator=adt.MLEstimator,
+            exposure_control="MaximumPriorityIndex",
+            exposure_control_args={
+                "constraints": [adt.Constraint("Math", 0.5, 6), adt.Constraint("English", 0.5, 6)],
+                "participant_ids": None,
+                "output_format": None,
+                "n_items": None,
+                "seed": None,
+                "exposure_counter": self.counter
+            }
+        )
+        specs = [adt.SimulationSpec(str(i), ability, seed=i)
+                 for i, ability in enumerate([-1.0, -0.5, 0.0, 0.5, 1.0, 1.5])]
+        adt.SpecSimulationPool(self.item_pool, test_factory, specs, "shared_exposure",
+                               adt.ResultOutputFormat.PICKLE,
+                               criterion=adt.StoppingCriterion.LENGTH,
+                               value=3,
+                               chunk_size=1,
+                               max_workers=2).start(parallel=True)
+
+        self.assertEqual(int(self.counter.counts.sum()), 18)
+        expected_counts: dict[int, int] = {}
+        for spec in specs:
+            for result in adt.load_test_results_single_participant("shared_exposure", spec.participant_id,
+                                                                   adt.ResultOutputFormat.PICKLE):
+                expected_counts[result.showed_item["id"]] = expected_counts.get(result.showed_item["id"], 0) + 1
+        self.assertEqual({k: v for k, v in self.counter.item_counts().items() if v > 0}, expected_counts)
+
+    def test_parallel_simulation_pool(self):
+        exposure_control_args: Any = {
+            "constraints": [adt.Constraint("Math", 0.5, 6), adt.Constraint("English", 0.5, 6)],
+            "participant_ids": None,
+            "output_format": None,
+            "n_items": None,
+            "seed": None,
+            "exposure_counter": self.counter
+        }
+        tests: list[adt.AdaptiveTest] = [
+            adt.TestAssembler(self.item_pool, "shared_exposure", str(i), adt.MLEstimator,
+                              true_ability_level=ability, seed=i,
+                              exposure_control="MaximumPriorityIndex",
+                              exposure_control_args=exposure_control_args)
+            for i, ability in enumerate([-1.0, -0.5, 0.0, 0.5, 1.0, 1.5])
+        ]
+        adt.SimulationPool(tests, adt.ResultOutputFormat.PICKLE, adt.StoppingCriterion.LENGTH, 3).start(parallel=True)
+
+        self.assertEqual(int(self.counter.counts.sum()), 18)
+        self.assertEqual(self.counter.constraint_counts(["Math", "English"]),
+                         {"Math": int(self.counter.counts[[0, 2, 4, 5]].sum()),
+                          "English": int(self.counter.counts[[1, 3, 5]].sum())})
+
+    def test_pickle_without_locks(self):
+        # outside of process creation, the locks are taken from the process
+        restored = pickle.loads(pickle.dumps(self.counter))
+        restored.on_item_administered(self.item_pool.test_items[0])
+        self.assertEqual(self.counter.item_counts()[1], 1)
+        restored.close()
+
+        name = self.counter.name
+        locks = _process_locks.pop(name)
+        try:
+            with self.assertRaises(RuntimeError):
+                pickle.loads(pickle.dumps(self.counter))
+        finally:
+            _process_locks[name] = locks
@@ -0,0 +1,75 @@
+import unittest
+import pathlib
+import pickle
+import shutil
+from functools import partial
+import numpy as np
+import adaptivetesting as adt
+from adaptivetesting.tests.__item_pools import create_item_pool
+
+
+class TestSharedItemBank(unittest.TestCase):
+    def setUp(self):
+        self.item_pool = create_item_pool(15, 3, guessing=True, slipping=True)
+        self.item_bank = adt.ItemBank.from_item_pool(self.item_pool)
+        self.shared_bank = adt.SharedItemBank.create(self.item_bank, np.linspace(-4, 4, 801))
+
+        def clean_up():
+            self.shared_bank.close()
+            self.shared_bank.unlink()
+            path = pathlib.Path("./data/shared_bank")
+            if path.exists():
+                shutil.rmtree(path)
+
+        self.addCleanup(clean_up)
+
+    def test_parameters_and_information_table(self):
+        np.testing.assert_array_equal(self.shared_bank.a, self.item_bank.a)
+        np.testing.assert_array_equal(self.shared_bank.d, self.item_bank.d)
+        self.assertEqual(self.shared_bank.information_table.shape, (801, len(self.item_bank)))
+        np.testing.assert_allclose(self.shared_bank.information(self.shared_bank.grid[[10, 400]]),
+                                   self.item_bank.information(self.shared_bank.grid[[10, 400]]))
+
+    def test_interpolated_information(self):
+        abilities = np.array([-1.234, 0.0101, 2.5])
+        np.testing.assert_allclose(self.shared_bank.information(abilities),
+                                   self.item_bank.information(abilities),
+                                   atol=1e-3)
+
+    def test_pickled_bank_attaches_read_only(self):
+        attached = pickle.loads(pickle.dumps(self.shared_bank))
+        self.assertFalse(attached.owner)
+        self.assertEqual(attached.name, self.shared_bank.name)
+        np.testing.assert_array_equal(attached.information_table, self.shared_bank.information_table)
+        with self.assertRaises(ValueError):
+            attached.a[0] = 5
+        attached.close()
+
+    def test_duplicate_ids(self):
+        item_pool = adt.ItemPool.load_from_list(b=[0.1, 0.2], ids=[1, 1])
+        with self.assertRaises(ValueError):
+            adt.SharedItemBank.create(adt.ItemBank.from_item_pool(item_pool))
+
+    def test_tabulated_maximum_information_criterion(self):
+        items = self.item_pool.test_items[3:]
+        for ability in [-1.5, 0.2, 1.1]:
+            self.assertEqual(
+                adt.tabulated_maximum_information_criterion(items, ability, self.shared_bank),
+                adt.maximum_information_criterion(items, ability)
+            )
+
+    def test_spec_pool_with_shared_bank(self):
+        test_factory = partial(adt.TestAssembler,
+                               ability_estimator=adt.MLEstimator,
+                               item_selector=adt.tabulated_maximum_information_criterion, # type: ignore
+                               item_selector_args={"item_bank": self.shared_bank})
+        specs = [adt.SimulationSpec(str(i), ability, seed=i) for i, ability in enumerate([-0.5, 0.5, 1.0])]
+        adt.SpecSimulationPool(self.item_pool, test_factory, specs, "shared_bank",
+                               adt.ResultOutputFormat.PICKLE,
+                               criterion=adt.StoppingCriterion.LENGTH,
+                               value=5,
+                               max_workers=2).start(parallel=True)
+        for spec in specs:
+            results = adt.load_test_results_single_participant("shared_bank", spec.participant_id,
+                                                               adt.ResultOutputFormat.PICKLE)
+            self.assertEqual(len(results), 5)
@@ -1,4 +1,7 @@
 import unittest
+import pathlib
+import shutil
+from functools import partial
 from unittest.mock import MagicMock, patch, PropertyMock
 from adaptivetesting.simulation.__simulation import Simulation
 from adaptivetesting.models.__adaptive_test import AdaptiveTest
@@ -12,12 +15,15 @@ def get_mock_adaptive_test():
     mock_test.simulation_id = "sim1"
     mock_test.participant_id = "p1"
     mock_test.test_results = {"score": 42}
+    mock_test.exposure_counter = None
     # Properly mock item_pool and its test_items
     mock_item_pool = MagicMock()
     type(mock_item_pool).test_items = PropertyMock(return_value=[1, 2, 3])
     mock_test.item_pool = mock_item_pool
     mock_test.check_se_criterion.return_value = False
     mock_test.check_length_criterion.return_value = False
+    # the stopping rules call the mocked criteria
+    mock_test.check_stopping_criteria.side_effect = partial(AdaptiveTest.check_stopping_criteria, mock_test)
     mock_test.run_test_once = MagicMock()
     return mock_test
 
@@ -27,9 +33,11 @@ def get_mock_adaptive_test_empty_pool():
     mock_test.simulation_id = "sim2"
     mock_test.participant_id = "p2"
     mock_test.test_results = {"score": 99}
+    mock_test.exposure_counter = None
     mock_item_pool = MagicMock()
     type(mock_item_pool).test_items = PropertyMock(return_value=[])
     mock_test.item_pool = mock_item_pool
+    mock_test.check_stopping_criteria.side_effect = partial(AdaptiveTest.check_stopping_criteria, mock_test)
     mock_test.run_test_once = MagicMock()
     return mock_test
 
@@ -159,3 +167,86 @@ class TestFullSimulation(unittest.TestCase):
 
         sim = adt.Simulation(adaptive_test, adt.ResultOutputFormat.CSV)
         sim.simulate()
+
+
+class TestSimulationPools(unittest.TestCase):
+    def setUp(self):
+        self.item_pool = adt.ItemPool.load_from_list(
+            b=[-1.5, -0.9, -0.4, 0.1, 0.5, 0.8, 1.3, 1.9],
+            a=[1.1, 0.8, 1.4, 1.0, 1.2, 0.9, 1.5, 1.3],
+            ids=list(range(8))
+        )
+        self.specs = [adt.SimulationSpec(str(i), ability, seed=i)
+                      for i, ability in enumerate([-1.0, -0.2, 0.3, 0.7, 1.4])]
+
+        def clean_up_sim():
+            for simulation_id in ["spec_pool", "test_pool"]:
+                path = pathlib.Path("./data") / simulation_id
+                if path.exists():
+                    shutil.rmtree(path)
+
+        self.addCleanup(clean_up_sim)
+
+    def load_results(self, simulation_id):
+        return [
+            adt.load_test_results_single_participant(simulation_id, spec.participant_id,
+                                                     adt.ResultOutputFormat.PICKLE)
+            for spec in self.specs
+        ]
+
+    def test_spec_pool_matches_simulation_pool(self):
+        tests: list[AdaptiveTest] = [
+            adt.TestAssembler(self.item_pool, "test_pool", spec.participant_id, adt.MLEstimator,
+                              true_ability_level=spec.true_ability_level,
+                              seed=spec.seed)
+            for spec in self.specs
+        ]
+        adt.SimulationPool(tests, adt.ResultOutputFormat.PICKLE,
+                           StoppingCriterion.LENGTH, 4).start(parallel=True)
+
+        spec_pool = adt.SpecSimulationPool(
+            item_pool=self.item_pool,
+            test_factory=partial(adt.TestAssembler, ability_estimator=adt.MLEstimator),
+            specs=self.specs,
+            simulation_id="spec_pool",
+            test_result_output=adt.ResultOutputFormat.PICKLE,
+            criterion=StoppingCriterion.LENGTH,
+            value=4,
+            chunk_size=2,
+            max_workers=2
+        )
+        spec_pool.start(parallel=True)
+
+        expected = self.load_results("test_pool")
+        actual = self.load_results("spec_pool")
+        for expected_results, actual_results in zip(expected, actual):
+            self.assertEqual(len(actual_results), 4)
+            self.assertEqual([result.showed_item["id"] for result in expected_results],
+                             [result.showed_item["id"] for result in actual_results])
+            self.assertEqual([result.ability_estimation for result in expected_results],
+                             [result.ability_estimation for result in actual_results])
+
+    def test_spec_pool_sequential(self):
+        spec_pool = adt.SpecSimulationPool(
+            item_pool=self.item_pool,
+            test_factory=partial(adt.TestAssembler, ability_estimator=adt.MLEstimator),
+            specs=self.specs,
+            simulation_id="spec_pool",
+            test_result_output=adt.ResultOutputFormat.PICKLE,
+            criterion=StoppingCriterion.LENGTH,
+            value=3,
+            chunk_size=3
+        )
+        spec_pool.start(parallel=False)
+        for spec, results in zip(self.specs, self.load_results("spec_pool")):
+            self.assertEqual(len(results), 3)
+            self.assertEqual(results[0].true_ability_level, spec.true_ability_level)
+
+    def test_chunk_specs(self):
+        chunks = list(adt.simulation.chunk_specs(self.specs, 2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            adt.SpecSimulationPool(self.item_pool, partial(adt.TestAssembler, ability_estimator=adt.MLEstimator),
+                                   self.specs, "spec_pool", adt.ResultOutputFormat.PICKLE, chunk_size=0)
@@ -0,0 +1,117 @@
+import unittest
+import math
+import pathlib
+import sqlite3
+from functools import partial
+import adaptivetesting as adt
+
+
+def create_results(participant: int, length: int) -> list[adt.TestResult]:
+    return [
+        adt.TestResult(
+            test_id="sqlite",
+            ability_estimation=participant + step / 10,
+            standard_error=1 / (step + 1),
+            showed_item={"id": step, "a": 1.0, "b": step / 2, "c": 0.0, "d": 1.0,
+                         "additional_properties": {"category": ["Math"]}},
+            response=step % 2,
+            true_ability_level=float(participant)
+        )
+        for step in range(length)
+    ]
+
+
+class TestSQLiteContext(unittest.TestCase):
+    def setUp(self):
+        def clean_up():
+            for path in pathlib.Path("data").glob("sqlite.db*"):
+                path.unlink()
+
+        clean_up()
+        self.addCleanup(clean_up)
+
+    def save_participants(self, n_participants: int):
+        for participant in range(n_participants):
+            adt.SQLiteContext("sqlite", str(participant)).save(create_results(participant, participant + 1))
+
+    def test_save_and_load(self):
+        self.save_participants(4)
+        for participant in range(4):
+            self.assertEqual(adt.SQLiteContext("sqlite", str(participant)).load(),
+                             create_results(participant, participant + 1))
+
+    def test_tables(self):
+        self.save_participants(3)
+        connection = sqlite3.connect("data/sqlite.db")
+        try:
+            self.assertEqual(connection.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            # every item is only stored once
+            self.assertEqual(connection.execute("SELECT COUNT(*) FROM items").fetchone()[0], 3)
+            self.assertEqual(connection.execute("SELECT COUNT(*) FROM results").fetchone()[0], 6)
+        finally:
+            connection.close()
+
+    def test_save_replaces_previous_results(self):
+        context = adt.SQLiteContext("sqlite", "1")
+        context.save(create_results(1, 4))
+        context.save(create_results(1, 2))
+        self.assertEqual(len(context.load()), 2)
+
+    def test_items_without_id(self):
+        results = create_results(1, 1)
+        results[0].showed_item["id"] = None
+        with self.assertRaises(ValueError):
+            adt.SQLiteContext("sqlite", "1").save(results)
+
+    def test_pretest_results(self):
+        # the estimates of the pretest are NaN, which SQLite stores as NULL
+        item_pool = adt.ItemPool.load_from_list(b=[-1, -0.5, 0, 0.5, 1], ids=list(range(5)))
+        test = adt.TestAssembler(item_pool, "sqlite", "pretest", adt.MLEstimator,
+                                 true_ability_level=0.5, pretest=True, pretest_seed=1)
+        simulation = adt.Simulation(test, adt.ResultOutputFormat.SQLITE)
+        simulation.simulate(adt.StoppingCriterion.LENGTH, 3)
+        simulation.save_test_results()
+
+        results = adt.SQLiteContext("sqlite", "pretest").load()
+        self.assertEqual(len(results), len(test.test_results))
+        for loaded, saved in zip(results, test.test_results):
+            for value, expected in [(loaded.ability_estimation, saved.ability_estimation),
+                                    (loaded.standard_error, saved.standard_error)]:
+                if math.isnan(expected):
+                    self.assertTrue(math.isnan(value))
+                else:
+                    self.assertAlmostEqual(value, expected)
+        self.assertTrue(math.isnan(results[0].ability_estimation))
+
+    def test_final_results_and_exposure(self):
+        self.save_participants(3)
+        final_results = adt.load_final_test_results("sqlite", ["2", "0", "1"], adt.ResultOutputFormat.SQLITE)
+        self.assertEqual([result.ability_estimation for result in final_results], [2.2, 0.0, 1.1])
+        self.assertEqual(adt.read_sqlite_exposure_counts("sqlite"), {0: 3, 1: 2, 2: 1})
+        self.assertEqual(adt.read_sqlite_exposure_counts("sqlite", ["0", "1"]), {0: 2, 1: 1})
+
+    def test_parallel_simulation(self):
+        item_pool = adt.ItemPool.load_from_list(b=[-1, -0.5, 0, 0.5, 1], ids=list(range(5)))
+        specs = [adt.SimulationSpec(str(i), ability, seed=i) for i, ability in enumerate([-1.0, 0.0, 1.0, 1.5])]
+        adt.SpecSimulationPool(item_pool,
+                               partial(adt.TestAssembler, ability_estimator=adt.MLEstimator),
+                               specs,
+                               "sqlite",
+                               adt.ResultOutputFormat.SQLITE,
+                               criterion=adt.StoppingCriterion.LENGTH,
+                               value=3,
+                               chunk_size=1,
+                               max_workers=2).start(parallel=True)
+        for spec in specs:
+            results = adt.load_test_results_single_participant("sqlite", spec.participant_id,
+                                                               adt.ResultOutputFormat.SQLITE)
+            self.assertEqual(len(results), 3)
+        participant_ids = [spec.participant_id for spec in specs]
+        final_results = [
+            adt.load_test_results_single_participant("sqlite", participant_id, adt.ResultOutputFormat.SQLITE)[-1]
+            for participant_id in participant_ids
+        ]
+        expected_bias = sum([result.ability_estimation - result.true_ability_level
+                             for result in final_results]) / len(final_results)
+        self.assertAlmostEqual(float(adt.bias("sqlite", participant_ids, adt.ResultOutputFormat.SQLITE)),
+                               expected_bias)
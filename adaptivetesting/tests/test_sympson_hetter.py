@@ -0,0 +1,99 @@
+import unittest
+import numpy as np
+import adaptivetesting as adt
+from adaptivetesting.tests.__item_pools import create_item_pool
+
+
+class DummyAdaptiveTest:
+    def __init__(self, item_pool: adt.ItemPool, ability_level: float):
+        self.item_pool = item_pool
+        self.ability_level = ability_level
+
+
+class TestSympsonHetter(unittest.TestCase):
+    def test_parameters(self):
+        parameters = adt.SympsonHetterParameters([1, 2, 3], np.array([[1, 0.5, 0.2], [0.3, 1, 1]]),
+                                                 cut_points=np.array([0.0]))
+        self.assertEqual(parameters.interval(-1), 0)
+        self.assertEqual(parameters.interval(0.5), 1)
+        item = adt.TestItem()
+        item.id = 4
+        items = create_item_pool(3, 11, a_range=(0.6, 2)).test_items[1:] + [item]
+        self.assertEqual(parameters.for_items(items, 1.0).tolist(), [0.3, 1.0, 1.0])
+        self.assertEqual(parameters.for_items(items, -1.0).tolist(), [1.0, 0.5, 1.0])
+
+        with self.assertRaises(ValueError):
+            adt.SympsonHetterParameters([1, 2], np.ones((2, 2)))
+
+    def test_acceptance_test(self):
+        item_pool = create_item_pool(40, 11, a_range=(0.6, 2))
+        information = [adt.item_information_function(0.0, item) for item in item_pool.test_items]
+        most_informative = int(np.argmax(information))
+
+        # without restrictions, the most informative item is selected
+        parameters = adt.SympsonHetterParameters(list(range(40)), np.ones((1, 40)))
+        selection = adt.SympsonHetter(DummyAdaptiveTest(item_pool, 0.0), parameters, seed=1)  # type: ignore
+        self.assertIs(selection.select_item(), item_pool.test_items[most_informative])
+
+        # items with a parameter of 0 are rejected and not selected again
+        values = np.ones((1, 40))
+        values[0, most_informative] = 0
+        parameters = adt.SympsonHetterParameters(list(range(40)), values)
+        selection = adt.SympsonHetter(DummyAdaptiveTest(item_pool, 0.0), parameters, seed=1)  # type: ignore
+        for _ in range(5):
+            self.assertIsNot(selection.select_item(), item_pool.test_items[most_informative])
+        self.assertEqual(selection.rejected_items, [item_pool.test_items[most_informative]])
+
+    def test_rejected_items_become_available_again(self):
+        item_pool = adt.ItemPool.load_from_list(b=[0, 0.1, 2], ids=[0, 1, 2])
+        parameters = adt.SympsonHetterParameters([0, 1, 2], np.array([[0.0, 0.0, 1.0]]))
+        test = adt.TestAssembler(item_pool, "sympson_hetter", "1", adt.MLEstimator,
+                                 exposure_control="SympsonHetter",
+                                 exposure_control_args={"constraints": None, "participant_ids": None,
+                                                        "output_format": None, "n_items": None, "seed": 4,
+                                                        "exposure_parameters": parameters},
+                                 true_ability_level=0.0, seed=4)
+        # the first item is the only one passing the acceptance test,
+        # the second item is selected from the previously rejected items
+        for _ in range(2):
+            test.run_test_once()
+        self.assertEqual(len(test.answered_items), 2)
+        self.assertEqual(test.answered_items[0].id, 2)
+
+    def test_calibration(self):
+        item_pool = create_item_pool(40, 11, a_range=(0.6, 2))
+        abilities = np.random.default_rng(5).normal(0, 1, 300)
+        uncontrolled = adt.calibrate_sympson_hetter(item_pool, abilities, 5, 1.0, adt.MLEstimator,
+                                                    seed=2, n_rounds=1)
+        self.assertTrue(np.all(uncontrolled.parameters == 1))
+        assert uncontrolled.exposure_rates is not None
+        self.assertAlmostEqual(float(uncontrolled.exposure_rates.sum()), 5.0)
+
+        controlled = adt.calibrate_sympson_hetter(item_pool, abilities, 5, 0.3, adt.MLEstimator,
+                                                  seed=2, n_rounds=10)
+        assert controlled.exposure_rates is not None
+        self.assertLess(controlled.exposure_rates.max(), uncontrolled.exposure_rates.max())
+        self.assertLess(controlled.exposure_rates.max(), 0.4)
+        self.assertGreaterEqual(int(np.sum(controlled.parameters == 1)), 5)
+
+        conditional = adt.calibrate_sympson_hetter(item_pool, abilities, 5, 0.3, adt.MLEstimator,
+                                                   cut_points=[-0.5, 0.5], seed=2, n_rounds=3)
+        self.assertEqual(conditional.parameters.shape, (3, 40))
+        self.assertEqual(conditional.cut_points.tolist(), [-0.5, 0.5])
+
+        with self.assertRaises(ValueError):
+            adt.calibrate_sympson_hetter(item_pool, abilities, 5, 0.0, adt.MLEstimator)
+
+    def test_test_assembler(self):
+        item_pool = create_item_pool(40, 11, a_range=(0.6, 2))
+        parameters = adt.calibrate_sympson_hetter(item_pool, np.linspace(-2, 2, 100), 5, 0.3,
+                                                  adt.MLEstimator, seed=3, n_rounds=3)
+        test = adt.TestAssembler(item_pool, "sympson_hetter", "1", adt.MLEstimator,
+                                 exposure_control="SympsonHetter",
+                                 exposure_control_args={"constraints": None, "participant_ids": None,
+                                                        "output_format": None, "n_items": None, "seed": 4,
+                                                        "exposure_parameters": parameters},
+                                 true_ability_level=0.5, seed=4)
+        for _ in range(5):
+            test.run_test_once()
+        self.assertEqual(len(set([item.id for item in test.answered_items])), 5)
@@ -3,6 +3,7 @@ import unittest
 import pandas as pd
 import adaptivetesting as adt
 import copy
+import numpy as np
 from typing import Literal
 
 
@@ -528,3 +529,83 @@ class TestWeightedPenaltyModelPoly(unittest.TestCase):
             selected_item.as_dict(),
             information_selected_item.as_dict()
         )
+
+
+class TestWeightedPenaltyModelState(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        categories = [["math"], ["english"], ["math", "science"], ["science"], ["art"]]
+        self.item_pool = adt.ItemPool.load_from_list(
+            a=rng.uniform(0.5, 2, 50).tolist(),
+            b=rng.normal(0, 1, 50).tolist(),
+            c=rng.uniform(0, 0.2, 50).tolist(),
+            ids=list(range(50)),
+            content_categories=[categories[i % 5] for i in range(50)]
+        )
+        self.constraints = [
+            adt.Constraint("math", weight=1, prevalence=0.4, lower=0.3, upper=0.5),
+            adt.Constraint("english", weight=2, prevalence=0.2, lower=0.1, upper=0.3),
+            adt.Constraint("science", weight=1, prevalence=0.4, lower=0.2, upper=0.6)
+        ]
+
+    def legacy_ranking(self, test) -> list[tuple[int, float, str]]:
+        # original implementation based on Python lists
+        model = adt.WeightedPenaltyModel(test, self.constraints, 0.6, 0.4)
+        information = model.calculate_information()
+        content_penalties = model.calculate_content_penalties()
+        model.calculate_weighted_penalty_for_all_items(
+            item_information_list=information,
+            max_item=max(information),
+            content_penalties=content_penalties,
+            max_content_penalty=max(content_penalties),
+            min_content_penalty=min(content_penalties)
+        )
+        model.form_list_of_candidate_items(model.get_constraint_group_assignments())
+        model.order_candidate_items()
+        return [(item.id, value, group) for item, value, group in model.eligible_items]
+
+    def test_matches_legacy_ranking(self):
+        test = adt.TestAssembler(self.item_pool, "wpm", "1", adt.MLEstimator,
+                                 true_ability_level=0.5, seed=3)
+        model = adt.WeightedPenaltyModel(test, self.constraints, 0.6, 0.4)
+        for _ in range(12):
+            model.prepare_item_pool()
+            ranking = [(item.id, value, group) for item, value, group in model.eligible_items]
+            expected = self.legacy_ranking(test)
+            self.assertEqual([entry[0] for entry in ranking], [entry[0] for entry in expected])
+            self.assertEqual([entry[2] for entry in ranking], [entry[2] for entry in expected])
+            np.testing.assert_allclose([entry[1] for entry in ranking], [entry[1] for entry in expected],
+                                       atol=1e-6)
+
+            # administer the selected item
+            item = model.select_item()
+            test.response_pattern.append(test.item_pool.get_item_response(item))
+            test.answered_items.append(item)
+            test.item_pool.delete_item(item)
+            test.ability_level = float(test.ability_level + 0.1)
+
+        # the counts are updated on the next item selection
+        model.select_item()
+        self.assertEqual(model.state.test_length, 12)
+        self.assertEqual(model.state.remaining.tolist(), [
+            len([item for item in test.item_pool.test_items
+                 if constraint.name in item.additional_properties["category"]])
+            for constraint in self.constraints
+        ])
+
+    def test_persistent_model_in_test(self):
+        test = adt.TestAssembler(
+            self.item_pool, "wpm", "1", adt.MLEstimator,
+            true_ability_level=0.5,
+            content_balancing="WeightedPenaltyModel",
+            content_balancing_args={
+                "constraints": self.constraints,
+                "constraint_weight": lambda adaptive_test: 0.5 + len(adaptive_test.answered_items) / 20,
+                "information_weight": 0.5
+            },
+            seed=3
+        )
+        for _ in range(10):
+            test.run_test_once()
+        self.assertEqual(len(set([item.id for item in test.answered_items])), 10)
+        self.assertEqual(len(test.item_pool.test_items), 40)
@@ -1,6 +1,8 @@
 from ..models.__test_result import TestResult
 from ..data.__csv_context import CSVContext
 from ..data.__pickle_context import PickleContext
+from ..data.__columnar_context import ColumnarContext, read_columnar_test_results
+from ..data.__sqlite_context import SQLiteContext, read_sqlite_final_test_results
 from ..services.__test_results_interface import ITestResults
 from ..models.__misc import ResultOutputFormat
 
@@ -10,17 +12,18 @@ def load_final_test_results(simulation_id: str,
                             output_format: ResultOutputFormat) -> list[TestResult]:
     """
     Loads the final test results for a list of participants from the specified simulation or adaptive test.
-    Depending on the output format (CSV or PICKLE), this function initializes the appropriate context,
+    Depending on the output format (CSV, PICKLE, COLUMNAR or SQLITE), this function initializes the appropriate context,
     loads all test results for each participant, and selects the final result (assumed to be the last entry).
     The final results are collected and returned as a list.
     Args:
         simulation_id (str): The identifier for the simulation from which to load results.
         participant_ids (list[str]): A list of participant IDs whose results are to be loaded.
-        output_format (ResultOutputFormat): The format in which results are stored (CSV or PICKLE).
+        output_format (ResultOutputFormat): The format in which results are stored (CSV, PICKLE, COLUMNAR or SQLITE).
     Returns:
         list[TestResult]: A list containing the final test result for each participant.
     Raises:
-        ValueError: If the output_format is not set to either ResultOutputFormat.CSV or ResultOutputFormat.PICKLE.
+        ValueError: If the output_format is not set to either ResultOutputFormat.CSV, ResultOutputFormat.PICKLE,
+            ResultOutputFormat.COLUMNAR or ResultOutputFormat.SQLITE.
     """
     # load data
     final_test_results: list[TestResult] = []
@@ -41,8 +44,18 @@ def load_final_test_results(simulation_id: str,
             # select final result
             final_result = test_results[-1]
             final_test_results.append(final_result)
+
+    elif output_format is ResultOutputFormat.COLUMNAR:
+        # read all participants at once
+        all_test_results = read_columnar_test_results(simulation_id)
+        for id in participant_ids:
+            final_test_results.append(all_test_results[str(id)][-1])
+
+    elif output_format is ResultOutputFormat.SQLITE:
+        # select the final results with a single query
+        final_test_results = read_sqlite_final_test_results(simulation_id, participant_ids)
     else:
-        raise ValueError("output_format is not correctly set to either PICKLE of CSV.")
+        raise ValueError("output_format is not correctly set to either PICKLE, CSV, COLUMNAR or SQLITE.")
 
     return final_test_results
 
@@ -52,16 +65,17 @@ def load_test_results_single_participant(simulation_id: str,
                                          output_format: ResultOutputFormat) -> list[TestResult]:
     """
     Loads the test results for a participant from the specified simulation or adaptive test.
-    Depending on the output format (CSV or PICKLE), this function reads the available CSV or PICKLE files.
+    Depending on the output format (CSV, PICKLE, COLUMNAR or SQLITE), this function reads the available files.
 
     Args:
         simulation_id (str): The identifier for the simulation from which to load results.
         participant_id (str): Participant ID whose results are to be loaded.
-        output_format (ResultOutputFormat): The format in which results are stored (CSV or PICKLE).
+        output_format (ResultOutputFormat): The format in which results are stored (CSV, PICKLE, COLUMNAR or SQLITE).
     Returns:
         list[TestResult]: A list containing the test results for the participant.
     Raises:
-        ValueError: If the output_format is not set to either ResultOutputFormat.CSV or ResultOutputFormat.PICKLE.
+        ValueError: If the output_format is not set to either ResultOutputFormat.CSV, ResultOutputFormat.PICKLE,
+            ResultOutputFormat.COLUMNAR or ResultOutputFormat.SQLITE.
     """
     context: ITestResults
 
@@ -74,5 +88,15 @@ def load_test_results_single_participant(simulation_id: str,
         context = PickleContext(simulation_id=simulation_id,
                                 participant_id=participant_id)
         return context.load()
+
+    if output_format is ResultOutputFormat.COLUMNAR:
+        context = ColumnarContext(simulation_id=simulation_id,
+                                  participant_id=participant_id)
+        return context.load()
+
+    if output_format is ResultOutputFormat.SQLITE:
+        context = SQLiteContext(simulation_id=simulation_id,
+                                participant_id=participant_id)
+        return context.load()
     else:
-        raise ValueError("output_format is not correctly set to either PICKLE of CSV.")
+        raise ValueError("output_format is not correctly set to either PICKLE, CSV, COLUMNAR or SQLITE.")
@@ -1,13 +1,35 @@
+from typing import TYPE_CHECKING
+import importlib
+
 from .__descriptives import bias, average_absolute_deviation, rmse
 
 from .__funcs import load_final_test_results, load_test_results_single_participant
 
-from .__plots import (
-    plot_exposure_rate,
-    plot_final_ability_estimates,
-    plot_icc,
-    plot_iif,
-    plot_exposure_rate,
-    plot_test_information,
-    plot_theta_estimation_trace
-)
\ No newline at end of file
+# the plots import matplotlib on first access
+_PLOTS = (
+    "plot_exposure_rate",
+    "plot_final_ability_estimates",
+    "plot_icc",
+    "plot_iif",
+    "plot_test_information",
+    "plot_theta_estimation_trace"
+)
+
+
+def __getattr__(name: str):
+    if name not in _PLOTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(".__plots", __name__), name)
+    globals()[name] = value
+    return value
+
+
+if TYPE_CHECKING:
+    from .__plots import (
+        plot_exposure_rate,
+        plot_final_ability_estimates,
+        plot_icc,
+        plot_iif,
+        plot_test_information,
+        plot_theta_estimation_trace
+    )
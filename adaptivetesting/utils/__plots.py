@@ -6,6 +6,7 @@ from ..models.__test_item import TestItem
 from ..math.estimators.__functions.__estimators import probability_y1
 from ..math.estimators.__test_information import item_information_function
 from .__funcs import load_final_test_results, load_test_results_single_participant
+from ..data.__sqlite_context import read_sqlite_exposure_counts
 import numpy as np
 from typing import Literal
 
@@ -153,35 +154,41 @@ def plot_exposure_rate(simulation_id: str,
     Returns:
         tuple[Figure, Axes]: matplotlib figure and axes
     """
-    # read test results for each participant and collect shown item ids
-    all_item_ids: list[str] = []
-    for participant in participant_ids:
-        test_results = load_test_results_single_participant(
-            simulation_id=simulation_id,
-            participant_id=participant,
-            output_format=output_format,
-        )
-
-        # each TestResult has a 'showed_item' dict with an 'id' key
-        participant_item_ids = [res.showed_item["id"] for res in test_results]
-        all_item_ids.extend(participant_item_ids)
-
-    if len(all_item_ids) == 0:
+    if output_format is ResultOutputFormat.SQLITE:
+        # count the exposures in the database
+        exposure_counts = read_sqlite_exposure_counts(simulation_id, participant_ids)
+        unique_ids = np.array(list(exposure_counts.keys()), dtype=object)
+        counts = np.array(list(exposure_counts.values()), dtype=np.int64)
+    else:
+        # read test results for each participant and collect shown item ids
+        all_item_ids: list[str] = []
+        for participant in participant_ids:
+            test_results = load_test_results_single_participant(
+                simulation_id=simulation_id,
+                participant_id=participant,
+                output_format=output_format,
+            )
+
+            # each TestResult has a 'showed_item' dict with an 'id' key
+            participant_item_ids = [res.showed_item["id"] for res in test_results]
+            all_item_ids.extend(participant_item_ids)
+
+        # unique item ids and counts
+        unique_ids, counts = np.unique(np.array(all_item_ids, dtype=object), return_counts=True)
+
+    if len(unique_ids) == 0:
         # nothing to plot, return empty figure
         fig, ax = plt.subplots()
         ax.set_title("No items shown - no exposure data")
         return fig, ax
 
-    # unique item ids and counts
-    unique_ids, counts = np.unique(np.array(all_item_ids, dtype=object), return_counts=True)
-
     # sort by counts descending for better readability
     order = np.argsort(counts)[::-1]
     unique_ids_sorted = unique_ids[order]
     counts_sorted = counts[order]
 
     # compute exposure percentage relative to number of participants (or total exposures)
-    total_exposures = len(all_item_ids)
+    total_exposures = int(counts.sum())
     exposure_pct = counts_sorted / total_exposures * 100.0
 
     # create bar plot
@@ -0,0 +1,58 @@
+"""Benchmark of the import time of adaptivetesting.
+
+Every scenario is run in fresh interpreters, so that no module is cached.
+The script reports the median wall time and the heavy optional dependencies
+that have been imported by the scenario.
+
+Usage:
+    python profiler/import_time.py [--repeat 5]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ["matplotlib", "pandas", "numdifftools", "scipy.stats", "adaptivetesting.tests"]
+
+SCENARIOS = {
+    "import adaptivetesting": "import adaptivetesting",
+    "dichotomous TestAssembler": """
+import adaptivetesting as adt
+item_pool = adt.ItemPool.load_from_list(a=[1.0] * 20, b=[i / 10 for i in range(-10, 10)], ids=list(range(20)))
+test = adt.TestAssembler(item_pool, "import_time", "1", adt.MLEstimator, true_ability_level=0.2, seed=1)
+test.run_test_once()
+""",
+    "plots": "import adaptivetesting as adt; adt.plot_icc",
+}
+
+RUNNER = """
+import json, sys, time
+start = time.perf_counter()
+exec(compile(sys.argv[1], "<scenario>", "exec"))
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "modules": [m for m in json.loads(sys.argv[2]) if m in sys.modules]}))
+"""
+
+
+def run_scenario(code: str) -> dict:
+    output = subprocess.run([sys.executable, "-c", RUNNER, code, json.dumps(HEAVY_MODULES)],
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="number of fresh interpreters per scenario")
+    args = parser.parse_args()
+
+    print(f"{'scenario':<28}{'median ms':>12}{'min ms':>10}  heavy modules")
+    for name, code in SCENARIOS.items():
+        runs = [run_scenario(code) for _ in range(args.repeat)]
+        seconds = [run["seconds"] for run in runs]
+        modules = ", ".join(runs[0]["modules"]) or "-"
+        print(f"{name:<28}{statistics.median(seconds) * 1e3:>12.1f}{min(seconds) * 1e3:>10.1f}  {modules}")
+
+
+if __name__ == "__main__":
+    main()